@@ -1,29 +1,57 @@
 from app.bulletpoints_generation.llm_client import (
     BulletPointLLMClientError,
+    LLMBulletPointBatchResult,
     LLMBulletPointResult,
+    StreamedBulletPoint,
+    generate_bulletpoints_batch_with_llm,
+    generate_bulletpoints_batch_with_llm_async,
     generate_bulletpoints_with_llm,
+    generate_bulletpoints_with_llm_async,
+    stream_bulletpoints_with_llm_async,
 )
 from app.bulletpoints_generation.models import (
+    BulletBatchRecord,
+    BulletBatchResult,
     BulletCountRange,
+    BulletGenerationBatchRequest,
+    BulletGenerationBatchResponse,
     BulletGenerationRequest,
     BulletGenerationResponse,
     BulletJobContext,
 )
 from app.bulletpoints_generation.service import (
     BulletPointGenerationError,
+    generate_bulletpoints_batch_service,
+    generate_bulletpoints_batch_service_async,
     generate_bulletpoints_service,
+    generate_bulletpoints_service_async,
     record_bulletpoint_generation_error,
+    stream_bulletpoints_service,
 )
 
 __all__ = [
+    "BulletBatchRecord",
+    "BulletBatchResult",
     "BulletCountRange",
+    "BulletGenerationBatchRequest",
+    "BulletGenerationBatchResponse",
     "BulletGenerationRequest",
     "BulletGenerationResponse",
     "BulletJobContext",
     "BulletPointGenerationError",
     "BulletPointLLMClientError",
+    "LLMBulletPointBatchResult",
     "LLMBulletPointResult",
+    "StreamedBulletPoint",
+    "generate_bulletpoints_batch_service",
+    "generate_bulletpoints_batch_service_async",
+    "generate_bulletpoints_batch_with_llm",
+    "generate_bulletpoints_batch_with_llm_async",
     "generate_bulletpoints_service",
+    "generate_bulletpoints_service_async",
     "generate_bulletpoints_with_llm",
+    "generate_bulletpoints_with_llm_async",
     "record_bulletpoint_generation_error",
+    "stream_bulletpoints_service",
+    "stream_bulletpoints_with_llm_async",
 ]
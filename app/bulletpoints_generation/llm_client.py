@@ -4,18 +4,33 @@ import json
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Callable, Literal, TypeVar
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.bulletpoints_generation.models import BulletCountRange, BulletJobContext
 from app.config import settings
+from app.hedging import HedgedCreate, hedge_tokens
+from app.model_scheduler import scheduled_stream_async
+from app.openai_clients import (
+    ResponseExchange,
+    get_async_openai_client,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
+from app.output_budget import output_budgets
 from app.skill_selection.llm_client import _extract_output_text
 from app.skill_selection.llm_client import supports_temperature
 from app.resume_evidence.models import ExperienceRecord, ProjectRecord
 
 logger = logging.getLogger("bulletpoints_llm_client")
 
+METRICS_SUBSYSTEM = "bulletpoints_generation"
+
+T = TypeVar("T")
+
 
 class BulletPointLLMClientError(RuntimeError):
     """Raised when a bullet-point generation request or response cannot be used."""
@@ -27,9 +42,30 @@ class LLMBulletPointResult:
     metadata: dict[str, Any]
 
 
+@dataclass
+class StreamedBulletPoint:
+    """One validated bullet, emitted as soon as the model finishes writing it."""
+
+    index: int
+    text: str
+
+
+@dataclass
+class LLMBulletPointBatchResult:
+    """Bullets per record key; records that failed validation are in `errors`."""
+
+    bullet_points: dict[str, list[str]]
+    errors: dict[str, str]
+    metadata: dict[str, Any]
+
+
 EvidenceType = Literal["project", "experience"]
 
 
+def bulletpoint_record_key(evidence_type: EvidenceType, evidence_id: str) -> str:
+    return f"{evidence_type}:{evidence_id}"
+
+
 def build_bulletpoint_schema(count_range: BulletCountRange) -> dict[str, Any]:
     return {
         "type": "object",
@@ -57,14 +93,8 @@ def build_bulletpoint_prompt_payload(
         project=project,
         experience=experience,
     )
-    job_payload: dict[str, Any] = {"title": context.title}
-    if context.job_focus is not None:
-        job_payload["focus"] = context.job_focus.model_dump()
-    else:
-        job_payload["description"] = context.description or ""
-
     payload = {
-        "job": job_payload,
+        "job": _build_job_payload(context),
         evidence_type: evidence_payload,
         "bullet_count_range": count_range.model_dump(),
         "grounding_rules": [
@@ -77,6 +107,77 @@ def build_bulletpoint_prompt_payload(
     return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
+def build_bulletpoint_batch_schema(count_ranges: dict[str, BulletCountRange]) -> dict[str, Any]:
+    """One required property per record key, each holding that record's bullet schema."""
+    return {
+        "type": "object",
+        "properties": {
+            key: build_bulletpoint_schema(count_range)
+            for key, count_range in count_ranges.items()
+        },
+        "required": list(count_ranges),
+        "additionalProperties": False,
+    }
+
+
+def build_bulletpoint_batch_prompt_payload(
+    *,
+    context: BulletJobContext,
+    records: list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]],
+) -> str:
+    record_payloads = []
+    for project, experience, count_range in records:
+        evidence_type, evidence_payload = _build_evidence_payload(
+            project=project,
+            experience=experience,
+        )
+        record_payloads.append(
+            {
+                "key": bulletpoint_record_key(evidence_type, evidence_payload["id"]),
+                "evidence_type": evidence_type,
+                evidence_type: evidence_payload,
+                "bullet_count_range": count_range.model_dump(),
+            }
+        )
+
+    payload = {
+        "job": _build_job_payload(context),
+        "records": record_payloads,
+        "grounding_rules": [
+            "Use only a record's own evidence as the source of user experience for its bullets.",
+            "Never move facts, metrics, or skills from one record to another.",
+            "The job focus or description may guide emphasis but is not evidence of user experience.",
+            "Omit unsupported claims instead of guessing.",
+            "Return plain bullet text without leading bullet symbols.",
+        ],
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_job_payload(context: BulletJobContext) -> dict[str, Any]:
+    job_payload: dict[str, Any] = {"title": context.title}
+    if context.job_focus is not None:
+        job_payload["focus"] = context.job_focus.model_dump()
+    else:
+        job_payload["description"] = context.description or ""
+    return job_payload
+
+
+_BULLET_STYLE_GUIDANCE = (
+    "Treat the evidence "
+    "as mostly raw, human-written factual context: it may be simple, poorly "
+    "written, or stylistically unsuitable, and the bullets should not copy "
+    "its logic, tone, or wording. Maximize the user's "
+    "chances of getting an interview by creating strong, ATS-friendly "
+    "resume bullets. Use strong action verbs + task + impact, prioritize "
+    "measurable results, and follow best practices for resume bullet "
+    "writing by extracting and reframing the most recruiting-relevant "
+    "information from the live evidence. Do not fabricate any details that "
+    "are not supported by the supplied evidence. "
+    "Each string must be a polished resume bullet without a leading bullet marker."
+)
+
+
 def build_bulletpoint_instructions(
     count_range: BulletCountRange,
     evidence_type: EvidenceType = "project",
@@ -93,17 +194,18 @@ def build_bulletpoint_instructions(
         "You are a deterministic resume bullet writer. Return JSON only. "
         f"{count_instruction} Tailor the supplied {evidence_type} evidence to the "
         "target job focus while staying grounded in the supplied "
-        f"{evidence_type} summary, highlights, and skills. Treat the evidence "
-        "as mostly raw, human-written factual context: it may be simple, poorly "
-        "written, or stylistically unsuitable, and the bullets should not copy "
-        "its logic, tone, or wording. Maximize the user's "
-        "chances of getting an interview by creating strong, ATS-friendly "
-        "resume bullets. Use strong action verbs + task + impact, prioritize "
-        "measurable results, and follow best practices for resume bullet "
-        "writing by extracting and reframing the most recruiting-relevant "
-        "information from the live evidence. Do not fabricate any details that "
-        "are not supported by the supplied evidence. "
-        "Each string must be a polished resume bullet without a leading bullet marker."
+        f"{evidence_type} summary, highlights, and skills. {_BULLET_STYLE_GUIDANCE}"
+    )
+
+
+def build_bulletpoint_batch_instructions() -> str:
+    return (
+        "You are a deterministic resume bullet writer. Return JSON only. The input "
+        "lists several evidence records, each with a key. Return one property per "
+        "record key holding that record's bullet_points, with a count inside the "
+        "record's bullet_count_range that best represents its evidence. Tailor each "
+        "record's evidence to the target job focus while staying grounded in that "
+        f"record's summary, highlights, and skills. {_BULLET_STYLE_GUIDANCE}"
     )
 
 
@@ -168,7 +270,8 @@ def _aggregate_attempt_metadata(
     model: str,
     latency_ms: float,
 ) -> dict[str, Any]:
-    return {
+    hedged_tokens = hedge_tokens(attempts)
+    metadata = {
         "model": model,
         "api_calls": len(attempts),
         "latency_ms": round(latency_ms, 3),
@@ -176,9 +279,13 @@ def _aggregate_attempt_metadata(
         "completion_tokens": sum(
             int(attempt.get("completion_tokens", 0) or 0) for attempt in attempts
         ),
-        "total_tokens": sum(int(attempt.get("total_tokens", 0) or 0) for attempt in attempts),
+        "total_tokens": sum(int(attempt.get("total_tokens", 0) or 0) for attempt in attempts)
+        + hedged_tokens,
         "attempts": attempts,
     }
+    if hedged_tokens:
+        metadata["hedge_tokens"] = hedged_tokens
+    return metadata
 
 
 def build_bulletpoint_response_create_kwargs(
@@ -218,35 +325,120 @@ def _validate_bullet_points(raw_response: Any, count_range: BulletCountRange) ->
     if not isinstance(raw_bullets, list):
         raise BulletPointLLMClientError("Bullet-point LLM response must include bullet_points")
 
-    bullets: list[str] = []
-    for index, bullet in enumerate(raw_bullets, start=1):
-        if not isinstance(bullet, str):
-            raise BulletPointLLMClientError(f"Bullet point {index} must be a string")
-        normalized = bullet.strip()
-        if not normalized:
-            raise BulletPointLLMClientError(f"Bullet point {index} must not be empty")
-        cleaned = normalized.lstrip("-* ").strip()
-        if not cleaned:
-            raise BulletPointLLMClientError(f"Bullet point {index} must not be empty")
-        bullets.append(cleaned)
-
-    if len(bullets) < count_range.min or len(bullets) > count_range.max:
+    bullets = [
+        _validate_bullet_point(index, bullet)
+        for index, bullet in enumerate(raw_bullets, start=1)
+    ]
+    _validate_bullet_count(len(bullets), count_range)
+    return bullets
+
+
+def _validate_bullet_point(index: int, bullet: Any) -> str:
+    if not isinstance(bullet, str):
+        raise BulletPointLLMClientError(f"Bullet point {index} must be a string")
+    normalized = bullet.strip()
+    if not normalized:
+        raise BulletPointLLMClientError(f"Bullet point {index} must not be empty")
+    cleaned = normalized.lstrip("-* ").strip()
+    if not cleaned:
+        raise BulletPointLLMClientError(f"Bullet point {index} must not be empty")
+    return cleaned
+
+
+def _validate_bullet_count(count: int, count_range: BulletCountRange) -> None:
+    if count < count_range.min or count > count_range.max:
         raise BulletPointLLMClientError(
             "Bullet-point LLM response count was outside the requested range"
         )
 
-    return bullets
 
+def _validate_bullet_point_batch(
+    raw_response: Any,
+    count_ranges: dict[str, BulletCountRange],
+) -> tuple[dict[str, list[str]], dict[str, str]]:
+    if not isinstance(raw_response, dict):
+        raise BulletPointLLMClientError("Bullet-point LLM response must be a JSON object")
 
-def generate_bulletpoints_with_llm(
+    bullets_by_key: dict[str, list[str]] = {}
+    errors: dict[str, str] = {}
+    for key, count_range in count_ranges.items():
+        try:
+            bullets_by_key[key] = _validate_bullet_points(raw_response.get(key), count_range)
+        except BulletPointLLMClientError as exc:
+            errors[key] = str(exc)
+
+    if not bullets_by_key:
+        raise BulletPointLLMClientError(
+            f"Bullet-point LLM batch response had no valid records: {next(iter(errors.values()))}"
+        )
+    return bullets_by_key, errors
+
+
+@dataclass
+class _BulletPointRequest:
+    api_key: str
+    model: str
+    max_output_tokens: int
+    evidence_type: str
+    count_range: BulletCountRange
+    instructions: str
+    prompt_payload: str
+    schema: dict[str, Any]
+
+    @property
+    def schema_name(self) -> str:
+        return f"{self.evidence_type}_bullet_points"
+
+
+@dataclass
+class _BulletPointBatchRequest:
+    api_key: str
+    model: str
+    max_output_tokens: int
+    count_ranges: dict[str, BulletCountRange]
+    instructions: str
+    prompt_payload: str
+    schema: dict[str, Any]
+    schema_name: str = "bullet_points_batch"
+
+
+def _api_key() -> str:
+    api_key = openai_api_key()
+    if not api_key:
+        raise BulletPointLLMClientError("OPENAI_API_KEY is required for bullet-point generation")
+    return api_key
+
+
+def _effective_model_and_budget(
+    *,
+    model: str | None,
+    max_output_tokens: int | None,
+    prompt_payload: str,
+    default_max_output_tokens: int,
+) -> tuple[str, int]:
+    effective_model = model if model is not None else settings.BULLETPOINTS_LLM_MODEL
+    effective_max_output_tokens = (
+        max_output_tokens
+        if max_output_tokens is not None
+        else output_budgets.budget(
+            subsystem=METRICS_SUBSYSTEM,
+            model=effective_model,
+            input_size=len(prompt_payload),
+            default=default_max_output_tokens,
+        )
+    )
+    return effective_model, effective_max_output_tokens
+
+
+def _prepare_bulletpoint_request(
     *,
     context: BulletJobContext,
     count_range: BulletCountRange,
-    project: ProjectRecord | None = None,
-    experience: ExperienceRecord | None = None,
-    model: str | None = None,
-    max_output_tokens: int | None = None,
-) -> LLMBulletPointResult:
+    project: ProjectRecord | None,
+    experience: ExperienceRecord | None,
+    model: str | None,
+    max_output_tokens: int | None,
+) -> _BulletPointRequest:
     evidence_type, _ = _build_evidence_payload(
         project=project,
         experience=experience,
@@ -259,40 +451,113 @@ def generate_bulletpoints_with_llm(
     )
     schema = build_bulletpoint_schema(count_range)
     instructions = build_bulletpoint_instructions(count_range, evidence_type=evidence_type)
+    api_key = _api_key()
+    effective_model, effective_max_output_tokens = _effective_model_and_budget(
+        model=model,
+        max_output_tokens=max_output_tokens,
+        prompt_payload=prompt_payload,
+        default_max_output_tokens=settings.BULLETPOINTS_LLM_MAX_OUTPUT_TOKENS,
+    )
+    return _BulletPointRequest(
+        api_key=api_key,
+        model=effective_model,
+        max_output_tokens=effective_max_output_tokens,
+        evidence_type=evidence_type,
+        count_range=count_range,
+        instructions=instructions,
+        prompt_payload=prompt_payload,
+        schema=schema,
+    )
 
-    api_key = getattr(settings, "OPENAI_API_KEY", "")
-    if not api_key.strip():
-        raise BulletPointLLMClientError("OPENAI_API_KEY is required for bullet-point generation")
 
-    effective_model = model if model is not None else settings.BULLETPOINTS_LLM_MODEL
-    effective_max_output_tokens = (
-        max_output_tokens
-        if max_output_tokens is not None
-        else settings.BULLETPOINTS_LLM_MAX_OUTPUT_TOKENS
+def _prepare_bulletpoint_batch_request(
+    *,
+    context: BulletJobContext,
+    records: list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]],
+    model: str | None,
+    max_output_tokens: int | None,
+) -> _BulletPointBatchRequest:
+    if not records:
+        raise BulletPointLLMClientError("Bullet-point batch requires at least one record")
+
+    count_ranges: dict[str, BulletCountRange] = {}
+    for project, experience, count_range in records:
+        evidence_type, evidence_payload = _build_evidence_payload(
+            project=project,
+            experience=experience,
+        )
+        key = bulletpoint_record_key(evidence_type, evidence_payload["id"])
+        if key in count_ranges:
+            raise BulletPointLLMClientError(f"Duplicate bullet-point batch record: {key}")
+        count_ranges[key] = count_range
+
+    prompt_payload = build_bulletpoint_batch_prompt_payload(context=context, records=records)
+    api_key = _api_key()
+    # The per-record default scales with the batch; the learned budget takes over
+    # once batches of this prompt size have completed.
+    effective_model, effective_max_output_tokens = _effective_model_and_budget(
+        model=model,
+        max_output_tokens=max_output_tokens,
+        prompt_payload=prompt_payload,
+        default_max_output_tokens=settings.BULLETPOINTS_LLM_MAX_OUTPUT_TOKENS * len(records),
+    )
+    return _BulletPointBatchRequest(
+        api_key=api_key,
+        model=effective_model,
+        max_output_tokens=effective_max_output_tokens,
+        count_ranges=count_ranges,
+        instructions=build_bulletpoint_batch_instructions(),
+        prompt_payload=prompt_payload,
+        schema=build_bulletpoint_batch_schema(count_ranges),
+    )
+
+
+def _observe_output_budget(
+    request: _BulletPointRequest | _BulletPointBatchRequest,
+    attempts: list[dict[str, Any]],
+    *,
+    succeeded: bool,
+) -> None:
+    output_budgets.observe(
+        subsystem=METRICS_SUBSYSTEM,
+        model=request.model,
+        input_size=len(request.prompt_payload),
+        attempts=attempts,
+        succeeded=succeeded,
+    )
+
+
+def _request_error(
+    exc: Exception,
+    request: _BulletPointRequest | _BulletPointBatchRequest,
+    *,
+    attempt: int,
+) -> BulletPointLLMClientError:
+    logger.exception(
+        "bulletpoints_llm_request_failed",
+        extra={
+            "event": "bulletpoints_llm_request_failed",
+            "subsystem": "bulletpoints_generation",
+            "model": request.model,
+            "attempt": attempt,
+        },
     )
+    return BulletPointLLMClientError(f"Bullet-point LLM request failed: {exc}")
 
+
+def _validated_exchange(
+    request: _BulletPointRequest | _BulletPointBatchRequest,
+    validate: Callable[[Any], T],
+    hedge: HedgedCreate | None = None,
+) -> ResponseExchange[tuple[T, dict[str, Any]]]:
+    """Request, retry, and parse loop shared by single-record and batch generation."""
     start = time.perf_counter()
     attempts: list[dict[str, Any]] = []
     retry_reason: str | None = None
 
-    try:
-        client = OpenAI(api_key=api_key)
-    except Exception as exc:
-        logger.exception(
-            "bulletpoints_llm_request_failed",
-            extra={
-                "event": "bulletpoints_llm_request_failed",
-                "subsystem": "bulletpoints_generation",
-                "model": effective_model,
-                "attempt": 0,
-            },
-        )
-        raise BulletPointLLMClientError(
-            f"Bullet-point LLM request failed: {exc}"
-        ) from exc
     max_output_tokens_by_attempt = [
-        effective_max_output_tokens,
-        max(effective_max_output_tokens * 2, 3000),
+        request.max_output_tokens,
+        max(request.max_output_tokens * 2, 3000),
     ]
 
     for attempt_index, attempt_max_output_tokens in enumerate(
@@ -301,32 +566,22 @@ def generate_bulletpoints_with_llm(
     ):
         try:
             create_kwargs = build_bulletpoint_response_create_kwargs(
-                model=effective_model,
-                instructions=instructions,
-                prompt_payload=prompt_payload,
-                schema=schema,
+                model=request.model,
+                instructions=request.instructions,
+                prompt_payload=request.prompt_payload,
+                schema=request.schema,
                 max_output_tokens=attempt_max_output_tokens,
-                schema_name=f"{evidence_type}_bullet_points",
+                schema_name=request.schema_name,
             )
-            response = client.responses.create(**create_kwargs)
+            response = yield create_kwargs
         except Exception as exc:
-            logger.exception(
-                "bulletpoints_llm_request_failed",
-                extra={
-                    "event": "bulletpoints_llm_request_failed",
-                    "subsystem": "bulletpoints_generation",
-                    "model": effective_model,
-                    "attempt": attempt_index,
-                },
-            )
-            raise BulletPointLLMClientError(
-                f"Bullet-point LLM request failed: {exc}"
-            ) from exc
+            raise _request_error(exc, request, attempt=attempt_index) from exc
 
         attempt_metadata = {
             "attempt": attempt_index,
             "max_output_tokens": attempt_max_output_tokens,
             **_usage_metadata(response),
+            **(hedge.attempt_metadata() if hedge is not None else {}),
         }
         attempts.append(attempt_metadata)
 
@@ -341,18 +596,20 @@ def generate_bulletpoints_with_llm(
                 retry_reason = f"Bullet-point LLM response was not valid JSON: {exc}"
                 attempt_metadata["error"] = retry_reason
             else:
-                bullets = _validate_bullet_points(raw_response, count_range)
+                _observe_output_budget(request, attempts, succeeded=True)
+                validated = validate(raw_response)
                 latency_ms = (time.perf_counter() - start) * 1000.0
                 metadata = _aggregate_attempt_metadata(
                     attempts,
-                    model=effective_model,
+                    model=request.model,
                     latency_ms=latency_ms,
                 )
                 if retry_reason is not None:
                     metadata["retry_reason"] = retry_reason
-                return LLMBulletPointResult(bullet_points=bullets, metadata=metadata)
+                return validated, metadata
 
         if attempt_index == len(max_output_tokens_by_attempt):
+            _observe_output_budget(request, attempts, succeeded=False)
             raise BulletPointLLMClientError(
                 retry_reason or "Bullet-point LLM response could not be parsed"
             )
@@ -362,10 +619,320 @@ def generate_bulletpoints_with_llm(
             extra={
                 "event": "bulletpoints_llm_response_retry",
                 "subsystem": "bulletpoints_generation",
-                "model": effective_model,
+                "model": request.model,
                 "attempt": attempt_index,
                 "retry_reason": retry_reason,
             },
         )
 
     raise BulletPointLLMClientError("Bullet-point LLM response could not be parsed")
+
+
+def _bulletpoint_exchange(
+    request: _BulletPointRequest,
+    hedge: HedgedCreate | None = None,
+) -> ResponseExchange[LLMBulletPointResult]:
+    bullets, metadata = yield from _validated_exchange(
+        request,
+        lambda raw_response: _validate_bullet_points(raw_response, request.count_range),
+        hedge,
+    )
+    return LLMBulletPointResult(bullet_points=bullets, metadata=metadata)
+
+
+def _bulletpoint_batch_exchange(
+    request: _BulletPointBatchRequest,
+) -> ResponseExchange[LLMBulletPointBatchResult]:
+    (bullets_by_key, errors), metadata = yield from _validated_exchange(
+        request,
+        lambda raw_response: _validate_bullet_point_batch(raw_response, request.count_ranges),
+    )
+    if errors:
+        logger.warning(
+            "bulletpoints_llm_batch_records_invalid",
+            extra={
+                "event": "bulletpoints_llm_batch_records_invalid",
+                "subsystem": "bulletpoints_generation",
+                "model": request.model,
+                "record_count": len(request.count_ranges),
+                "invalid_records": sorted(errors),
+            },
+        )
+    return LLMBulletPointBatchResult(
+        bullet_points=bullets_by_key,
+        errors=errors,
+        metadata=metadata,
+    )
+
+
+def generate_bulletpoints_with_llm(
+    *,
+    context: BulletJobContext,
+    count_range: BulletCountRange,
+    project: ProjectRecord | None = None,
+    experience: ExperienceRecord | None = None,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMBulletPointResult:
+    request = _prepare_bulletpoint_request(
+        context=context,
+        count_range=count_range,
+        project=project,
+        experience=experience,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    return run_response_exchange(_bulletpoint_exchange(request), client.responses.create)
+
+
+async def generate_bulletpoints_with_llm_async(
+    *,
+    context: BulletJobContext,
+    count_range: BulletCountRange,
+    project: ProjectRecord | None = None,
+    experience: ExperienceRecord | None = None,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMBulletPointResult:
+    request = _prepare_bulletpoint_request(
+        context=context,
+        count_range=count_range,
+        project=project,
+        experience=experience,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    hedge = HedgedCreate(
+        client.responses.create,
+        subsystem=METRICS_SUBSYSTEM,
+        usage=_usage_metadata,
+    )
+    return await run_response_exchange_async(_bulletpoint_exchange(request, hedge), hedge)
+
+
+def generate_bulletpoints_batch_with_llm(
+    *,
+    context: BulletJobContext,
+    records: list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMBulletPointBatchResult:
+    """Generate bullets for several `(project, experience, count_range)` records in one call.
+
+    Each record has exactly one of project or experience. The job context and
+    instructions are sent once, and each record gets its own schema property keyed by
+    `bulletpoint_record_key`, so counts are enforced per record. A record that fails
+    validation is reported in `errors` instead of failing the batch.
+    """
+    request = _prepare_bulletpoint_batch_request(
+        context=context,
+        records=records,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    return run_response_exchange(_bulletpoint_batch_exchange(request), client.responses.create)
+
+
+async def generate_bulletpoints_batch_with_llm_async(
+    *,
+    context: BulletJobContext,
+    records: list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMBulletPointBatchResult:
+    """`generate_bulletpoints_batch_with_llm` on the async OpenAI client."""
+    request = _prepare_bulletpoint_batch_request(
+        context=context,
+        records=records,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    return await run_response_exchange_async(
+        _bulletpoint_batch_exchange(request),
+        client.responses.create,
+    )
+
+
+class _BulletArrayParser:
+    """Pulls completed strings out of a streamed `{"bullet_points": [...]}` document.
+
+    The strict schema has a single array property, so every string after the first
+    `[` is a bullet. Escapes are honored, and each string is decoded with `json` once
+    its closing quote arrives.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._position = 0
+        self._in_array = False
+        self._string_start: int | None = None
+        self._escaped = False
+
+    def feed(self, delta: str) -> list[str]:
+        self.text += delta
+        completed: list[str] = []
+        while self._position < len(self.text):
+            char = self.text[self._position]
+            if not self._in_array:
+                self._in_array = char == "["
+            elif self._string_start is not None:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    literal = self.text[self._string_start : self._position + 1]
+                    try:
+                        completed.append(json.loads(literal))
+                    except json.JSONDecodeError as exc:
+                        raise BulletPointLLMClientError(
+                            f"Bullet-point LLM stream had an invalid string: {exc}"
+                        ) from exc
+                    self._string_start = None
+            elif char == '"':
+                self._string_start = self._position
+            self._position += 1
+        return completed
+
+
+async def stream_bulletpoints_with_llm_async(
+    *,
+    context: BulletJobContext,
+    count_range: BulletCountRange,
+    project: ProjectRecord | None = None,
+    experience: ExperienceRecord | None = None,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> AsyncIterator[StreamedBulletPoint | LLMBulletPointResult]:
+    """Stream bullets from the Responses API as each one is complete and valid.
+
+    Yields a `StreamedBulletPoint` per bullet, then an `LLMBulletPointResult` with all
+    bullets and the usage metadata. Each bullet is checked with the
+    `_validate_bullet_points` rules as soon as it arrives. The maximum count is enforced
+    as bullets arrive, and the full response is validated at the end. An attempt that
+    fails before any bullet is emitted is retried with a larger output budget, as in
+    `generate_bulletpoints_with_llm`. After a bullet has been emitted, a failure raises
+    `BulletPointLLMClientError`.
+    """
+    request = _prepare_bulletpoint_request(
+        context=context,
+        count_range=count_range,
+        project=project,
+        experience=experience,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+
+    start = time.perf_counter()
+    attempts: list[dict[str, Any]] = []
+    retry_reason: str | None = None
+    bullets: list[str] = []
+    first_bullet_ms: float | None = None
+
+    max_output_tokens_by_attempt = [
+        request.max_output_tokens,
+        max(request.max_output_tokens * 2, 3000),
+    ]
+
+    for attempt_index, attempt_max_output_tokens in enumerate(
+        max_output_tokens_by_attempt,
+        start=1,
+    ):
+        create_kwargs = build_bulletpoint_response_create_kwargs(
+            model=request.model,
+            instructions=request.instructions,
+            prompt_payload=request.prompt_payload,
+            schema=request.schema,
+            max_output_tokens=attempt_max_output_tokens,
+            schema_name=request.schema_name,
+        )
+        parser = _BulletArrayParser()
+        final_response: Any = None
+        try:
+            async for event in scheduled_stream_async(client.responses.create, create_kwargs):
+                if event.type == "response.output_text.delta":
+                    for raw_bullet in parser.feed(event.delta):
+                        bullet = _validate_bullet_point(len(bullets) + 1, raw_bullet)
+                        if len(bullets) == request.count_range.max:
+                            _validate_bullet_count(len(bullets) + 1, request.count_range)
+                        bullets.append(bullet)
+                        if first_bullet_ms is None:
+                            first_bullet_ms = (time.perf_counter() - start) * 1000.0
+                        yield StreamedBulletPoint(index=len(bullets) - 1, text=bullet)
+                elif event.type in {"response.completed", "response.incomplete"}:
+                    final_response = event.response
+                elif event.type in {"response.failed", "error"}:
+                    raise BulletPointLLMClientError(f"Bullet-point LLM stream failed: {event.type}")
+        except BulletPointLLMClientError:
+            raise
+        except Exception as exc:
+            raise _request_error(exc, request, attempt=attempt_index) from exc
+
+        attempt_metadata = {
+            "attempt": attempt_index,
+            "max_output_tokens": attempt_max_output_tokens,
+            **_usage_metadata(final_response),
+        }
+        attempts.append(attempt_metadata)
+
+        if final_response is None:
+            retry_reason = "Bullet-point LLM stream ended without a final response"
+            attempt_metadata["error"] = retry_reason
+        else:
+            try:
+                raw_response = json.loads(parser.text)
+            except json.JSONDecodeError as exc:
+                retry_reason = f"Bullet-point LLM response was not valid JSON: {exc}"
+                attempt_metadata["error"] = retry_reason
+            else:
+                _observe_output_budget(request, attempts, succeeded=True)
+                if _validate_bullet_points(raw_response, request.count_range) != bullets:
+                    raise BulletPointLLMClientError(
+                        "Bullet-point LLM stream did not match its final response"
+                    )
+                metadata = _aggregate_attempt_metadata(
+                    attempts,
+                    model=request.model,
+                    latency_ms=(time.perf_counter() - start) * 1000.0,
+                )
+                metadata["first_bullet_ms"] = round(first_bullet_ms or 0.0, 3)
+                if retry_reason is not None:
+                    metadata["retry_reason"] = retry_reason
+                yield LLMBulletPointResult(bullet_points=bullets, metadata=metadata)
+                return
+
+        if bullets or attempt_index == len(max_output_tokens_by_attempt):
+            _observe_output_budget(request, attempts, succeeded=False)
+            raise BulletPointLLMClientError(retry_reason)
+
+        logger.warning(
+            "bulletpoints_llm_response_retry",
+            extra={
+                "event": "bulletpoints_llm_response_retry",
+                "subsystem": "bulletpoints_generation",
+                "model": request.model,
+                "attempt": attempt_index,
+                "retry_reason": retry_reason,
+                "streamed": True,
+            },
+        )
@@ -97,3 +97,92 @@ class BulletGenerationRequest(StrictSchemaModel):
 class BulletGenerationResponse(StrictSchemaModel):
     bullet_points: list[str]
     details: dict[str, Any] | None = None
+
+
+class BulletBatchRecord(StrictSchemaModel):
+    project: ProjectRecord | None = None
+    experience: ExperienceRecord | None = None
+    bullet_count_range: BulletCountRange | None = None
+
+    @model_validator(mode="after")
+    def validate_single_evidence_record(self) -> "BulletBatchRecord":
+        evidence_count = int(self.project is not None) + int(self.experience is not None)
+        if evidence_count != 1:
+            raise ValueError("Exactly one of project or experience must be provided")
+        return self
+
+    @property
+    def evidence_type(self) -> Literal["project", "experience"]:
+        return "project" if self.project is not None else "experience"
+
+    @property
+    def evidence_id(self) -> str:
+        if self.project is not None:
+            return self.project.id
+        if self.experience is not None:
+            return self.experience.id
+        raise ValueError("Exactly one of project or experience must be provided")
+
+
+class BulletGenerationBatchRequest(StrictSchemaModel):
+    context: BulletJobContext
+    records: list[BulletBatchRecord]
+    dev_mode: bool | None = None
+    llm_model: str | None = None
+    llm_max_output_tokens: int | None = None
+
+    @field_validator("records")
+    @classmethod
+    def validate_records(cls, value: list[BulletBatchRecord]) -> list[BulletBatchRecord]:
+        if not value:
+            raise ValueError("records must not be empty")
+        seen: set[tuple[str, str]] = set()
+        for record in value:
+            identity = (record.evidence_type, record.evidence_id)
+            if identity in seen:
+                raise ValueError(f"Duplicate {identity[0]} record: {identity[1]}")
+            seen.add(identity)
+        return value
+
+    @field_validator("llm_model")
+    @classmethod
+    def validate_llm_model(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        normalized = value.strip()
+        if not normalized:
+            raise ValueError("llm_model must not be empty")
+        return normalized
+
+    @field_validator("llm_max_output_tokens")
+    @classmethod
+    def validate_llm_max_output_tokens(cls, value: int | None) -> int | None:
+        if value is not None and value <= 0:
+            raise ValueError("llm_max_output_tokens must be greater than 0")
+        return value
+
+    def record_request(self, record: BulletBatchRecord) -> BulletGenerationRequest:
+        """Expand one batch record into the equivalent single-record request.
+
+        `llm_max_output_tokens` budgets the whole batch, so it is not carried over.
+        """
+        return BulletGenerationRequest(
+            context=self.context,
+            project=record.project,
+            experience=record.experience,
+            bullet_count_range=record.bullet_count_range,
+            dev_mode=self.dev_mode,
+            llm_model=self.llm_model,
+        )
+
+
+class BulletBatchResult(StrictSchemaModel):
+    evidence_type: Literal["project", "experience"]
+    evidence_id: str
+    bullet_points: list[str]
+    details: dict[str, Any] | None = None
+
+
+class BulletGenerationBatchResponse(StrictSchemaModel):
+    results: list[BulletBatchResult]  # One result per record, in request order
+    details: dict[str, Any] | None = None
@@ -1,25 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any
+from typing import Any, AsyncIterator
 
 from app.bulletpoints_generation.llm_client import (
     BulletPointLLMClientError,
+    LLMBulletPointBatchResult,
+    LLMBulletPointResult,
+    StreamedBulletPoint,
+    bulletpoint_record_key,
+    generate_bulletpoints_batch_with_llm,
+    generate_bulletpoints_batch_with_llm_async,
     generate_bulletpoints_with_llm,
+    generate_bulletpoints_with_llm_async,
+    stream_bulletpoints_with_llm_async,
 )
 from app.bulletpoints_generation.models import (
+    BulletBatchRecord,
+    BulletBatchResult,
     BulletCountRange,
+    BulletGenerationBatchRequest,
+    BulletGenerationBatchResponse,
     BulletGenerationRequest,
     BulletGenerationResponse,
 )
 from app.config import settings
 from app.metrics import metrics
+from app.resume_evidence.models import ExperienceRecord, ProjectRecord
+from app.single_flight import SingleFlight, stage_request_key
 
 logger = logging.getLogger("bulletpoints_generator")
 
 METRICS_SUBSYSTEM = "bulletpoints_generation"
 
+# Identical requests that arrive while one is in flight share its LLM call.
+_in_flight: SingleFlight[LLMBulletPointResult] = SingleFlight()
+
 
 class BulletPointGenerationError(RuntimeError):
     """Raised when bullet-point generation cannot complete."""
@@ -46,12 +64,81 @@ def record_bulletpoint_generation_error(method: str = "llm") -> None:
     metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
 
 
-def generate_bulletpoints_service(req: BulletGenerationRequest) -> BulletGenerationResponse:
+def _generation_response(
+    req: BulletGenerationRequest,
+    llm_result: LLMBulletPointResult,
+    *,
+    count_range: BulletCountRange,
+    latency_ms: float,
+    coalesced: bool = False,
+) -> BulletGenerationResponse:
     dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
+    llm_metadata = llm_result.metadata
+    metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
+    if coalesced:
+        metrics.observe_coalesced(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
+    else:
+        metrics.observe_tokens(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
+    metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
+
+    logger.info(
+        "generate_bulletpoints",
+        extra={
+            "event": "generate_bulletpoints",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "evidence_type": req.evidence_type,
+            "evidence_id": req.evidence_id,
+            "method": "llm",
+            "latency_ms": round(latency_ms, 3),
+            "bullet_count": len(llm_result.bullet_points),
+            "coalesced": coalesced,
+        },
+    )
+
+    details: dict[str, Any] | None = None
+    if dev_mode:
+        details = {
+            "method": "llm",
+            "requested_count_range": (
+                req.bullet_count_range.model_dump()
+                if req.bullet_count_range is not None
+                else None
+            ),
+            "effective_count_range": count_range.model_dump(),
+            "evidence_type": req.evidence_type,
+            "_bulletpoints_llm": llm_metadata,
+        }
+
+    return BulletGenerationResponse(
+        bullet_points=llm_result.bullet_points,
+        details=details,
+    )
+
+
+def _generation_error(
+    req: BulletGenerationRequest,
+    exc: BulletPointLLMClientError,
+) -> BulletPointGenerationError:
+    record_bulletpoint_generation_error()
+    logger.warning(
+        "generate_bulletpoints_failed",
+        extra={
+            "event": "generate_bulletpoints_failed",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "evidence_type": req.evidence_type,
+            "evidence_id": req.evidence_id,
+            "method": "llm",
+            "error": str(exc),
+        },
+    )
+    return BulletPointGenerationError(str(exc))
+
+
+def generate_bulletpoints_service(req: BulletGenerationRequest) -> BulletGenerationResponse:
     count_range = effective_bullet_count_range(req.bullet_count_range)
     start = time.perf_counter()
-    request_counted = False
-    llm_metadata: dict[str, Any] | None = None
 
     try:
         llm_result = generate_bulletpoints_with_llm(
@@ -62,61 +149,279 @@ def generate_bulletpoints_service(req: BulletGenerationRequest) -> BulletGenerat
             model=req.llm_model,
             max_output_tokens=req.llm_max_output_tokens,
         )
-        llm_metadata = llm_result.metadata
+    except BulletPointLLMClientError as exc:
+        raise _generation_error(req, exc) from exc
 
-        latency_ms = (time.perf_counter() - start) * 1000.0
-        metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
-        request_counted = True
-        metrics.observe_tokens(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
-        metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
-
-        logger.info(
-            "generate_bulletpoints",
-            extra={
-                "event": "generate_bulletpoints",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.context.title,
-                "evidence_type": req.evidence_type,
-                "evidence_id": req.evidence_id,
-                "method": "llm",
-                "latency_ms": round(latency_ms, 3),
-                "bullet_count": len(llm_result.bullet_points),
-            },
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _generation_response(req, llm_result, count_range=count_range, latency_ms=latency_ms)
+
+
+async def generate_bulletpoints_service_async(req: BulletGenerationRequest) -> BulletGenerationResponse:
+    """`generate_bulletpoints_service` on the async OpenAI client.
+
+    Concurrent requests with an identical payload share one LLM call.
+    """
+    count_range = effective_bullet_count_range(req.bullet_count_range)
+    start = time.perf_counter()
+
+    try:
+        llm_result, coalesced = await _in_flight.run(
+            stage_request_key(
+                stage=f"{req.evidence_type}_bullet_points",
+                payload=req.model_dump(mode="json"),
+            ),
+            lambda: generate_bulletpoints_with_llm_async(
+                context=req.context,
+                project=req.project,
+                experience=req.experience,
+                count_range=count_range,
+                model=req.llm_model,
+                max_output_tokens=req.llm_max_output_tokens,
+            ),
         )
+    except BulletPointLLMClientError as exc:
+        raise _generation_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _generation_response(
+        req,
+        llm_result,
+        count_range=count_range,
+        latency_ms=latency_ms,
+        coalesced=coalesced,
+    )
+
+
+def _batch_records(
+    req: BulletGenerationBatchRequest,
+) -> list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]]:
+    return [
+        (record.project, record.experience, effective_bullet_count_range(record.bullet_count_range))
+        for record in req.records
+    ]
+
+
+def _batch_generation_error(
+    req: BulletGenerationBatchRequest,
+    exc: BulletPointLLMClientError,
+) -> BulletPointGenerationError:
+    record_bulletpoint_generation_error()
+    logger.warning(
+        "generate_bulletpoints_batch_failed",
+        extra={
+            "event": "generate_bulletpoints_batch_failed",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "record_count": len(req.records),
+            "method": "llm",
+            "error": str(exc),
+        },
+    )
+    return BulletPointGenerationError(str(exc))
+
+
+def _records_to_regenerate(
+    req: BulletGenerationBatchRequest,
+    llm_result: LLMBulletPointBatchResult,
+) -> list[BulletBatchRecord]:
+    return [
+        record
+        for record in req.records
+        if bulletpoint_record_key(record.evidence_type, record.evidence_id)
+        not in llm_result.bullet_points
+    ]
+
+
+def _batch_generation_response(
+    req: BulletGenerationBatchRequest,
+    llm_result: LLMBulletPointBatchResult,
+    *,
+    records: list[tuple[ProjectRecord | None, ExperienceRecord | None, BulletCountRange]],
+    regenerated: dict[str, BulletGenerationResponse],
+    latency_ms: float,
+) -> BulletGenerationBatchResponse:
+    dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
+    metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
+    metrics.observe_tokens(_extract_total_tokens(llm_result.metadata), subsystem=METRICS_SUBSYSTEM)
+    metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
+
+    results: list[BulletBatchResult] = []
+    for record, (_, _, count_range) in zip(req.records, records):
+        key = bulletpoint_record_key(record.evidence_type, record.evidence_id)
+        fallback = regenerated.get(key)
+        if fallback is not None:
+            results.append(
+                BulletBatchResult(
+                    evidence_type=record.evidence_type,
+                    evidence_id=record.evidence_id,
+                    bullet_points=fallback.bullet_points,
+                    details=fallback.details,
+                )
+            )
+            continue
 
         details: dict[str, Any] | None = None
         if dev_mode:
             details = {
                 "method": "llm",
+                "batched": True,
                 "requested_count_range": (
-                    req.bullet_count_range.model_dump()
-                    if req.bullet_count_range is not None
+                    record.bullet_count_range.model_dump()
+                    if record.bullet_count_range is not None
                     else None
                 ),
                 "effective_count_range": count_range.model_dump(),
-                "evidence_type": req.evidence_type,
-                "_bulletpoints_llm": llm_metadata,
+                "evidence_type": record.evidence_type,
             }
-
-        return BulletGenerationResponse(
-            bullet_points=llm_result.bullet_points,
-            details=details,
+        results.append(
+            BulletBatchResult(
+                evidence_type=record.evidence_type,
+                evidence_id=record.evidence_id,
+                bullet_points=llm_result.bullet_points[key],
+                details=details,
+            )
         )
 
+    logger.info(
+        "generate_bulletpoints_batch",
+        extra={
+            "event": "generate_bulletpoints_batch",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "record_count": len(req.records),
+            "regenerated_records": sorted(llm_result.errors),
+            "method": "llm",
+            "latency_ms": round(latency_ms, 3),
+        },
+    )
+
+    batch_details: dict[str, Any] | None = None
+    if dev_mode:
+        batch_details = {
+            "method": "llm",
+            "record_count": len(req.records),
+            "regenerated_records": sorted(llm_result.errors),
+            "_bulletpoints_llm": llm_result.metadata,
+        }
+    return BulletGenerationBatchResponse(results=results, details=batch_details)
+
+
+def generate_bulletpoints_batch_service(
+    req: BulletGenerationBatchRequest,
+) -> BulletGenerationBatchResponse:
+    """Generate bullets for every record in one LLM call.
+
+    Results are validated per record. A record whose bullets fail validation is
+    regenerated on its own with `generate_bulletpoints_service`, so one bad record
+    does not cost the rest of the batch.
+    """
+    records = _batch_records(req)
+    start = time.perf_counter()
+
+    try:
+        llm_result = generate_bulletpoints_batch_with_llm(
+            context=req.context,
+            records=records,
+            model=req.llm_model,
+            max_output_tokens=req.llm_max_output_tokens,
+        )
     except BulletPointLLMClientError as exc:
-        if not request_counted:
-            metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
-        metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
-        logger.warning(
-            "generate_bulletpoints_failed",
-            extra={
-                "event": "generate_bulletpoints_failed",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.context.title,
-                "evidence_type": req.evidence_type,
-                "evidence_id": req.evidence_id,
-                "method": "llm",
-                "error": str(exc),
-            },
+        raise _batch_generation_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    regenerated = {
+        bulletpoint_record_key(record.evidence_type, record.evidence_id): (
+            generate_bulletpoints_service(req.record_request(record))
+        )
+        for record in _records_to_regenerate(req, llm_result)
+    }
+    return _batch_generation_response(
+        req,
+        llm_result,
+        records=records,
+        regenerated=regenerated,
+        latency_ms=latency_ms,
+    )
+
+
+async def generate_bulletpoints_batch_service_async(
+    req: BulletGenerationBatchRequest,
+) -> BulletGenerationBatchResponse:
+    """`generate_bulletpoints_batch_service` on the async OpenAI client.
+
+    Records that fail validation are regenerated concurrently.
+    """
+    records = _batch_records(req)
+    start = time.perf_counter()
+
+    try:
+        llm_result = await generate_bulletpoints_batch_with_llm_async(
+            context=req.context,
+            records=records,
+            model=req.llm_model,
+            max_output_tokens=req.llm_max_output_tokens,
         )
-        raise BulletPointGenerationError(str(exc)) from exc
+    except BulletPointLLMClientError as exc:
+        raise _batch_generation_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    to_regenerate = _records_to_regenerate(req, llm_result)
+    responses = await asyncio.gather(
+        *(generate_bulletpoints_service_async(req.record_request(record)) for record in to_regenerate)
+    )
+    regenerated = {
+        bulletpoint_record_key(record.evidence_type, record.evidence_id): response
+        for record, response in zip(to_regenerate, responses)
+    }
+    return _batch_generation_response(
+        req,
+        llm_result,
+        records=records,
+        regenerated=regenerated,
+        latency_ms=latency_ms,
+    )
+
+
+async def stream_bulletpoints_service(
+    req: BulletGenerationRequest,
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """`generate_bulletpoints_service` as `(event, data)` pairs for Server-Sent Events.
+
+    Emits `("bullet", {"index", "text"})` for each bullet once it is complete and
+    valid, then `("done", response)`, where response is the `BulletGenerationResponse`
+    plus a `usage` summary. A failure after the stream has started is emitted as
+    `("error", {"detail"})`.
+    """
+    count_range = effective_bullet_count_range(req.bullet_count_range)
+    start = time.perf_counter()
+
+    try:
+        async for item in stream_bulletpoints_with_llm_async(
+            context=req.context,
+            project=req.project,
+            experience=req.experience,
+            count_range=count_range,
+            model=req.llm_model,
+            max_output_tokens=req.llm_max_output_tokens,
+        ):
+            if isinstance(item, StreamedBulletPoint):
+                yield "bullet", {"index": item.index, "text": item.text}
+                continue
+
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            response = _generation_response(req, item, count_range=count_range, latency_ms=latency_ms)
+            usage_fields = (
+                "prompt_tokens",
+                "completion_tokens",
+                "total_tokens",
+                "api_calls",
+                "latency_ms",
+                "first_bullet_ms",
+            )
+            yield "done", {
+                **response.model_dump(mode="json"),
+                "usage": {field: item.metadata.get(field) for field in usage_fields},
+            }
+    except BulletPointLLMClientError as exc:
+        error = _generation_error(req, exc)
+        yield "error", {"detail": str(error)}
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Literal
+
+from app.config import settings
+
+logger = logging.getLogger("circuit_breaker")
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one (subsystem, model) pair.
+
+    Callers ask `allow()` before a model call and report the outcome with
+    `record_success(latency_ms)` or `record_failure(reason)`. A success slower than
+    `CIRCUIT_BREAKER_SLOW_CALL_MS` counts as a failure. After
+    `CIRCUIT_BREAKER_FAILURE_THRESHOLD` failures in a row the circuit opens and
+    `allow()` is False, so callers go straight to their baseline path. After
+    `CIRCUIT_BREAKER_OPEN_SECONDS` it is half-open: one probe call is let through, and
+    its outcome closes the circuit or opens it again. A probe that never reports back
+    is replaced after another `CIRCUIT_BREAKER_OPEN_SECONDS`.
+    """
+
+    def __init__(self, subsystem: str, model: str, clock: Callable[[], float] = time.monotonic):
+        self.subsystem = subsystem
+        self.model = model
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        self.opened_total = 0
+        self.short_circuited = 0
+        self.last_failure: str | None = None
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+
+    def allow(self) -> bool:
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return True
+        with self._lock:
+            if self.state == "closed":
+                return True
+            now = self._clock()
+            open_seconds = settings.CIRCUIT_BREAKER_OPEN_SECONDS
+            if self.state == "open" and now - self._opened_at >= open_seconds:
+                self._transition("half_open")
+            if self.state == "half_open" and (
+                self._probe_started is None or now - self._probe_started >= open_seconds
+            ):
+                self._probe_started = now
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_success(self, latency_ms: float) -> None:
+        if latency_ms >= settings.CIRCUIT_BREAKER_SLOW_CALL_MS:
+            self.record_failure(f"slow call: {latency_ms:.0f} ms")
+            return
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != "closed":
+                self._transition("closed")
+
+    def record_failure(self, reason: str) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_failure = reason
+            if self.state == "half_open" or (
+                self.state == "closed"
+                and self.consecutive_failures >= settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+            ):
+                self._opened_at = self._clock()
+                self.opened_total += 1
+                self._transition("open")
+
+    def _transition(self, state: CircuitState) -> None:
+        previous, self.state = self.state, state
+        self._probe_started = None
+        logger.warning(
+            "circuit_breaker_state_changed",
+            extra={
+                "event": "circuit_breaker_state_changed",
+                "subsystem": self.subsystem,
+                "model": self.model,
+                "from_state": previous,
+                "to_state": state,
+                "consecutive_failures": self.consecutive_failures,
+                "last_failure": self.last_failure,
+            },
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == "open":
+                elapsed = self._clock() - self._opened_at
+                retry_in = max(0.0, settings.CIRCUIT_BREAKER_OPEN_SECONDS - elapsed)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "opened_total": self.opened_total,
+                "short_circuited": self.short_circuited,
+                "last_failure": self.last_failure,
+                "retry_in_seconds": round(retry_in, 3),
+            }
+
+
+class CircuitBreakers:
+    """Process-wide breakers, created on first use per (subsystem, model)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, subsystem: str, model: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get((subsystem, model))
+            if breaker is None:
+                breaker = self._breakers[(subsystem, model)] = CircuitBreaker(subsystem, model, self._clock)
+            return breaker
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        snapshot: dict[str, dict[str, dict[str, Any]]] = {}
+        for breaker in breakers:
+            snapshot.setdefault(breaker.subsystem, {})[breaker.model] = breaker.snapshot()
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakers()
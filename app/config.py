@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 SkillSelectionMethod = Literal["baseline", "embeddings", "llm"]
+EmbeddingProviderName = Literal["openai", "local"]
+EmbeddingStoreDtype = Literal["float32", "float16", "int8"]
 ProjectSelectionMethod = Literal["baseline", "llm"]
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -26,17 +28,50 @@ class Settings(BaseSettings):
     DEV_MODE: bool = True
     LOG_LEVEL: str = "INFO"
     RESUME_EVIDENCE_ROOT: Path = _REPO_ROOT / "user" / "resume_evidence"
+    SKILL_POOLS_PATH: Path = _REPO_ROOT / "data" / "skill_pools" / "normalized" / "skill_pools.json"
 
     # Embedding-related settings, only relevant if SKILL_METHOD=embeddings
+    # "local" uses the offline hashed n-gram embedder instead of the OpenAI API.
+    EMBEDDING_PROVIDER: EmbeddingProviderName = "openai"
+    LOCAL_EMBEDDING_DIMENSIONS: int = 512
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     EMBEDDING_BATCH_SIZE: int = 100
+    # Concurrent embedding requests per call, and per-batch retries after a rate limit.
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+    EMBEDDING_RATE_LIMIT_RETRIES: int = 3
     # EMBEDDING_DIMENSIONS: int = 1024 # Optionally reduce dimensionality
+    # Journal size that triggers a background compaction into the embedding stores.
+    EMBEDDING_JOURNAL_COMPACT_BYTES: int = 8 * 1024 * 1024
+    # Skill vector storage: float32, float16, or per-vector-scaled int8 (ranked without decoding).
+    EMBEDDING_SKILL_STORE_DTYPE: EmbeddingStoreDtype = "float32"
+    # Role embeddings are keyed by a digest of the role text and evicted least recently used.
+    ROLE_EMBEDDING_CACHE_MAX_ENTRIES: int = 5000
+    ROLE_EMBEDDING_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # /skills/similar switches from brute force to a cluster-pruned (IVF) index at this many skills.
+    SKILL_INDEX_IVF_THRESHOLD: int = 50_000
+    SKILL_INDEX_IVF_PROBES: int = 8
+    # Pre-embed skill pools and evidence skills in the background at startup.
+    EMBEDDING_PREWARM_ON_STARTUP: bool = False
 
     # LLM-related settings, split by subsystem so selection methods can be tuned independently.
     SKILL_LLM_MODEL: str = "gpt-5-mini"
     SKILL_LLM_MAX_OUTPUT_TOKENS: int = 1200
     PROJ_LLM_MODEL: str = "gpt-5-mini"
     PROJ_LLM_MAX_OUTPUT_TOKENS: int = 1200
+    # Optional in-process cache of /select-skills (embeddings, llm) and /select-projects (llm)
+    # responses; baseline fallbacks are never cached.
+    SELECTION_CACHE_ENABLED: bool = False
+    SELECTION_CACHE_TTL_SECONDS: float = 3600.0
+    SELECTION_CACHE_MAX_ENTRIES: int = 1024
+    # First-attempt max_output_tokens for skill scoring and bullet generation rise to the
+    # percentile of completion tokens seen for similar prompts (times headroom), so
+    # fewer first attempts are truncated and retried. OUTPUT_BUDGET_PATH persists samples.
+    OUTPUT_BUDGET_ADAPTIVE: bool = True
+    OUTPUT_BUDGET_PERCENTILE: float = 0.95
+    OUTPUT_BUDGET_HEADROOM: float = 1.2
+    OUTPUT_BUDGET_MIN_SAMPLES: int = 8
+    OUTPUT_BUDGET_MAX_SAMPLES: int = 256
+    OUTPUT_BUDGET_PATH: Path | None = None
     JOB_FOCUS_LLM_MODEL: str = "gpt-5-mini"
     JOB_FOCUS_LLM_MAX_OUTPUT_TOKENS: int = 1200
     BULLETPOINTS_LLM_MODEL: str = "gpt-5-mini"
@@ -49,8 +84,40 @@ class Settings(BaseSettings):
     LINK_SCANNING_MAX_TOKENS_PER_HIGHLIGHT: int = 120
 
     OPENAI_API_KEY: str = "" # This should be set in the .env file or environment variable
+    OPENAI_BASE_URL: str | None = None # Optional OpenAI-compatible endpoint
+    # Shared HTTP connection pool used by every OpenAI client in the process.
+    OPENAI_MAX_CONNECTIONS: int = 20
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    # Process-wide requests/tokens per minute per model; calls over budget queue, interactive
+    # before batch. Unset means unlimited. OPENAI_MODEL_RATE_LIMITS overrides per model, e.g.
+    # {"gpt-5-mini": {"rpm": 500, "tpm": 200000}}. Batch calls leave the reserve fraction free.
+    OPENAI_RPM_LIMIT: int | None = None
+    OPENAI_TPM_LIMIT: int | None = None
+    OPENAI_MODEL_RATE_LIMITS: dict[str, dict[str, int]] = {}
+    OPENAI_INTERACTIVE_RESERVE: float = 0.1
+    # Per (subsystem, model) breaker for LLM skill/project selection: after this many
+    # consecutive failures or slow calls, requests go straight to baseline until a
+    # half-open probe succeeds, tried every CIRCUIT_BREAKER_OPEN_SECONDS.
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_SLOW_CALL_MS: float = 20000.0
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    # Opt-in hedging for async bullet-point and job-focus calls: a call still running after
+    # this percentile of the subsystem's recent latencies gets a second identical request,
+    # and the first response wins. Needs LLM_HEDGE_MIN_SAMPLES recent latencies.
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_PERCENTILE: float = 0.9
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_WINDOW: int = 200
+    # Record/replay under every responses.create and embeddings.create call: "record" saves
+    # request, response, latency, and usage to LLM_CASSETTE_DIR; "replay" serves them
+    # offline (sleeping for the recorded latency with LLM_CASSETTE_REPLAY_LATENCY).
+    LLM_CASSETTE_MODE: Literal["off", "record", "replay"] = "off"
+    LLM_CASSETTE_DIR: Path = _REPO_ROOT / "user" / "cassettes"
+    LLM_CASSETTE_REPLAY_LATENCY: bool = False
 
-    @field_validator("SKILL_METHOD", "PROJ_METHOD", mode="before")
+    @field_validator("SKILL_METHOD", "PROJ_METHOD", "EMBEDDING_PROVIDER", mode="before")
     @classmethod
     def normalize_method(cls, value: str) -> str:
         if isinstance(value, str):
@@ -77,6 +144,114 @@ class Settings(BaseSettings):
             raise ValueError("LLM max output tokens must be greater than 0")
         return value
 
+    @field_validator(
+        "EMBEDDING_BATCH_SIZE",
+        "EMBEDDING_MAX_CONCURRENCY",
+        "EMBEDDING_JOURNAL_COMPACT_BYTES",
+        "LOCAL_EMBEDDING_DIMENSIONS",
+        "ROLE_EMBEDDING_CACHE_MAX_ENTRIES",
+        "ROLE_EMBEDDING_CACHE_MAX_BYTES",
+        "SKILL_INDEX_IVF_THRESHOLD",
+        "SKILL_INDEX_IVF_PROBES",
+    )
+    @classmethod
+    def validate_positive_embedding_ints(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("Embedding batch sizes, concurrency, cache limits, and journal thresholds must be greater than 0")
+        return value
+
+    @field_validator("SELECTION_CACHE_TTL_SECONDS", "SELECTION_CACHE_MAX_ENTRIES")
+    @classmethod
+    def validate_positive_selection_cache_limits(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("Selection cache TTL and size limits must be greater than 0")
+        return value
+
+    @field_validator("OUTPUT_BUDGET_PERCENTILE")
+    @classmethod
+    def validate_output_budget_percentile(cls, value: float) -> float:
+        if value <= 0 or value > 1:
+            raise ValueError("OUTPUT_BUDGET_PERCENTILE must be greater than 0 and at most 1")
+        return value
+
+    @field_validator("OUTPUT_BUDGET_HEADROOM")
+    @classmethod
+    def validate_output_budget_headroom(cls, value: float) -> float:
+        if value < 1:
+            raise ValueError("OUTPUT_BUDGET_HEADROOM must be at least 1")
+        return value
+
+    @field_validator("OUTPUT_BUDGET_MIN_SAMPLES", "OUTPUT_BUDGET_MAX_SAMPLES")
+    @classmethod
+    def validate_output_budget_samples(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("Output budget sample counts must be greater than 0")
+        return value
+
+    @field_validator("OPENAI_MAX_CONNECTIONS", "OPENAI_MAX_KEEPALIVE_CONNECTIONS", "OPENAI_KEEPALIVE_EXPIRY_SECONDS")
+    @classmethod
+    def validate_positive_openai_pool_limits(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("OpenAI connection pool limits must be greater than 0")
+        return value
+
+    @field_validator("OPENAI_RPM_LIMIT", "OPENAI_TPM_LIMIT")
+    @classmethod
+    def validate_openai_rate_limits(cls, value: int | None) -> int | None:
+        if value is not None and value <= 0:
+            raise ValueError("OpenAI rate limits must be greater than 0")
+        return value
+
+    @field_validator("OPENAI_MODEL_RATE_LIMITS")
+    @classmethod
+    def validate_openai_model_rate_limits(cls, value: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+        for model, limits in value.items():
+            unknown = set(limits) - {"rpm", "tpm"}
+            if unknown:
+                raise ValueError(f"OPENAI_MODEL_RATE_LIMITS[{model!r}] has unknown keys: {sorted(unknown)}")
+            if any(limit <= 0 for limit in limits.values()):
+                raise ValueError("OpenAI rate limits must be greater than 0")
+        return value
+
+    @field_validator("OPENAI_INTERACTIVE_RESERVE")
+    @classmethod
+    def validate_openai_interactive_reserve(cls, value: float) -> float:
+        if value < 0 or value >= 1:
+            raise ValueError("OPENAI_INTERACTIVE_RESERVE must be at least 0 and less than 1")
+        return value
+
+    @field_validator(
+        "CIRCUIT_BREAKER_FAILURE_THRESHOLD",
+        "CIRCUIT_BREAKER_SLOW_CALL_MS",
+        "CIRCUIT_BREAKER_OPEN_SECONDS",
+    )
+    @classmethod
+    def validate_positive_circuit_breaker_limits(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("Circuit breaker thresholds and open duration must be greater than 0")
+        return value
+
+    @field_validator("LLM_HEDGE_PERCENTILE")
+    @classmethod
+    def validate_llm_hedge_percentile(cls, value: float) -> float:
+        if value <= 0 or value >= 1:
+            raise ValueError("LLM_HEDGE_PERCENTILE must be greater than 0 and less than 1")
+        return value
+
+    @field_validator("LLM_HEDGE_MIN_SAMPLES", "LLM_HEDGE_WINDOW")
+    @classmethod
+    def validate_llm_hedge_samples(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("LLM hedge sample counts must be greater than 0")
+        return value
+
+    @field_validator("EMBEDDING_RATE_LIMIT_RETRIES")
+    @classmethod
+    def validate_embedding_rate_limit_retries(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("EMBEDDING_RATE_LIMIT_RETRIES must be 0 or greater")
+        return value
+
     @field_validator(
         "LINK_SCANNING_DEFAULT_HIGHLIGHT_COUNT",
         "LINK_SCANNING_MAX_TOKENS_PER_HIGHLIGHT",
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.model_scheduler import scheduled_call_async
+
+logger = logging.getLogger("hedging")
+
+
+class LatencyWindows:
+    """Recent successful model-call latencies per subsystem."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+
+    def observe(self, subsystem: str, latency_ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(subsystem)
+            if samples is None or samples.maxlen != settings.LLM_HEDGE_WINDOW:
+                samples = self._samples[subsystem] = deque(samples or (), maxlen=settings.LLM_HEDGE_WINDOW)
+            samples.append(latency_ms)
+
+    def hedge_delay_ms(self, subsystem: str) -> float | None:
+        """`LLM_HEDGE_PERCENTILE` of recent latencies, or None below `LLM_HEDGE_MIN_SAMPLES`."""
+        with self._lock:
+            samples = sorted(self._samples.get(subsystem, ()))
+        if len(samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return None
+        # Nearest-rank percentile.
+        rank = max(1, math.ceil(settings.LLM_HEDGE_PERCENTILE * len(samples)))
+        return samples[rank - 1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+latency_windows = LatencyWindows()
+
+
+class HedgedCreate:
+    """Awaitable `responses.create` that sends a backup request when the first is slow.
+
+    With `LLM_HEDGE_ENABLED`, a call still running after the subsystem's recent
+    `LLM_HEDGE_PERCENTILE` latency gets a second, identical request. The first
+    response to arrive is used and the other request is cancelled; if one of them
+    fails, the other is awaited instead. Without enough latency samples, calls are
+    sent once. The backup request waits for the model scheduler like any other call.
+
+    The exchange reads `attempt_metadata()` after each response: a hedged call reports
+    the winner, the delay, and the usage of the other request. A cancelled request's
+    usage is unknown, so its prompt tokens are estimated from the winner's (the prompt
+    is identical) and it is flagged `estimated`.
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        *,
+        subsystem: str,
+        usage: Callable[[Any], dict[str, int]],
+    ) -> None:
+        self._create = create
+        self.subsystem = subsystem
+        self._usage = usage
+        self._last: dict[str, Any] | None = None
+
+    async def __call__(self, **request: Any) -> Any:
+        self._last = None
+        start = time.perf_counter()
+        delay_ms = latency_windows.hedge_delay_ms(self.subsystem) if settings.LLM_HEDGE_ENABLED else None
+        if delay_ms is None:
+            response = await self._create(**request)
+            latency_windows.observe(self.subsystem, (time.perf_counter() - start) * 1000.0)
+            return response
+
+        primary = asyncio.ensure_future(self._create(**request))
+        tasks = {primary: "primary"}
+        try:
+            done, _pending = await asyncio.wait({primary}, timeout=delay_ms / 1000.0)
+            if done:
+                response = primary.result()
+                latency_windows.observe(self.subsystem, (time.perf_counter() - start) * 1000.0)
+                return response
+
+            logger.info(
+                "llm_hedge_fired",
+                extra={
+                    "event": "llm_hedge_fired",
+                    "subsystem": self.subsystem,
+                    "model": request.get("model"),
+                    "hedge_delay_ms": round(delay_ms, 3),
+                },
+            )
+            backup = asyncio.ensure_future(scheduled_call_async(self._create, request))
+            tasks[backup] = "hedge"
+            pending = set(tasks)
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None:
+                    first_error = first_error or next(iter(done)).exception()
+                    continue
+                response = winner.result()
+                latency_windows.observe(self.subsystem, (time.perf_counter() - start) * 1000.0)
+                loser = next(task for task in tasks if task is not winner)
+                self._last = self._hedge_metadata(
+                    winner=tasks[winner],
+                    delay_ms=delay_ms,
+                    response=response,
+                    loser=loser,
+                )
+                return response
+            assert first_error is not None
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _hedge_metadata(
+        self,
+        *,
+        winner: str,
+        delay_ms: float,
+        response: Any,
+        loser: asyncio.Future,
+    ) -> dict[str, Any]:
+        if loser.done() and loser.exception() is None:
+            loser_usage: dict[str, Any] = {"cancelled": False, **self._usage(loser.result())}
+        elif loser.done():
+            loser_usage = {
+                "cancelled": False,
+                "failed": True,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+            }
+        else:
+            prompt_tokens = self._usage(response).get("prompt_tokens", 0)
+            loser_usage = {
+                "cancelled": True,
+                "estimated": True,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": 0,
+                "total_tokens": prompt_tokens,
+            }
+        return {"winner": winner, "delay_ms": round(delay_ms, 3), **loser_usage}
+
+    def attempt_metadata(self) -> dict[str, Any]:
+        """`{"hedge": {...}}` for the last call if it was hedged, else `{}`."""
+        return {"hedge": self._last} if self._last is not None else {}
+
+
+def hedge_tokens(attempts: list[dict[str, Any]]) -> int:
+    """Tokens spent by the losing requests of hedged attempts."""
+    return sum(int((attempt.get("hedge") or {}).get("total_tokens", 0) or 0) for attempt in attempts)
@@ -2,11 +2,13 @@ from app.job_focus_generation.llm_client import (
     JobFocusLLMClientError,
     LLMJobFocusResult,
     derive_job_focus_with_llm,
+    derive_job_focus_with_llm_async,
 )
 from app.job_focus_generation.models import JobFocus, JobFocusRequest, JobFocusResponse
 from app.job_focus_generation.service import (
     JobFocusGenerationError,
     derive_job_focus_service,
+    derive_job_focus_service_async,
     record_job_focus_generation_error,
 )
 
@@ -18,6 +20,8 @@ __all__ = [
     "JobFocusResponse",
     "LLMJobFocusResult",
     "derive_job_focus_service",
+    "derive_job_focus_service_async",
     "derive_job_focus_with_llm",
+    "derive_job_focus_with_llm_async",
     "record_job_focus_generation_error",
 ]
@@ -6,14 +6,25 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.hedging import HedgedCreate, hedge_tokens
+from app.openai_clients import (
+    ResponseExchange,
+    get_async_openai_client,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
 from app.job_focus_generation.models import JobFocus
 from app.skill_selection.llm_client import _extract_output_text, supports_temperature
 
 logger = logging.getLogger("job_focus_llm_client")
 
+METRICS_SUBSYSTEM = "job_focus_generation"
+
 
 class JobFocusLLMClientError(RuntimeError):
     """Raised when a job-focus LLM request or response cannot be used."""
@@ -106,7 +117,8 @@ def _aggregate_attempt_metadata(
     model: str,
     latency_ms: float,
 ) -> dict[str, Any]:
-    return {
+    hedged_tokens = hedge_tokens(attempts)
+    metadata = {
         "model": model,
         "api_calls": len(attempts),
         "latency_ms": round(latency_ms, 3),
@@ -114,9 +126,13 @@ def _aggregate_attempt_metadata(
         "completion_tokens": sum(
             int(attempt.get("completion_tokens", 0) or 0) for attempt in attempts
         ),
-        "total_tokens": sum(int(attempt.get("total_tokens", 0) or 0) for attempt in attempts),
+        "total_tokens": sum(int(attempt.get("total_tokens", 0) or 0) for attempt in attempts)
+        + hedged_tokens,
         "attempts": attempts,
     }
+    if hedged_tokens:
+        metadata["hedge_tokens"] = hedged_tokens
+    return metadata
 
 
 def build_job_focus_response_create_kwargs(
@@ -156,13 +172,23 @@ def _validate_job_focus(raw_response: Any) -> JobFocus:
         raise JobFocusLLMClientError(f"Job-focus LLM response was invalid: {exc}") from exc
 
 
-def derive_job_focus_with_llm(
+@dataclass
+class _JobFocusRequest:
+    api_key: str
+    model: str
+    max_output_tokens: int
+    instructions: str
+    prompt_payload: str
+    schema: dict[str, Any]
+
+
+def _prepare_job_focus_request(
     *,
     title: str,
     description: str | None,
-    model: str | None = None,
-    max_output_tokens: int | None = None,
-) -> LLMJobFocusResult:
+    model: str | None,
+    max_output_tokens: int | None,
+) -> _JobFocusRequest:
     prompt_payload = build_job_focus_prompt_payload(
         title=title,
         description=description,
@@ -170,8 +196,8 @@ def derive_job_focus_with_llm(
     schema = build_job_focus_schema()
     instructions = build_job_focus_instructions()
 
-    api_key = getattr(settings, "OPENAI_API_KEY", "")
-    if not api_key.strip():
+    api_key = openai_api_key()
+    if not api_key:
         raise JobFocusLLMClientError("OPENAI_API_KEY is required for job-focus generation")
 
     effective_model = model if model is not None else settings.JOB_FOCUS_LLM_MODEL
@@ -180,28 +206,40 @@ def derive_job_focus_with_llm(
         if max_output_tokens is not None
         else settings.JOB_FOCUS_LLM_MAX_OUTPUT_TOKENS
     )
+    return _JobFocusRequest(
+        api_key=api_key,
+        model=effective_model,
+        max_output_tokens=effective_max_output_tokens,
+        instructions=instructions,
+        prompt_payload=prompt_payload,
+        schema=schema,
+    )
+
+
+def _request_error(exc: Exception, request: _JobFocusRequest, *, attempt: int) -> JobFocusLLMClientError:
+    logger.exception(
+        "job_focus_llm_request_failed",
+        extra={
+            "event": "job_focus_llm_request_failed",
+            "subsystem": "job_focus_generation",
+            "model": request.model,
+            "attempt": attempt,
+        },
+    )
+    return JobFocusLLMClientError(f"Job-focus LLM request failed: {exc}")
+
 
+def _job_focus_exchange(
+    request: _JobFocusRequest,
+    hedge: HedgedCreate | None = None,
+) -> ResponseExchange[LLMJobFocusResult]:
     start = time.perf_counter()
     attempts: list[dict[str, Any]] = []
     retry_reason: str | None = None
 
-    try:
-        client = OpenAI(api_key=api_key)
-    except Exception as exc:
-        logger.exception(
-            "job_focus_llm_request_failed",
-            extra={
-                "event": "job_focus_llm_request_failed",
-                "subsystem": "job_focus_generation",
-                "model": effective_model,
-                "attempt": 0,
-            },
-        )
-        raise JobFocusLLMClientError(f"Job-focus LLM request failed: {exc}") from exc
-
     max_output_tokens_by_attempt = [
-        effective_max_output_tokens,
-        max(effective_max_output_tokens * 2, 1200),
+        request.max_output_tokens,
+        max(request.max_output_tokens * 2, 1200),
     ]
 
     for attempt_index, attempt_max_output_tokens in enumerate(
@@ -210,29 +248,21 @@ def derive_job_focus_with_llm(
     ):
         try:
             create_kwargs = build_job_focus_response_create_kwargs(
-                model=effective_model,
-                instructions=instructions,
-                prompt_payload=prompt_payload,
-                schema=schema,
+                model=request.model,
+                instructions=request.instructions,
+                prompt_payload=request.prompt_payload,
+                schema=request.schema,
                 max_output_tokens=attempt_max_output_tokens,
             )
-            response = client.responses.create(**create_kwargs)
+            response = yield create_kwargs
         except Exception as exc:
-            logger.exception(
-                "job_focus_llm_request_failed",
-                extra={
-                    "event": "job_focus_llm_request_failed",
-                    "subsystem": "job_focus_generation",
-                    "model": effective_model,
-                    "attempt": attempt_index,
-                },
-            )
-            raise JobFocusLLMClientError(f"Job-focus LLM request failed: {exc}") from exc
+            raise _request_error(exc, request, attempt=attempt_index) from exc
 
         attempt_metadata = {
             "attempt": attempt_index,
             "max_output_tokens": attempt_max_output_tokens,
             **_usage_metadata(response),
+            **(hedge.attempt_metadata() if hedge is not None else {}),
         }
         attempts.append(attempt_metadata)
 
@@ -251,7 +281,7 @@ def derive_job_focus_with_llm(
                 latency_ms = (time.perf_counter() - start) * 1000.0
                 metadata = _aggregate_attempt_metadata(
                     attempts,
-                    model=effective_model,
+                    model=request.model,
                     latency_ms=latency_ms,
                 )
                 if retry_reason is not None:
@@ -268,10 +298,55 @@ def derive_job_focus_with_llm(
             extra={
                 "event": "job_focus_llm_response_retry",
                 "subsystem": "job_focus_generation",
-                "model": effective_model,
+                "model": request.model,
                 "attempt": attempt_index,
                 "retry_reason": retry_reason,
             },
         )
 
     raise JobFocusLLMClientError("Job-focus LLM response could not be parsed")
+
+
+def derive_job_focus_with_llm(
+    *,
+    title: str,
+    description: str | None,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMJobFocusResult:
+    request = _prepare_job_focus_request(
+        title=title,
+        description=description,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    return run_response_exchange(_job_focus_exchange(request), client.responses.create)
+
+
+async def derive_job_focus_with_llm_async(
+    *,
+    title: str,
+    description: str | None,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMJobFocusResult:
+    request = _prepare_job_focus_request(
+        title=title,
+        description=description,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request, attempt=0) from exc
+    hedge = HedgedCreate(
+        client.responses.create,
+        subsystem=METRICS_SUBSYSTEM,
+        usage=_usage_metadata,
+    )
+    return await run_response_exchange_async(_job_focus_exchange(request, hedge), hedge)
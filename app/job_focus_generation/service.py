@@ -7,14 +7,21 @@ from typing import Any
 from app.config import settings
 from app.job_focus_generation.llm_client import (
     JobFocusLLMClientError,
+    LLMJobFocusResult,
     derive_job_focus_with_llm,
+    derive_job_focus_with_llm_async,
 )
 from app.job_focus_generation.models import JobFocusRequest, JobFocusResponse
 from app.metrics import metrics
+from app.single_flight import SingleFlight, stage_request_key
 
 logger = logging.getLogger("job_focus_generator")
 
 METRICS_SUBSYSTEM = "job_focus_generation"
+STAGE = "job_focus_generation"
+
+# Identical requests that arrive while one is in flight share its LLM call.
+_in_flight: SingleFlight[LLMJobFocusResult] = SingleFlight()
 
 
 class JobFocusGenerationError(RuntimeError):
@@ -35,11 +42,61 @@ def record_job_focus_generation_error(method: str = "llm") -> None:
     metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
 
 
-def derive_job_focus_service(req: JobFocusRequest) -> JobFocusResponse:
+def _job_focus_response(
+    req: JobFocusRequest,
+    llm_result: LLMJobFocusResult,
+    *,
+    latency_ms: float,
+    coalesced: bool = False,
+) -> JobFocusResponse:
     dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
+    llm_metadata = llm_result.metadata
+    metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
+    if coalesced:
+        metrics.observe_coalesced(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
+    else:
+        metrics.observe_tokens(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
+    metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
+
+    logger.info(
+        "derive_job_focus",
+        extra={
+            "event": "derive_job_focus",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.title,
+            "method": "llm",
+            "latency_ms": round(latency_ms, 3),
+            "coalesced": coalesced,
+        },
+    )
+
+    details: dict[str, Any] | None = None
+    if dev_mode:
+        details = {
+            "method": "llm",
+            "_job_focus_llm": llm_metadata,
+        }
+
+    return JobFocusResponse(job_focus=llm_result.job_focus, details=details)
+
+
+def _generation_error(req: JobFocusRequest, exc: JobFocusLLMClientError) -> JobFocusGenerationError:
+    record_job_focus_generation_error()
+    logger.warning(
+        "derive_job_focus_failed",
+        extra={
+            "event": "derive_job_focus_failed",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.title,
+            "method": "llm",
+            "error": str(exc),
+        },
+    )
+    return JobFocusGenerationError(str(exc))
+
+
+def derive_job_focus_service(req: JobFocusRequest) -> JobFocusResponse:
     start = time.perf_counter()
-    request_counted = False
-    llm_metadata: dict[str, Any] | None = None
 
     try:
         llm_result = derive_job_focus_with_llm(
@@ -48,46 +105,32 @@ def derive_job_focus_service(req: JobFocusRequest) -> JobFocusResponse:
             model=req.llm_model,
             max_output_tokens=req.llm_max_output_tokens,
         )
-        llm_metadata = llm_result.metadata
+    except JobFocusLLMClientError as exc:
+        raise _generation_error(req, exc) from exc
 
-        latency_ms = (time.perf_counter() - start) * 1000.0
-        metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
-        request_counted = True
-        metrics.observe_tokens(_extract_total_tokens(llm_metadata), subsystem=METRICS_SUBSYSTEM)
-        metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
-
-        logger.info(
-            "derive_job_focus",
-            extra={
-                "event": "derive_job_focus",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.title,
-                "method": "llm",
-                "latency_ms": round(latency_ms, 3),
-            },
-        )
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _job_focus_response(req, llm_result, latency_ms=latency_ms)
 
-        details: dict[str, Any] | None = None
-        if dev_mode:
-            details = {
-                "method": "llm",
-                "_job_focus_llm": llm_metadata,
-            }
 
-        return JobFocusResponse(job_focus=llm_result.job_focus, details=details)
+async def derive_job_focus_service_async(req: JobFocusRequest) -> JobFocusResponse:
+    """`derive_job_focus_service` on the async OpenAI client.
 
-    except JobFocusLLMClientError as exc:
-        if not request_counted:
-            metrics.inc_request(method="llm", subsystem=METRICS_SUBSYSTEM)
-        metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
-        logger.warning(
-            "derive_job_focus_failed",
-            extra={
-                "event": "derive_job_focus_failed",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.title,
-                "method": "llm",
-                "error": str(exc),
-            },
+    Concurrent requests with an identical payload share one LLM call.
+    """
+    start = time.perf_counter()
+
+    try:
+        llm_result, coalesced = await _in_flight.run(
+            stage_request_key(stage=STAGE, payload=req.model_dump(mode="json")),
+            lambda: derive_job_focus_with_llm_async(
+                title=req.title,
+                description=req.description,
+                model=req.llm_model,
+                max_output_tokens=req.llm_max_output_tokens,
+            ),
         )
-        raise JobFocusGenerationError(str(exc)) from exc
+    except JobFocusLLMClientError as exc:
+        raise _generation_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _job_focus_response(req, llm_result, latency_ms=latency_ms, coalesced=coalesced)
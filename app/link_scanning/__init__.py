@@ -3,11 +3,12 @@ from app.link_scanning.models import (
     LinkScanRequest,
     LinkScanResponse,
 )
-from app.link_scanning.service import scan_link_evidence_service
+from app.link_scanning.service import scan_link_evidence_service, scan_link_evidence_service_async
 
 __all__ = [
     "LinkScanHighlight",
     "LinkScanRequest",
     "LinkScanResponse",
     "scan_link_evidence_service",
+    "scan_link_evidence_service_async",
 ]
@@ -7,9 +7,17 @@ from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.openai_clients import (
+    ResponseExchange,
+    get_async_openai_client,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
 from app.link_scanning.models import LinkScanHighlight
 from app.skill_selection.llm_client import _extract_output_text, supports_temperature
 from app.resume_evidence.models import ExperienceRecord, ProjectRecord
@@ -408,18 +416,33 @@ def resolve_link_scan_max_output_tokens(
     return effective_highlight_count * effective_max_tokens_per_highlight
 
 
-def scan_evidence_links_with_llm(
+@dataclass
+class _LinkScanRequest:
+    evidence_type: str
+    evidence: LinkScannableEvidence
+    links: list[str]
+    scan_targets: list[LinkScanTarget]
+    model: str
+    requested_highlight_count: int
+    max_tokens_per_highlight: int
+    max_output_tokens: int
+    api_key: str = ""
+    instructions: str = ""
+    prompt_payload: str = ""
+    schema: dict[str, Any] | None = None
+
+
+def _prepare_link_scan_request(
     *,
     evidence_type: str,
     evidence: LinkScannableEvidence,
-    model: str | None = None,
-    max_output_tokens: int | None = None,
-    requested_highlight_count: int | None = None,
-    max_tokens_per_highlight: int | None = None,
-) -> LLMLinkScanResult:
+    model: str | None,
+    max_output_tokens: int | None,
+    requested_highlight_count: int | None,
+    max_tokens_per_highlight: int | None,
+) -> _LinkScanRequest:
+    """Resolve request settings; evidence without links needs no API key or prompt."""
     links = evidence.links or []
-    scan_targets = build_link_scan_targets(links)
-    effective_model = model if model is not None else settings.LINK_SCANNING_LLM_MODEL
     effective_requested_highlight_count = (
         requested_highlight_count
         if requested_highlight_count is not None
@@ -430,65 +453,85 @@ def scan_evidence_links_with_llm(
         if max_tokens_per_highlight is not None
         else settings.LINK_SCANNING_MAX_TOKENS_PER_HIGHLIGHT
     )
-    effective_max_output_tokens = resolve_link_scan_max_output_tokens(
-        max_output_tokens=max_output_tokens,
+    request = _LinkScanRequest(
+        evidence_type=evidence_type,
+        evidence=evidence,
+        links=links,
+        scan_targets=build_link_scan_targets(links),
+        model=model if model is not None else settings.LINK_SCANNING_LLM_MODEL,
         requested_highlight_count=effective_requested_highlight_count,
         max_tokens_per_highlight=effective_max_tokens_per_highlight,
+        max_output_tokens=resolve_link_scan_max_output_tokens(
+            max_output_tokens=max_output_tokens,
+            requested_highlight_count=effective_requested_highlight_count,
+            max_tokens_per_highlight=effective_max_tokens_per_highlight,
+        ),
     )
     if not links:
-        return LLMLinkScanResult(
-            highlights=[],
-            metadata={
-                "model": effective_model,
-                "api_calls": 0,
-                "scanned_links": [],
-                "scan_targets": [],
-                "source_urls": [],
-                "requested_highlight_count": effective_requested_highlight_count,
-                "max_tokens_per_highlight": effective_max_tokens_per_highlight,
-                "max_output_tokens": effective_max_output_tokens,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0,
-                "latency_ms": 0.0,
-            },
-        )
+        return request
 
-    api_key = getattr(settings, "OPENAI_API_KEY", "")
-    if not api_key.strip():
+    api_key = openai_api_key()
+    if not api_key:
         raise LinkScanningLLMClientError("OPENAI_API_KEY is required for link scanning")
 
-    prompt_payload = build_link_scan_prompt_payload(
+    request.api_key = api_key
+    request.prompt_payload = build_link_scan_prompt_payload(
         evidence_type=evidence_type,
         evidence=evidence,
         requested_highlight_count=effective_requested_highlight_count,
     )
-    schema = build_link_scan_schema()
-    instructions = build_link_scan_instructions()
+    request.schema = build_link_scan_schema()
+    request.instructions = build_link_scan_instructions()
+    return request
+
+
+def _no_links_result(request: _LinkScanRequest) -> LLMLinkScanResult:
+    return LLMLinkScanResult(
+        highlights=[],
+        metadata={
+            "model": request.model,
+            "api_calls": 0,
+            "scanned_links": [],
+            "scan_targets": [],
+            "source_urls": [],
+            "requested_highlight_count": request.requested_highlight_count,
+            "max_tokens_per_highlight": request.max_tokens_per_highlight,
+            "max_output_tokens": request.max_output_tokens,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "latency_ms": 0.0,
+        },
+    )
 
+
+def _request_error(exc: Exception, request: _LinkScanRequest) -> LinkScanningLLMClientError:
+    logger.exception(
+        "link_scanning_llm_request_failed",
+        extra={
+            "event": "link_scanning_llm_request_failed",
+            "subsystem": "link_scanning",
+            "model": request.model,
+            "evidence_type": request.evidence_type,
+            "evidence_id": request.evidence.id,
+        },
+    )
+    return LinkScanningLLMClientError(f"Link-scanning LLM request failed: {exc}")
+
+
+def _link_scan_exchange(request: _LinkScanRequest) -> ResponseExchange[LLMLinkScanResult]:
     start = time.perf_counter()
     try:
-        client = OpenAI(api_key=api_key)
         create_kwargs = build_link_scan_response_create_kwargs(
-            model=effective_model,
-            instructions=instructions,
-            prompt_payload=prompt_payload,
-            schema=schema,
-            max_output_tokens=effective_max_output_tokens,
+            model=request.model,
+            instructions=request.instructions,
+            prompt_payload=request.prompt_payload,
+            schema=request.schema or {},
+            max_output_tokens=request.max_output_tokens,
         )
-        response = client.responses.create(**create_kwargs)
+        response = yield create_kwargs
     except Exception as exc:
-        logger.exception(
-            "link_scanning_llm_request_failed",
-            extra={
-                "event": "link_scanning_llm_request_failed",
-                "subsystem": "link_scanning",
-                "model": effective_model,
-                "evidence_type": evidence_type,
-                "evidence_id": evidence.id,
-            },
-        )
-        raise LinkScanningLLMClientError(f"Link-scanning LLM request failed: {exc}") from exc
+        raise _request_error(exc, request) from exc
 
     latency_ms = (time.perf_counter() - start) * 1000.0
     output_text = _extract_output_text(response)
@@ -505,32 +548,84 @@ def scan_evidence_links_with_llm(
     source_urls = _extract_source_urls(response)
     github_repo_scopes = [
         target.repo_scope
-        for target in scan_targets
+        for target in request.scan_targets
         if target.mode == "github_repo" and target.repo_scope is not None
     ]
     highlights = _validate_link_scan_response(
         raw_response,
-        scanned_links=links,
+        scanned_links=request.links,
         cited_source_urls=source_urls,
         github_repo_scopes=github_repo_scopes,
     )
     metadata = {
-        "model": effective_model,
+        "model": request.model,
         "api_calls": 1,
         "latency_ms": round(latency_ms, 3),
-        "scanned_links": links,
-        "requested_highlight_count": effective_requested_highlight_count,
-        "max_tokens_per_highlight": effective_max_tokens_per_highlight,
-        "max_output_tokens": effective_max_output_tokens,
+        "scanned_links": request.links,
+        "requested_highlight_count": request.requested_highlight_count,
+        "max_tokens_per_highlight": request.max_tokens_per_highlight,
+        "max_output_tokens": request.max_output_tokens,
         "scan_targets": [
             {
                 "url": target.url,
                 "mode": target.mode,
                 "repo_scope": target.repo_scope,
             }
-            for target in scan_targets
+            for target in request.scan_targets
         ],
         "source_urls": source_urls,
         **_usage_metadata(response),
     }
     return LLMLinkScanResult(highlights=highlights, metadata=metadata)
+
+
+def scan_evidence_links_with_llm(
+    *,
+    evidence_type: str,
+    evidence: LinkScannableEvidence,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+    requested_highlight_count: int | None = None,
+    max_tokens_per_highlight: int | None = None,
+) -> LLMLinkScanResult:
+    request = _prepare_link_scan_request(
+        evidence_type=evidence_type,
+        evidence=evidence,
+        model=model,
+        max_output_tokens=max_output_tokens,
+        requested_highlight_count=requested_highlight_count,
+        max_tokens_per_highlight=max_tokens_per_highlight,
+    )
+    if not request.links:
+        return _no_links_result(request)
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request) from exc
+    return run_response_exchange(_link_scan_exchange(request), client.responses.create)
+
+
+async def scan_evidence_links_with_llm_async(
+    *,
+    evidence_type: str,
+    evidence: LinkScannableEvidence,
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+    requested_highlight_count: int | None = None,
+    max_tokens_per_highlight: int | None = None,
+) -> LLMLinkScanResult:
+    request = _prepare_link_scan_request(
+        evidence_type=evidence_type,
+        evidence=evidence,
+        model=model,
+        max_output_tokens=max_output_tokens,
+        requested_highlight_count=requested_highlight_count,
+        max_tokens_per_highlight=max_tokens_per_highlight,
+    )
+    if not request.links:
+        return _no_links_result(request)
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request) from exc
+    return await run_response_exchange_async(_link_scan_exchange(request), client.responses.create)
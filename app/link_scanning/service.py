@@ -6,8 +6,10 @@ from typing import Any
 
 from app.config import settings
 from app.link_scanning.llm_client import (
+    LLMLinkScanResult,
     LinkScanningLLMClientError,
     scan_evidence_links_with_llm,
+    scan_evidence_links_with_llm_async,
 )
 from app.link_scanning.models import LinkScanRequest, LinkScanResponse
 
@@ -27,34 +29,13 @@ def _extract_total_tokens(result_metadata: dict[str, Any] | None) -> int:
         return 0
 
 
-def scan_link_evidence_service(req: LinkScanRequest) -> LinkScanResponse:
+def _scan_response(
+    req: LinkScanRequest,
+    llm_result: LLMLinkScanResult,
+    *,
+    latency_ms: float,
+) -> LinkScanResponse:
     dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
-    start = time.perf_counter()
-
-    try:
-        llm_result = scan_evidence_links_with_llm(
-            evidence_type=req.evidence_type,
-            evidence=req.evidence,
-            model=req.llm_model,
-            max_output_tokens=req.llm_max_output_tokens,
-            requested_highlight_count=req.requested_highlight_count,
-            max_tokens_per_highlight=req.max_tokens_per_highlight,
-        )
-    except LinkScanningLLMClientError as exc:
-        logger.warning(
-            "scan_link_evidence_failed",
-            extra={
-                "event": "scan_link_evidence_failed",
-                "subsystem": "link_scanning",
-                "evidence_type": req.evidence_type,
-                "evidence_id": req.evidence.id,
-                "method": "llm",
-                "error": str(exc),
-            },
-        )
-        raise LinkScanningError(str(exc)) from exc
-
-    latency_ms = (time.perf_counter() - start) * 1000.0
     logger.info(
         "scan_link_evidence",
         extra={
@@ -84,3 +65,57 @@ def scan_link_evidence_service(req: LinkScanRequest) -> LinkScanResponse:
         added_highlights=llm_result.highlights,
         details=details,
     )
+
+
+def _scan_error(req: LinkScanRequest, exc: LinkScanningLLMClientError) -> LinkScanningError:
+    logger.warning(
+        "scan_link_evidence_failed",
+        extra={
+            "event": "scan_link_evidence_failed",
+            "subsystem": "link_scanning",
+            "evidence_type": req.evidence_type,
+            "evidence_id": req.evidence.id,
+            "method": "llm",
+            "error": str(exc),
+        },
+    )
+    return LinkScanningError(str(exc))
+
+
+def scan_link_evidence_service(req: LinkScanRequest) -> LinkScanResponse:
+    start = time.perf_counter()
+
+    try:
+        llm_result = scan_evidence_links_with_llm(
+            evidence_type=req.evidence_type,
+            evidence=req.evidence,
+            model=req.llm_model,
+            max_output_tokens=req.llm_max_output_tokens,
+            requested_highlight_count=req.requested_highlight_count,
+            max_tokens_per_highlight=req.max_tokens_per_highlight,
+        )
+    except LinkScanningLLMClientError as exc:
+        raise _scan_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _scan_response(req, llm_result, latency_ms=latency_ms)
+
+
+async def scan_link_evidence_service_async(req: LinkScanRequest) -> LinkScanResponse:
+    """`scan_link_evidence_service` on the async OpenAI client."""
+    start = time.perf_counter()
+
+    try:
+        llm_result = await scan_evidence_links_with_llm_async(
+            evidence_type=req.evidence_type,
+            evidence=req.evidence,
+            model=req.llm_model,
+            max_output_tokens=req.llm_max_output_tokens,
+            requested_highlight_count=req.requested_highlight_count,
+            max_tokens_per_highlight=req.max_tokens_per_highlight,
+        )
+    except LinkScanningLLMClientError as exc:
+        raise _scan_error(req, exc) from exc
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return _scan_response(req, llm_result, latency_ms=latency_ms)
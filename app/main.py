@@ -1,33 +1,56 @@
+import asyncio
 from contextlib import asynccontextmanager
+import json
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from app import __version__
 from pydantic import ValidationError
 
-from app.skill_selection.models import SkillSelectRequest, SkillSelectResponse
+from app.skill_selection.models import (
+    SkillSelectBatchRequest,
+    SkillSelectBatchResponse,
+    SkillSelectRequest,
+    SkillSelectResponse,
+    SimilarSkillsRequest,
+    SimilarSkillsResponse,
+)
 from app.config import settings
-from app.skill_selection.selector import select_skills_service
+from app.skill_selection import selector as skill_selector
+from app.skill_selection.selector import select_skills_batch_service, select_skills_service_async
+from app.skill_selection.similar_skills import similar_skills_service
+from app.skill_selection.scoring.embeddings import cache as embedding_cache
+from app.skill_selection.embedding_prewarm import prewarm_in_background
+from app.circuit_breaker import circuit_breakers
 from app.metrics import metrics
+from app.model_scheduler import model_scheduler
+from app.openai_clients import openai_clients
+from app.output_budget import output_budgets
 from app.logging_config import setup_logging
 from app.project_selection.models import ProjectSelectRequest, ProjectSelectionResult
-from app.project_selection.service import record_project_selection_error, select_projects_service
+from app.project_selection import service as project_selection_service
+from app.project_selection.service import record_project_selection_error, select_projects_service_async
 from app.bulletpoints_generation.models import (
+    BulletGenerationBatchRequest,
+    BulletGenerationBatchResponse,
     BulletGenerationRequest,
     BulletGenerationResponse,
 )
 from app.bulletpoints_generation.service import (
     BulletPointGenerationError,
-    generate_bulletpoints_service,
+    generate_bulletpoints_batch_service_async,
+    generate_bulletpoints_service_async,
     record_bulletpoint_generation_error,
+    stream_bulletpoints_service,
 )
 from app.link_scanning.models import LinkScanRequest, LinkScanResponse
-from app.link_scanning.service import LinkScanningError, scan_link_evidence_service
+from app.link_scanning.service import LinkScanningError, scan_link_evidence_service_async
 from app.job_focus_generation.models import JobFocusRequest, JobFocusResponse
 from app.job_focus_generation.service import (
     JobFocusGenerationError,
-    derive_job_focus_service,
+    derive_job_focus_service_async,
     record_job_focus_generation_error,
 )
 from app.resume_evidence import load_registered_evidence
@@ -42,7 +65,12 @@ logger = logging.getLogger("app_main")
 async def lifespan(app: FastAPI):
     setup_logging(settings.LOG_LEVEL)
     app.state.resume_evidence = load_registered_evidence()
+    if settings.EMBEDDING_PREWARM_ON_STARTUP:
+        prewarm_in_background()
     yield
+    embedding_cache.close()
+    output_budgets.save()
+    await openai_clients.aclose()
 
 
 app = FastAPI(title="JobForge Resume Engine", lifespan=lifespan)
@@ -86,6 +114,10 @@ async def health():
             "default_highlight_count": settings.LINK_SCANNING_DEFAULT_HIGHLIGHT_COUNT,
             "max_tokens_per_highlight": settings.LINK_SCANNING_MAX_TOKENS_PER_HIGHLIGHT,
         },
+        "circuit_breakers": {
+            "enabled": settings.CIRCUIT_BREAKER_ENABLED,
+            "subsystems": circuit_breakers.snapshot(),
+        },
     }
 
 
@@ -96,8 +128,18 @@ async def get_metrics():
         "errors_total": metrics.errors_total,
         "total_tokens": metrics.total_tokens,
         "avg_latency_ms": round(metrics.avg_latency_ms(), 3),
+        "coalesced_total": metrics.coalesced_total,
+        "tokens_saved": metrics.tokens_saved,
         "method_usage": metrics.method_usage,
         "subsystems": metrics.subsystem_snapshots(),
+        "embedding_cache": {"role": embedding_cache.role_cache_stats()},
+        "output_budget": output_budgets.snapshot(),
+        "selection_cache": {
+            "enabled": settings.SELECTION_CACHE_ENABLED,
+            "skill_selection": skill_selector.response_cache.snapshot(),
+            "project_selection": project_selection_service.response_cache.snapshot(),
+        },
+        "model_scheduler": model_scheduler.snapshot(),
     }
 
 
@@ -114,9 +156,44 @@ async def select_skills(payload: SkillSelectRequest) -> SkillSelectResponse:
         },
     )
     try:
-        return select_skills_service(payload)
+        return await select_skills_service_async(payload)
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
+    except RuntimeError as re:
+        raise HTTPException(status_code=503, detail=str(re))
+
+
+@app.post("/select-skills/batch", response_model=SkillSelectBatchResponse)
+async def select_skills_batch(payload: SkillSelectBatchRequest) -> SkillSelectBatchResponse:
+    logger.info(
+        "app_content_stage_request",
+        extra={
+            "event": "app_content_stage_request",
+            "stage": "skill_selection",
+            "endpoint": "/select-skills/batch",
+            "source": "http",
+            "target_count": len(payload.targets),
+            "llm_max_output_tokens": payload.llm_max_output_tokens,
+        },
+    )
+    try:
+        # LLM and embedding batches make blocking model calls, so keep them off the event loop.
+        return await asyncio.to_thread(select_skills_batch_service, payload)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except RuntimeError as re:
+        raise HTTPException(status_code=503, detail=str(re))
+
+
+@app.post("/skills/similar", response_model=SimilarSkillsResponse)
+async def similar_skills(payload: SimilarSkillsRequest) -> SimilarSkillsResponse:
+    try:
+        # Embedding a query role and refreshing the skill cache block, so run them off the event loop.
+        return await asyncio.to_thread(similar_skills_service, payload)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except RuntimeError as re:
+        raise HTTPException(status_code=503, detail=str(re))
 
 
 @app.post("/generate-bulletpoints", response_model=BulletGenerationResponse)
@@ -133,7 +210,58 @@ async def generate_bulletpoints(payload: BulletGenerationRequest) -> BulletGener
         },
     )
     try:
-        return generate_bulletpoints_service(payload)
+        return await generate_bulletpoints_service_async(payload)
+    except ValueError as ve:
+        record_bulletpoint_generation_error()
+        raise HTTPException(status_code=400, detail=str(ve))
+    except BulletPointGenerationError as exc:
+        raise HTTPException(status_code=502, detail=str(exc))
+
+
+async def _server_sent_events(
+    events: AsyncIterator[tuple[str, dict[str, Any]]],
+) -> AsyncIterator[str]:
+    async for event, data in events:
+        yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/generate-bulletpoints/stream")
+async def generate_bulletpoints_stream(payload: BulletGenerationRequest) -> StreamingResponse:
+    logger.info(
+        "app_content_stage_request",
+        extra={
+            "event": "app_content_stage_request",
+            "stage": f"{payload.evidence_type}_bullet_points",
+            "endpoint": "/generate-bulletpoints/stream",
+            "source": "http",
+            "evidence_type": payload.evidence_type,
+            "evidence_id": payload.evidence_id,
+        },
+    )
+    return StreamingResponse(
+        _server_sent_events(stream_bulletpoints_service(payload)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/generate-bulletpoints/batch", response_model=BulletGenerationBatchResponse)
+async def generate_bulletpoints_batch(
+    payload: BulletGenerationBatchRequest,
+) -> BulletGenerationBatchResponse:
+    logger.info(
+        "app_content_stage_request",
+        extra={
+            "event": "app_content_stage_request",
+            "stage": "bullet_points_batch",
+            "endpoint": "/generate-bulletpoints/batch",
+            "source": "http",
+            "record_count": len(payload.records),
+            "llm_max_output_tokens": payload.llm_max_output_tokens,
+        },
+    )
+    try:
+        return await generate_bulletpoints_batch_service_async(payload)
     except ValueError as ve:
         record_bulletpoint_generation_error()
         raise HTTPException(status_code=400, detail=str(ve))
@@ -154,7 +282,7 @@ async def derive_job_focus(payload: JobFocusRequest) -> JobFocusResponse:
         },
     )
     try:
-        return derive_job_focus_service(payload)
+        return await derive_job_focus_service_async(payload)
     except ValueError as ve:
         record_job_focus_generation_error()
         raise HTTPException(status_code=400, detail=str(ve))
@@ -180,7 +308,7 @@ async def enrich_link_evidence(payload: LinkScanRequest) -> LinkScanResponse:
         extra=_link_scan_log_extra(payload, "/enrich-link-evidence"),
     )
     try:
-        return scan_link_evidence_service(payload)
+        return await scan_link_evidence_service_async(payload)
     except LinkScanningError as exc:
         raise HTTPException(status_code=502, detail=str(exc))
 
@@ -198,7 +326,7 @@ async def select_projects(payload: dict[str, Any]) -> ProjectSelectionResult:
     )
     try:
         request = ProjectSelectRequest.model_validate(payload)
-        return select_projects_service(request)
+        return await select_projects_service_async(request)
     except ValidationError as ve:
         method = payload.get("method") if isinstance(payload, dict) else None
         record_project_selection_error(method if isinstance(method, str) else "invalid")
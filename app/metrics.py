@@ -12,6 +12,8 @@ class MetricsBucket:
     total_tokens: int = 0
     latency_ms_sum: float = 0.0
     latency_ms_count: int = 0
+    coalesced_total: int = 0
+    tokens_saved: int = 0
     method_usage: Dict[str, int] = field(default_factory=dict)
 
     def avg_latency_ms(self) -> float:
@@ -23,6 +25,8 @@ class MetricsBucket:
             "errors_total": self.errors_total,
             "total_tokens": self.total_tokens,
             "avg_latency_ms": round(self.avg_latency_ms(), 3),
+            "coalesced_total": self.coalesced_total,
+            "tokens_saved": self.tokens_saved,
             "method_usage": dict(self.method_usage),
         }
 
@@ -67,6 +71,15 @@ class Metrics(MetricsBucket):
             self.total_tokens += tokens
             self._subsystem_bucket(subsystem).total_tokens += tokens
 
+    def observe_coalesced(self, tokens_saved: int, subsystem: str = "skill_selection") -> None:
+        """Count a request answered by another request's in-flight LLM call."""
+        with self._lock:
+            self.coalesced_total += 1
+            self.tokens_saved += max(tokens_saved, 0)
+            bucket = self._subsystem_bucket(subsystem)
+            bucket.coalesced_total += 1
+            bucket.tokens_saved += max(tokens_saved, 0)
+
     def observe_latency_ms(self, ms: float, subsystem: str = "skill_selection") -> None:
         with self._lock:
             self.latency_ms_sum += ms
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Literal, TypeVar
+
+from app.config import settings
+from app.model_transport import Endpoint, model_transport
+
+logger = logging.getLogger("model_scheduler")
+
+T = TypeVar("T")
+
+Priority = Literal["interactive", "batch"]
+PRIORITIES: tuple[Priority, ...] = ("interactive", "batch")
+# Waiters that are not at the head of their queue re-check this often.
+POLL_SECONDS = 0.05
+# Rough prompt size when estimating tokens before the request is sent.
+CHARS_PER_TOKEN = 4
+
+_priority: ContextVar[Priority] = ContextVar("model_call_priority", default="interactive")
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def model_call_priority(priority: Priority) -> Iterator[None]:
+    """Run model calls made in this context (and tasks it spawns) at `priority`.
+
+    Also usable as a decorator on sync functions, e.g. `@model_call_priority("batch")`.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _text_chars(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(_text_chars(item) for item in value)
+    return 0
+
+
+def estimate_prompt_tokens(request: dict[str, Any]) -> int:
+    """Approximate input tokens of a `responses.create` or `embeddings.create` request."""
+    prompt_chars = _text_chars(request.get("instructions")) + _text_chars(request.get("input"))
+    return prompt_chars // CHARS_PER_TOKEN + 1
+
+
+def estimate_request_tokens(request: dict[str, Any]) -> int:
+    """Upper-bound token cost of a `responses.create` or `embeddings.create` request."""
+    return estimate_prompt_tokens(request) + int(request.get("max_output_tokens") or 0)
+
+
+def response_total_tokens(response: Any) -> int | None:
+    usage = getattr(response, "usage", None)
+    total_tokens = getattr(usage, "total_tokens", None)
+    return total_tokens if isinstance(total_tokens, int) else None
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously; the level may go negative on overruns."""
+
+    def __init__(self, per_minute: int, clock: Callable[[], float]):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def seconds_until(self, amount: float) -> float:
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+@dataclass
+class _ModelQueue:
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+    waiters: list[tuple[int, int]] = field(default_factory=list)
+
+
+@dataclass
+class Reservation:
+    model: str
+    tokens: int
+    priority: Priority
+    wait_ms: float
+
+
+class ModelScheduler:
+    """Process-wide admission control for model calls, by model and priority.
+
+    Each model with a limit has a requests-per-minute and a tokens-per-minute bucket
+    (`OPENAI_RPM_LIMIT`/`OPENAI_TPM_LIMIT`, overridden per model by
+    `OPENAI_MODEL_RATE_LIMITS`). A call reserves one request and its estimated tokens
+    before it is sent and returns the unused tokens once the response reports usage.
+    Calls that do not fit wait in a queue instead of failing: interactive calls go
+    ahead of batch calls, FIFO within a class. Batch calls also leave
+    `OPENAI_INTERACTIVE_RESERVE` of each bucket for interactive work. Models without
+    limits are admitted immediately. Sync callers block their thread; async callers
+    sleep without blocking the event loop.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._queues: dict[str, _ModelQueue] = {}
+        self._limits_signature: Any = None
+        self._sequence = itertools.count()
+        self._stats = {priority: self._empty_stats() for priority in PRIORITIES}
+
+    @staticmethod
+    def _empty_stats() -> dict[str, float]:
+        return {
+            "calls": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "waited": 0,
+            "wait_ms_sum": 0.0,
+            "max_wait_ms": 0.0,
+        }
+
+    def _limits(self, model: str) -> tuple[int | None, int | None]:
+        overrides = settings.OPENAI_MODEL_RATE_LIMITS.get(model, {})
+        return (
+            overrides.get("rpm", settings.OPENAI_RPM_LIMIT),
+            overrides.get("tpm", settings.OPENAI_TPM_LIMIT),
+        )
+
+    def _queue(self, model: str) -> _ModelQueue | None:
+        signature = (settings.OPENAI_RPM_LIMIT, settings.OPENAI_TPM_LIMIT, repr(settings.OPENAI_MODEL_RATE_LIMITS))
+        if signature != self._limits_signature:
+            # Limits changed (tests, reloads): rebuild buckets; queued waiters re-register.
+            self._queues = {}
+            self._limits_signature = signature
+        queue = self._queues.get(model)
+        if queue is None:
+            rpm, tpm = self._limits(model)
+            if not rpm and not tpm:
+                return None
+            queue = self._queues[model] = _ModelQueue(
+                requests=TokenBucket(rpm, self._clock) if rpm else None,
+                tokens=TokenBucket(tpm, self._clock) if tpm else None,
+            )
+        return queue
+
+    def _try_admit(self, queue: _ModelQueue, ticket: tuple[int, int], tokens: int) -> float:
+        """Take the budget for `ticket` and return 0, or return seconds to wait."""
+        if min(queue.waiters) != ticket:
+            return POLL_SECONDS
+        reserve = settings.OPENAI_INTERACTIVE_RESERVE if ticket[0] > 0 else 0.0
+        wait = 0.0
+        needs: list[tuple[TokenBucket, float]] = []
+        for bucket, amount in ((queue.requests, 1.0), (queue.tokens, float(tokens))):
+            if bucket is None:
+                continue
+            bucket.refill()
+            # A request larger than the whole bucket is admitted once the bucket is full.
+            need = min(amount + reserve * bucket.capacity, bucket.capacity)
+            wait = max(wait, bucket.seconds_until(need))
+            needs.append((bucket, amount))
+        if wait > 0:
+            return wait
+        for bucket, amount in needs:
+            bucket.level -= amount
+        queue.waiters.remove(ticket)
+        return 0.0
+
+    def _enter(self, model: str, tokens: int, priority: Priority) -> tuple[_ModelQueue | None, tuple[int, int]]:
+        queue = self._queue(model)
+        ticket = (PRIORITIES.index(priority), next(self._sequence))
+        stats = self._stats[priority]
+        stats["calls"] += 1
+        if queue is not None:
+            queue.waiters.append(ticket)
+            stats["queued"] += 1
+            stats["max_queued"] = max(stats["max_queued"], stats["queued"])
+        return queue, ticket
+
+    def _admitted(self, model: str, tokens: int, priority: Priority, queued: bool, started: float) -> Reservation:
+        wait_ms = (self._clock() - started) * 1000.0
+        stats = self._stats[priority]
+        if queued:
+            stats["queued"] -= 1
+        if wait_ms > 1.0:
+            stats["waited"] += 1
+            stats["wait_ms_sum"] += wait_ms
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+            logger.info(
+                "model_call_queued",
+                extra={
+                    "event": "model_call_queued",
+                    "model": model,
+                    "priority": priority,
+                    "estimated_tokens": tokens,
+                    "wait_ms": round(wait_ms, 3),
+                },
+            )
+        self._changed.notify_all()
+        return Reservation(model=model, tokens=tokens, priority=priority, wait_ms=wait_ms)
+
+    def _reenter_if_reset(self, model: str, queue: _ModelQueue | None, ticket: tuple[int, int]) -> _ModelQueue | None:
+        current = self._queue(model)
+        if current is not queue and current is not None:
+            current.waiters.append(ticket)
+        return current
+
+    def acquire(self, model: str, tokens: int, priority: Priority | None = None) -> Reservation:
+        """Block until `model` has budget for one request of `tokens` tokens."""
+        priority = priority or current_priority()
+        started = self._clock()
+        with self._lock:
+            queue, ticket = self._enter(model, tokens, priority)
+            queued = queue is not None
+            while queue is not None:
+                wait = self._try_admit(queue, ticket, tokens)
+                if wait == 0:
+                    break
+                self._changed.wait(timeout=wait)
+                queue = self._reenter_if_reset(model, queue, ticket)
+            return self._admitted(model, tokens, priority, queued, started)
+
+    async def acquire_async(self, model: str, tokens: int, priority: Priority | None = None) -> Reservation:
+        """`acquire` for coroutines: waits with `asyncio.sleep` instead of blocking."""
+        priority = priority or current_priority()
+        started = self._clock()
+        with self._lock:
+            queue, ticket = self._enter(model, tokens, priority)
+        queued = queue is not None
+        try:
+            while True:
+                with self._lock:
+                    queue = self._reenter_if_reset(model, queue, ticket)
+                    wait = self._try_admit(queue, ticket, tokens) if queue is not None else 0.0
+                    if wait == 0:
+                        return self._admitted(model, tokens, priority, queued, started)
+                await asyncio.sleep(min(wait, POLL_SECONDS * 4))
+        except asyncio.CancelledError:
+            with self._lock:
+                if queue is not None and ticket in queue.waiters:
+                    queue.waiters.remove(ticket)
+                if queued:
+                    self._stats[priority]["queued"] -= 1
+                self._changed.notify_all()
+            raise
+
+    def settle(self, reservation: Reservation, used_tokens: int | None) -> None:
+        """Return unused reserved tokens (or charge an overrun) once usage is known."""
+        if used_tokens is None:
+            return
+        with self._lock:
+            queue = self._queues.get(reservation.model)
+            if queue is None or queue.tokens is None:
+                return
+            queue.tokens.refill()
+            queue.tokens.level = min(
+                queue.tokens.capacity,
+                queue.tokens.level + reservation.tokens - used_tokens,
+            )
+            self._changed.notify_all()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            priorities = {}
+            for priority, stats in self._stats.items():
+                waited = stats["waited"]
+                priorities[priority] = {
+                    "calls": stats["calls"],
+                    "queued": stats["queued"],
+                    "max_queued": stats["max_queued"],
+                    "waited": waited,
+                    "avg_wait_ms": round(stats["wait_ms_sum"] / waited, 3) if waited else 0.0,
+                    "max_wait_ms": round(stats["max_wait_ms"], 3),
+                }
+            models = {}
+            for model, queue in self._queues.items():
+                models[model] = {
+                    "rpm": int(queue.requests.capacity) if queue.requests is not None else None,
+                    "tpm": int(queue.tokens.capacity) if queue.tokens is not None else None,
+                    "queued": len(queue.waiters),
+                }
+            return {"priorities": priorities, "models": models}
+
+
+model_scheduler = ModelScheduler()
+
+
+def scheduled_call(
+    create: Callable[..., T],
+    request: dict[str, Any],
+    *,
+    priority: Priority | None = None,
+    endpoint: Endpoint = "responses",
+) -> T:
+    """Call `create(**request)` once the scheduler admits it, then settle its usage.
+
+    The call goes through `model_transport`, which may record or replay it. A call that
+    raises (or is cancelled) is settled at its estimated prompt tokens, which returns
+    the reserved output budget.
+    """
+    reservation = model_scheduler.acquire(
+        str(request.get("model", "")),
+        estimate_request_tokens(request),
+        priority,
+    )
+    try:
+        response = model_transport.send(create, request, endpoint=endpoint)
+    except BaseException:
+        model_scheduler.settle(reservation, estimate_prompt_tokens(request))
+        raise
+    model_scheduler.settle(reservation, response_total_tokens(response))
+    return response
+
+
+async def scheduled_call_async(
+    create: Callable[..., Awaitable[T]],
+    request: dict[str, Any],
+    *,
+    priority: Priority | None = None,
+    endpoint: Endpoint = "responses",
+) -> T:
+    """`scheduled_call` for an awaitable `create`."""
+    reservation = await model_scheduler.acquire_async(
+        str(request.get("model", "")),
+        estimate_request_tokens(request),
+        priority,
+    )
+    try:
+        response = await model_transport.send_async(create, request, endpoint=endpoint)
+    except BaseException:
+        model_scheduler.settle(reservation, estimate_prompt_tokens(request))
+        raise
+    model_scheduler.settle(reservation, response_total_tokens(response))
+    return response
+
+
+async def scheduled_stream_async(
+    create: Callable[..., Awaitable[Any]],
+    request: dict[str, Any],
+    *,
+    priority: Priority | None = None,
+) -> AsyncIterator[Any]:
+    """Stream `create(**request, stream=True)` events once the scheduler admits the call.
+
+    Usage is settled from the final response event; a stream that ends early (or is
+    closed by the consumer) keeps its full reservation.
+    """
+    reservation = await model_scheduler.acquire_async(
+        str(request.get("model", "")),
+        estimate_request_tokens(request),
+        priority,
+    )
+    used_tokens: int | None = None
+    try:
+        async for event in model_transport.stream_async(create, request):
+            if event.type in {"response.completed", "response.incomplete"}:
+                used_tokens = response_total_tokens(event.response)
+            yield event
+    finally:
+        model_scheduler.settle(reservation, used_tokens)
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
+
+from openai.types import CreateEmbeddingResponse
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseIncompleteEvent,
+    ResponseTextDeltaEvent,
+)
+
+from app.config import settings
+
+logger = logging.getLogger("model_transport")
+
+Endpoint = Literal["responses", "embeddings"]
+
+_CASSETTE_VERSION = 1
+_RESPONSE_TYPES: dict[str, Any] = {"responses": Response, "embeddings": CreateEmbeddingResponse}
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no recording matches a request."""
+
+
+def cassette_key(endpoint: Endpoint, request: dict[str, Any]) -> str:
+    canonical = json.dumps(
+        {"endpoint": endpoint, "request": request},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _usage(response_data: dict[str, Any]) -> dict[str, Any]:
+    usage = response_data.get("usage")
+    return usage if isinstance(usage, dict) else {}
+
+
+class ModelTransport:
+    """Record/replay layer under every `responses.create` and `embeddings.create` call.
+
+    `LLM_CASSETTE_MODE` selects the behavior:
+
+    - `off` sends requests unchanged.
+    - `record` sends them and saves each request, response, observed latency, and
+      usage as `<LLM_CASSETTE_DIR>/<endpoint>/<key>.json`. The key is a hash of the
+      endpoint and the request kwargs.
+    - `replay` never calls the API. It returns the recorded response for the same
+      request, or raises `CassetteMissError`. With `LLM_CASSETTE_REPLAY_LATENCY`, it
+      first sleeps for the recorded latency, so timings stay realistic offline.
+
+    Replayed responses are rebuilt as OpenAI SDK models, so callers cannot tell them
+    from live ones. Identical requests share one recording, and the latest one wins.
+    """
+
+    def _path(self, endpoint: Endpoint, key: str) -> Path:
+        return Path(settings.LLM_CASSETTE_DIR) / endpoint / f"{key}.json"
+
+    def _load(self, endpoint: Endpoint, request: dict[str, Any]) -> tuple[Any, float]:
+        key = cassette_key(endpoint, request)
+        path = self._path(endpoint, key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                recording = json.load(handle)
+        except FileNotFoundError:
+            raise CassetteMissError(
+                f"No {endpoint} recording for request {key[:12]} in {settings.LLM_CASSETTE_DIR}; "
+                "record it with LLM_CASSETTE_MODE=record"
+            ) from None
+        except (JSONDecodeError, OSError) as exc:
+            raise CassetteMissError(f"Unreadable cassette {path}: {exc}") from exc
+        if recording.get("version") != _CASSETTE_VERSION:
+            raise CassetteMissError(f"Cassette {path} has unsupported version {recording.get('version')!r}")
+
+        response = _RESPONSE_TYPES[endpoint].model_validate(recording["response"])
+        latency_ms = float(recording.get("latency_ms", 0.0) or 0.0)
+        logger.debug(
+            "model_transport_replayed",
+            extra={"event": "model_transport_replayed", "endpoint": endpoint, "key": key, "latency_ms": latency_ms},
+        )
+        return response, latency_ms / 1000.0 if settings.LLM_CASSETTE_REPLAY_LATENCY else 0.0
+
+    def _save(self, endpoint: Endpoint, request: dict[str, Any], response: Any, latency_ms: float) -> None:
+        key = cassette_key(endpoint, request)
+        path = self._path(endpoint, key)
+        response_data = response.model_dump(mode="json")
+        recording = {
+            "version": _CASSETTE_VERSION,
+            "endpoint": endpoint,
+            "request": request,
+            "response": response_data,
+            "latency_ms": round(latency_ms, 3),
+            "usage": _usage(response_data),
+            "recorded_at": time.time(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(recording, handle, ensure_ascii=False, indent=2, sort_keys=True, default=str)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning(
+                "model_transport_record_failed",
+                extra={"event": "model_transport_record_failed", "path": str(path), "error": str(exc)},
+            )
+
+    def send(self, create: Callable[..., Any], request: dict[str, Any], *, endpoint: Endpoint) -> Any:
+        mode = settings.LLM_CASSETTE_MODE
+        if mode == "replay":
+            response, delay = self._load(endpoint, request)
+            if delay:
+                time.sleep(delay)
+            return response
+        start = time.perf_counter()
+        response = create(**request)
+        if mode == "record":
+            self._save(endpoint, request, response, (time.perf_counter() - start) * 1000.0)
+        return response
+
+    async def send_async(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        request: dict[str, Any],
+        *,
+        endpoint: Endpoint,
+    ) -> Any:
+        mode = settings.LLM_CASSETTE_MODE
+        if mode == "replay":
+            response, delay = self._load(endpoint, request)
+            if delay:
+                await asyncio.sleep(delay)
+            return response
+        start = time.perf_counter()
+        response = await create(**request)
+        if mode == "record":
+            self._save(endpoint, request, response, (time.perf_counter() - start) * 1000.0)
+        return response
+
+    async def stream_async(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        request: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        """Streaming `responses.create`: yields the Responses API stream events.
+
+        Streamed calls share recordings with non-streamed ones: `record` saves the
+        final response of the stream under the non-streamed request's key, and
+        `replay` yields the recorded output text as one delta followed by the final
+        `response.completed` (or `response.incomplete`) event.
+        """
+        mode = settings.LLM_CASSETTE_MODE
+        if mode == "replay":
+            response, delay = self._load("responses", request)
+            if delay:
+                await asyncio.sleep(delay)
+            yield ResponseTextDeltaEvent(
+                type="response.output_text.delta",
+                delta=response.output_text,
+                content_index=0,
+                item_id="",
+                logprobs=[],
+                output_index=0,
+                sequence_number=0,
+            )
+            final_type = ResponseIncompleteEvent if response.status == "incomplete" else ResponseCompletedEvent
+            yield final_type(
+                type="response.incomplete" if response.status == "incomplete" else "response.completed",
+                response=response,
+                sequence_number=1,
+            )
+            return
+
+        start = time.perf_counter()
+        stream = await create(**request, stream=True)
+        try:
+            async for event in stream:
+                if mode == "record" and event.type in {"response.completed", "response.incomplete"}:
+                    self._save("responses", request, event.response, (time.perf_counter() - start) * 1000.0)
+                yield event
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                await close()
+
+
+model_transport = ModelTransport()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Generator, TypeVar
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from app.config import settings
+from app.model_scheduler import scheduled_call, scheduled_call_async
+
+logger = logging.getLogger("openai_clients")
+
+T = TypeVar("T")
+
+ResponseExchange = Generator[dict[str, Any], Any, T]
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def _http_client() -> httpx.Client:
+    return DefaultHttpxClient(limits=_limits())
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    return DefaultAsyncHttpxClient(limits=_limits())
+
+
+class OpenAIClientRegistry:
+    """Process-wide OpenAI clients keyed by (factory, api_key, base_url).
+
+    Each client owns one keep-alive httpx pool, so sequential and concurrent calls
+    from every subsystem reuse warm connections instead of reconnecting per request.
+    Sync clients are thread-safe. Async clients are additionally keyed by their event
+    loop, because an async pool's connections cannot be used from another loop.
+    `aclose()` (or `close()` outside an event loop) releases all pools at shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple, tuple[Any, httpx.Client | httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+
+    def _get(
+        self,
+        key: tuple,
+        *,
+        api_key: str,
+        base_url: str | None,
+        factory: Callable[..., Any],
+        http_client_factory: Callable[[], httpx.Client | httpx.AsyncClient],
+    ) -> Any:
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                http_client = http_client_factory()
+                kwargs: dict[str, Any] = {"api_key": api_key, "http_client": http_client}
+                if base_url is not None:
+                    kwargs["base_url"] = base_url
+                try:
+                    client = factory(**kwargs)
+                except Exception:
+                    if isinstance(http_client, httpx.Client):
+                        http_client.close()
+                    raise
+                entry = (client, http_client)
+                self._clients[key] = entry
+                logger.debug(
+                    "openai_client_created",
+                    extra={"event": "openai_client_created", "base_url": base_url, "clients": len(self._clients)},
+                )
+            return entry[0]
+
+    def get(
+        self,
+        api_key: str,
+        *,
+        base_url: str | None = None,
+        factory: Callable[..., Any] = OpenAI,
+    ) -> Any:
+        return self._get(
+            (factory, api_key, base_url),
+            api_key=api_key,
+            base_url=base_url,
+            factory=factory,
+            http_client_factory=_http_client,
+        )
+
+    def get_async(
+        self,
+        api_key: str,
+        *,
+        base_url: str | None = None,
+        factory: Callable[..., Any] = AsyncOpenAI,
+    ) -> Any:
+        """Async client for the running event loop; must be called from inside it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Pools bound to a closed loop can neither be reused nor closed; drop them.
+            stale = [key for key in self._clients if len(key) == 4 and key[3].is_closed()]
+            for key in stale:
+                del self._clients[key]
+        return self._get(
+            (factory, api_key, base_url, loop),
+            api_key=api_key,
+            base_url=base_url,
+            factory=factory,
+            http_client_factory=_async_http_client,
+        )
+
+    def _drain(self) -> list[tuple[tuple, tuple[Any, httpx.Client | httpx.AsyncClient]]]:
+        with self._lock:
+            entries = list(self._clients.items())
+            self._clients.clear()
+        return entries
+
+    def close(self) -> None:
+        """Close every sync client. Async clients are dropped; use `aclose` to close them."""
+        for _key, (client, http_client) in self._drain():
+            if isinstance(http_client, httpx.AsyncClient):
+                continue
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+            http_client.close()
+
+    async def aclose(self) -> None:
+        """Close every sync client and every async client owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        for key, (client, http_client) in self._drain():
+            if isinstance(http_client, httpx.AsyncClient):
+                if key[3] is not loop:
+                    continue
+                close = getattr(client, "close", None)
+                if callable(close):
+                    result = close()
+                    if inspect.isawaitable(result):
+                        await result
+                await http_client.aclose()
+                continue
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+            http_client.close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+openai_clients = OpenAIClientRegistry()
+
+
+# Cassette replay never sends a request, so it runs without a configured key.
+REPLAY_API_KEY = "cassette-replay"
+
+
+def openai_api_key() -> str:
+    """Return `OPENAI_API_KEY`, or "" when it is unset outside cassette replay."""
+    api_key = getattr(settings, "OPENAI_API_KEY", "")
+    if api_key.strip():
+        return api_key
+    return REPLAY_API_KEY if getattr(settings, "LLM_CASSETTE_MODE", "off") == "replay" else ""
+
+
+def get_openai_client(
+    api_key: str,
+    *,
+    base_url: str | None = None,
+    factory: Callable[..., Any] = OpenAI,
+) -> Any:
+    """Return the shared client for api_key and base_url (default `OPENAI_BASE_URL`).
+
+    Callers pass their module's `OpenAI` as `factory` so tests can substitute it.
+    """
+    effective_base_url = base_url if base_url is not None else getattr(settings, "OPENAI_BASE_URL", None)
+    return openai_clients.get(api_key, base_url=effective_base_url, factory=factory)
+
+
+def get_async_openai_client(
+    api_key: str,
+    *,
+    base_url: str | None = None,
+    factory: Callable[..., Any] = AsyncOpenAI,
+) -> Any:
+    """Async counterpart of `get_openai_client`, shared per event loop.
+
+    Callers pass their module's `AsyncOpenAI` as `factory` so tests can substitute it.
+    """
+    effective_base_url = base_url if base_url is not None else getattr(settings, "OPENAI_BASE_URL", None)
+    return openai_clients.get_async(api_key, base_url=effective_base_url, factory=factory)
+
+
+def run_response_exchange(exchange: ResponseExchange[T], create: Callable[..., Any]) -> T:
+    """Drive a Responses API exchange with a blocking `create` call.
+
+    An exchange is a generator that yields `responses.create` kwargs, receives each
+    response (or has the request's exception thrown in at the `yield`), and returns
+    its parsed result. LLM clients write request, retry, and parse logic once as an
+    exchange and run it with this driver or `run_response_exchange_async`. Each
+    request waits for the model scheduler's rate budget before it is sent.
+    """
+    try:
+        request = next(exchange)
+        while True:
+            try:
+                response = scheduled_call(create, request)
+            except Exception as exc:
+                request = exchange.throw(exc)
+            else:
+                request = exchange.send(response)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_response_exchange_async(
+    exchange: ResponseExchange[T],
+    create: Callable[..., Awaitable[Any]],
+) -> T:
+    """Drive a Responses API exchange with an awaitable `create` call."""
+    try:
+        request = next(exchange)
+        while True:
+            try:
+                response = await scheduled_call_async(create, request)
+            except Exception as exc:
+                request = exchange.throw(exc)
+            else:
+                request = exchange.send(response)
+    except StopIteration as stop:
+        return stop.value
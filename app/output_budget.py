@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from collections import deque
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger("output_budget")
+
+_STORE_VERSION = 1
+# Unsaved observations that trigger a write to the store path.
+SAVE_EVERY = 20
+
+
+def input_size_bucket(input_size: int) -> int:
+    """Power-of-two bucket of a prompt size: 1, 2, 3-4, 5-8, ... share a bucket."""
+    return max(0, int(input_size) - 1).bit_length()
+
+
+def _attempt_int(attempt: dict[str, Any], key: str) -> int:
+    try:
+        return int(attempt.get(key, 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class OutputBudgetModel:
+    """Learns `max_output_tokens` budgets from the completion tokens of past responses.
+
+    LLM clients report each finished exchange's attempt metadata to `observe`. The
+    completion tokens of the parsed attempt are kept per (subsystem, model, prompt-size
+    bucket), keeping the most recent `max_samples`. `budget` returns the configured
+    or estimated default, raised to the percentile of those samples times `headroom`
+    when there are at least `min_samples`. A first attempt sized this way is rarely
+    truncated, so the retry that re-sends the whole prompt is rarely needed. Budgets
+    never drop below the default.
+
+    Per-subsystem counters of first-attempt successes, retries, and the prompt tokens
+    re-sent by retries show how often this happens. With a `path`, samples are loaded
+    from that JSON file and written back every `SAVE_EVERY` observations and on `save()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path | str | None = None,
+        max_samples: int = 256,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_samples = max_samples
+        self._samples: dict[str, deque[int]] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls) -> "OutputBudgetModel":
+        return cls(path=settings.OUTPUT_BUDGET_PATH, max_samples=settings.OUTPUT_BUDGET_MAX_SAMPLES)
+
+    @staticmethod
+    def _key(subsystem: str, model: str, input_size: int) -> str:
+        return f"{subsystem}|{model}|{input_size_bucket(input_size)}"
+
+    def budget(
+        self,
+        *,
+        subsystem: str,
+        model: str,
+        input_size: int,
+        default: int,
+    ) -> int:
+        """First-attempt `max_output_tokens` for a request whose prompt is `input_size` chars."""
+        if not settings.OUTPUT_BUDGET_ADAPTIVE:
+            return default
+        with self._lock:
+            samples = sorted(self._samples.get(self._key(subsystem, model, input_size), ()))
+        if len(samples) < settings.OUTPUT_BUDGET_MIN_SAMPLES:
+            return default
+        # Nearest-rank percentile.
+        rank = max(1, math.ceil(settings.OUTPUT_BUDGET_PERCENTILE * len(samples)))
+        predicted = math.ceil(samples[rank - 1] * settings.OUTPUT_BUDGET_HEADROOM)
+        return max(default, predicted)
+
+    def observe(
+        self,
+        *,
+        subsystem: str,
+        model: str,
+        input_size: int,
+        attempts: list[dict[str, Any]],
+        succeeded: bool,
+    ) -> None:
+        """Record one exchange; `attempts` is the client's per-attempt metadata list."""
+        if not attempts:
+            return
+        completion_tokens = _attempt_int(attempts[-1], "completion_tokens") if succeeded else 0
+        retry_prompt_tokens = sum(_attempt_int(attempt, "prompt_tokens") for attempt in attempts[:-1])
+
+        with self._lock:
+            stats = self._stats.setdefault(subsystem, self._empty_stats())
+            stats["exchanges"] += 1
+            if len(attempts) == 1 and succeeded:
+                stats["first_attempt_successes"] += 1
+            if len(attempts) > 1:
+                stats["retries"] += 1
+                stats["retry_prompt_tokens"] += retry_prompt_tokens
+            if completion_tokens <= 0:
+                return
+            key = self._key(subsystem, model, input_size)
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+            samples.append(completion_tokens)
+            self._unsaved += 1
+            should_save = self.path is not None and self._unsaved >= SAVE_EVERY
+
+        if should_save:
+            self.save()
+
+    @staticmethod
+    def _empty_stats() -> dict[str, int]:
+        return {"exchanges": 0, "first_attempt_successes": 0, "retries": 0, "retry_prompt_tokens": 0}
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            snapshot: dict[str, dict] = {}
+            for subsystem, stats in self._stats.items():
+                exchanges = stats["exchanges"]
+                snapshot[subsystem] = {
+                    **stats,
+                    "retry_rate": round(stats["retries"] / exchanges, 4) if exchanges else 0.0,
+                    "buckets": sum(1 for key in self._samples if key.startswith(f"{subsystem}|")),
+                }
+            return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._stats.clear()
+            self._unsaved = 0
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                stored = json.load(handle)
+        except FileNotFoundError:
+            return
+        except (JSONDecodeError, OSError) as exc:
+            logger.warning(
+                "output_budget_load_failed",
+                extra={"event": "output_budget_load_failed", "path": str(self.path), "error": str(exc)},
+            )
+            return
+
+        if not isinstance(stored, dict) or stored.get("version") != _STORE_VERSION:
+            return
+        buckets = stored.get("buckets")
+        if not isinstance(buckets, dict):
+            return
+        for key, values in buckets.items():
+            if isinstance(key, str) and isinstance(values, list):
+                tokens = [int(value) for value in values if isinstance(value, int) and value > 0]
+                self._samples[key] = deque(tokens, maxlen=self.max_samples)
+
+    def save(self) -> None:
+        """Write the samples to `path` (atomic replace); a no-op without a path."""
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": _STORE_VERSION,
+                "buckets": {key: list(samples) for key, samples in self._samples.items()},
+            }
+            self._unsaved = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning(
+                "output_budget_save_failed",
+                extra={"event": "output_budget_save_failed", "path": str(self.path), "error": str(exc)},
+            )
+
+
+output_budgets = OutputBudgetModel.from_settings()
@@ -5,8 +5,8 @@ from app.project_selection.models import (
     ProjectSelectionResult,
     RankedProject,
 )
-from app.project_selection.service import select_projects_service
-from app.project_selection.selector import select_projects
+from app.project_selection.service import select_projects_service, select_projects_service_async
+from app.project_selection.selector import select_projects, select_projects_async
 
 __all__ = [
     "ProjectCandidate",
@@ -15,5 +15,7 @@ __all__ = [
     "ProjectSelectionResult",
     "RankedProject",
     "select_projects",
+    "select_projects_async",
     "select_projects_service",
+    "select_projects_service_async",
 ]
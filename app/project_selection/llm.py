@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
+from app.circuit_breaker import CircuitBreaker, circuit_breakers
+from app.config import settings
 from app.project_selection.baseline import baseline_select_projects
 from app.project_selection.models import (
     ProjectCandidate,
@@ -11,12 +14,16 @@ from app.project_selection.models import (
     RankedProject,
 )
 from app.project_selection.llm_client import (
+    LLMProjectScoreResult,
     ProjectLLMClientError,
     score_projects_with_llm,
+    score_projects_with_llm_async,
 )
 
 logger = logging.getLogger("project_llm_scorer")
 
+METRICS_SUBSYSTEM = "project_selection"
+
 
 class ProjectLLMValidationError(ValueError):
     """Raised when a model response is too malformed to rank safely."""
@@ -83,41 +90,80 @@ def _fallback_to_baseline(
     return result
 
 
-def llm_select_projects(
+def _fallback_after_error(
+    exc: Exception,
+    llm_metadata: dict[str, Any] | None,
     *,
     context: ProjectJobContext,
     candidates: list[ProjectCandidate],
-    top_n: int | None = None,
-    dev_mode: bool = False,
-    llm_model: str | None = None,
-    llm_max_output_tokens: int | None = None,
+    top_n: int | None,
+    dev_mode: bool,
+) -> ProjectSelectionResult:
+    logger.warning(
+        "project_llm_fallback_to_baseline",
+        extra={
+            "event": "project_llm_fallback_to_baseline",
+            "job_title": context.title,
+            "error": str(exc),
+        },
+    )
+    return _fallback_to_baseline(
+        context=context,
+        candidates=candidates,
+        top_n=top_n,
+        dev_mode=dev_mode,
+        warning=f"Project LLM selection failed; fell back to baseline: {exc}",
+        llm_metadata=llm_metadata,
+    )
+
+
+def _circuit_breaker(llm_model: str | None) -> CircuitBreaker:
+    return circuit_breakers.get(
+        METRICS_SUBSYSTEM,
+        llm_model if llm_model is not None else settings.PROJ_LLM_MODEL,
+    )
+
+
+def _short_circuit_to_baseline(
+    breaker: CircuitBreaker,
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    top_n: int | None,
+    dev_mode: bool,
+) -> ProjectSelectionResult:
+    logger.warning(
+        "project_llm_circuit_open",
+        extra={"event": "project_llm_circuit_open", "job_title": context.title, "model": breaker.model},
+    )
+    return _fallback_to_baseline(
+        context=context,
+        candidates=candidates,
+        top_n=top_n,
+        dev_mode=dev_mode,
+        warning=f"Project LLM circuit open for {breaker.model}; used baseline",
+        llm_metadata={"model": breaker.model, "circuit": breaker.state},
+    )
+
+
+def _select_from_llm_result(
+    llm_result: LLMProjectScoreResult,
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    top_n: int | None,
+    dev_mode: bool,
 ) -> ProjectSelectionResult:
-    llm_metadata: dict[str, Any] | None = None
     try:
-        llm_result = score_projects_with_llm(
-            context=context,
-            candidates=candidates,
-            model=llm_model,
-            max_output_tokens=llm_max_output_tokens,
-        )
-        llm_metadata = llm_result.metadata
         scores, warnings = _validate_scores(llm_result.scores, candidates)
-    except (ProjectLLMClientError, ProjectLLMValidationError) as exc:
-        logger.warning(
-            "project_llm_fallback_to_baseline",
-            extra={
-                "event": "project_llm_fallback_to_baseline",
-                "job_title": context.title,
-                "error": str(exc),
-            },
-        )
-        return _fallback_to_baseline(
+    except ProjectLLMValidationError as exc:
+        return _fallback_after_error(
+            exc,
+            llm_result.metadata,
             context=context,
             candidates=candidates,
             top_n=top_n,
             dev_mode=dev_mode,
-            warning=f"Project LLM selection failed; fell back to baseline: {exc}",
-            llm_metadata=llm_metadata,
         )
 
     candidates_by_id = {candidate.id: candidate for candidate in candidates}
@@ -156,3 +202,66 @@ def llm_select_projects(
         ranked_projects=ranked_projects,
         details=details,
     )
+
+
+def llm_select_projects(
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    llm_model: str | None = None,
+    llm_max_output_tokens: int | None = None,
+) -> ProjectSelectionResult:
+    selection = {"context": context, "candidates": candidates, "top_n": top_n, "dev_mode": dev_mode}
+    breaker = _circuit_breaker(llm_model)
+    if not breaker.allow():
+        return _short_circuit_to_baseline(breaker, **selection)
+    start = time.perf_counter()
+    try:
+        llm_result = score_projects_with_llm(
+            context=context,
+            candidates=candidates,
+            model=llm_model,
+            max_output_tokens=llm_max_output_tokens,
+        )
+    except ProjectLLMClientError as exc:
+        breaker.record_failure(str(exc))
+        return _fallback_after_error(exc, None, **selection)
+    except BaseException as exc:
+        # Unexpected errors count too, or a half-open probe would never settle.
+        breaker.record_failure(f"{type(exc).__name__}: {exc}")
+        raise
+    breaker.record_success((time.perf_counter() - start) * 1000.0)
+    return _select_from_llm_result(llm_result, **selection)
+
+
+async def llm_select_projects_async(
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    llm_model: str | None = None,
+    llm_max_output_tokens: int | None = None,
+) -> ProjectSelectionResult:
+    selection = {"context": context, "candidates": candidates, "top_n": top_n, "dev_mode": dev_mode}
+    breaker = _circuit_breaker(llm_model)
+    if not breaker.allow():
+        return _short_circuit_to_baseline(breaker, **selection)
+    start = time.perf_counter()
+    try:
+        llm_result = await score_projects_with_llm_async(
+            context=context,
+            candidates=candidates,
+            model=llm_model,
+            max_output_tokens=llm_max_output_tokens,
+        )
+    except ProjectLLMClientError as exc:
+        breaker.record_failure(str(exc))
+        return _fallback_after_error(exc, None, **selection)
+    except BaseException as exc:
+        breaker.record_failure(f"{type(exc).__name__}: {exc}")
+        raise
+    breaker.record_success((time.perf_counter() - start) * 1000.0)
+    return _select_from_llm_result(llm_result, **selection)
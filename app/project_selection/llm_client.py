@@ -6,9 +6,17 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.openai_clients import (
+    ResponseExchange,
+    get_async_openai_client,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
 from app.project_selection.models import ProjectCandidate, ProjectJobContext
 from app.skill_selection.llm_client import supports_temperature
 
@@ -109,13 +117,23 @@ def build_project_response_create_kwargs(
     return kwargs
 
 
-def score_projects_with_llm(
+@dataclass
+class _ProjectScoreRequest:
+    api_key: str
+    model: str
+    max_output_tokens: int
+    instructions: str
+    prompt_payload: str
+    schema: dict[str, Any]
+
+
+def _prepare_project_score_request(
     *,
     context: ProjectJobContext,
     candidates: list[ProjectCandidate],
-    model: str | None = None,
-    max_output_tokens: int | None = None,
-) -> LLMProjectScoreResult:
+    model: str | None,
+    max_output_tokens: int | None,
+) -> _ProjectScoreRequest:
     prompt_payload = build_project_prompt_payload(context=context, candidates=candidates)
     schema = build_project_score_schema([candidate.id for candidate in candidates])
     instructions = (
@@ -125,8 +143,8 @@ def score_projects_with_llm(
         "rewrite projects. Scores must be integers from 0 to 3."
     )
 
-    api_key = getattr(settings, "OPENAI_API_KEY", "")
-    if not api_key.strip():
+    api_key = openai_api_key()
+    if not api_key:
         raise ProjectLLMClientError("OPENAI_API_KEY is required for project LLM scoring")
 
     effective_model = model if model is not None else settings.PROJ_LLM_MODEL
@@ -135,28 +153,41 @@ def score_projects_with_llm(
         if max_output_tokens is not None
         else settings.PROJ_LLM_MAX_OUTPUT_TOKENS
     )
+    return _ProjectScoreRequest(
+        api_key=api_key,
+        model=effective_model,
+        max_output_tokens=effective_max_output_tokens,
+        instructions=instructions,
+        prompt_payload=prompt_payload,
+        schema=schema,
+    )
 
+
+def _request_error(exc: Exception, request: _ProjectScoreRequest) -> ProjectLLMClientError:
+    logger.exception(
+        "project_llm_request_failed",
+        extra={
+            "event": "project_llm_request_failed",
+            "subsystem": "project_selection",
+            "model": request.model,
+        },
+    )
+    return ProjectLLMClientError(f"Project LLM request failed: {exc}")
+
+
+def _project_score_exchange(request: _ProjectScoreRequest) -> ResponseExchange[LLMProjectScoreResult]:
     start = time.perf_counter()
     try:
-        client = OpenAI(api_key=api_key)
         create_kwargs = build_project_response_create_kwargs(
-            model=effective_model,
-            instructions=instructions,
-            prompt_payload=prompt_payload,
-            schema=schema,
-            max_output_tokens=effective_max_output_tokens,
+            model=request.model,
+            instructions=request.instructions,
+            prompt_payload=request.prompt_payload,
+            schema=request.schema,
+            max_output_tokens=request.max_output_tokens,
         )
-        response = client.responses.create(**create_kwargs)
+        response = yield create_kwargs
     except Exception as exc:
-        logger.exception(
-            "project_llm_request_failed",
-            extra={
-                "event": "project_llm_request_failed",
-                "subsystem": "project_selection",
-                "model": effective_model,
-            },
-        )
-        raise ProjectLLMClientError(f"Project LLM request failed: {exc}") from exc
+        raise _request_error(exc, request) from exc
 
     latency_ms = (time.perf_counter() - start) * 1000.0
     output_text = getattr(response, "output_text", None)
@@ -169,9 +200,49 @@ def score_projects_with_llm(
         raise ProjectLLMClientError(f"Project LLM response was not valid JSON: {exc}") from exc
 
     metadata = {
-        "model": effective_model,
+        "model": request.model,
         "api_calls": 1,
         "latency_ms": round(latency_ms, 3),
         **_usage_metadata(response),
     }
     return LLMProjectScoreResult(scores=scores, metadata=metadata)
+
+
+def score_projects_with_llm(
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMProjectScoreResult:
+    request = _prepare_project_score_request(
+        context=context,
+        candidates=candidates,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request) from exc
+    return run_response_exchange(_project_score_exchange(request), client.responses.create)
+
+
+async def score_projects_with_llm_async(
+    *,
+    context: ProjectJobContext,
+    candidates: list[ProjectCandidate],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMProjectScoreResult:
+    request = _prepare_project_score_request(
+        context=context,
+        candidates=candidates,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _request_error(exc, request) from exc
+    return await run_response_exchange_async(_project_score_exchange(request), client.responses.create)
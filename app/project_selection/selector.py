@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from app.project_selection.baseline import baseline_select_projects
-from app.project_selection.llm import llm_select_projects
+from app.project_selection.llm import llm_select_projects, llm_select_projects_async
 from app.project_selection.models import (
     ProjectCandidate,
     ProjectJobContext,
@@ -39,6 +39,18 @@ def _validate_top_n(top_n: int | None) -> None:
         raise ValueError("top_n must be greater than or equal to 0")
 
 
+def _prepare_selection(
+    context: ProjectJobContext | dict[str, Any],
+    candidates: list[ProjectCandidate] | list[dict[str, Any]],
+    top_n: int | None,
+) -> tuple[ProjectJobContext, list[ProjectCandidate]]:
+    job_context = _coerce_context(context)
+    project_candidates = _coerce_candidates(candidates)
+    _validate_unique_project_ids(project_candidates)
+    _validate_top_n(top_n)
+    return job_context, project_candidates
+
+
 def select_projects(
     *,
     context: ProjectJobContext | dict[str, Any],
@@ -49,10 +61,7 @@ def select_projects(
     llm_model: str | None = None,
     llm_max_output_tokens: int | None = None,
 ) -> ProjectSelectionResult:
-    job_context = _coerce_context(context)
-    project_candidates = _coerce_candidates(candidates)
-    _validate_unique_project_ids(project_candidates)
-    _validate_top_n(top_n)
+    job_context, project_candidates = _prepare_selection(context, candidates, top_n)
 
     normalized_method = method.lower()
     if normalized_method == "baseline":
@@ -73,3 +82,34 @@ def select_projects(
         )
 
     raise ValueError(f"Unsupported project selection method: {method}")
+
+
+async def select_projects_async(
+    *,
+    context: ProjectJobContext | dict[str, Any],
+    candidates: list[ProjectCandidate] | list[dict[str, Any]],
+    method: str,
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    llm_model: str | None = None,
+    llm_max_output_tokens: int | None = None,
+) -> ProjectSelectionResult:
+    """`select_projects` with LLM scoring awaited on the async OpenAI client."""
+    if method.lower() != "llm":
+        return select_projects(
+            context=context,
+            candidates=candidates,
+            method=method,
+            top_n=top_n,
+            dev_mode=dev_mode,
+        )
+
+    job_context, project_candidates = _prepare_selection(context, candidates, top_n)
+    return await llm_select_projects_async(
+        context=job_context,
+        candidates=project_candidates,
+        top_n=top_n,
+        dev_mode=dev_mode,
+        llm_model=llm_model,
+        llm_max_output_tokens=llm_max_output_tokens,
+    )
@@ -5,12 +5,20 @@ import time
 
 from app.config import settings
 from app.metrics import metrics
+from app.project_selection.llm import METRICS_SUBSYSTEM
 from app.project_selection.models import ProjectSelectRequest, ProjectSelectionResult
-from app.project_selection.selector import select_projects
+from app.project_selection.selector import select_projects, select_projects_async
+from app.response_cache import ResponseCache, is_baseline_fallback
+from app.single_flight import stage_request_key
 
 logger = logging.getLogger("project_selector")
 
-METRICS_SUBSYSTEM = "project_selection"
+CACHED_METHODS = {"llm"}
+
+response_cache = ResponseCache(
+    max_entries=settings.SELECTION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SELECTION_CACHE_TTL_SECONDS,
+)
 
 
 def _effective_method(requested_method: str, result: ProjectSelectionResult) -> str:
@@ -50,62 +58,173 @@ def record_project_selection_error(method: str = "invalid") -> None:
     metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
 
 
-def select_projects_service(req: ProjectSelectRequest) -> ProjectSelectionResult:
+def _resolve_options(req: ProjectSelectRequest) -> tuple[str, int | None, bool]:
     method = req.method or settings.PROJ_METHOD
     top_n = req.top_n if req.top_n is not None else settings.PROJ_TOP_N
     dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
     if req.llm_max_output_tokens is not None and req.llm_max_output_tokens <= 0:
         raise ValueError("llm_max_output_tokens must be greater than 0")
+    return method, top_n, dev_mode
+
+
+def _response_cache_key(req: ProjectSelectRequest, method: str, top_n: int | None) -> str | None:
+    """Cache key for an LLM request, or None when the response is not cached.
+
+    `top_n` and `dev_mode` only shape the response, so they are left out of the key:
+    cached results rank every candidate and keep full details. A negative `top_n`
+    bypasses the cache so the selector rejects it.
+    """
+    if not settings.SELECTION_CACHE_ENABLED or method.lower() not in CACHED_METHODS:
+        return None
+    if top_n is not None and top_n < 0:
+        return None
+    payload = req.model_dump(mode="json", exclude={"top_n", "dev_mode"})
+    payload["method"] = method.lower()
+    return stage_request_key(stage="project_selection", payload=payload)
+
+
+def _store_selection(cache_key: str | None, result: ProjectSelectionResult) -> None:
+    if cache_key is not None and not is_baseline_fallback(result.details):
+        response_cache.put(cache_key, result)
+
+
+def _shape_cached_result(
+    result: ProjectSelectionResult,
+    *,
+    top_n: int | None,
+    dev_mode: bool,
+    cache_hit: bool,
+) -> ProjectSelectionResult:
+    details = result.details if dev_mode else None
+    if cache_hit and isinstance(details, dict):
+        details = {**details, "_response_cache": "hit"}
+    return ProjectSelectionResult(
+        selected_project_ids=result.selected_project_ids[:top_n],
+        ranked_projects=result.ranked_projects[:top_n],
+        details=details,
+    )
+
+
+def _record_selection(
+    *,
+    req: ProjectSelectRequest,
+    method: str,
+    top_n: int | None,
+    result: ProjectSelectionResult,
+    latency_ms: float,
+    cache_hit: bool = False,
+) -> None:
+    effective_method = _effective_method(method, result)
+    metrics.inc_request(method=effective_method, subsystem=METRICS_SUBSYSTEM)
+    if not cache_hit:
+        metrics.observe_tokens(_extract_total_tokens(result), subsystem=METRICS_SUBSYSTEM)
+    metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
+
+    logger.info(
+        "select_projects",
+        extra={
+            "event": "select_projects",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "method": effective_method,
+            "requested_method": method,
+            "top_n": top_n,
+            "latency_ms": round(latency_ms, 3),
+            "cache_hit": cache_hit,
+            "candidate_count": len(req.candidates),
+            "selected_count": len(result.selected_project_ids),
+        },
+    )
+
+
+def _record_selection_failure(req: ProjectSelectRequest, method: str) -> None:
+    record_project_selection_error(method)
+    logger.exception(
+        "select_projects_failed",
+        extra={
+            "event": "select_projects_failed",
+            "subsystem": METRICS_SUBSYSTEM,
+            "job_title": req.context.title,
+            "method": method,
+        },
+    )
+
 
+def select_projects_service(req: ProjectSelectRequest) -> ProjectSelectionResult:
+    """Rank project candidates for one job context.
+
+    With `SELECTION_CACHE_ENABLED`, LLM results are cached in process (see
+    `_response_cache_key`); baseline fallbacks are never cached.
+    """
+    method, top_n, dev_mode = _resolve_options(req)
+    cache_key = _response_cache_key(req, method, top_n)
     start = time.perf_counter()
-    request_counted = False
 
     try:
-        result = select_projects(
-            context=req.context,
-            candidates=req.candidates,
-            method=method,
-            top_n=top_n,
-            dev_mode=dev_mode,
-            llm_model=req.llm_model,
-            llm_max_output_tokens=req.llm_max_output_tokens,
-        )
-
-        latency_ms = (time.perf_counter() - start) * 1000.0
-        effective_method = _effective_method(method, result)
-        metrics.inc_request(method=effective_method, subsystem=METRICS_SUBSYSTEM)
-        request_counted = True
-        metrics.observe_tokens(_extract_total_tokens(result), subsystem=METRICS_SUBSYSTEM)
-        metrics.observe_latency_ms(latency_ms, subsystem=METRICS_SUBSYSTEM)
-
-        logger.info(
-            "select_projects",
-            extra={
-                "event": "select_projects",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.context.title,
-                "method": effective_method,
-                "requested_method": method,
-                "top_n": top_n,
-                "latency_ms": round(latency_ms, 3),
-                "candidate_count": len(req.candidates),
-                "selected_count": len(result.selected_project_ids),
-            },
-        )
-
-        return result
+        result = response_cache.get(cache_key) if cache_key is not None else None
+        cache_hit = result is not None
+        if result is None:
+            result = select_projects(
+                context=req.context,
+                candidates=req.candidates,
+                method=method,
+                top_n=None if cache_key is not None else top_n,
+                dev_mode=dev_mode or cache_key is not None,
+                llm_model=req.llm_model,
+                llm_max_output_tokens=req.llm_max_output_tokens,
+            )
+            _store_selection(cache_key, result)
+    except Exception:
+        _record_selection_failure(req, method)
+        raise
+
+    if cache_key is not None:
+        result = _shape_cached_result(result, top_n=top_n, dev_mode=dev_mode, cache_hit=cache_hit)
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    _record_selection(
+        req=req,
+        method=method,
+        top_n=top_n,
+        result=result,
+        latency_ms=latency_ms,
+        cache_hit=cache_hit,
+    )
+    return result
+
+
+async def select_projects_service_async(req: ProjectSelectRequest) -> ProjectSelectionResult:
+    """`select_projects_service` with LLM scoring awaited on the async OpenAI client."""
+    method, top_n, dev_mode = _resolve_options(req)
+    cache_key = _response_cache_key(req, method, top_n)
+    start = time.perf_counter()
 
+    try:
+        result = response_cache.get(cache_key) if cache_key is not None else None
+        cache_hit = result is not None
+        if result is None:
+            result = await select_projects_async(
+                context=req.context,
+                candidates=req.candidates,
+                method=method,
+                top_n=None if cache_key is not None else top_n,
+                dev_mode=dev_mode or cache_key is not None,
+                llm_model=req.llm_model,
+                llm_max_output_tokens=req.llm_max_output_tokens,
+            )
+            _store_selection(cache_key, result)
     except Exception:
-        if not request_counted:
-            metrics.inc_request(method=method, subsystem=METRICS_SUBSYSTEM)
-        metrics.inc_error(subsystem=METRICS_SUBSYSTEM)
-        logger.exception(
-            "select_projects_failed",
-            extra={
-                "event": "select_projects_failed",
-                "subsystem": METRICS_SUBSYSTEM,
-                "job_title": req.context.title,
-                "method": method,
-            },
-        )
+        _record_selection_failure(req, method)
         raise
+
+    if cache_key is not None:
+        result = _shape_cached_result(result, top_n=top_n, dev_mode=dev_mode, cache_hit=cache_hit)
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    _record_selection(
+        req=req,
+        method=method,
+        top_n=top_n,
+        result=result,
+        latency_ms=latency_ms,
+        cache_hit=cache_hit,
+    )
+    return result
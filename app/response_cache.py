@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def is_baseline_fallback(details: Any) -> bool:
+    """Whether selection `details` show a model-backed method that fell back to baseline.
+
+    Fallbacks are never cached: the next identical request should retry the model.
+    """
+    if not isinstance(details, dict):
+        return False
+
+    if details.get("_fallback_method") == "baseline":
+        return True
+
+    for llm_key in ("_llm", "_project_llm"):
+        llm_metadata = details.get(llm_key)
+        if isinstance(llm_metadata, dict) and llm_metadata.get("fallback") == "baseline":
+            return True
+
+    return False
+
+
+class ResponseCache:
+    """In-process response cache bounded by entry count (LRU) and age (TTL).
+
+    Values are deep-copied on the way in and out, so callers can mutate what they
+    get back. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self._clock(), stored)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -8,6 +8,7 @@ from app.config import settings
 from app.resume_evidence.models import ExperienceRecord, ProjectRecord
 from app.resume_generation.cache import ResumeGenerationStageCache
 from app.resume_generation.models import (
+    BulletPointGenerationConfig,
     ExperienceBulletPointResult,
     JobFocusResult,
     JobTarget,
@@ -15,11 +16,20 @@ from app.resume_generation.models import (
     ResumeGenerationConfig,
 )
 from app.resume_generation.selection import (
+    ResumeGenerationError,
     _cached_post_json,
     _exclude_none,
+    _post_json,
+    _record_stage_response,
     open_stage_client,
 )
-from app.resume_generation.token_usage import ResumeGenerationTokenUsageMonitor
+from app.resume_generation.token_usage import (
+    ResumeGenerationTokenUsageMonitor,
+    extract_response_token_usage,
+)
+
+BULLET_ENDPOINT = "/generate-bulletpoints"
+BULLET_BATCH_ENDPOINT = "/generate-bulletpoints/batch"
 
 
 def _effective_bullet_count_range(payload: dict[str, Any]) -> tuple[int, int]:
@@ -84,60 +94,240 @@ def _shape_bullet_response(
     return shaped
 
 
-def generate_project_bullet_points(
+def _bullet_batch_payload(
+    payloads: list[dict[str, Any]],
     *,
-    selected_projects: Iterable[ProjectRecord],
+    evidence_type: str,
+    dev_mode: bool | None,
+) -> dict[str, Any]:
+    # Context and LLM settings are identical across a stage's payloads, so they are
+    # sent once per batch; only the evidence and count range vary per record.
+    batch_payload = {
+        key: value
+        for key, value in payloads[0].items()
+        if key not in {evidence_type, "bullet_count_range"}
+    }
+    if dev_mode is not None:
+        batch_payload["dev_mode"] = dev_mode
+    batch_payload["records"] = [
+        {
+            evidence_type: payload[evidence_type],
+            **(
+                {"bullet_count_range": payload["bullet_count_range"]}
+                if "bullet_count_range" in payload
+                else {}
+            ),
+        }
+        for payload in payloads
+    ]
+    return batch_payload
+
+
+def _batched_bullet_responses(
+    *,
+    cache: ResumeGenerationStageCache | None,
+    stage: str,
+    evidence_type: str,
+    client: httpx.Client,
+    payloads: list[dict[str, Any]],
+    batch_size: int,
+    token_usage_monitor: ResumeGenerationTokenUsageMonitor | None,
+    stage_response_records: list[dict] | None,
+) -> list[dict[str, Any]]:
+    """Per-record responses, fetching cache misses `batch_size` records at a time.
+
+    Cache entries use the same keys as single-record requests, so hits are resolved
+    per record before any batch is sent and batched results are stored per record.
+    """
+    responses: list[dict[str, Any]] = [{} for _ in payloads]
+    missing: list[int] = []
+    for index, payload in enumerate(payloads):
+        record_id = payload[evidence_type]["id"]
+        cached = None
+        if cache is not None:
+            cached = cache.lookup(
+                stage=stage,
+                payload=_bullet_cache_payload(payload, evidence_type=evidence_type),
+                namespace=record_id,
+                should_use_cached=lambda data, request_payload=payload: (
+                    _bullet_count_matches_request(data, payload=request_payload)
+                ),
+            )
+        if cached is None:
+            missing.append(index)
+            continue
+        responses[index] = cached.data
+        _record_stage_response(
+            stage=stage,
+            endpoint=BULLET_ENDPOINT,
+            namespace=record_id,
+            source="cache",
+            cache_status="hit",
+            cache_key=cached.cache_key,
+            payload=payload,
+            token_usage=extract_response_token_usage(stage, cached.data),
+            token_usage_monitor=token_usage_monitor,
+            stage_response_records=stage_response_records,
+        )
+
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start : start + batch_size]
+        record_ids = [payloads[index][evidence_type]["id"] for index in chunk]
+        batch_payload = _bullet_batch_payload(
+            [payloads[index] for index in chunk],
+            evidence_type=evidence_type,
+            dev_mode=True if cache is not None else None,
+        )
+        data = _post_json(client, BULLET_BATCH_ENDPOINT, batch_payload)
+        results = data.get("results")
+        if not isinstance(results, list) or [
+            result.get("evidence_id") if isinstance(result, dict) else None
+            for result in results
+        ] != record_ids:
+            raise ResumeGenerationError(
+                f"HTTP response from {BULLET_BATCH_ENDPOINT} did not match the requested "
+                f"{evidence_type} records"
+            )
+
+        # Shared batch usage plus any records the service regenerated on their own.
+        token_usage = extract_response_token_usage(stage, data)
+        for result in results:
+            token_usage.add(extract_response_token_usage(stage, result))
+        _record_stage_response(
+            stage=stage,
+            endpoint=BULLET_BATCH_ENDPOINT,
+            namespace=",".join(record_ids),
+            source="http",
+            cache_status=(
+                "disabled" if cache is None else "refresh" if cache.force_refresh else "miss"
+            ),
+            cache_key=None,
+            payload=batch_payload,
+            token_usage=token_usage,
+            token_usage_monitor=token_usage_monitor,
+            stage_response_records=stage_response_records,
+        )
+
+        for index, result, record_id in zip(chunk, results, record_ids):
+            record_data: dict[str, Any] = {"bullet_points": result.get("bullet_points", [])}
+            if result.get("details") is not None:
+                record_data["details"] = result["details"]
+            if cache is not None:
+                cache.store(
+                    stage=stage,
+                    payload=_bullet_cache_payload(payloads[index], evidence_type=evidence_type),
+                    data=record_data,
+                    namespace=record_id,
+                )
+            responses[index] = record_data
+
+    return responses
+
+
+def _generate_bullet_responses(
+    *,
+    stage: str,
+    evidence_type: str,
+    records: list[ProjectRecord] | list[ExperienceRecord],
+    generation_config: BulletPointGenerationConfig,
     config: ResumeGenerationConfig,
     job_target: JobTarget,
-    job_focus: JobFocusResult | None = None,
-    cache: ResumeGenerationStageCache | None = None,
-    token_usage_monitor: ResumeGenerationTokenUsageMonitor | None = None,
-    stage_response_records: list[dict] | None = None,
-) -> list[ProjectBulletPointResult]:
-    bullet_config = _exclude_none(config.project_bullet_point_generation)
+    job_focus: JobFocusResult | None,
+    cache: ResumeGenerationStageCache | None,
+    token_usage_monitor: ResumeGenerationTokenUsageMonitor | None,
+    stage_response_records: list[dict] | None,
+) -> list[dict[str, Any]]:
+    bullet_config = _exclude_none(generation_config)
+    batch_size = bullet_config.pop("batch_size", None)
+
+    context_payload: dict[str, Any] = {"title": job_target.title}
+    if job_focus is not None:
+        context_payload["job_focus"] = job_focus.model_dump()
+    else:
+        context_payload["description"] = job_target.description
+    payloads = [
+        {
+            "context": context_payload,
+            evidence_type: record.model_dump(),
+            **bullet_config,
+        }
+        for record in records
+    ]
 
-    results: list[ProjectBulletPointResult] = []
     with open_stage_client(config, httpx.Client) as client:
-        for project in selected_projects:
-            context_payload: dict[str, Any] = {"title": job_target.title}
-            if job_focus is not None:
-                context_payload["job_focus"] = job_focus.model_dump()
-            else:
-                context_payload["description"] = job_target.description
-            payload = {
-                "context": context_payload,
-                "project": project.model_dump(),
-                **bullet_config,
-            }
-            response = _cached_post_json(
+        if batch_size is not None and payloads:
+            responses = _batched_bullet_responses(
                 cache=cache,
-                stage="project_bullet_points",
+                stage=stage,
+                evidence_type=evidence_type,
                 client=client,
-                endpoint="/generate-bulletpoints",
-                payload=payload,
-                cache_payload=_bullet_cache_payload(
-                    payload,
-                    evidence_type="project",
-                ),
-                fetch_payload=_bullet_fetch_payload(payload),
-                namespace=project.id,
-                should_use_cached=lambda data, request_payload=payload: (
-                    _bullet_count_matches_request(data, payload=request_payload)
-                ),
+                payloads=payloads,
+                batch_size=batch_size,
                 token_usage_monitor=token_usage_monitor,
                 stage_response_records=stage_response_records,
             )
-            if cache is not None:
-                response = _shape_bullet_response(response, payload=payload)
-            results.append(
-                ProjectBulletPointResult(
-                    project_id=project.id,
-                    bullet_points=response["bullet_points"],
-                    details=response.get("details"),
+        else:
+            responses = [
+                _cached_post_json(
+                    cache=cache,
+                    stage=stage,
+                    client=client,
+                    endpoint=BULLET_ENDPOINT,
+                    payload=payload,
+                    cache_payload=_bullet_cache_payload(
+                        payload,
+                        evidence_type=evidence_type,
+                    ),
+                    fetch_payload=_bullet_fetch_payload(payload),
+                    namespace=payload[evidence_type]["id"],
+                    should_use_cached=lambda data, request_payload=payload: (
+                        _bullet_count_matches_request(data, payload=request_payload)
+                    ),
+                    token_usage_monitor=token_usage_monitor,
+                    stage_response_records=stage_response_records,
                 )
-            )
+                for payload in payloads
+            ]
+
+    if cache is None:
+        return responses
+    return [
+        _shape_bullet_response(response, payload=payload)
+        for response, payload in zip(responses, payloads)
+    ]
 
-    return results
+
+def generate_project_bullet_points(
+    *,
+    selected_projects: Iterable[ProjectRecord],
+    config: ResumeGenerationConfig,
+    job_target: JobTarget,
+    job_focus: JobFocusResult | None = None,
+    cache: ResumeGenerationStageCache | None = None,
+    token_usage_monitor: ResumeGenerationTokenUsageMonitor | None = None,
+    stage_response_records: list[dict] | None = None,
+) -> list[ProjectBulletPointResult]:
+    projects = list(selected_projects)
+    responses = _generate_bullet_responses(
+        stage="project_bullet_points",
+        evidence_type="project",
+        records=projects,
+        generation_config=config.project_bullet_point_generation,
+        config=config,
+        job_target=job_target,
+        job_focus=job_focus,
+        cache=cache,
+        token_usage_monitor=token_usage_monitor,
+        stage_response_records=stage_response_records,
+    )
+    return [
+        ProjectBulletPointResult(
+            project_id=project.id,
+            bullet_points=response["bullet_points"],
+            details=response.get("details"),
+        )
+        for project, response in zip(projects, responses)
+    ]
 
 
 def generate_experience_bullet_points(
@@ -150,49 +340,24 @@ def generate_experience_bullet_points(
     token_usage_monitor: ResumeGenerationTokenUsageMonitor | None = None,
     stage_response_records: list[dict] | None = None,
 ) -> list[ExperienceBulletPointResult]:
-    bullet_config = _exclude_none(config.experience_bullet_point_generation)
-
-    results: list[ExperienceBulletPointResult] = []
-    with open_stage_client(config, httpx.Client) as client:
-        for item in experience:
-            if not item.active:
-                continue
-            context_payload: dict[str, Any] = {"title": job_target.title}
-            if job_focus is not None:
-                context_payload["job_focus"] = job_focus.model_dump()
-            else:
-                context_payload["description"] = job_target.description
-            payload = {
-                "context": context_payload,
-                "experience": item.model_dump(),
-                **bullet_config,
-            }
-            response = _cached_post_json(
-                cache=cache,
-                stage="experience_bullet_points",
-                client=client,
-                endpoint="/generate-bulletpoints",
-                payload=payload,
-                cache_payload=_bullet_cache_payload(
-                    payload,
-                    evidence_type="experience",
-                ),
-                fetch_payload=_bullet_fetch_payload(payload),
-                namespace=item.id,
-                should_use_cached=lambda data, request_payload=payload: (
-                    _bullet_count_matches_request(data, payload=request_payload)
-                ),
-                token_usage_monitor=token_usage_monitor,
-                stage_response_records=stage_response_records,
-            )
-            if cache is not None:
-                response = _shape_bullet_response(response, payload=payload)
-            results.append(
-                ExperienceBulletPointResult(
-                    experience_id=item.id,
-                    bullet_points=response["bullet_points"],
-                    details=response.get("details"),
-                )
-            )
-
-    return results
+    active_experience = [item for item in experience if item.active]
+    responses = _generate_bullet_responses(
+        stage="experience_bullet_points",
+        evidence_type="experience",
+        records=active_experience,
+        generation_config=config.experience_bullet_point_generation,
+        config=config,
+        job_target=job_target,
+        job_focus=job_focus,
+        cache=cache,
+        token_usage_monitor=token_usage_monitor,
+        stage_response_records=stage_response_records,
+    )
+    return [
+        ExperienceBulletPointResult(
+            experience_id=item.id,
+            bullet_points=response["bullet_points"],
+            details=response.get("details"),
+        )
+        for item, response in zip(active_experience, responses)
+    ]
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 from app.resume_generation.models import ResumeGenerationCacheConfig
+from app.single_flight import stage_request_key
 
 _CACHE_VERSION = 1
 _SAFE_SEGMENT_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
@@ -88,27 +89,22 @@ class ResumeGenerationStageCache:
         should_use_cached: Callable[[dict[str, Any]], bool] | None = None,
         should_store: Callable[[dict[str, Any]], bool] | None = None,
     ) -> ResumeGenerationStageCacheResult:
-        cache_key = self.cache_key(
+        key_payload = cache_payload if cache_payload is not None else payload
+        cached = self.lookup(
             stage=stage,
-            payload=cache_payload if cache_payload is not None else payload,
+            payload=key_payload,
+            namespace=namespace,
+            should_use_cached=should_use_cached,
         )
-        path = self._entry_path(stage=stage, cache_key=cache_key, namespace=namespace)
-
-        if not self.force_refresh:
-            cached_data = self._read(path=path, stage=stage, cache_key=cache_key)
-            if cached_data is not None and (
-                should_use_cached is None or should_use_cached(cached_data)
-            ):
-                return ResumeGenerationStageCacheResult(
-                    data=cached_data,
-                    source="cache",
-                    cache_key=cache_key,
-                )
+        if cached is not None:
+            return cached
 
         data = fetch()
         stored = should_store(data) if should_store is not None else True
         if stored:
-            self._write(path=path, stage=stage, cache_key=cache_key, data=data)
+            cache_key = self.store(stage=stage, payload=key_payload, data=data, namespace=namespace)
+        else:
+            cache_key = self.cache_key(stage=stage, payload=key_payload)
         return ResumeGenerationStageCacheResult(
             data=data,
             source="http",
@@ -116,13 +112,49 @@ class ResumeGenerationStageCache:
             stored=stored,
         )
 
-    def cache_key(self, *, stage: str, payload: dict[str, Any]) -> str:
-        canonical_payload = json.dumps(
-            {"stage": stage, "payload": payload},
-            sort_keys=True,
-            separators=(",", ":"),
+    def lookup(
+        self,
+        *,
+        stage: str,
+        payload: dict[str, Any],
+        namespace: str | None = None,
+        should_use_cached: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> ResumeGenerationStageCacheResult | None:
+        '''
+        Return the usable cache entry for payload, or None on a miss or force refresh.
+        Lets callers that fetch several entries in one request check each entry first.
+        '''
+        if self.force_refresh:
+            return None
+
+        cache_key = self.cache_key(stage=stage, payload=payload)
+        path = self._entry_path(stage=stage, cache_key=cache_key, namespace=namespace)
+        cached_data = self._read(path=path, stage=stage, cache_key=cache_key)
+        if cached_data is None or (
+            should_use_cached is not None and not should_use_cached(cached_data)
+        ):
+            return None
+        return ResumeGenerationStageCacheResult(
+            data=cached_data,
+            source="cache",
+            cache_key=cache_key,
         )
-        return hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+
+    def store(
+        self,
+        *,
+        stage: str,
+        payload: dict[str, Any],
+        data: dict[str, Any],
+        namespace: str | None = None,
+    ) -> str:
+        cache_key = self.cache_key(stage=stage, payload=payload)
+        path = self._entry_path(stage=stage, cache_key=cache_key, namespace=namespace)
+        self._write(path=path, stage=stage, cache_key=cache_key, data=data)
+        return cache_key
+
+    def cache_key(self, *, stage: str, payload: dict[str, Any]) -> str:
+        return stage_request_key(stage=stage, payload=payload)
 
     def _entry_path(
         self,
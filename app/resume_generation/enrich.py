@@ -12,6 +12,7 @@ import yaml
 
 from app.link_scanning.models import LinkScanRequest, LinkScanResponse
 from app.link_scanning.service import scan_link_evidence_service
+from app.model_scheduler import model_call_priority
 from app.resume_evidence.loader import default_evidence_paths, load_evidence_yaml
 from app.resume_evidence.models import (
     ExperienceFile,
@@ -232,6 +233,7 @@ def _enrich_records_data(
     return updated_data, tuple(results), changed, matched_target
 
 
+@model_call_priority("batch")
 def run_link_evidence_enrichment(
     *,
     evidence_type: EvidenceSchema = "all",
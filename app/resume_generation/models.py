@@ -128,6 +128,15 @@ class BulletPointGenerationConfig(StrictSchemaModel):
     dev_mode: bool | None = None
     llm_model: str | None = None
     llm_max_output_tokens: int | None = None
+    # Records per /generate-bulletpoints/batch call; unset sends one request per record.
+    batch_size: int | None = None
+
+    @field_validator("batch_size")
+    @classmethod
+    def validate_batch_size(cls, value: int | None) -> int | None:
+        if value is not None and value < 1:
+            raise ValueError("batch_size must be greater than or equal to 1")
+        return value
 
     @field_validator("llm_model")
     @classmethod
@@ -7,9 +7,13 @@ from typing import Any, Callable, Mapping
 import httpx
 from pydantic import BaseModel
 
-from app.bulletpoints_generation.models import BulletGenerationRequest
+from app.bulletpoints_generation.models import (
+    BulletGenerationBatchRequest,
+    BulletGenerationRequest,
+)
 from app.bulletpoints_generation.service import (
     BulletPointGenerationError,
+    generate_bulletpoints_batch_service,
     generate_bulletpoints_service,
 )
 from app.config import settings
@@ -20,6 +24,7 @@ from app.job_focus_generation.service import (
 )
 from app.project_selection.models import ProjectSelectRequest
 from app.project_selection.service import select_projects_service
+from app.response_cache import is_baseline_fallback
 from app.resume_evidence import ProjectsFile, SkillsFile, default_evidence_paths
 from app.resume_generation.config import (
     DEFAULT_GENERATION_CONFIG_PATH,
@@ -35,6 +40,7 @@ from app.resume_generation.models import (
 )
 from app.resume_generation.token_usage import (
     ResumeGenerationTokenUsageMonitor,
+    TokenUsage,
     extract_response_token_usage,
 )
 from app.skill_selection.models import SkillSelectRequest
@@ -82,6 +88,10 @@ class LocalStageClient:
                 response = generate_bulletpoints_service(
                     BulletGenerationRequest.model_validate(json)
                 )
+            elif endpoint == "/generate-bulletpoints/batch":
+                response = generate_bulletpoints_batch_service(
+                    BulletGenerationBatchRequest.model_validate(json)
+                )
             else:
                 return _LocalStageResponse(404, {"detail": f"Unknown stage: {endpoint}"})
         except (BulletPointGenerationError, JobFocusGenerationError) as exc:
@@ -280,25 +290,7 @@ def _should_cache_stage_response(
     if stage not in {"skill_selection", "project_selection"}:
         return True
 
-    details = response_data.get("details")
-    if not isinstance(details, dict):
-        return True
-
-    if details.get("_fallback_method") == "baseline":
-        return False
-
-    llm_metadata = details.get("_llm")
-    if isinstance(llm_metadata, dict) and llm_metadata.get("fallback") == "baseline":
-        return False
-
-    project_llm_metadata = details.get("_project_llm")
-    if (
-        isinstance(project_llm_metadata, dict)
-        and project_llm_metadata.get("fallback") == "baseline"
-    ):
-        return False
-
-    return True
+    return not is_baseline_fallback(response_data.get("details"))
 
 
 def _should_use_cached_stage_response(
@@ -309,6 +301,42 @@ def _should_use_cached_stage_response(
     return _should_cache_stage_response(stage=stage, response_data=response_data)
 
 
+def _record_stage_response(
+    *,
+    stage: str,
+    endpoint: str,
+    namespace: str | None,
+    source: str,
+    cache_status: str,
+    cache_key: str | None,
+    payload: dict[str, Any],
+    token_usage: TokenUsage,
+    token_usage_monitor: ResumeGenerationTokenUsageMonitor | None,
+    stage_response_records: list[dict[str, Any]] | None,
+) -> None:
+    if token_usage_monitor is not None:
+        token_usage_monitor.observe(stage, token_usage)
+    record = {
+        "stage": stage,
+        "endpoint": endpoint,
+        "namespace": namespace,
+        "source": source,
+        "cache_status": cache_status,
+        "cache_key": cache_key,
+        "llm_max_output_tokens": payload.get("llm_max_output_tokens"),
+        **token_usage.model_dump(),
+    }
+    if stage_response_records is not None:
+        stage_response_records.append(record)
+    logger.info(
+        "resume_generation_stage_response",
+        extra={
+            "event": "resume_generation_stage_response",
+            **record,
+        },
+    )
+
+
 def _cached_post_json(
     *,
     cache: ResumeGenerationStageCache | None,
@@ -325,27 +353,17 @@ def _cached_post_json(
 ) -> dict[str, Any]:
     if cache is None:
         data = _post_json(client, endpoint, payload)
-        token_usage = extract_response_token_usage(stage, data)
-        if token_usage_monitor is not None:
-            token_usage_monitor.observe(stage, token_usage)
-        record = {
-            "stage": stage,
-            "endpoint": endpoint,
-            "namespace": namespace,
-            "source": "http",
-            "cache_status": "disabled",
-            "cache_key": None,
-            "llm_max_output_tokens": payload.get("llm_max_output_tokens"),
-            **token_usage.model_dump(),
-        }
-        if stage_response_records is not None:
-            stage_response_records.append(record)
-        logger.info(
-            "resume_generation_stage_response",
-            extra={
-                "event": "resume_generation_stage_response",
-                **record,
-            },
+        _record_stage_response(
+            stage=stage,
+            endpoint=endpoint,
+            namespace=namespace,
+            source="http",
+            cache_status="disabled",
+            cache_key=None,
+            payload=payload,
+            token_usage=extract_response_token_usage(stage, data),
+            token_usage_monitor=token_usage_monitor,
+            stage_response_records=stage_response_records,
         )
         return data
 
@@ -362,9 +380,6 @@ def _cached_post_json(
             response_data=data,
         ),
     )
-    token_usage = extract_response_token_usage(stage, result.data)
-    if token_usage_monitor is not None:
-        token_usage_monitor.observe(stage, token_usage)
     cache_status = (
         "hit"
         if result.source == "cache"
@@ -374,24 +389,17 @@ def _cached_post_json(
         if cache.force_refresh
         else "miss"
     )
-    record = {
-        "stage": stage,
-        "endpoint": endpoint,
-        "namespace": namespace,
-        "source": result.source,
-        "cache_status": cache_status,
-        "cache_key": result.cache_key,
-        "llm_max_output_tokens": payload.get("llm_max_output_tokens"),
-        **token_usage.model_dump(),
-    }
-    if stage_response_records is not None:
-        stage_response_records.append(record)
-    logger.info(
-        "resume_generation_stage_response",
-        extra={
-            "event": "resume_generation_stage_response",
-            **record,
-        },
+    _record_stage_response(
+        stage=stage,
+        endpoint=endpoint,
+        namespace=namespace,
+        source=result.source,
+        cache_status=cache_status,
+        cache_key=result.cache_key,
+        payload=payload,
+        token_usage=extract_response_token_usage(stage, result.data),
+        token_usage_monitor=token_usage_monitor,
+        stage_response_records=stage_response_records,
     )
     return result.data
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def stage_request_key(*, stage: str, payload: dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON of a stage name and payload.
+
+    This is also the resume-generation stage cache key, so a request coalesced here and
+    an entry in that cache identify the same stage call.
+    """
+    canonical_payload = json.dumps(
+        {"stage": stage, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight(Generic[T]):
+    """Shares one in-flight call between concurrent async callers with the same key.
+
+    The first caller for a key starts the call as a task; callers that arrive before it
+    finishes await the same task instead of starting another. The key is released as
+    soon as the call finishes, so later callers start a fresh call. Errors are shared
+    like results. A caller that is cancelled does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Return `(result, shared)`; `shared` is True when another caller's call was reused."""
+        loop = asyncio.get_running_loop()
+        slot = (loop, key)
+        task = self._calls.get(slot)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        task = loop.create_task(call())
+        self._calls[slot] = task
+
+        def release(finished: asyncio.Task[T]) -> None:
+            if self._calls.get(slot) is finished:
+                del self._calls[slot]
+            if not finished.cancelled():
+                # Mark the error retrieved even if every caller was cancelled.
+                finished.exception()
+
+        task.add_done_callback(release)
+        return await asyncio.shield(task), False
@@ -1,6 +1,15 @@
-from app.skill_selection.models import SkillSelectRequest, SkillSelectResponse
+from app.skill_selection.models import (
+    SkillSelectBatchRequest,
+    SkillSelectBatchResponse,
+    SkillSelectRequest,
+    SkillSelectResponse,
+    SkillSelectTarget,
+)
 
 __all__ = [
+    "SkillSelectBatchRequest",
+    "SkillSelectBatchResponse",
     "SkillSelectRequest",
     "SkillSelectResponse",
+    "SkillSelectTarget",
 ]
@@ -1,105 +1,422 @@
-import json
+import hashlib
 import logging
-import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Mapping
+
+import numpy as np
 
 from app.config import settings
+from app.skill_selection.embedding_journal import EmbeddingJournal
+from app.skill_selection.embedding_store import EmbeddingStore
+from app.skill_selection.file_lock import exclusive_file_lock
 
 logger = logging.getLogger("embedding_cache")
 
+EMBEDDING_CACHE_ROOT = Path(__file__).parent / "data" / "embeddings"
+CACHE_TYPES = ("role", "skill")
+ROLE_KEY_PATTERN = re.compile(r"^b2:[0-9a-f]{32}$")
+DEFAULT_ROLE_CACHE_MAX_ENTRIES = 5000
+DEFAULT_ROLE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def role_cache_key(role_text: str) -> str:
+    """Key a role embedding by a digest of its whitespace-normalized text."""
+    normalized = " ".join(role_text.split())
+    return "b2:" + hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _entry_bytes(key: str, vector) -> int:
+    nbytes = getattr(vector, "nbytes", None)
+    if nbytes is None:
+        nbytes = len(vector) * np.dtype(np.float32).itemsize
+    return len(key) + int(nbytes)
+
+
+class LRUBudget:
+    """Recency order, size accounting, and hit/miss/eviction counters for one cache type."""
+
+    def __init__(self, max_entries: int | None, max_bytes: int | None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._order: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def record(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            if key in self._order:
+                self._order.move_to_end(key)
+
+    def add(self, key: str, nbytes: int) -> None:
+        with self._lock:
+            self.bytes += nbytes - self._order.pop(key, 0)
+            self._order[key] = nbytes
+
+    def reconcile(self, store: Mapping) -> None:
+        """Track entries added behind our back (other workers, replay) as least recent."""
+        with self._lock:
+            for key in [key for key in self._order if key not in store]:
+                self.bytes -= self._order.pop(key)
+            # Reversed so untracked keys keep their store order ahead of tracked ones.
+            for key in reversed([key for key in store if key not in self._order]):
+                nbytes = _entry_bytes(key, store[key])
+                self._order[key] = nbytes
+                self._order.move_to_end(key, last=False)
+                self.bytes += nbytes
+
+    def evict(self) -> list[str]:
+        """Pop least recently used keys until the budget holds; return them."""
+        evicted: list[str] = []
+        with self._lock:
+            while self._order and (
+                (self.max_entries is not None and len(self._order) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                key, nbytes = self._order.popitem(last=False)
+                self.bytes -= nbytes
+                evicted.append(key)
+            self.evictions += len(evicted)
+        return evicted
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._order),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
 class EmbeddingCache:
-    def __init__(self, model: str):
-        self._ROLE_EMB_CACHE_DIR = Path(__file__).parent / "data" / "embeddings" / model / "role_cache.json"
-        self._SKILL_EMB_CACHE_DIR = Path(__file__).parent / "data" / "embeddings" / model / "skill_cache.json"
+    """Role and skill embedding stores that several worker processes can share.
+
+    New vectors go to an append-only journal (ADR-019). Journal appends, reads, and
+    compaction run under an exclusive file lock on `cache.lock`, so every worker using
+    the same `cache_dir` can tail the journal for vectors the others added (`refresh`),
+    and compaction merges everything on disk before it rewrites the stores.
+
+    With `persist=False` the cache is in-memory only (plain dicts, no files or locks),
+    for providers whose vectors are cheaper to recompute than to write to disk.
+
+    Role entries are keyed by `role_cache_key` (full job descriptions never become keys)
+    and bounded by an entry count and byte budget with LRU eviction; evicted rows are
+    dropped from disk at the next compaction.
+
+    `skill_dtype` ("float32", "float16", or "int8") sets how skill rows are stored; the
+    journal always keeps full-precision vectors.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        cache_dir: Path | None = None,
+        compact_bytes: int | None = None,
+        persist: bool = True,
+        role_max_entries: int | None = None,
+        role_max_bytes: int | None = None,
+        skill_dtype: str | None = None,
+    ):
+        self.cache_dir = cache_dir if cache_dir is not None else EMBEDDING_CACHE_ROOT / model
         self.model = model
+        self.persist = persist
         self.dimensions = getattr(settings, "EMBEDDING_DIMENSIONS", None)
-        self.role_cache, self.skill_cache = self._load_embeddings_cache()
+        self.skill_dtype = (
+            skill_dtype if skill_dtype is not None else getattr(settings, "EMBEDDING_SKILL_STORE_DTYPE", "float32")
+        )
+        self.compact_bytes = (
+            compact_bytes
+            if compact_bytes is not None
+            else getattr(settings, "EMBEDDING_JOURNAL_COMPACT_BYTES", 8 * 1024 * 1024)
+        )
+        self.journal = EmbeddingJournal(self.cache_dir / "cache.journal", model=model)
+        self.lock_path = self.cache_dir / "cache.lock"
+        self._write_lock = threading.RLock()
+        self._batch_state = threading.local()
+        self._compactor: threading.Thread | None = None
+        self._journal_generation: bytes | None = None
+        self._journal_offset = 0
+        self._store_stamps: dict[str, tuple[int, int, int] | None] = {}
+        self.role_budget = LRUBudget(
+            role_max_entries
+            if role_max_entries is not None
+            else getattr(settings, "ROLE_EMBEDDING_CACHE_MAX_ENTRIES", DEFAULT_ROLE_CACHE_MAX_ENTRIES),
+            role_max_bytes
+            if role_max_bytes is not None
+            else getattr(settings, "ROLE_EMBEDDING_CACHE_MAX_BYTES", DEFAULT_ROLE_CACHE_MAX_BYTES),
+        )
+        if persist:
+            self.role_cache, self.skill_cache = self._load_embeddings_cache()
+        else:
+            self.role_cache, self.skill_cache = {}, {}
 
-    def _load_embeddings_cache(self) -> tuple[dict, dict]:
-        model = getattr(self, "model", None)
-        dimensions = getattr(self, "dimensions", None)
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._write_lock, exclusive_file_lock(self.lock_path):
+            yield
 
-        # load role
-        try:
-            with open(self._ROLE_EMB_CACHE_DIR) as f:
-                self.role_cache = self._parse_cache_payload(json.load(f), model, dimensions)
-        except FileNotFoundError:
-            logger.warning(
-                "role_embedding_cache_not_found",
-                extra={"event": "role_embedding_cache_not_found", "cache_path": str(self._ROLE_EMB_CACHE_DIR)},
-            )
-            self.role_cache = {}
-        
-        # load skill
-        try:
-            with open(self._SKILL_EMB_CACHE_DIR) as f:
-                self.skill_cache = self._parse_cache_payload(json.load(f), model, dimensions)
-        except FileNotFoundError:
-            logger.warning(
-                "skill_embedding_cache_not_found",
-                extra={"event": "skill_embedding_cache_not_found", "cache_path": str(self._SKILL_EMB_CACHE_DIR)},
+    def _open_store(self, type: str) -> EmbeddingStore:
+        return EmbeddingStore(
+            self.cache_dir / f"{type}_cache",
+            model=self.model,
+            dimensions=self.dimensions,
+            legacy_path=self.cache_dir / f"{type}_cache.json",
+            dtype=self.skill_dtype if type == "skill" else "float32",
+        )
+
+    def _load_embeddings_cache(self) -> tuple[EmbeddingStore, EmbeddingStore]:
+        with self._locked():
+            stores = {type: self._open_store(type) for type in CACHE_TYPES}
+            self._store_stamps = {type: store.disk_stamp() for type, store in stores.items()}
+            replayed = self._apply_journal(stores)
+            if self._rekey_legacy_roles(stores["role"]):
+                self._save_stores(stores)
+            self._enforce_role_budget(stores["role"])
+
+        if replayed:
+            logger.info(
+                "embedding_journal_replayed",
+                extra={"event": "embedding_journal_replayed", "journal_path": str(self.journal.path), "entries": replayed},
             )
-            self.skill_cache = {}
+        return stores["role"], stores["skill"]
 
-        return self.role_cache, self.skill_cache
+    def _rekey_legacy_roles(self, store: EmbeddingStore) -> int:
+        """Re-key role entries stored under their full text by the role digest."""
+        legacy_keys = [key for key in store if not ROLE_KEY_PATTERN.match(key)]
+        for key in legacy_keys:
+            digest = role_cache_key(key)
+            if digest not in store:
+                store[digest] = store[key]
+            del store[key]
 
-    def _parse_cache_payload(self, payload: dict, model: str | None, dimensions: int | None) -> dict:
-        if "data" not in payload:
-            # Backwards compatibility: old format was a raw dict mapping text -> embedding
-            return payload
+        if legacy_keys:
+            logger.info(
+                "embedding_role_cache_rekeyed",
+                extra={"event": "embedding_role_cache_rekeyed", "cache_dir": str(self.cache_dir), "entries": len(legacy_keys)},
+            )
+        return len(legacy_keys)
 
-        payload_model = payload.get("model")
-        payload_dimensions = payload.get("dimensions")
-        if model is not None and payload_model != model:
-            logger.warning(
-                "embedding_cache_model_mismatch",
-                extra={"event": "embedding_cache_model_mismatch", "expected": model, "found": payload_model},
+    def _enforce_role_budget(self, store: Mapping) -> None:
+        self.role_budget.reconcile(store)
+        evicted = self.role_budget.evict()
+        for key in evicted:
+            store.pop(key, None)  # type: ignore[attr-defined]
+        if evicted:
+            logger.debug(
+                "embedding_role_cache_evicted",
+                extra={"event": "embedding_role_cache_evicted", "cache_dir": str(self.cache_dir), "entries": len(evicted)},
             )
-            return {}
-        if dimensions is not None and dimensions != payload_dimensions:
-            logger.warning(
-                "embedding_cache_dimensions_mismatch",
-                extra={"event": "embedding_cache_dimensions_mismatch", "expected": dimensions, "found": payload_dimensions},
+
+    def _stores(self) -> dict[str, EmbeddingStore]:
+        return {type: self._store(type) for type in CACHE_TYPES}
+
+    def _apply_journal(self, stores: Mapping[str, EmbeddingStore]) -> int:
+        """Apply journal records written since the last read; return the entries added."""
+        generation, records, offset = self.journal.read(self._journal_offset, self._journal_generation)
+        self._journal_generation, self._journal_offset = generation, offset
+
+        added = 0
+        for type, rows in records:
+            store = stores.get(type)
+            if store is None:
+                continue
+            for text, embedding in rows.items():
+                if text in store:
+                    continue
+                try:
+                    store[text] = embedding
+                except ValueError:
+                    continue
+                added += 1
+        return added
+
+    def _sync(self) -> int:
+        """Pick up stores rewritten and journal records appended by other processes.
+
+        Must be called with the cache locked.
+        """
+        stores = self._stores()
+        changed = 0
+        for type, store in stores.items():
+            if not isinstance(store, EmbeddingStore):
+                continue
+            stamp = store.disk_stamp()
+            if stamp != self._store_stamps.get(type):
+                before = len(store)
+                store.reload()
+                self._store_stamps[type] = stamp
+                changed += max(len(store) - before, 0)
+        return changed + self._apply_journal(stores)
+
+    def refresh(self) -> int:
+        """Load entries other workers have written since the last sync; return how many."""
+        if not self.persist:
+            return 0
+        with self._locked():
+            added = self._sync()
+            if added:
+                self._enforce_role_budget(self.role_cache)
+
+        if added:
+            logger.debug(
+                "embedding_cache_refreshed",
+                extra={"event": "embedding_cache_refreshed", "cache_dir": str(self.cache_dir), "entries": added},
             )
-            return {}
-
-        return payload.get("data", {})
-
-    def _cache_payload(self, data: dict) -> dict:
-        return {
-            "version": 1,
-            "model": self.model,
-            "dimensions": self.dimensions,
-            "data": data,
-        }
-
-    def _atomic_write_json(self, path: Path, payload: dict) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(payload, f, sort_keys=True)
-        os.replace(tmp_path, path)
-
-    def _store_role_cache(self) -> None:
-        self._atomic_write_json(self._ROLE_EMB_CACHE_DIR, self._cache_payload(self.role_cache))
-
-    def _store_skill_cache(self) -> None:
-        self._atomic_write_json(self._SKILL_EMB_CACHE_DIR, self._cache_payload(self.skill_cache))
-    
-    def cache_store(self, text: str, embedding: list[float], type: str) -> None:
+        return added
+
+    def _store(self, type: str):
         if type == 'role':
-            self.role_cache[text] = embedding
-            self._store_role_cache()
+            return self.role_cache
         elif type == 'skill':
-            self.skill_cache[text] = embedding
-            self._store_skill_cache()
+            return self.skill_cache
         else:
             raise ValueError(f"Invalid cache type: {type}")
 
-    def cache_lookup(self, text: str, type: str) -> list[float] | None:
-        if type == 'role':
-            return self.role_cache.get(text)
-        elif type == 'skill':
-            return self.skill_cache.get(text)
+    @contextmanager
+    def write_batch(self) -> Iterator["EmbeddingCache"]:
+        """Collect every `cache_store_many` call in the block into one journal append.
+
+        Stored vectors are visible to lookups immediately; they are made durable with a
+        single fsync'd append when the outermost block exits, even if it raises.
+        """
+        state = self._batch_state
+        depth = getattr(state, "depth", 0)
+        if depth == 0:
+            state.pending = {}
+        state.depth = depth + 1
+        try:
+            yield self
+        finally:
+            state.depth = depth
+            if depth == 0:
+                pending, state.pending = state.pending, None
+                self._append(pending)
+
+    def cache_store_many(self, items: Mapping[str, list[float] | np.ndarray], type: str) -> None:
+        """Store many embeddings of one type with at most one journal append."""
+        if not items:
+            return
+
+        store = self._store(type)
+        with self._write_lock:
+            rows = {}
+            for text, embedding in items.items():
+                key = self._key(text, type)
+                store[key] = embedding
+                rows[key] = embedding
+            if type == "role":
+                for key in rows:
+                    self.role_budget.add(key, _entry_bytes(key, store[key]))
+                for key in self.role_budget.evict():
+                    store.pop(key, None)
+
+        pending = getattr(self._batch_state, "pending", None)
+        if pending is not None:
+            pending.setdefault(type, {}).update(rows)
         else:
-            raise ValueError(f"Invalid cache type: {type}")
+            self._append({type: rows})
+
+    def cache_store(self, text: str, embedding: list[float], type: str) -> None:
+        self.cache_store_many({text: embedding}, type=type)
+
+    @staticmethod
+    def _key(text: str, type: str) -> str:
+        return role_cache_key(text) if type == "role" else text
+
+    def _record_lookups(self, keys: list[str], found: list, type: str) -> None:
+        if type != "role":
+            return
+        hits = 0
+        for key, vec in zip(keys, found):
+            if vec is not None:
+                hits += 1
+                self.role_budget.touch(key)
+        self.role_budget.record(hits=hits, misses=len(keys) - hits)
+
+    def cache_lookup(self, text: str, type: str) -> np.ndarray | list[float] | None:
+        key = self._key(text, type)
+        vec = self._store(type).get(key)
+        self._record_lookups([key], [vec], type)
+        return vec
+
+    def cache_lookup_many(self, texts: list[str], type: str) -> list[np.ndarray | list[float] | None]:
+        """Look up many texts, refreshing once from other workers if any are missing."""
+        store = self._store(type)
+        keys = [self._key(text, type) for text in texts]
+        found = [store.get(key) for key in keys]
+        if any(vec is None for vec in found) and self.refresh():
+            found = [vec if vec is not None else store.get(key) for key, vec in zip(keys, found)]
+        self._record_lookups(keys, found, type)
+        return found
+
+    def role_cache_stats(self) -> dict:
+        """Role cache size, budget, and hit/miss/eviction counters for /metrics-lite."""
+        return self.role_budget.snapshot()
+
+    def _append(self, batches: dict[str, dict]) -> None:
+        if not self.persist or not any(batches.values()):
+            return
+        with self._locked():
+            self.journal.append(batches)
+            if self.journal.size >= self.compact_bytes:
+                self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="embedding-cache-compactor", daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> None:
+        """Fold journaled entries into the main stores and drop the journal."""
+        if not self.persist:
+            return
+        with self._locked():
+            journal_bytes = self.journal.size
+            if not journal_bytes:
+                return
+            # Merge-on-write: fold in other workers' compactions and records before rewriting.
+            self._sync()
+            self._enforce_role_budget(self.role_cache)
+            self._save_stores(self._stores())
+
+        logger.info(
+            "embedding_cache_compacted",
+            extra={"event": "embedding_cache_compacted", "cache_dir": str(self.cache_dir), "journal_bytes": journal_bytes},
+        )
+
+    def _save_stores(self, stores: Mapping[str, EmbeddingStore]) -> None:
+        """Rewrite the stores and drop the journal they now contain. Call with the cache locked."""
+        for type, store in stores.items():
+            if isinstance(store, EmbeddingStore):
+                store.save()
+                self._store_stamps[type] = store.disk_stamp()
+        self.journal.clear()
+        self._journal_generation, self._journal_offset = None, 0
+
+    def close(self) -> None:
+        """Wait for a running background compaction, then compact what remains."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        self.compact()
@@ -1,21 +1,49 @@
 import tiktoken
 from app.config import settings
+from app.model_scheduler import Priority, current_priority, scheduled_call
+from app.openai_clients import get_openai_client
+from app.skill_selection.local_embeddings import DEFAULT_LOCAL_DIMENSIONS, HashedNgramEmbedder, get_local_embedder
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import openai
 from openai import OpenAI
 import logging
+import numpy as np
+import time
 
 logger = logging.getLogger("embedding_client")
 
 MAX_ROLE_TOKENS = 512
 MAX_SKILL_TOKENS = 16
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+MAX_RATE_LIMIT_BACKOFF_SECONDS = 20.0
 
+def uses_local_provider() -> bool:
+    """Whether EMBEDDING_PROVIDER selects the offline hashed n-gram backend."""
+    return getattr(settings, "EMBEDDING_PROVIDER", "openai") == "local"
+
+def local_embedder() -> HashedNgramEmbedder:
+    return get_local_embedder(getattr(settings, "LOCAL_EMBEDDING_DIMENSIONS", DEFAULT_LOCAL_DIMENSIONS))
+
+def embedding_cache_namespace() -> str:
+    """Cache directory name for the active provider, so providers never share vectors."""
+    if uses_local_provider():
+        return local_embedder().model_id
+    return settings.EMBEDDING_MODEL
+
+@lru_cache(maxsize=None)
 def get_tokenizer(model_name: str):
-    """Get the appropriate tiktoken encoding for the specified model."""
+    """Get the appropriate tiktoken encoding for the specified model (resolved once per model)."""
     try:
         return tiktoken.encoding_for_model(model_name)
     except KeyError:
         # Fallback to a default encoding if model-specific one is not found
         return tiktoken.get_encoding("cl100k_base")
 
+def _fits_without_tokenizing(text: str, max_tokens: int) -> bool:
+    """Byte-level BPE never emits more tokens than UTF-8 bytes, so short texts always fit."""
+    return len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens
+
 def truncate_texts(
     texts: list[str],
     max_tokens: int,
@@ -25,14 +53,20 @@ def truncate_texts(
 ) -> list[str]:
     """
     Truncate an array of strings to fit within max_tokens (per string) for the specified model.
+
+    Texts whose byte length already fits skip tokenization; the rest are encoded in one
+    `encode_ordinary_batch` call.
     """
+    truncated = list(texts)
+    long_indices = [idx for idx, text in enumerate(texts) if not _fits_without_tokenizing(text, max_tokens)]
+    if not long_indices:
+        return truncated
+
     tokenizer = get_tokenizer(model)
-    truncated = []
-    for text in texts:
-        tokens = tokenizer.encode(text)
+    token_batches = tokenizer.encode_ordinary_batch([texts[idx] for idx in long_indices])
+    for idx, tokens in zip(long_indices, token_batches):
         if len(tokens) > max_tokens:
-            truncated_text = tokenizer.decode(tokens[:max_tokens])
-            truncated.append(truncated_text)
+            truncated[idx] = tokenizer.decode(tokens[:max_tokens])
             extra = {
                 "event": "text_truncated",
                 "original_length": len(tokens),
@@ -41,18 +75,19 @@ def truncate_texts(
             if text_kind is not None:
                 extra["text_kind"] = text_kind
             logger.info("text_truncated", extra=extra)
-        else:
-            truncated.append(text)
     return truncated
 
 
-def embed_role(role_text: str) -> list[float]:
+def embed_role(role_text: str) -> list[float] | np.ndarray:
     """
     Embed a single role text (job role + job description)
     """
     # Validation
     if role_text == "" or not isinstance(role_text, str):
         raise ValueError("Input role text cannot be an empty string or non-string")
+
+    if uses_local_provider():
+        return local_embedder().embed([role_text])[0]
     
     # Truncate to max tokens for role
     truncated_role = truncate_texts(
@@ -63,50 +98,85 @@ def embed_role(role_text: str) -> list[float]:
     )[0]
 
     # Call OpenAI API to get embedding
-    client = OpenAI(api_key=getattr(settings, "OPENAI_API_KEY", ""))
+    client = get_openai_client(getattr(settings, "OPENAI_API_KEY", ""), factory=OpenAI)
     embed_kwargs = {
         "input": truncated_role,
         "model": settings.EMBEDDING_MODEL,
     }
     if getattr(settings, "EMBEDDING_DIMENSIONS", None) is not None:
         embed_kwargs["dimensions"] = settings.EMBEDDING_DIMENSIONS
-    response = client.embeddings.create(**embed_kwargs)
+    response = scheduled_call(client.embeddings.create, embed_kwargs, endpoint="embeddings")
 
     embedding = response.data[0].embedding
     return embedding
 
-def embed_skills(texts: list[str]) -> list[list[float]]:
-    """
-    Embed an array of strings (batch)
-    """
+def _chunks(texts: list[str], size: int) -> list[list[str]]:
+    size = max(int(size or 0), 1)
+    return [texts[start:start + size] for start in range(0, len(texts), size)]
 
-    # Validation
-    if not texts:
-        raise ValueError("Input texts cannot be an empty list")
-    if any((t=="" or not isinstance(t, str)) for t in texts):
-        raise ValueError("Input texts cannot be empty strings or non-strings")
-    
-    # Truncate each skill text to max tokens for skills
-    truncated_texts = truncate_texts(
-        texts,
-        MAX_SKILL_TOKENS,
-        settings.EMBEDDING_MODEL,
-        text_kind="skill",
-    )
 
-    # Call OpenAI API to get embeddings in batch
-    client = OpenAI(api_key=getattr(settings, "OPENAI_API_KEY", ""))
-    
+def _retry_after_seconds(exc: openai.RateLimitError, attempt: int) -> float:
+    """Honor the server's Retry-After header, else back off exponentially."""
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), MAX_RATE_LIMIT_BACKOFF_SECONDS)
+    except ValueError:
+        pass
+    return min(RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt), MAX_RATE_LIMIT_BACKOFF_SECONDS)
+
+
+def _embed_batch(
+    client: OpenAI,
+    batch: list[str],
+    batch_index: int,
+    priority: Priority | None = None,
+) -> list[list[float]]:
+    """Embed one batch, retrying it alone when the API rate-limits it.
+
+    `priority` is the caller's model-scheduler priority; pool threads do not inherit it.
+    """
     embed_kwargs = {
-        "input": truncated_texts,
+        "input": batch,
         "model": settings.EMBEDDING_MODEL,
     }
     if getattr(settings, "EMBEDDING_DIMENSIONS", None) is not None:
         embed_kwargs["dimensions"] = settings.EMBEDDING_DIMENSIONS
 
-    response = client.embeddings.create(**embed_kwargs)
+    retries = getattr(settings, "EMBEDDING_RATE_LIMIT_RETRIES", 3)
+    attempt = 0
+    while True:
+        try:
+            response = scheduled_call(
+                client.embeddings.create,
+                embed_kwargs,
+                priority=priority,
+                endpoint="embeddings",
+            )
+            break
+        except openai.RateLimitError as exc:
+            if attempt >= retries:
+                raise
+            delay = _retry_after_seconds(exc, attempt)
+            logger.warning(
+                "embedding_batch_rate_limited",
+                extra={
+                    "event": "embedding_batch_rate_limited",
+                    "batch_index": batch_index,
+                    "batch_size": len(batch),
+                    "attempt": attempt + 1,
+                    "retry_in_s": delay,
+                },
+            )
+            time.sleep(delay)
+            attempt += 1
 
     embeddings = [item.embedding for item in response.data]
+    if len(embeddings) != len(batch):
+        raise ValueError(
+            f"Embedding batch {batch_index} returned {len(embeddings)} vectors for {len(batch)} inputs"
+        )
 
     if settings.DEV_MODE:
         logger.debug(f"Embedding batch request: {embed_kwargs}")
@@ -115,4 +185,102 @@ def embed_skills(texts: list[str]) -> list[list[float]]:
 
     return embeddings
 
+
+def embed_batched(texts: list[str], *, allow_partial: bool = False) -> list[list[float] | None]:
+    """Embed texts in `EMBEDDING_BATCH_SIZE` chunks sent concurrently, preserving order.
+
+    At most `EMBEDDING_MAX_CONCURRENCY` requests are in flight, and each chunk retries
+    rate limits on its own. With `allow_partial`, a chunk that still fails yields None
+    for its texts while the other chunks' vectors are kept. The error is re-raised when
+    every chunk fails, or on any failure without `allow_partial`.
+    """
+    batches = _chunks(texts, getattr(settings, "EMBEDDING_BATCH_SIZE", len(texts)))
+    client = get_openai_client(getattr(settings, "OPENAI_API_KEY", ""), factory=OpenAI)
+
+    if len(batches) == 1:
+        return _embed_batch(client, batches[0], 0)
+
+    max_workers = min(max(getattr(settings, "EMBEDDING_MAX_CONCURRENCY", 4), 1), len(batches))
+    priority = current_priority()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="embedding-batch") as pool:
+        futures = [
+            pool.submit(_embed_batch, client, batch, batch_index, priority)
+            for batch_index, batch in enumerate(batches)
+        ]
+
+    results: list[list[float] | None] = []
+    failures: list[Exception] = []
+    for batch_index, (batch, future) in enumerate(zip(batches, futures)):
+        exc = future.exception()
+        if exc is None:
+            results.extend(future.result())
+            continue
+        if not allow_partial:
+            raise exc
+        failures.append(exc)
+        logger.error(
+            "embedding_batch_failed",
+            extra={
+                "event": "embedding_batch_failed",
+                "batch_index": batch_index,
+                "batch_size": len(batch),
+                "error": str(exc),
+            },
+        )
+        results.extend([None] * len(batch))
+
+    if failures and len(failures) == len(batches):
+        raise failures[0]
+    return results
+
+
+def embed_roles(role_texts: list[str]) -> list[list[float] | np.ndarray]:
+    """
+    Embed several role texts (job role + job description) in batched requests
+    """
+    # Validation
+    if not role_texts:
+        raise ValueError("Input role texts cannot be an empty list")
+    if any((t == "" or not isinstance(t, str)) for t in role_texts):
+        raise ValueError("Input role texts cannot be empty strings or non-strings")
+
+    if uses_local_provider():
+        return list(local_embedder().embed(role_texts))
+
+    # Truncate each role text to max tokens for roles
+    truncated_roles = truncate_texts(
+        role_texts,
+        MAX_ROLE_TOKENS,
+        settings.EMBEDDING_MODEL,
+        text_kind="role",
+    )
+
+    return embed_batched(truncated_roles)
+
+
+def embed_skills(texts: list[str]) -> list[list[float] | np.ndarray | None]:
+    """
+    Embed an array of strings in concurrent batches.
+
+    Texts of a batch that failed after its retries map to None; the call raises only
+    when every batch failed.
+    """
+
+    # Validation
+    if not texts:
+        raise ValueError("Input texts cannot be an empty list")
+    if any((t=="" or not isinstance(t, str)) for t in texts):
+        raise ValueError("Input texts cannot be empty strings or non-strings")
+
+    if uses_local_provider():
+        return list(local_embedder().embed(texts))
     
+    # Truncate each skill text to max tokens for skills
+    truncated_texts = truncate_texts(
+        texts,
+        MAX_SKILL_TOKENS,
+        settings.EMBEDDING_MODEL,
+        text_kind="skill",
+    )
+
+    return embed_batched(truncated_texts, allow_partial=True)
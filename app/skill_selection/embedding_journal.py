@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator, Mapping
+
+import numpy as np
+
+from app.skill_selection.embedding_store import STORE_DTYPE
+
+logger = logging.getLogger("embedding_cache")
+
+JOURNAL_MAGIC = b"EJH1"
+# magic, random generation id; a compacted journal is replaced by one with a new id
+JOURNAL_HEADER = struct.Struct("<4s16s")
+RECORD_MAGIC = b"EJR1"
+# magic, header length, payload length, crc32(header + payload)
+RECORD_HEADER = struct.Struct("<4sIII")
+
+JournalRecord = tuple[str, dict[str, np.ndarray]]
+
+
+def encode_record(type: str, model: str | None, rows: Mapping[str, object]) -> bytes:
+    """Encode one (type, rows) batch as a self-checking journal record."""
+    keys = list(rows)
+    matrix = np.ascontiguousarray(
+        np.stack([np.asarray(rows[key], dtype=STORE_DTYPE).reshape(-1) for key in keys]),
+        dtype=np.dtype(STORE_DTYPE).newbyteorder("<"),
+    )
+    header = json.dumps(
+        {"type": type, "model": model, "width": int(matrix.shape[1]), "keys": keys}
+    ).encode("utf-8")
+    payload = matrix.tobytes()
+    checksum = zlib.crc32(payload, zlib.crc32(header))
+    return RECORD_HEADER.pack(RECORD_MAGIC, len(header), len(payload), checksum) + header + payload
+
+
+class EmbeddingJournal:
+    """Append-only log of embedding writes not yet compacted into an `EmbeddingStore`.
+
+    Each `append` writes every record of a batch with one `write` and one `fsync`, so a
+    request that embeds a role and several skill categories costs a single durable append
+    instead of a full matrix rewrite per vector. Records carry a length prefix and CRC32;
+    a torn or corrupt tail left by a crash is dropped on replay.
+
+    The file starts with a random generation id so readers tailing it from an offset can
+    tell when another process compacted it away and started a fresh journal. Callers
+    serialize `append`, `read`, and `clear` across processes with a file lock.
+    """
+
+    def __init__(self, path: Path, *, model: str | None):
+        self.path = path
+        self.model = model
+
+    @property
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, batches: Mapping[str, Mapping[str, object]]) -> int:
+        """Durably append one record per non-empty type; return the bytes written."""
+        data = b"".join(
+            encode_record(type, self.model, rows) for type, rows in batches.items() if rows
+        )
+        if not data:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            if f.tell() == 0:
+                data = JOURNAL_HEADER.pack(JOURNAL_MAGIC, os.urandom(16)) + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(data)
+
+    def replay(self) -> Iterator[JournalRecord]:
+        """Yield (type, rows) for every intact record written for this model."""
+        _, records, _ = self.read()
+        yield from records
+
+    def read(
+        self,
+        start: int = 0,
+        generation: bytes | None = None,
+    ) -> tuple[bytes | None, list[JournalRecord], int]:
+        """Read records after `start`, or from the beginning if the generation changed.
+
+        Returns (generation, records, end_offset); pass the last two back in to tail
+        the journal incrementally.
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None, [], 0
+
+        with f:
+            head = f.read(JOURNAL_HEADER.size)
+            if len(head) < JOURNAL_HEADER.size:
+                return None, [], 0
+            magic, current_generation = JOURNAL_HEADER.unpack(head)
+            if magic != JOURNAL_MAGIC:
+                logger.warning(
+                    "embedding_journal_invalid",
+                    extra={"event": "embedding_journal_invalid", "journal_path": str(self.path)},
+                )
+                return None, [], 0
+
+            offset = start
+            size = os.fstat(f.fileno()).st_size
+            if current_generation != generation or not JOURNAL_HEADER.size <= start <= size:
+                offset = JOURNAL_HEADER.size
+            f.seek(offset)
+            data = f.read()
+
+        records: list[JournalRecord] = []
+        position = 0
+        while position < len(data):
+            record = self._decode(data, position)
+            if record is None:
+                logger.warning(
+                    "embedding_journal_truncated",
+                    extra={
+                        "event": "embedding_journal_truncated",
+                        "journal_path": str(self.path),
+                        "valid_bytes": offset + position,
+                        "dropped_bytes": len(data) - position,
+                    },
+                )
+                # Cut the damaged tail so later appends are not hidden behind it.
+                with open(self.path, "r+b") as f:
+                    f.truncate(offset + position)
+                break
+
+            position, header, matrix = record
+            if self.model is not None and header.get("model") != self.model:
+                continue
+            records.append((header["type"], dict(zip(header["keys"], matrix))))
+
+        return current_generation, records, offset + position
+
+    def _decode(self, data: bytes, offset: int) -> tuple[int, dict, np.ndarray] | None:
+        end = offset + RECORD_HEADER.size
+        if end > len(data):
+            return None
+        magic, header_len, payload_len, checksum = RECORD_HEADER.unpack_from(data, offset)
+        if magic != RECORD_MAGIC or end + header_len + payload_len > len(data):
+            return None
+
+        header_bytes = data[end:end + header_len]
+        payload = data[end + header_len:end + header_len + payload_len]
+        if zlib.crc32(payload, zlib.crc32(header_bytes)) != checksum:
+            return None
+
+        header = json.loads(header_bytes)
+        width = header["width"]
+        matrix = np.frombuffer(payload, dtype=np.dtype(STORE_DTYPE).newbyteorder("<"))
+        matrix = matrix.astype(STORE_DTYPE).reshape(len(header["keys"]), width)
+        return end + header_len + payload_len, header, matrix
+
+    def clear(self) -> None:
+        """Drop all records once they have been compacted into the main store."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.config import settings
+from app.model_scheduler import model_call_priority
+from app.resume_evidence.loader import load_evidence_yaml
+from app.skill_selection.scoring import embeddings
+
+logger = logging.getLogger("embedding_prewarm")
+
+CATEGORIES = ("technology", "programming", "concepts")
+
+
+def load_skill_pool_skills(path: Path) -> list[str]:
+    """Every skill in a normalized skill pools file (all roles, categories, and tiers)."""
+    with open(path, encoding="utf-8") as f:
+        pools = json.load(f)
+    return [
+        skill
+        for categories in pools.values()
+        for tiers in categories.values()
+        for tier_skills in tiers.values()
+        for skill in tier_skills
+    ]
+
+
+def load_evidence_skills(path: Path) -> list[str]:
+    """Every skill listed in a resume evidence `skills.yaml`."""
+    skills = load_evidence_yaml(path, "skills").skills  # type: ignore[attr-defined]
+    return [skill for category in CATEGORIES for skill in getattr(skills, category)]
+
+
+def collect_prewarm_skills(
+    skill_pools_path: Path | None = None,
+    evidence_skills_path: Path | None = None,
+) -> dict[str, list[str]]:
+    """Normalized, de-duplicated skills per source; missing source files are skipped."""
+    sources = {
+        "skill_pools": (
+            skill_pools_path if skill_pools_path is not None else settings.SKILL_POOLS_PATH,
+            load_skill_pool_skills,
+        ),
+        "resume_evidence": (
+            evidence_skills_path
+            if evidence_skills_path is not None
+            else Path(settings.RESUME_EVIDENCE_ROOT) / "skills.yaml",
+            load_evidence_skills,
+        ),
+    }
+
+    collected: dict[str, list[str]] = {}
+    for name, (path, loader) in sources.items():
+        path = Path(path)
+        if not path.exists():
+            logger.warning(
+                "embedding_prewarm_source_missing",
+                extra={"event": "embedding_prewarm_source_missing", "source": name, "path": str(path)},
+            )
+            continue
+        normalized = (embeddings.normalize_skill(skill) for skill in loader(path))
+        collected[name] = list(dict.fromkeys(skill for skill in normalized if skill))
+    return collected
+
+
+@dataclass
+class PrewarmReport:
+    """Skill-cache coverage before and after a pre-embedding run."""
+
+    skills: int = 0
+    already_cached: int = 0
+    embedded: int = 0
+    failed: int = 0
+    sources: dict[str, dict[str, int | float]] = field(default_factory=dict)
+    missing: list[str] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        return round((self.skills - len(self.missing)) / self.skills, 4) if self.skills else 1.0
+
+    def model_dump(self) -> dict:
+        return {
+            "skills": self.skills,
+            "already_cached": self.already_cached,
+            "embedded": self.embedded,
+            "failed": self.failed,
+            "coverage": self.coverage,
+            "sources": self.sources,
+            "missing": self.missing,
+        }
+
+
+@model_call_priority("batch")
+def prewarm_skill_embeddings(
+    sources: dict[str, list[str]],
+    *,
+    chunk_size: int | None = None,
+    dry_run: bool = False,
+) -> PrewarmReport:
+    """Embed every source skill missing from the skill cache and report coverage.
+
+    Missing skills are embedded `chunk_size` at a time (default: one full wave of
+    `EMBEDDING_MAX_CONCURRENCY` concurrent `EMBEDDING_BATCH_SIZE` requests), each chunk
+    journaled with one append, and the journal is compacted at the end. A chunk that
+    fails is counted and skipped so one outage does not lose the rest of the run.
+    Embedding requests run at batch priority in the model scheduler.
+    """
+    cache = embeddings.cache
+    skills = list(dict.fromkeys(skill for source_skills in sources.values() for skill in source_skills))
+    report = PrewarmReport(skills=len(skills))
+
+    missing = [skill for skill, vec in zip(skills, cache.cache_lookup_many(skills, type="skill")) if vec is None]
+    report.already_cached = len(skills) - len(missing)
+
+    if chunk_size is None:
+        chunk_size = settings.EMBEDDING_BATCH_SIZE * settings.EMBEDDING_MAX_CONCURRENCY
+    chunks = [] if dry_run else [missing[start:start + chunk_size] for start in range(0, len(missing), chunk_size)]
+    for chunk in chunks:
+        try:
+            vectors = embeddings.embed_skills(chunk)
+        except Exception as exc:
+            report.failed += len(chunk)
+            logger.error(
+                "embedding_prewarm_chunk_failed",
+                extra={"event": "embedding_prewarm_chunk_failed", "skills": len(chunk), "error": str(exc)},
+            )
+            continue
+
+        stored = {skill: vec for skill, vec in zip(chunk, vectors) if vec is not None}
+        cache.cache_store_many(stored, type="skill")
+        report.embedded += len(stored)
+        report.failed += len(chunk) - len(stored)
+
+    if report.embedded:
+        cache.compact()
+
+    cached = {skill for skill, vec in zip(skills, cache.cache_lookup_many(skills, type="skill")) if vec is not None}
+    report.missing = [skill for skill in skills if skill not in cached]
+    for name, source_skills in sources.items():
+        covered = sum(1 for skill in source_skills if skill in cached)
+        report.sources[name] = {
+            "skills": len(source_skills),
+            "cached": covered,
+            "coverage": round(covered / len(source_skills), 4) if source_skills else 1.0,
+        }
+    return report
+
+
+def prewarm_in_background() -> threading.Thread:
+    """Pre-embed configured skill sources on a daemon thread and log the coverage report."""
+
+    def run() -> None:
+        try:
+            report = prewarm_skill_embeddings(collect_prewarm_skills())
+        except Exception as exc:
+            logger.error(
+                "embedding_prewarm_failed",
+                extra={"event": "embedding_prewarm_failed", "error": str(exc)},
+            )
+            return
+        logger.info(
+            "embedding_prewarm_completed",
+            extra={
+                "event": "embedding_prewarm_completed",
+                "skills": report.skills,
+                "already_cached": report.already_cached,
+                "embedded": report.embedded,
+                "failed": report.failed,
+                "coverage": report.coverage,
+            },
+        )
+
+    thread = threading.Thread(target=run, name="embedding-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+logger = logging.getLogger("embedding_cache")
+
+# v3 indexes name the generation of the row files they describe; v2 files are unsuffixed.
+STORE_VERSION = 3
+STORE_DTYPE = np.float32
+# Row encodings: float16 halves the matrix, int8 with a per-row scale quarters it.
+STORE_DTYPES = ("float32", "float16", "int8")
+INT8_MAX = 127
+
+
+def quantize_rows(matrix: np.ndarray, dtype: str) -> tuple[np.ndarray, np.ndarray | None]:
+    """Encode float rows as `dtype`; int8 rows also return their float32 scales.
+
+    Each int8 row is scaled so its largest component maps to +/-127, which keeps the row's
+    direction (all cosine ranking needs) to within half a quantization step per component.
+    """
+    matrix = np.asarray(matrix, dtype=STORE_DTYPE)
+    if dtype != "int8":
+        return matrix.astype(dtype, copy=False), None
+
+    peaks = np.abs(matrix).max(axis=1) if matrix.shape[1] else np.zeros(len(matrix), dtype=STORE_DTYPE)
+    scales = (peaks / INT8_MAX).astype(STORE_DTYPE)
+    safe = np.where(scales > 0, scales, 1.0).astype(STORE_DTYPE)
+    codes = np.rint(matrix / safe[:, None]).clip(-INT8_MAX, INT8_MAX).astype(np.int8)
+    return codes, scales
+
+
+def dequantize_rows(codes: np.ndarray, scales: np.ndarray | None) -> np.ndarray:
+    """Decode rows written by `quantize_rows` back to float32."""
+    matrix = np.asarray(codes).astype(STORE_DTYPE)
+    if scales is not None:
+        matrix *= np.asarray(scales, dtype=STORE_DTYPE).reshape(-1, 1)
+    return matrix
+
+
+def _atomic_write_bytes(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def parse_legacy_payload(payload: dict, model: str | None, dimensions: int | None) -> dict:
+    """Return the text -> vector data of a v1 JSON cache payload, or {} on metadata mismatch."""
+    if "data" not in payload:
+        # Backwards compatibility: old format was a raw dict mapping text -> embedding
+        return payload
+
+    payload_model = payload.get("model")
+    payload_dimensions = payload.get("dimensions")
+    if model is not None and payload_model != model:
+        logger.warning(
+            "embedding_cache_model_mismatch",
+            extra={"event": "embedding_cache_model_mismatch", "expected": model, "found": payload_model},
+        )
+        return {}
+    if dimensions is not None and dimensions != payload_dimensions:
+        logger.warning(
+            "embedding_cache_dimensions_mismatch",
+            extra={"event": "embedding_cache_dimensions_mismatch", "expected": dimensions, "found": payload_dimensions},
+        )
+        return {}
+
+    return payload.get("data", {})
+
+
+class EmbeddingStore(MutableMapping):
+    """Text -> vector mapping persisted as a `.npy` matrix plus a key index.
+
+    `<name>.<generation>.npy` holds one row per key and is opened with `mmap_mode="r"`, so
+    loading costs only the index parse and lookups return zero-copy row views.
+    `<name>.index.json` records the model metadata, row dtype, row-file generation, and the
+    key of every row in row order. New vectors are held in memory until `save()` writes a
+    new generation and then swaps the index, so the index never names rows it did not
+    write. Access is guarded by a re-entrant lock so a background compaction can `save()`
+    while requests read. Saves of one store must not run concurrently across processes;
+    `EmbeddingCache` serializes them with its file lock.
+
+    With `dtype="float16"` or `"int8"` rows are stored and returned quantized; they keep
+    each vector's direction, so cosine scores can be computed on them directly. int8
+    stores keep per-row scales in `<name>.<generation>.scales.npy`, and `vector()` decodes any row
+    back to float32. A store saved with another dtype is re-encoded on load.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        model: str | None,
+        dimensions: int | None,
+        legacy_path: Path | None = None,
+        dtype: str = "float32",
+    ):
+        if dtype not in STORE_DTYPES:
+            raise ValueError(f"Unsupported embedding store dtype: {dtype}")
+        self.path = path
+        self.index_path = path.with_name(path.name + ".index.json")
+        self.legacy_path = legacy_path
+        self.model = model
+        self.dimensions = dimensions
+        self.dtype = dtype
+        self._matrix: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._rows: dict[str, int] = {}
+        self._views: dict[str, np.ndarray] = {}
+        self._pending: dict[str, np.ndarray] = {}
+        self._pending_scales: dict[str, float] = {}
+        self._dirty = False
+        self._version = 0
+        self._generation: str | None = None
+        self._lock = threading.RLock()
+        self.load()
+
+    # -- Mapping protocol -------------------------------------------------
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+
+            view = self._views.get(key)
+            if view is None:
+                row = self._rows[key]
+                view = self._matrix[row]  # type: ignore[index]
+                self._views[key] = view
+            return view
+
+    def __setitem__(self, key: str, vector) -> None:
+        with self._lock:
+            codes, scales = quantize_rows(self._as_row(vector).reshape(1, -1), self.dtype)
+            self._pending[key] = codes[0]
+            if scales is not None:
+                self._pending_scales[key] = float(scales[0])
+            self._views.pop(key, None)
+            self._dirty = True
+            self._version += 1
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            self._pending_scales.pop(key, None)
+            found = self._pending.pop(key, None) is not None
+            if self._rows.pop(key, None) is not None:
+                found = True
+            self._views.pop(key, None)
+            if not found:
+                raise KeyError(key)
+            self._dirty = True
+            self._version += 1
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = list(self._rows)
+            keys.extend(key for key in self._pending if key not in self._rows)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows) + sum(1 for key in self._pending if key not in self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._pending or key in self._rows
+
+    # -- Persistence ------------------------------------------------------
+
+    @property
+    def width(self) -> int | None:
+        if self._matrix is not None and self._matrix.ndim == 2:
+            return int(self._matrix.shape[1])
+        for vector in self._pending.values():
+            return int(vector.shape[0])
+        return self.dimensions
+
+    @property
+    def matrix_path(self) -> Path:
+        """Row file of the generation currently loaded."""
+        return self._row_path(self._generation, ".npy")
+
+    @property
+    def scales_path(self) -> Path:
+        """int8 scale file of the generation currently loaded."""
+        return self._row_path(self._generation, ".scales.npy")
+
+    def _row_path(self, generation: str | None, suffix: str) -> Path:
+        # Stores written before generations existed use the unsuffixed names.
+        stem = self.path.name if generation is None else f"{self.path.name}.{generation}"
+        return self.path.with_name(stem + suffix)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every write, delete, load, and save; cheap change detection."""
+        return self._version
+
+    def snapshot(self) -> tuple[list[str], np.ndarray]:
+        """Return (keys, matrix) for every live row, in storage dtype.
+
+        Right after a load or save this is the memory-mapped matrix itself; pending or
+        deleted rows cost one gather into a new array.
+        """
+        with self._lock:
+            disk_keys = [key for key in self._rows if key not in self._pending]
+            rows = [self._rows[key] for key in disk_keys]
+            if self._matrix is None or not rows:
+                disk_matrix = np.empty((0, self.width or 0), dtype=self.dtype)
+            elif rows == list(range(len(rows))):
+                disk_matrix = self._matrix[: len(rows)]
+            else:
+                disk_matrix = self._matrix[rows]
+            if not self._pending:
+                return disk_keys, disk_matrix
+            pending_keys = list(self._pending)
+            pending_matrix = np.stack([self._pending[key] for key in pending_keys])
+            return disk_keys + pending_keys, np.concatenate([disk_matrix, pending_matrix])
+
+    def scale(self, key: str) -> float:
+        """Return the int8 scale of a row (1.0 for float rows)."""
+        with self._lock:
+            if self.dtype != "int8":
+                return 1.0
+            if key in self._pending:
+                return self._pending_scales[key]
+            return float(self._scales[self._rows[key]])  # type: ignore[index]
+
+    def vector(self, key: str) -> np.ndarray:
+        """Return the row for `key` decoded to float32."""
+        with self._lock:
+            row = self[key]
+            return row.astype(STORE_DTYPE) * STORE_DTYPE(self.scale(key))
+
+    def _as_row(self, vector) -> np.ndarray:
+        row = np.array(vector, dtype=STORE_DTYPE).reshape(-1)
+        width = self.width
+        if width is not None and row.shape[0] != width:
+            raise ValueError(f"Embedding has {row.shape[0]} dimensions; store expects {width}")
+        return row
+
+    def _reset(self) -> None:
+        self._matrix = None
+        self._scales = None
+        self._rows = {}
+        self._views = {}
+        self._pending = {}
+        self._pending_scales = {}
+        self._dirty = False
+        self._generation = None
+        self._version += 1
+
+    def load(self) -> None:
+        """Open the binary store, migrating a legacy JSON cache on first load."""
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        self._reset()
+
+        if self.index_path.exists():
+            self._load_binary()
+            return
+
+        if self.legacy_path is not None and self.legacy_path.exists():
+            self._migrate_legacy()
+            return
+
+        logger.warning(
+            "embedding_cache_not_found",
+            extra={"event": "embedding_cache_not_found", "cache_path": str(self.index_path)},
+        )
+
+    def _load_binary(self) -> None:
+        try:
+            self._load_index(self._read_index())
+        except FileNotFoundError:
+            # Another process saved a new generation and removed the rows this index named.
+            self._reset()
+            self._load_index(self._read_index())
+
+    def _read_index(self) -> dict:
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def _load_index(self, index: dict) -> None:
+
+        if self.model is not None and index.get("model") != self.model:
+            logger.warning(
+                "embedding_cache_model_mismatch",
+                extra={"event": "embedding_cache_model_mismatch", "expected": self.model, "found": index.get("model")},
+            )
+            return
+        if self.dimensions is not None and index.get("dimensions") != self.dimensions:
+            logger.warning(
+                "embedding_cache_dimensions_mismatch",
+                extra={
+                    "event": "embedding_cache_dimensions_mismatch",
+                    "expected": self.dimensions,
+                    "found": index.get("dimensions"),
+                },
+            )
+            return
+
+        keys = index.get("keys", [])
+        if not keys:
+            return
+
+        generation = index.get("generation")
+        matrix = np.load(self._row_path(generation, ".npy"), mmap_mode="r")
+        stored_dtype = index.get("dtype", np.dtype(STORE_DTYPE).name)
+        scales = np.load(self._row_path(generation, ".scales.npy"), mmap_mode="r") if stored_dtype == "int8" else None
+        self._generation = generation
+        if scales is not None and scales.shape[0] < matrix.shape[0]:
+            matrix = matrix[: scales.shape[0]]
+        if matrix.shape[0] < len(keys):
+            logger.warning(
+                "embedding_cache_truncated",
+                extra={
+                    "event": "embedding_cache_truncated",
+                    "cache_path": str(self.matrix_path),
+                    "rows": int(matrix.shape[0]),
+                    "keys": len(keys),
+                },
+            )
+            keys = keys[: matrix.shape[0]]
+
+        if stored_dtype != self.dtype:
+            self._requantize(keys, dequantize_rows(matrix[: len(keys)], scales), stored_dtype)
+            return
+
+        self._matrix = matrix
+        self._scales = scales
+        self._rows = {key: row for row, key in enumerate(keys)}
+
+    def _requantize(self, keys: list[str], matrix: np.ndarray, stored_dtype: str) -> None:
+        codes, scales = quantize_rows(matrix, self.dtype)
+        self._pending = dict(zip(keys, codes))
+        if scales is not None:
+            self._pending_scales = dict(zip(keys, scales.tolist()))
+        self._dirty = True
+        self._save()
+        logger.info(
+            "embedding_cache_requantized",
+            extra={
+                "event": "embedding_cache_requantized",
+                "cache_path": str(self.matrix_path),
+                "from_dtype": stored_dtype,
+                "to_dtype": self.dtype,
+                "entries": len(keys),
+            },
+        )
+
+    def reload(self) -> None:
+        """Re-open files rewritten by another process, keeping vectors not yet on disk."""
+        with self._lock:
+            pending, pending_scales = self._pending, self._pending_scales
+            self._reset()
+            if self.index_path.exists():
+                self._load_binary()
+            for key, vector in pending.items():
+                if key not in self._rows:
+                    self._pending[key] = vector
+                    if key in pending_scales:
+                        self._pending_scales[key] = pending_scales[key]
+                    self._dirty = True
+
+    def disk_stamp(self) -> tuple[int, int, int] | None:
+        """Identify the index file on disk; it changes whenever any process saves."""
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _migrate_legacy(self) -> None:
+        with open(self.legacy_path) as f:  # type: ignore[arg-type]
+            data = parse_legacy_payload(json.load(f), self.model, self.dimensions)
+
+        for key, vector in data.items():
+            self[key] = vector
+        self.save()
+        logger.info(
+            "embedding_cache_migrated",
+            extra={
+                "event": "embedding_cache_migrated",
+                "legacy_path": str(self.legacy_path),
+                "cache_path": str(self.matrix_path),
+                "entries": len(data),
+            },
+        )
+
+    def save(self) -> None:
+        """Write all live rows as a new generation and atomically switch the index to it."""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+
+        keys = [key for key in self._rows if key not in self._pending]
+        keys.extend(self._pending)
+        width = self.width or 0
+        matrix = np.empty((len(keys), width), dtype=self.dtype)
+        scales = np.empty(len(keys), dtype=STORE_DTYPE) if self.dtype == "int8" else None
+        for row, key in enumerate(keys):
+            matrix[row] = self[key]
+            if scales is not None:
+                scales[row] = self.scale(key)
+
+        # Rows go to fresh generation files that no index names yet. Replacing the index is
+        # the only switch-over, so a crash at any point leaves keys and rows that match.
+        generation = uuid.uuid4().hex[:12]
+        matrix_path = self._row_path(generation, ".npy")
+        scales_path = self._row_path(generation, ".scales.npy")
+        _atomic_write_bytes(matrix_path, lambda f: np.save(f, matrix, allow_pickle=False))
+        if scales is not None:
+            _atomic_write_bytes(scales_path, lambda f: np.save(f, scales, allow_pickle=False))
+        index = {
+            "version": STORE_VERSION,
+            "model": self.model,
+            "dimensions": self.dimensions,
+            "dtype": self.dtype,
+            "generation": generation,
+            "keys": keys,
+        }
+        _atomic_write_bytes(self.index_path, lambda f: f.write(json.dumps(index).encode("utf-8")))
+
+        self._reset()
+        self._generation = generation
+        if keys:
+            self._matrix = np.load(matrix_path, mmap_mode="r")
+            if self.dtype == "int8":
+                self._scales = np.load(scales_path, mmap_mode="r")
+            self._rows = {key: row for row, key in enumerate(keys)}
+        self._remove_stale_generations()
+
+    def _remove_stale_generations(self) -> None:
+        """Delete row files no longer named by the index, including those left by a crash."""
+        current = {self.matrix_path, self.scales_path}
+        for path in self.path.parent.glob(f"{self.path.name}.*npy"):
+            if path in current:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Still mapped by a reader on a platform that refuses to delete open files.
+                logger.debug(
+                    "embedding_cache_stale_rows_kept",
+                    extra={"event": "embedding_cache_stale_rows_kept", "path": str(path)},
+                )
@@ -6,12 +6,23 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.openai_clients import (
+    ResponseExchange,
+    get_async_openai_client,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
+from app.output_budget import output_budgets
 
 logger = logging.getLogger("llm_client")
 
+METRICS_SUBSYSTEM = "skill_selection"
+
 CATEGORIES = ("technology", "programming", "concepts")
 TEMPERATURE_UNSUPPORTED_MODELS = {
     "gpt-5",
@@ -225,17 +236,26 @@ def build_response_create_kwargs(
     return kwargs
 
 
-def score_skills_with_llm(
+@dataclass
+class _ScoreRequest:
+    api_key: str
+    model: str
+    max_output_tokens: int
+    instructions: str
+    prompt_payload: str
+    schema: dict[str, Any]
+
+
+def _prepare_score_request(
     *,
     job_role: str,
     job_text: str | None,
     technology: list[str],
     programming: list[str],
     concepts: list[str],
-    model: str | None = None,
-    max_output_tokens: int | None = None,
-) -> LLMScoreResult:
-    """Score every candidate skill through the OpenAI Responses API."""
+    model: str | None,
+    max_output_tokens: int | None,
+) -> _ScoreRequest:
     category_inputs = {
         "technology": technology,
         "programming": programming,
@@ -257,42 +277,73 @@ def score_skills_with_llm(
         "categories. Scores must be integers from 0 to 3."
     )
 
-    api_key = getattr(settings, "OPENAI_API_KEY", "")
-    if not api_key.strip():
+    api_key = openai_api_key()
+    if not api_key:
         raise LLMClientError("OPENAI_API_KEY is required for LLM scoring")
 
     effective_model = model if model is not None else settings.SKILL_LLM_MODEL
     effective_max_output_tokens = (
         max_output_tokens
         if max_output_tokens is not None
-        else _estimated_default_max_output_tokens(
-            category_inputs=category_inputs,
-            schema=schema,
-            configured_default=settings.SKILL_LLM_MAX_OUTPUT_TOKENS,
+        else output_budgets.budget(
+            subsystem=METRICS_SUBSYSTEM,
+            model=effective_model,
+            input_size=len(prompt_payload),
+            default=_estimated_default_max_output_tokens(
+                category_inputs=category_inputs,
+                schema=schema,
+                configured_default=settings.SKILL_LLM_MAX_OUTPUT_TOKENS,
+            ),
         )
     )
+    return _ScoreRequest(
+        api_key=api_key,
+        model=effective_model,
+        max_output_tokens=effective_max_output_tokens,
+        instructions=instructions,
+        prompt_payload=prompt_payload,
+        schema=schema,
+    )
+
+
+def _observe_output_budget(
+    request: _ScoreRequest,
+    attempts: list[dict[str, Any]],
+    *,
+    succeeded: bool,
+) -> None:
+    output_budgets.observe(
+        subsystem=METRICS_SUBSYSTEM,
+        model=request.model,
+        input_size=len(request.prompt_payload),
+        attempts=attempts,
+        succeeded=succeeded,
+    )
+
+
+def _client_error(exc: Exception, request: _ScoreRequest) -> LLMClientError:
+    logger.exception(
+        "llm_request_failed",
+        extra={
+            "event": "llm_request_failed",
+            "subsystem": "skill_selection",
+            "model": request.model,
+            "attempt": 0,
+            "llm_max_output_tokens": request.max_output_tokens,
+        },
+    )
+    return LLMClientError(f"LLM request failed: {exc}")
 
+
+def _score_exchange(request: _ScoreRequest) -> ResponseExchange[LLMScoreResult]:
+    """Request scores, retrying once with a larger output budget on unparseable output."""
     start = time.perf_counter()
     attempts: list[dict[str, Any]] = []
     retry_reason: str | None = None
-    try:
-        client = OpenAI(api_key=api_key)
-    except Exception as exc:
-        logger.exception(
-            "llm_request_failed",
-            extra={
-                "event": "llm_request_failed",
-                "subsystem": "skill_selection",
-                "model": effective_model,
-                "attempt": 0,
-                "llm_max_output_tokens": effective_max_output_tokens,
-            },
-        )
-        raise LLMClientError(f"LLM request failed: {exc}") from exc
 
-    retry_max_output_tokens = max(effective_max_output_tokens * 2, 3000)
+    retry_max_output_tokens = max(request.max_output_tokens * 2, 3000)
     max_output_tokens_by_attempt = [
-        effective_max_output_tokens,
+        request.max_output_tokens,
         retry_max_output_tokens,
     ]
 
@@ -302,13 +353,13 @@ def score_skills_with_llm(
     ):
         try:
             create_kwargs = build_response_create_kwargs(
-                model=effective_model,
-                instructions=instructions,
-                prompt_payload=prompt_payload,
-                schema=schema,
+                model=request.model,
+                instructions=request.instructions,
+                prompt_payload=request.prompt_payload,
+                schema=request.schema,
                 max_output_tokens=attempt_max_output_tokens,
             )
-            response = client.responses.create(**create_kwargs)
+            response = yield create_kwargs
         except Exception as exc:
             attempt_metadata = {
                 "attempt": attempt_index,
@@ -319,7 +370,7 @@ def score_skills_with_llm(
             latency_ms = (time.perf_counter() - start) * 1000.0
             metadata = _aggregate_attempt_metadata(
                 attempts,
-                model=effective_model,
+                model=request.model,
                 latency_ms=latency_ms,
             )
             logger.exception(
@@ -327,7 +378,7 @@ def score_skills_with_llm(
                 extra={
                     "event": "llm_request_failed",
                     "subsystem": "skill_selection",
-                    "model": effective_model,
+                    "model": request.model,
                     "attempt": attempt_index,
                     "llm_max_output_tokens": attempt_max_output_tokens,
                 },
@@ -352,10 +403,11 @@ def score_skills_with_llm(
                 retry_reason = f"LLM response was not valid JSON: {exc}"
                 attempt_metadata["error"] = retry_reason
             else:
+                _observe_output_budget(request, attempts, succeeded=True)
                 latency_ms = (time.perf_counter() - start) * 1000.0
                 metadata = _aggregate_attempt_metadata(
                     attempts,
-                    model=effective_model,
+                    model=request.model,
                     latency_ms=latency_ms,
                 )
                 if retry_reason is not None:
@@ -363,10 +415,11 @@ def score_skills_with_llm(
                 return LLMScoreResult(scores=scores, metadata=metadata)
 
         if attempt_index == len(max_output_tokens_by_attempt):
+            _observe_output_budget(request, attempts, succeeded=False)
             latency_ms = (time.perf_counter() - start) * 1000.0
             metadata = _aggregate_attempt_metadata(
                 attempts,
-                model=effective_model,
+                model=request.model,
                 latency_ms=latency_ms,
             )
             if retry_reason is not None:
@@ -381,7 +434,7 @@ def score_skills_with_llm(
             extra={
                 "event": "llm_response_retry",
                 "subsystem": "skill_selection",
-                "model": effective_model,
+                "model": request.model,
                 "attempt": attempt_index,
                 "llm_max_output_tokens": attempt_max_output_tokens,
                 "next_llm_max_output_tokens": max_output_tokens_by_attempt[attempt_index],
@@ -390,3 +443,57 @@ def score_skills_with_llm(
         )
 
     raise LLMClientError("LLM response could not be parsed")
+
+
+def score_skills_with_llm(
+    *,
+    job_role: str,
+    job_text: str | None,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMScoreResult:
+    """Score every candidate skill through the OpenAI Responses API."""
+    request = _prepare_score_request(
+        job_role=job_role,
+        job_text=job_text,
+        technology=technology,
+        programming=programming,
+        concepts=concepts,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_openai_client(request.api_key, factory=OpenAI)
+    except Exception as exc:
+        raise _client_error(exc, request) from exc
+    return run_response_exchange(_score_exchange(request), client.responses.create)
+
+
+async def score_skills_with_llm_async(
+    *,
+    job_role: str,
+    job_text: str | None,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    model: str | None = None,
+    max_output_tokens: int | None = None,
+) -> LLMScoreResult:
+    """`score_skills_with_llm` on the shared `AsyncOpenAI` client for the running loop."""
+    request = _prepare_score_request(
+        job_role=job_role,
+        job_text=job_text,
+        technology=technology,
+        programming=programming,
+        concepts=concepts,
+        model=model,
+        max_output_tokens=max_output_tokens,
+    )
+    try:
+        client = get_async_openai_client(request.api_key, factory=AsyncOpenAI)
+    except Exception as exc:
+        raise _client_error(exc, request) from exc
+    return await run_response_exchange_async(_score_exchange(request), client.responses.create)
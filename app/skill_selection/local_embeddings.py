@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+LOCAL_EMBEDDING_MODEL = "local-hashed-ngram-v1"
+DEFAULT_LOCAL_DIMENSIONS = 512
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:#|\+\+)?")
+CHAR_NGRAM_SIZES = (3, 4, 5)
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.75
+CHAR_WEIGHT = 0.35
+
+
+class HashedNgramEmbedder:
+    """Deterministic, offline text vectorizer using the signed hashing trick.
+
+    Words, word bigrams, and boundary-marked character 3-5 grams are hashed with CRC32
+    (stable across processes, unlike `hash()`) into `dimensions` buckets with a
+    hash-derived sign. Rows are L2-normalized, so dot products are cosine similarities
+    of lexical overlap: no network, no tokens, microseconds per skill name.
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_LOCAL_DIMENSIONS):
+        if dimensions <= 0:
+            raise ValueError("Local embedding dimensions must be greater than 0")
+        self.dimensions = dimensions
+
+    @property
+    def model_id(self) -> str:
+        return f"{LOCAL_EMBEDDING_MODEL}-{self.dimensions}"
+
+    def _features(self, text: str) -> tuple[list[int], list[float]]:
+        words = WORD_PATTERN.findall(text.lower())
+        buckets: list[int] = []
+        weights: list[float] = []
+
+        def add(feature: str, weight: float) -> None:
+            hashed = zlib.crc32(feature.encode("utf-8"))
+            buckets.append(hashed % self.dimensions)
+            # The top bit picks the sign so colliding features tend to cancel out.
+            weights.append(weight if hashed & 0x80000000 else -weight)
+
+        for word in words:
+            add(f"w:{word}", WORD_WEIGHT)
+            marked = f"<{word}>"
+            for size in CHAR_NGRAM_SIZES:
+                for start in range(len(marked) - size + 1):
+                    add(f"c:{marked[start:start + size]}", CHAR_WEIGHT)
+        for first, second in zip(words, words[1:]):
+            add(f"b:{first} {second}", BIGRAM_WEIGHT)
+
+        return buckets, weights
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Return a (len(texts), dimensions) float32 matrix of unit-length rows."""
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets, weights = self._features(text)
+            if buckets:
+                matrix[row] = np.bincount(buckets, weights=weights, minlength=self.dimensions)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+@lru_cache(maxsize=None)
+def get_local_embedder(dimensions: int = DEFAULT_LOCAL_DIMENSIONS) -> HashedNgramEmbedder:
+    return HashedNgramEmbedder(dimensions)
@@ -21,3 +21,61 @@ class SkillSelectResponse(BaseModel):
     programming: List[str]
     concepts: List[str]
     details: Dict[str, Any] | None = None  # Optional field for dev mode
+
+
+class SkillSelectTarget(BaseModel):
+    job_role: str
+    job_text: str | None = None  # Optional full job description text for context
+
+
+class SkillSelectBatchRequest(BaseModel):
+    targets: List[SkillSelectTarget]
+    technology: List[str]
+    programming: List[str]
+    concepts: List[str]
+    top_n: int | None = None
+    method: str | None = None
+    baseline_filter: bool | None = None
+    dev_mode: bool | None = None
+    llm_model: str | None = None
+    llm_max_output_tokens: int | None = None
+
+    def target_request(self, target: SkillSelectTarget) -> SkillSelectRequest:
+        """Expand one batch target into the equivalent single-target request."""
+        return SkillSelectRequest(
+            job_role=target.job_role,
+            job_text=target.job_text,
+            technology=self.technology,
+            programming=self.programming,
+            concepts=self.concepts,
+            top_n=self.top_n,
+            method=self.method,
+            baseline_filter=self.baseline_filter,
+            dev_mode=self.dev_mode,
+            llm_model=self.llm_model,
+            llm_max_output_tokens=self.llm_max_output_tokens,
+        )
+
+
+class SkillSelectBatchResponse(BaseModel):
+    results: List[SkillSelectResponse]  # One response per target, in request order
+
+
+class SimilarSkillsRequest(BaseModel):
+    text: str  # Free-text skill name or job snippet
+    k: int = 10  # How many nearest known skills to return
+    min_similarity: float | None = None  # Optional cosine cutoff
+    include_query: bool = False  # Whether the query's own normalized skill may be returned
+    dev_mode: bool | None = None
+
+
+class SimilarSkill(BaseModel):
+    skill: str
+    similarity: float
+
+
+class SimilarSkillsResponse(BaseModel):
+    query: str
+    normalized_query: str
+    results: List[SimilarSkill]
+    details: Dict[str, Any] | None = None  # Optional field for dev mode
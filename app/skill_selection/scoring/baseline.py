@@ -1,92 +1,77 @@
 import dotenv
 import os
-import re
-from app.skill_selection.scoring.synonyms import SYNONYM_TO_NORMALIZED
+import numpy as np
+from app.skill_selection.scoring.keyword_index import (
+    KeywordIndex,
+    compile_skill_phrases,
+    get_keyword_index,
+    job_text_phrases,
+    normalize_skill,
+    phrase_tokens,
+)
+from app.skill_selection.scoring.phrase_matcher import Phrase
 from app.skill_selection.scoring.role_profiles import detect_role_family
 
-TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:#|\+\+)?")
+# A skill named in the job description is relevant even without a profile match.
+JOB_TEXT_MATCH_SCORE = 2.0
 
 
-def normalize_skill(skill: str) -> str:
-    """Normalize skill names to a standard format."""
-    s = skill.strip().lower()
-    
-    return SYNONYM_TO_NORMALIZED.get(s, s)
-
-
-def _phrase_tokens(text: str) -> tuple[str, ...]:
-    """Tokenize a normalized phrase while expanding known token aliases."""
-    tokens: list[str] = []
-    for token in TOKEN_PATTERN.findall(text):
-        normalized_token = SYNONYM_TO_NORMALIZED.get(token, token)
-        tokens.extend(TOKEN_PATTERN.findall(normalized_token) or [normalized_token])
-
-    return tuple(tokens)
-
-
-def _contains_token_phrase(container: str, phrase: str) -> bool:
-    """Return True when phrase appears in container as contiguous full tokens."""
-    container_tokens = _phrase_tokens(container)
-    phrase_tokens = _phrase_tokens(phrase)
-
-    if not container_tokens or not phrase_tokens or len(phrase_tokens) > len(container_tokens):
-        return False
-
-    phrase_length = len(phrase_tokens)
-    return any(
-        container_tokens[index:index + phrase_length] == phrase_tokens
-        for index in range(len(container_tokens) - phrase_length + 1)
-    )
-
-
-def _has_token_boundary_containment(left: str, right: str) -> bool:
-    """Check whether either phrase fully contains the other on token boundaries."""
-    return _contains_token_phrase(left, right) or _contains_token_phrase(right, left)
-
-
-def _normalized_profile_keywords(role_family: str, category: str) -> set[str]:
-    """Load role profile keywords for a category and canonicalize aliases."""
-    from app.skill_selection.scoring.role_profiles import ROLE_PROFILES
-
-    role_profile = ROLE_PROFILES.get(role_family, ROLE_PROFILES["general"])
-    keywords = set(role_profile.get(category, {}).get("keywords", []))
-
-    for parent_role in role_profile.get("inherits", []):
-        parent_keywords = set(ROLE_PROFILES.get(parent_role, {}).get(category, {}).get("keywords", []))
-        keywords.update(parent_keywords)
-
-    return {normalize_skill(keyword) for keyword in keywords}
-
-
-def score_skill(skill: str, role_family: str, category: str, job_text: str | None=None) -> tuple[float, dict | None]:
+def score_skill(
+    skill: str,
+    role_family: str,
+    category: str,
+    job_text: str | None=None,
+    *,
+    index: KeywordIndex | None = None,
+    job_phrases: frozenset[Phrase] | None = None,
+) -> tuple[float, dict | None]:
     """Score a skill based on its presence in the job text and its relevance to the role profile."""
     normalized_skill = normalize_skill(skill)
-    keywords = _normalized_profile_keywords(role_family, category)
+    skill_tokens = phrase_tokens(normalized_skill)
+    if index is None:
+        index = get_keyword_index(role_family, category)
+    if job_phrases is None and job_text:
+        job_phrases = job_text_phrases(job_text, [skill])
 
     # Exact or token-boundary containment = 3 points, weaker partial match = 1 point
     score = 0.0
-    matched_keywords: list[str] = []
     # Handle empty strings - they shouldn't match anything
-    if normalized_skill:
-        matched_keywords = sorted(
-            keyword for keyword in keywords
-            if keyword == normalized_skill or _has_token_boundary_containment(normalized_skill, keyword)
-        )
+    matched_keywords = index.strong_matches(normalized_skill, skill_tokens)
 
     if matched_keywords:
         score = 3.0
-    elif normalized_skill:
-        matched_keywords = sorted(keyword for keyword in keywords if normalized_skill in keyword)
+    else:
+        matched_keywords = index.partial_matches(normalized_skill)
         if matched_keywords:
             score = 1.0
 
-    return score, {"normalized_skill": normalized_skill, "matched_keywords": matched_keywords}
-
-def rank_skills(skills: list[str], role_family: str, category: str, job_text: str | None=None, top_n: int | None=None, include_zero: bool=False) -> tuple[list[str], dict | None]:
+    details = {"normalized_skill": normalized_skill, "matched_keywords": matched_keywords}
+    if job_phrases is not None:
+        # Mentioned in the job text = at least 2 points
+        job_text_match = bool(skill_tokens) and skill_tokens in job_phrases
+        if job_text_match:
+            score = max(score, JOB_TEXT_MATCH_SCORE)
+        details["job_text_match"] = job_text_match
+
+    return score, details
+
+def rank_skills(
+    skills: list[str],
+    role_family: str,
+    category: str,
+    job_text: str | None=None,
+    top_n: int | None=None,
+    include_zero: bool=False,
+    *,
+    job_phrases: frozenset[Phrase] | None = None,
+) -> tuple[list[str], dict | None]:
     """Rank skills based on their scores."""
+    index = get_keyword_index(role_family, category)
+    if job_phrases is None and job_text:
+        job_phrases = job_text_phrases(job_text, skills)
     scored_skills = []
     for skill in skills:
-        score, details = score_skill(skill, role_family, category, job_text)
+        score, details = score_skill(skill, role_family, category, job_text, index=index, job_phrases=job_phrases)
         if include_zero or score > 0:
             scored_skills.append((skill, score, details))
 
@@ -118,11 +103,139 @@ def baseline_select_skills(
         "programming": programming,
         "concepts": concepts,
     }
+    # Scan the job text once for every category's skills
+    job_phrases = job_text_phrases(job_text, technology + programming + concepts) if job_text else None
 
     for category, category_skills in category_inputs.items():
-        ranked_skills, category_details = rank_skills(category_skills, role_family, category, job_text=job_text, top_n=top_n, include_zero=include_zero)
+        ranked_skills, category_details = rank_skills(
+            category_skills,
+            role_family,
+            category,
+            job_text=job_text,
+            top_n=top_n,
+            include_zero=include_zero,
+            job_phrases=job_phrases,
+        )
         selected_skills[category] = ranked_skills
         if dev_mode:
             details[category] = category_details
 
     return selected_skills, details if dev_mode else None
+
+
+def _rank_category_batch(
+    skills: list[str],
+    role_families: list[str],
+    job_phrase_sets: list[frozenset[Phrase] | None],
+    category: str,
+    top_n: int | None,
+    include_zero: bool,
+) -> list[tuple[list[str], dict]]:
+    """Rank one category's skills for many targets using a target x skill score matrix."""
+    if not skills:
+        return [([], {}) for _ in role_families]
+
+    normalized_skills = [normalize_skill(skill) for skill in skills]
+    skill_tokens = [phrase_tokens(normalized) for normalized in normalized_skills]
+    name_order = {name: rank for rank, name in enumerate(sorted(set(skills)))}
+    name_ranks = np.array([name_order[skill] for skill in skills], dtype=np.int64)
+
+    # Profile scores depend only on the role family, so score each family once.
+    family_rows: dict[str, int] = {}
+    family_scores: list[list[float]] = []
+    family_details: list[list[dict]] = []
+    for role_family in role_families:
+        if role_family in family_rows:
+            continue
+        index = get_keyword_index(role_family, category)
+        scores: list[float] = []
+        details: list[dict] = []
+        for skill in skills:
+            score, skill_details = score_skill(skill, role_family, category, index=index)
+            scores.append(score)
+            details.append(skill_details)
+        family_rows[role_family] = len(family_scores)
+        family_scores.append(scores)
+        family_details.append(details)
+
+    target_rows = np.array([family_rows[role_family] for role_family in role_families], dtype=np.int64)
+    profile_matrix = np.asarray(family_scores, dtype=np.float64)[target_rows]
+    mention_matrix = np.array(
+        [
+            [bool(tokens) and job_phrases is not None and tokens in job_phrases for tokens in skill_tokens]
+            for job_phrases in job_phrase_sets
+        ],
+        dtype=bool,
+    )
+    score_matrix = np.where(mention_matrix, np.maximum(profile_matrix, JOB_TEXT_MATCH_SCORE), profile_matrix)
+
+    results: list[tuple[list[str], dict]] = []
+    for row, (role_family, job_phrases) in enumerate(zip(role_families, job_phrase_sets)):
+        scores = score_matrix[row]
+        # Score descending, then skill name ascending; lexsort is stable for duplicates.
+        order = np.lexsort((name_ranks, -scores))
+        if not include_zero:
+            order = order[scores[order] > 0]
+
+        base_details = family_details[family_rows[role_family]]
+        ranked_skills = [skills[position] for position in order]
+        details_dict = {}
+        for position in order:
+            details = {"score": float(scores[position]), **base_details[position]}
+            details["matched_keywords"] = list(details["matched_keywords"])
+            if job_phrases is not None:
+                details["job_text_match"] = bool(mention_matrix[row, position])
+            details_dict[skills[position]] = details
+
+        results.append((ranked_skills[:top_n], details_dict))
+
+    return results
+
+
+def baseline_select_skills_batch(
+    targets: list[tuple[str, str | None]],
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    include_zero: bool = False,
+) -> list[tuple[dict, dict | None]]:
+    """Select skills for many (job_role, job_text) targets against one shared inventory.
+
+    Returns one `baseline_select_skills` result per target, in target order.
+    """
+    if not targets:
+        return []
+
+    role_families = [detect_role_family(job_role) for job_role, _ in targets]
+    inventory_phrases = compile_skill_phrases(technology + programming + concepts)
+    job_phrase_sets = [
+        inventory_phrases.find_in(job_text) if job_text else None
+        for _, job_text in targets
+    ]
+
+    category_inputs = {
+        "technology": technology,
+        "programming": programming,
+        "concepts": concepts,
+    }
+    category_results = {
+        category: _rank_category_batch(
+            category_skills,
+            role_families,
+            job_phrase_sets,
+            category,
+            top_n,
+            include_zero,
+        )
+        for category, category_skills in category_inputs.items()
+    }
+
+    results: list[tuple[dict, dict | None]] = []
+    for row in range(len(targets)):
+        selected_skills = {category: category_results[category][row][0] for category in category_inputs}
+        details = {category: category_results[category][row][1] for category in category_inputs}
+        results.append((selected_skills, details if dev_mode else None))
+
+    return results
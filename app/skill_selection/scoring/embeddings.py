@@ -1,18 +1,30 @@
 import logging
+from collections import OrderedDict
 
 import numpy as np
 import openai
 
+from app.model_transport import CassetteMissError
 from app.skill_selection.scoring.synonyms import SYNONYM_TO_NORMALIZED
-from app.skill_selection.embedding_client import embed_role, embed_skills
+from app.skill_selection.embedding_client import (
+    embed_role,
+    embed_roles,
+    embed_skills,
+    embedding_cache_namespace,
+    uses_local_provider,
+)
 from app.skill_selection.embedding_cache import EmbeddingCache
-from app.config import settings
 
-cache = EmbeddingCache(settings.EMBEDDING_MODEL)
+# Local vectors are cheaper to recompute than to journal, so they stay in memory.
+cache = EmbeddingCache(embedding_cache_namespace(), persist=not uses_local_provider())
 
 logger = logging.getLogger("embeddings_scorer")
 
 MIN_ROLE_TEXT_CHARS = 8
+ROLE_UNIT_CACHE_SIZE = 128
+
+# Unit-normalized role vectors keyed by the identity of the cached role embedding.
+_role_unit_cache: OrderedDict[int, tuple[list[float] | np.ndarray, np.ndarray]] = OrderedDict()
 
     
 def normalize_skill(skill: str) -> str:
@@ -39,14 +51,64 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return float(np.dot(a_arr, b_arr) / norm)
 
 
+def unit_rows(vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+    """Stack vectors into a float32 matrix with unit-length rows (zero rows stay zero)."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def stack_rows(vectors: list[list[float] | np.ndarray]) -> np.ndarray:
+    """Stack vectors into one matrix, keeping a shared float16/int8 storage dtype as is."""
+    dtypes = {getattr(vec, "dtype", None) for vec in vectors}
+    if len(dtypes) == 1 and None not in dtypes:
+        return np.stack(vectors)  # type: ignore[arg-type]
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def cosine_scores(matrix: np.ndarray, role_unit: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every row to a unit role vector (zero rows score 0).
+
+    Works on quantized rows directly: an int8 row's scale cancels in the cosine, so rows
+    are never decoded; products and norms accumulate in float32.
+    """
+    dots = (matrix @ role_unit).astype(np.float32, copy=False)
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix, dtype=np.float32))
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def unit_role_vector(role_vec: list[float] | np.ndarray) -> np.ndarray:
+    """Return the unit-normalized float32 role vector, memoized per cached role embedding.
+
+    Cache lookups return the same object for a given entry, so identity is a safe key.
+    """
+    key = id(role_vec)
+    entry = _role_unit_cache.get(key)
+    if entry is not None and entry[0] is role_vec:
+        _role_unit_cache.move_to_end(key)
+        return entry[1]
+
+    unit = unit_rows(role_vec)[0]
+    _role_unit_cache[key] = (role_vec, unit)
+    if len(_role_unit_cache) > ROLE_UNIT_CACHE_SIZE:
+        _role_unit_cache.popitem(last=False)
+    return unit
+
+
 def embedding_rank_skills(
     skills: list[str],
-    role_vec: list[float],
+    role_vec: list[float] | np.ndarray,
     top_n: int | None = None,
     dev_mode: bool = False,
 ) -> tuple[list[str], dict | None]:
     """Rank skills by cosine similarity to the role embedding.
 
+    Candidate vectors are stacked into one matrix (in the cache's float16/int8 storage
+    dtype when quantized) and scored with a single matrix-vector product. Skills whose
+    embedding batch failed are not cached and rank after every embedded skill, in name order.
+
     Returns (ranked_skills, details_dict | None).
     """
     if not skills:
@@ -58,8 +120,8 @@ def embedding_rank_skills(
     missing_texts: list[str] = []
     missing_indices: list[int] = []
 
-    for idx, normalized in enumerate(normalized_skills):
-        cached = cache.cache_lookup(normalized, type="skill")
+    cached_vecs = cache.cache_lookup_many(normalized_skills, type="skill")
+    for idx, (normalized, cached) in enumerate(zip(normalized_skills, cached_vecs)):
         if cached is None:
             missing_texts.append(normalized)
             missing_indices.append(idx)
@@ -79,14 +141,15 @@ def embedding_rank_skills(
             )
             raise ValueError("Number of skill embeddings does not match number of skills")
 
-        for normalized, idx, vec in zip(missing_texts, missing_indices, missing_vecs):
+        for idx, vec in zip(missing_indices, missing_vecs):
             skill_vecs[idx] = vec
-            cache.cache_store(normalized, vec, type="skill")
-
-    scored = []
+        cache.cache_store_many(
+            {text: vec for text, vec in zip(missing_texts, missing_vecs) if vec is not None},
+            type="skill",
+        )
 
     # check lengths match
-    if len(normalized_skills) != len(skill_vecs) or any(vec is None for vec in skill_vecs):
+    if len(normalized_skills) != len(skill_vecs):
         logger.error(
             "embedding_length_mismatch",
             extra={
@@ -97,25 +160,71 @@ def embedding_rank_skills(
         )
         raise ValueError("Number of skill embeddings does not match number of skills")
 
-    for skill, normalized, vec in zip(skills, normalized_skills, skill_vecs):
-        sim = cosine_similarity(role_vec, vec)
-        scored.append((skill, sim, normalized))
+    embedded = np.array([vec is not None for vec in skill_vecs], dtype=bool)
+    similarities = np.full(len(skill_vecs), -np.inf, dtype=np.float32)
+    if embedded.any():
+        similarities[embedded] = cosine_scores(
+            stack_rows([vec for vec in skill_vecs if vec is not None]),
+            unit_role_vector(role_vec),
+        )
 
     # Sort: similarity desc, then normalized name asc (stable tie-break)
-    scored.sort(key=lambda x: (-x[1], x[2]))
+    name_order = {name: rank for rank, name in enumerate(sorted(set(normalized_skills)))}
+    name_ranks = np.array([name_order[name] for name in normalized_skills], dtype=np.int64)
+    order = np.lexsort((name_ranks, -similarities))
 
-    ranked = [skill for skill, _, _ in scored[:top_n]]
+    ranked = [skills[idx] for idx in order[:top_n]]
 
     details = None
     if dev_mode:
-        details = {
-            skill: {"similarity": round(sim, 6), "normalized_skill": norm}
-            for skill, sim, norm in scored
-        }
+        details = {}
+        for idx in order:
+            details[skills[idx]] = {
+                "similarity": round(float(similarities[idx]), 6) if embedded[idx] else None,
+                "normalized_skill": normalized_skills[idx],
+            }
+            if not embedded[idx]:
+                details[skills[idx]]["embedding_failed"] = True
 
     return ranked, details
 
 
+def _role_text_warnings(job_role: str, role_text: str) -> list[str]:
+    warnings: list[str] = []
+    if len(role_text) < MIN_ROLE_TEXT_CHARS:
+        msg = f"role text is very short ({len(role_text)} chars); embeddings may be low quality"
+        warnings.append(msg)
+        logger.warning(
+            "role_text_too_short",
+            extra={"event": "role_text_too_short", "role": job_role, "length": len(role_text)},
+        )
+    return warnings
+
+
+def _rank_categories(
+    role_vec: list[float] | np.ndarray,
+    category_inputs: dict[str, list[str]],
+    top_n: int | None,
+    dev_mode: bool,
+) -> tuple[dict[str, list[str]], dict | None]:
+    selected_skills: dict[str, list[str]] = {}
+    all_details: dict | None = {} if dev_mode else None
+    role_unit = unit_role_vector(role_vec)
+
+    for category, category_skills in category_inputs.items():
+        ranked, details = embedding_rank_skills(
+            skills=category_skills,
+            role_vec=role_unit,
+            top_n=top_n,
+            dev_mode=dev_mode,
+        )
+        selected_skills[category] = ranked
+        if dev_mode and details is not None:
+            all_details[category] = details  # type: ignore[index]
+
+    return selected_skills, all_details
+
+
 def embedding_select_skills(
     job_role: str,
     technology: list[str],
@@ -130,18 +239,7 @@ def embedding_select_skills(
     Mirrors the baseline_select_skills() interface.
     """
     role_text = construct_role_text(job_role, job_text)
-
-    warnings: list[str] = []
-    if len(role_text) < MIN_ROLE_TEXT_CHARS:
-        msg = f"role text is very short ({len(role_text)} chars); embeddings may be low quality"
-        warnings.append(msg)
-        logger.warning(
-            "role_text_too_short",
-            extra={"event": "role_text_too_short", "role": job_role, "length": len(role_text)},
-        )
-
-    selected_skills: dict[str, list[str]] = {}
-    all_details: dict | None = {} if dev_mode else None
+    warnings = _role_text_warnings(job_role, role_text)
 
     category_inputs = {
         "technology": technology,
@@ -150,22 +248,14 @@ def embedding_select_skills(
     }
 
     try:
-        
-        role_vec = cache.cache_lookup(role_text, type='role')
-        if role_vec is None:
-            role_vec = embed_role(role_text)
-            cache.cache_store(role_text, role_vec, type='role')
-
-        for category, category_skills in category_inputs.items():
-            ranked, details = embedding_rank_skills(
-                skills=category_skills,
-                role_vec=role_vec,
-                top_n=top_n,
-                dev_mode=dev_mode,
-            )
-            selected_skills[category] = ranked
-            if dev_mode and details is not None:
-                all_details[category] = details  # type: ignore[index]
+        # One journal append for the role and every category's new skill vectors.
+        with cache.write_batch():
+            role_vec = cache.cache_lookup_many([role_text], type='role')[0]
+            if role_vec is None:
+                role_vec = embed_role(role_text)
+                cache.cache_store(role_text, role_vec, type='role')
+
+            selected_skills, all_details = _rank_categories(role_vec, category_inputs, top_n, dev_mode)
 
     except openai.RateLimitError as e:
         logger.error(
@@ -173,8 +263,97 @@ def embedding_select_skills(
             extra={"event": "embedding_rate_limit", "role": job_role, "error": str(e)},
         )
         raise RuntimeError(f"Embedding API rate limit reached: {e}") from e
+    except CassetteMissError as e:
+        logger.error(
+            "embedding_cassette_miss",
+            extra={"event": "embedding_cassette_miss", "role": job_role, "error": str(e)},
+        )
+        raise RuntimeError(f"Embedding replay failed: {e}") from e
 
     if dev_mode and warnings:
         all_details["_warnings"] = warnings  # type: ignore[index]
 
     return selected_skills, all_details if dev_mode else None
+
+
+def _lookup_role_vectors(role_texts: list[str]) -> list[list[float]]:
+    """Resolve role vectors from the cache, embedding all misses in one batch request."""
+    unique_texts = list(dict.fromkeys(role_texts))
+    role_vecs: dict[str, list[float]] = {}
+    missing_texts: list[str] = []
+    for role_text, cached in zip(unique_texts, cache.cache_lookup_many(unique_texts, type="role")):
+        if cached is None:
+            missing_texts.append(role_text)
+        else:
+            role_vecs[role_text] = cached
+
+    if missing_texts:
+        missing_vecs = embed_roles(missing_texts)
+        if len(missing_vecs) != len(missing_texts):
+            logger.error(
+                "embedding_length_mismatch",
+                extra={
+                    "event": "embedding_length_mismatch",
+                    "num_roles": len(missing_texts),
+                    "num_role_vecs": len(missing_vecs),
+                },
+            )
+            raise ValueError("Number of role embeddings does not match number of roles")
+        role_vecs.update(zip(missing_texts, missing_vecs))
+        cache.cache_store_many(dict(zip(missing_texts, missing_vecs)), type="role")
+
+    return [role_vecs[role_text] for role_text in role_texts]
+
+
+def embedding_select_skills_batch(
+    targets: list[tuple[str, str | None]],
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    top_n: int | None = None,
+    dev_mode: bool = False,
+) -> list[tuple[dict, dict | None]]:
+    """Select skills for many (job_role, job_text) targets against one shared inventory.
+
+    Role texts missing from the cache are embedded in a single batch request; skill
+    vectors are resolved once and reused from the cache for every later target.
+    """
+    if not targets:
+        return []
+
+    role_texts = [construct_role_text(job_role, job_text) for job_role, job_text in targets]
+    target_warnings = [
+        _role_text_warnings(job_role, role_text)
+        for (job_role, _), role_text in zip(targets, role_texts)
+    ]
+
+    category_inputs = {
+        "technology": technology,
+        "programming": programming,
+        "concepts": concepts,
+    }
+
+    results: list[tuple[dict, dict | None]] = []
+    try:
+        with cache.write_batch():
+            role_vecs = _lookup_role_vectors(role_texts)
+            for role_vec, warnings in zip(role_vecs, target_warnings):
+                selected_skills, all_details = _rank_categories(role_vec, category_inputs, top_n, dev_mode)
+                if dev_mode and warnings:
+                    all_details["_warnings"] = warnings  # type: ignore[index]
+                results.append((selected_skills, all_details if dev_mode else None))
+
+    except openai.RateLimitError as e:
+        logger.error(
+            "embedding_rate_limit",
+            extra={"event": "embedding_rate_limit", "role_count": len(targets), "error": str(e)},
+        )
+        raise RuntimeError(f"Embedding API rate limit reached: {e}") from e
+    except CassetteMissError as e:
+        logger.error(
+            "embedding_cassette_miss",
+            extra={"event": "embedding_cassette_miss", "role_count": len(targets), "error": str(e)},
+        )
+        raise RuntimeError(f"Embedding replay failed: {e}") from e
+
+    return results
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from app.skill_selection.scoring.phrase_matcher import Phrase, PhraseMatcher
+from app.skill_selection.scoring.role_profiles import ROLE_PROFILES
+from app.skill_selection.scoring.synonyms import SYNONYM_TO_NORMALIZED
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:#|\+\+)?")
+CATEGORIES = ("technology", "programming", "concepts")
+
+# Skill names and aliases that are also everyday words or single letters. In job text they
+# count only when written distinctively ("Go", "REST", "C") or as part of a known
+# multi-token name ("rest api", "node.js"), so "we go the extra mile" names no skill.
+AMBIGUOUS_JOB_TEXT_TERMS = frozenset({
+    "c", "cd", "ci", "d", "dart", "express", "go", "ml", "node", "r", "rest", "rust", "spring", "swift", "unity",
+})
+_JOB_TEXT_TOKEN_PATTERN = re.compile(TOKEN_PATTERN.pattern, re.IGNORECASE)
+_SENTENCE_ENDS = ".!?:;"
+# Stands in for a dropped ambiguous word; no phrase contains it, so matches cannot span it.
+_NO_MATCH_TOKEN = ""
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize skill names to a standard format."""
+    s = skill.strip().lower()
+
+    return SYNONYM_TO_NORMALIZED.get(s, s)
+
+
+def phrase_tokens(text: str) -> tuple[str, ...]:
+    """Tokenize a normalized phrase while expanding known token aliases."""
+    tokens: list[str] = []
+    for token in TOKEN_PATTERN.findall(text):
+        normalized_token = SYNONYM_TO_NORMALIZED.get(token, token)
+        tokens.extend(TOKEN_PATTERN.findall(normalized_token) or [normalized_token])
+
+    return tuple(tokens)
+
+
+def _ngrams(tokens: tuple[str, ...]) -> set[tuple[str, ...]]:
+    return {
+        tokens[start:end]
+        for start in range(len(tokens))
+        for end in range(start + 1, len(tokens) + 1)
+    }
+
+
+@dataclass(frozen=True)
+class KeywordIndex:
+    """Pre-tokenized profile keywords for one (role_family, category) pair.
+
+    `phrases` maps a keyword's full token tuple to the keywords that tokenize to it,
+    and `postings` maps every contiguous token n-gram to the keywords containing it,
+    so a skill contained in a keyword is one dictionary lookup. Keywords contained
+    in a skill are found with a single `matcher` pass over the skill's tokens.
+    """
+
+    keywords: frozenset[str]
+    sorted_keywords: tuple[str, ...]
+    keyword_tokens: Mapping[str, tuple[str, ...]]
+    phrases: Mapping[tuple[str, ...], frozenset[str]]
+    postings: Mapping[tuple[str, ...], frozenset[str]]
+    matcher: PhraseMatcher
+
+    def strong_matches(self, normalized_skill: str, skill_tokens: tuple[str, ...] | None = None) -> list[str]:
+        """Return keywords equal to the skill or containing/contained on token boundaries."""
+        if not normalized_skill:
+            return []
+
+        matched: set[str] = set()
+        if normalized_skill in self.keywords:
+            matched.add(normalized_skill)
+
+        tokens = phrase_tokens(normalized_skill) if skill_tokens is None else skill_tokens
+        if tokens:
+            # Skill phrase contained in a keyword.
+            matched.update(self.postings.get(tokens, ()))
+            # Keyword phrases contained in the skill.
+            for phrase in self.matcher.find(tokens):
+                matched.update(self.phrases.get(phrase, ()))
+
+        return sorted(matched)
+
+    def partial_matches(self, normalized_skill: str) -> list[str]:
+        """Return keywords that contain the skill as a raw substring."""
+        if not normalized_skill:
+            return []
+        return [keyword for keyword in self.sorted_keywords if normalized_skill in keyword]
+
+
+def _synonym_patterns() -> list[tuple[Phrase, Phrase]]:
+    """Map each synonym's raw token phrase to its canonical token phrase."""
+    return [
+        (phrase_tokens(synonym), phrase_tokens(normalize_skill(synonym)))
+        for synonym in SYNONYM_TO_NORMALIZED
+    ]
+
+
+def build_vocabulary_matcher(keywords: Iterable[str]) -> PhraseMatcher:
+    """Build a phrase matcher over normalized keywords and all known synonyms."""
+    patterns = [(phrase_tokens(keyword), phrase_tokens(keyword)) for keyword in keywords]
+    return PhraseMatcher(patterns + _synonym_patterns())
+
+
+def build_keyword_index(
+    keywords: set[str] | frozenset[str],
+    matcher: PhraseMatcher | None = None,
+) -> KeywordIndex:
+    """Compile normalized keywords into an immutable lookup index."""
+    keyword_tokens: dict[str, tuple[str, ...]] = {}
+    phrases: dict[tuple[str, ...], set[str]] = {}
+    postings: dict[tuple[str, ...], set[str]] = {}
+
+    for keyword in keywords:
+        tokens = phrase_tokens(keyword)
+        keyword_tokens[keyword] = tokens
+        if not tokens:
+            continue
+        phrases.setdefault(tokens, set()).add(keyword)
+        for ngram in _ngrams(tokens):
+            postings.setdefault(ngram, set()).add(keyword)
+
+    return KeywordIndex(
+        keywords=frozenset(keywords),
+        sorted_keywords=tuple(sorted(keywords)),
+        keyword_tokens=MappingProxyType(keyword_tokens),
+        phrases=MappingProxyType({key: frozenset(value) for key, value in phrases.items()}),
+        postings=MappingProxyType({key: frozenset(value) for key, value in postings.items()}),
+        matcher=matcher if matcher is not None else build_vocabulary_matcher(keywords),
+    )
+
+
+def _profile_keywords(profiles: dict, role_family: str, category: str) -> set[str]:
+    """Collect a profile's category keywords plus those of its direct parents."""
+    role_profile = profiles.get(role_family, profiles["general"])
+    keywords = set(role_profile.get(category, {}).get("keywords", []))
+
+    for parent_role in role_profile.get("inherits", []):
+        keywords.update(profiles.get(parent_role, {}).get(category, {}).get("keywords", []))
+
+    return {normalize_skill(keyword) for keyword in keywords}
+
+
+def build_role_keyword_indexes(profiles: dict) -> Mapping[tuple[str, str], KeywordIndex]:
+    """Build one keyword index per (role_family, category) from loaded role profiles.
+
+    All indexes share a single vocabulary matcher built from every profile keyword.
+    """
+    profile_keywords = {
+        (role_family, category): _profile_keywords(profiles, role_family, category)
+        for role_family in profiles
+        for category in CATEGORIES
+    }
+    matcher = build_vocabulary_matcher(set().union(*profile_keywords.values()))
+    return MappingProxyType({
+        key: build_keyword_index(keywords, matcher)
+        for key, keywords in profile_keywords.items()
+    })
+
+
+ROLE_KEYWORD_INDEXES = build_role_keyword_indexes(ROLE_PROFILES)
+VOCABULARY_MATCHER = next(iter(ROLE_KEYWORD_INDEXES.values())).matcher
+EMPTY_KEYWORD_INDEX = build_keyword_index(set(), VOCABULARY_MATCHER)
+
+
+
+
+def _compound_bigrams(terms: Iterable[str]) -> frozenset[tuple[str, str]]:
+    """Adjacent raw token pairs of multi-token terms, e.g. ("rest", "api") or ("node", "js")."""
+    pairs: set[tuple[str, str]] = set()
+    for term in terms:
+        tokens = TOKEN_PATTERN.findall(term)
+        pairs.update(zip(tokens, tokens[1:]))
+    return frozenset(pairs)
+
+
+COMPOUND_BIGRAMS = _compound_bigrams(
+    set(SYNONYM_TO_NORMALIZED)
+    | set(SYNONYM_TO_NORMALIZED.values())
+    | set().union(*(index.keywords for index in ROLE_KEYWORD_INDEXES.values()))
+)
+
+
+def get_keyword_index(role_family: str, category: str) -> KeywordIndex:
+    """Return the compiled index for a role family, falling back to the general profile."""
+    profile_key = role_family if role_family in ROLE_PROFILES else "general"
+    return ROLE_KEYWORD_INDEXES.get((profile_key, category), EMPTY_KEYWORD_INDEX)
+
+
+def _distinctive_mention(job_text: str, match: re.Match, raw_tokens: list[str], position: int) -> bool:
+    """Whether an ambiguous term in job text reads as a skill rather than a plain word."""
+    token = raw_tokens[position]
+    if position > 0 and (raw_tokens[position - 1], token) in COMPOUND_BIGRAMS:
+        return True
+    if position + 1 < len(raw_tokens) and (token, raw_tokens[position + 1]) in COMPOUND_BIGRAMS:
+        return True
+
+    surface = match.group()
+    if surface.isupper():
+        return True
+    if surface.islower():
+        return False
+    # Title case ("Go") names the skill unless it only marks the start of a sentence.
+    preceding = job_text[: match.start()].rstrip()
+    return bool(preceding) and preceding[-1] not in _SENTENCE_ENDS
+
+
+def job_text_tokens(job_text: str) -> tuple[str, ...]:
+    """Tokenize job text like `phrase_tokens`, without reading everyday words as skills.
+
+    Terms in `AMBIGUOUS_JOB_TEXT_TERMS` written as ordinary prose become a token that no
+    phrase contains, so "take a rest" does not mention "restful api".
+    """
+    matches = list(_JOB_TEXT_TOKEN_PATTERN.finditer(job_text))
+    raw_tokens = [match.group().lower() for match in matches]
+    tokens: list[str] = []
+    for position, (match, token) in enumerate(zip(matches, raw_tokens)):
+        if token in AMBIGUOUS_JOB_TEXT_TERMS and not _distinctive_mention(job_text, match, raw_tokens, position):
+            tokens.append(_NO_MATCH_TOKEN)
+            continue
+        normalized_token = SYNONYM_TO_NORMALIZED.get(token, token)
+        tokens.extend(TOKEN_PATTERN.findall(normalized_token) or [normalized_token])
+
+    return tuple(tokens)
+
+
+@dataclass(frozen=True)
+class SkillPhrases:
+    """Canonical phrases for a skill inventory, compiled once for job-text scans.
+
+    Phrases covered by the shared vocabulary matcher are found by it; the rest are
+    matched by `unknown_matcher`, a small matcher over just those phrases.
+    """
+
+    phrases: frozenset[Phrase]
+    unknown_matcher: PhraseMatcher | None
+
+    def find_in(self, job_text: str | None) -> frozenset[Phrase]:
+        """Return the phrases mentioned in job_text on token boundaries."""
+        if not job_text:
+            return frozenset()
+
+        job_tokens = job_text_tokens(job_text)
+        if not job_tokens:
+            return frozenset()
+
+        found = VOCABULARY_MATCHER.find(job_tokens) & self.phrases
+        if self.unknown_matcher is not None:
+            found |= self.unknown_matcher.find(job_tokens)
+        return frozenset(found)
+
+
+def compile_skill_phrases(skills: Iterable[str]) -> SkillPhrases:
+    """Normalize and tokenize a skill inventory once for repeated job-text scans."""
+    phrases = {phrase_tokens(normalize_skill(skill)) for skill in skills}
+    phrases.discard(())
+    unknown_phrases = phrases - VOCABULARY_MATCHER.labels
+    return SkillPhrases(
+        phrases=frozenset(phrases),
+        unknown_matcher=PhraseMatcher((phrase, phrase) for phrase in unknown_phrases) if unknown_phrases else None,
+    )
+
+
+def job_text_phrases(job_text: str | None, skills: Iterable[str]) -> frozenset[Phrase]:
+    """Return the canonical phrases of skills mentioned in job_text on token boundaries.
+
+    The job text is scanned once with the shared vocabulary matcher; skills outside the
+    profile/synonym vocabulary are matched in one extra pass with a small request matcher.
+    Ambiguous short names only match where `job_text_tokens` keeps them.
+    """
+    if not job_text:
+        return frozenset()
+    return compile_skill_phrases(skills).find_in(job_text)
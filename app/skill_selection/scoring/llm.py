@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
+from app.circuit_breaker import CircuitBreaker, circuit_breakers
+from app.config import settings
 from app.skill_selection.scoring.baseline import baseline_select_skills, normalize_skill
-from app.skill_selection.llm_client import LLMClientError, score_skills_with_llm
+from app.skill_selection.llm_client import (
+    METRICS_SUBSYSTEM,
+    LLMClientError,
+    LLMScoreResult,
+    score_skills_with_llm,
+    score_skills_with_llm_async,
+)
 
 logger = logging.getLogger("llm_scorer")
 
@@ -103,54 +112,101 @@ def _rank_category(
     return ranked, details
 
 
-def llm_select_skills(
+def _fallback_after_error(
+    exc: Exception,
+    llm_metadata: dict[str, Any] | None,
+    *,
     job_role: str,
     technology: list[str],
     programming: list[str],
     concepts: list[str],
-    job_text: str | None = None,
-    top_n: int | None = None,
-    dev_mode: bool = False,
-    llm_model: str | None = None,
-    llm_max_output_tokens: int | None = None,
+    job_text: str | None,
+    top_n: int | None,
+    dev_mode: bool,
+    llm_max_output_tokens: int | None,
+) -> tuple[dict, dict | None]:
+    logger.warning(
+        "llm_fallback_to_baseline",
+        extra={
+            "event": "llm_fallback_to_baseline",
+            "role": job_role,
+            "error": str(exc),
+            "llm_max_output_tokens": llm_max_output_tokens,
+        },
+    )
+    return _fallback_to_baseline(
+        job_role=job_role,
+        technology=technology,
+        programming=programming,
+        concepts=concepts,
+        job_text=job_text,
+        top_n=top_n,
+        dev_mode=dev_mode,
+        warning=f"LLM selection failed; fell back to baseline: {exc}",
+        llm_metadata=llm_metadata,
+    )
+
+
+def _circuit_breaker(llm_model: str | None) -> CircuitBreaker:
+    return circuit_breakers.get(
+        METRICS_SUBSYSTEM,
+        llm_model if llm_model is not None else settings.SKILL_LLM_MODEL,
+    )
+
+
+def _short_circuit_to_baseline(
+    breaker: CircuitBreaker,
+    *,
+    job_role: str,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    job_text: str | None,
+    top_n: int | None,
+    dev_mode: bool,
+    llm_max_output_tokens: int | None,
+) -> tuple[dict, dict | None]:
+    logger.warning(
+        "llm_circuit_open",
+        extra={"event": "llm_circuit_open", "role": job_role, "model": breaker.model},
+    )
+    return _fallback_to_baseline(
+        job_role=job_role,
+        technology=technology,
+        programming=programming,
+        concepts=concepts,
+        job_text=job_text,
+        top_n=top_n,
+        dev_mode=dev_mode,
+        warning=f"LLM circuit open for {breaker.model}; used baseline",
+        llm_metadata={"model": breaker.model, "circuit": breaker.state},
+    )
+
+
+def _select_from_llm_result(
+    llm_result: LLMScoreResult,
+    *,
+    job_role: str,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    job_text: str | None,
+    top_n: int | None,
+    dev_mode: bool,
+    llm_max_output_tokens: int | None,
 ) -> tuple[dict, dict | None]:
-    """Select top skills per category using LLM scoring and local ranking."""
     category_inputs = {
         "technology": technology,
         "programming": programming,
         "concepts": concepts,
     }
 
-    llm_result = None
     try:
-        llm_result = score_skills_with_llm(
-            job_role=job_role,
-            job_text=job_text,
-            technology=technology,
-            programming=programming,
-            concepts=concepts,
-            model=llm_model,
-            max_output_tokens=llm_max_output_tokens,
-        )
         scores, warnings = _validate_scores(llm_result.scores, category_inputs)
-    except (LLMClientError, LLMValidationError) as exc:
-        llm_metadata = (
-            exc.metadata
-            if isinstance(exc, LLMClientError)
-            else llm_result.metadata
-            if llm_result is not None
-            else None
-        )
-        logger.warning(
-            "llm_fallback_to_baseline",
-            extra={
-                "event": "llm_fallback_to_baseline",
-                "role": job_role,
-                "error": str(exc),
-                "llm_max_output_tokens": llm_max_output_tokens,
-            },
-        )
-        return _fallback_to_baseline(
+    except LLMValidationError as exc:
+        return _fallback_after_error(
+            exc,
+            llm_result.metadata,
             job_role=job_role,
             technology=technology,
             programming=programming,
@@ -158,8 +214,7 @@ def llm_select_skills(
             job_text=job_text,
             top_n=top_n,
             dev_mode=dev_mode,
-            warning=f"LLM selection failed; fell back to baseline: {exc}",
-            llm_metadata=llm_metadata,
+            llm_max_output_tokens=llm_max_output_tokens,
         )
 
     selected: dict[str, list[str]] = {}
@@ -182,3 +237,100 @@ def llm_select_skills(
             all_details["_warnings"] = warnings  # type: ignore[index]
 
     return selected, all_details if dev_mode else None
+
+
+def llm_select_skills(
+    job_role: str,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    job_text: str | None = None,
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    llm_model: str | None = None,
+    llm_max_output_tokens: int | None = None,
+) -> tuple[dict, dict | None]:
+    """Select top skills per category using LLM scoring and local ranking.
+
+    While the (skill selection, model) circuit breaker is open, the baseline result is
+    returned without calling the model.
+    """
+    selection = {
+        "job_role": job_role,
+        "technology": technology,
+        "programming": programming,
+        "concepts": concepts,
+        "job_text": job_text,
+        "top_n": top_n,
+        "dev_mode": dev_mode,
+        "llm_max_output_tokens": llm_max_output_tokens,
+    }
+    breaker = _circuit_breaker(llm_model)
+    if not breaker.allow():
+        return _short_circuit_to_baseline(breaker, **selection)
+    start = time.perf_counter()
+    try:
+        llm_result = score_skills_with_llm(
+            job_role=job_role,
+            job_text=job_text,
+            technology=technology,
+            programming=programming,
+            concepts=concepts,
+            model=llm_model,
+            max_output_tokens=llm_max_output_tokens,
+        )
+    except LLMClientError as exc:
+        breaker.record_failure(str(exc))
+        return _fallback_after_error(exc, exc.metadata, **selection)
+    except BaseException as exc:
+        # Any other outcome (SDK error, replay miss, cancellation) still settles the probe.
+        breaker.record_failure(f"{type(exc).__name__}: {exc}")
+        raise
+    breaker.record_success((time.perf_counter() - start) * 1000.0)
+    return _select_from_llm_result(llm_result, **selection)
+
+
+async def llm_select_skills_async(
+    job_role: str,
+    technology: list[str],
+    programming: list[str],
+    concepts: list[str],
+    job_text: str | None = None,
+    top_n: int | None = None,
+    dev_mode: bool = False,
+    llm_model: str | None = None,
+    llm_max_output_tokens: int | None = None,
+) -> tuple[dict, dict | None]:
+    """`llm_select_skills` with the scoring request awaited on the async client."""
+    selection = {
+        "job_role": job_role,
+        "technology": technology,
+        "programming": programming,
+        "concepts": concepts,
+        "job_text": job_text,
+        "top_n": top_n,
+        "dev_mode": dev_mode,
+        "llm_max_output_tokens": llm_max_output_tokens,
+    }
+    breaker = _circuit_breaker(llm_model)
+    if not breaker.allow():
+        return _short_circuit_to_baseline(breaker, **selection)
+    start = time.perf_counter()
+    try:
+        llm_result = await score_skills_with_llm_async(
+            job_role=job_role,
+            job_text=job_text,
+            technology=technology,
+            programming=programming,
+            concepts=concepts,
+            model=llm_model,
+            max_output_tokens=llm_max_output_tokens,
+        )
+    except LLMClientError as exc:
+        breaker.record_failure(str(exc))
+        return _fallback_after_error(exc, exc.metadata, **selection)
+    except BaseException as exc:
+        breaker.record_failure(f"{type(exc).__name__}: {exc}")
+        raise
+    breaker.record_success((time.perf_counter() - start) * 1000.0)
+    return _select_from_llm_result(llm_result, **selection)
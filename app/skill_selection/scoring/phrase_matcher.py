@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Hashable, Iterable, Iterator
+
+Phrase = tuple[str, ...]
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over token streams.
+
+    Patterns are token tuples mapped to one or more labels. `find` walks a token
+    sequence once and reports the labels of every pattern that occurs in it as a
+    contiguous run of full tokens, regardless of how many patterns are loaded.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[Phrase, Hashable]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[frozenset] = [frozenset()]
+        self.pattern_count = 0
+        labels: set = set()
+
+        pending: list[set] = [set()]
+        for tokens, label in patterns:
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    pending.append(set())
+                state = next_state
+            pending[state].add(label)
+            labels.add(label)
+            self.pattern_count += 1
+
+        self.labels = frozenset(labels)
+
+        # Breadth-first failure links; each state's output absorbs its fallback's.
+        self._outputs = [frozenset()] * len(self._goto)
+        queue: deque[int] = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        self._outputs[0] = frozenset(pending[0])
+
+        while queue:
+            state = queue.popleft()
+            self._outputs[state] = frozenset(pending[state] | self._outputs[self._fail[state]])
+            for token, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                queue.append(next_state)
+
+    def iter_matches(self, tokens: Iterable[str]) -> Iterator[tuple[int, Hashable]]:
+        """Yield (end_token_index, label) for every pattern occurrence."""
+        state = 0
+        for position, token in enumerate(tokens):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for label in self._outputs[state]:
+                yield position, label
+
+    def find(self, tokens: Iterable[str]) -> set:
+        """Return the labels of all patterns contained in tokens."""
+        found: set = set()
+        state = 0
+        for token in tokens:
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            found.update(self._outputs[state])
+        return found
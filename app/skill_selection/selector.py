@@ -1,18 +1,34 @@
 # app/skill_selection/selector.py
 from __future__ import annotations
+import asyncio
 import logging
 import time
 
 from app.config import settings
 from app.metrics import metrics
-from app.skill_selection.models import SkillSelectRequest, SkillSelectResponse
-from app.skill_selection.scoring.baseline import baseline_select_skills
-from app.skill_selection.scoring.embeddings import embedding_select_skills
-from app.skill_selection.scoring.llm import llm_select_skills
+from app.model_scheduler import model_call_priority
+from app.response_cache import ResponseCache, is_baseline_fallback
+from app.single_flight import stage_request_key
+from app.skill_selection.models import (
+    SkillSelectBatchRequest,
+    SkillSelectBatchResponse,
+    SkillSelectRequest,
+    SkillSelectResponse,
+)
+from app.skill_selection.scoring.baseline import baseline_select_skills, baseline_select_skills_batch
+from app.skill_selection.scoring.embeddings import embedding_select_skills, embedding_select_skills_batch
+from app.skill_selection.scoring.llm import llm_select_skills, llm_select_skills_async
 from app.skill_selection.baseline_filter import select_with_baseline_filter
 
 logger = logging.getLogger("skill_selector")
 
+CACHED_METHODS = {"embeddings", "llm"}
+
+response_cache = ResponseCache(
+    max_entries=settings.SELECTION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SELECTION_CACHE_TTL_SECONDS,
+)
+
 
 def _effective_method(requested_method: str, meta: dict | None) -> str:
     """Return the method that produced the response after fallback handling."""
@@ -93,7 +109,7 @@ def _call_scorer(
     raise ValueError(f"Unsupported skill selection method: {method}")
 
 
-def select_skills_service(req: SkillSelectRequest) -> SkillSelectResponse:
+def _resolve_options(req: SkillSelectRequest | SkillSelectBatchRequest) -> tuple[str, int | None, bool, bool]:
     method = req.method.lower() if req.method is not None else settings.SKILL_METHOD.lower()
     top_n = req.top_n if req.top_n is not None else settings.SKILL_TOP_N
     dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
@@ -102,17 +118,125 @@ def select_skills_service(req: SkillSelectRequest) -> SkillSelectResponse:
     )
     if req.llm_max_output_tokens is not None and req.llm_max_output_tokens <= 0:
         raise ValueError("llm_max_output_tokens must be greater than 0")
+    return method, top_n, dev_mode, bool(baseline_filter)
+
+
+def _response_cache_key(req: SkillSelectRequest, method: str, baseline_filter: bool) -> str | None:
+    """Cache key for a model-backed request, or None when the response is not cached.
+
+    `top_n` and `dev_mode` only shape the response, so they are left out of the key:
+    cached selections hold every ranked skill and full details.
+    """
+    if not settings.SELECTION_CACHE_ENABLED or method not in CACHED_METHODS:
+        return None
+    payload = req.model_dump(mode="json", exclude={"top_n", "dev_mode"})
+    payload.update(method=method, baseline_filter=baseline_filter)
+    return stage_request_key(stage="skill_selection", payload=payload)
+
+
+def _cached_selection(cache_key: str | None) -> tuple[dict, dict | None] | None:
+    if cache_key is None:
+        return None
+    return response_cache.get(cache_key)
+
+
+def _store_selection(cache_key: str | None, selected: dict, meta: dict | None) -> None:
+    if cache_key is not None and not is_baseline_fallback(meta):
+        response_cache.put(cache_key, (selected, meta))
+
+
+def _record_selection(
+    *,
+    req: SkillSelectRequest,
+    method: str,
+    top_n: int | None,
+    dev_mode: bool,
+    baseline_filter: bool,
+    selected: dict,
+    meta: dict | None,
+    latency_ms: float,
+    cache_key: str | None = None,
+    cache_hit: bool = False,
+) -> SkillSelectResponse:
+    """Record metrics and logs for one completed selection and build its response.
+
+    Cached selections (`cache_key` set) are ranked in full and cut to `top_n` here.
+    """
+    if cache_key is not None:
+        selected = {category: skills[:top_n] for category, skills in selected.items()}
+        if cache_hit and isinstance(meta, dict):
+            meta = {**meta, "_response_cache": "hit"}
+
+    effective_method = _effective_method(method, meta)
+    metrics.inc_request(method=effective_method)
+    if not cache_hit:
+        metrics.observe_tokens(_extract_total_tokens(meta))
+    metrics.observe_latency_ms(latency_ms)
+
+    logger.info(
+        "select_skills",
+        extra={
+            "event": "select_skills",
+            "subsystem": "skill_selection",
+            "role": req.job_role,
+            "method": effective_method,
+            "requested_method": method,
+            "baseline_filter": bool(baseline_filter),
+            "top_n": top_n,
+            "llm_max_output_tokens": req.llm_max_output_tokens,
+            "latency_ms": round(latency_ms, 3),
+            "cache_hit": cache_hit,
+            "category_counts": {k: len(v) for k, v in selected.items()},
+        },
+    )
+
+    return SkillSelectResponse(
+        technology=selected.get("technology", []),
+        programming=selected.get("programming", []),
+        concepts=selected.get("concepts", []),
+        details=meta if dev_mode else None,
+    )
+
+
+def _record_selection_failure(req: SkillSelectRequest, method: str, request_counted: bool) -> None:
+    if not request_counted:
+        metrics.inc_request(method=method)
+    metrics.inc_error()
+    logger.exception(
+        "select_skills_failed",
+        extra={
+            "event": "select_skills_failed",
+            "subsystem": "skill_selection",
+            "role": req.job_role,
+            "method": method,
+            "llm_max_output_tokens": req.llm_max_output_tokens,
+        },
+    )
+
+
+def select_skills_service(req: SkillSelectRequest) -> SkillSelectResponse:
+    """Select skills for one job target.
+
+    With `SELECTION_CACHE_ENABLED`, embeddings and LLM selections are cached in
+    process (see `_response_cache_key`); baseline fallbacks are never cached.
+    """
+    method, top_n, dev_mode, baseline_filter = _resolve_options(req)
+    cache_key = _response_cache_key(req, method, baseline_filter)
 
     start = time.perf_counter()
     request_counted = False
 
     try:
-        if baseline_filter and method in {"embeddings", "llm"}:
+        cached = _cached_selection(cache_key)
+        if cached is not None:
+            selected, meta = cached
+        elif baseline_filter and method in {"embeddings", "llm"}:
             selected, meta = select_with_baseline_filter(
                 method=method,
                 req=req,
-                top_n=top_n,
+                top_n=None if cache_key is not None else top_n,
             )
+            _store_selection(cache_key, selected, meta)
         else:
             selected, meta = _call_scorer(
                 method=method,
@@ -121,54 +245,161 @@ def select_skills_service(req: SkillSelectRequest) -> SkillSelectResponse:
                 technology=req.technology,
                 programming=req.programming,
                 concepts=req.concepts,
-                top_n=top_n,
-                dev_mode=dev_mode,
+                top_n=None if cache_key is not None else top_n,
+                dev_mode=dev_mode or cache_key is not None,
                 llm_model=req.llm_model,
                 llm_max_output_tokens=req.llm_max_output_tokens,
             )
+            _store_selection(cache_key, selected, meta)
 
         latency_ms = (time.perf_counter() - start) * 1000.0
-        effective_method = _effective_method(method, meta)
-        metrics.inc_request(method=effective_method)
         request_counted = True
-        metrics.observe_tokens(_extract_total_tokens(meta))
-        metrics.observe_latency_ms(latency_ms)
-
-        logger.info(
-            "select_skills",
-            extra={
-                "event": "select_skills",
-                "subsystem": "skill_selection",
-                "role": req.job_role,
-                "method": effective_method,
-                "requested_method": method,
-                "baseline_filter": bool(baseline_filter),
-                "top_n": top_n,
-                "llm_max_output_tokens": req.llm_max_output_tokens,
-                "latency_ms": round(latency_ms, 3),
-                "category_counts": {k: len(v) for k, v in selected.items()},
-            },
+        return _record_selection(
+            req=req,
+            method=method,
+            top_n=top_n,
+            dev_mode=dev_mode,
+            baseline_filter=baseline_filter,
+            selected=selected,
+            meta=meta,
+            latency_ms=latency_ms,
+            cache_key=cache_key,
+            cache_hit=cached is not None,
         )
 
-        return SkillSelectResponse(
-            technology=selected.get("technology", []),
-            programming=selected.get("programming", []),
-            concepts=selected.get("concepts", []),
-            details=meta if dev_mode else None,
+    except Exception:
+        _record_selection_failure(req, method, request_counted)
+        raise
+
+
+
+async def select_skills_service_async(req: SkillSelectRequest) -> SkillSelectResponse:
+    """`select_skills_service` for async callers.
+
+    Plain LLM scoring awaits the async OpenAI client; every other method (including
+    baseline-filtered LLM) runs `select_skills_service` on a worker thread, so neither
+    path blocks the event loop.
+    """
+    method, top_n, dev_mode, baseline_filter = _resolve_options(req)
+    if method != "llm" or baseline_filter:
+        return await asyncio.to_thread(select_skills_service, req)
+    cache_key = _response_cache_key(req, method, baseline_filter)
+
+    start = time.perf_counter()
+    request_counted = False
+
+    try:
+        cached = _cached_selection(cache_key)
+        if cached is not None:
+            selected, meta = cached
+        else:
+            selected, meta = await llm_select_skills_async(
+                job_role=req.job_role,
+                job_text=req.job_text,
+                technology=req.technology,
+                programming=req.programming,
+                concepts=req.concepts,
+                top_n=None if cache_key is not None else top_n,
+                dev_mode=True,
+                llm_model=req.llm_model,
+                llm_max_output_tokens=req.llm_max_output_tokens,
+            )
+            _store_selection(cache_key, selected, meta)
+
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        request_counted = True
+        return _record_selection(
+            req=req,
+            method=method,
+            top_n=top_n,
+            dev_mode=dev_mode,
+            baseline_filter=baseline_filter,
+            selected=selected,
+            meta=meta,
+            latency_ms=latency_ms,
+            cache_key=cache_key,
+            cache_hit=cached is not None,
         )
 
     except Exception:
-        if not request_counted:
-            metrics.inc_request(method=method)
-        metrics.inc_error()
-        logger.exception(
-            "select_skills_failed",
-            extra={
-                "event": "select_skills_failed",
-                "subsystem": "skill_selection",
-                "role": req.job_role,
-                "method": method,
-                "llm_max_output_tokens": req.llm_max_output_tokens,
-            },
+        _record_selection_failure(req, method, request_counted)
+        raise
+
+def _call_batch_scorer(
+    *,
+    method: str,
+    targets: list[tuple[str, str | None]],
+    req: SkillSelectBatchRequest,
+    top_n: int | None,
+    dev_mode: bool,
+) -> list[tuple[dict, dict | None]]:
+    if method == "baseline":
+        return baseline_select_skills_batch(
+            targets=targets,
+            technology=req.technology,
+            programming=req.programming,
+            concepts=req.concepts,
+            top_n=top_n,
+            dev_mode=dev_mode,
         )
+    if method == "embeddings":
+        return embedding_select_skills_batch(
+            targets=targets,
+            technology=req.technology,
+            programming=req.programming,
+            concepts=req.concepts,
+            top_n=top_n,
+            dev_mode=dev_mode,
+        )
+
+    raise ValueError(f"Unsupported batch skill selection method: {method}")
+
+
+@model_call_priority("batch")
+def select_skills_batch_service(req: SkillSelectBatchRequest) -> SkillSelectBatchResponse:
+    """Select skills for many job targets against one shared skill inventory.
+
+    Baseline and embeddings scoring run as one batched pass over all targets; LLM
+    scoring and baseline-filtered requests are served per target. Every target is
+    recorded in metrics exactly like a separate `select_skills_service` call. Model
+    calls run at batch priority, behind interactive requests.
+    """
+    method, top_n, dev_mode, baseline_filter = _resolve_options(req)
+    target_requests = [req.target_request(target) for target in req.targets]
+
+    if method not in {"baseline", "embeddings"} or baseline_filter:
+        return SkillSelectBatchResponse(
+            results=[select_skills_service(target_request) for target_request in target_requests]
+        )
+
+    start = time.perf_counter()
+    try:
+        batch_results = _call_batch_scorer(
+            method=method,
+            targets=[(target.job_role, target.job_text) for target in req.targets],
+            req=req,
+            top_n=top_n,
+            dev_mode=dev_mode,
+        )
+    except Exception:
+        for target_request in target_requests:
+            _record_selection_failure(target_request, method, request_counted=False)
         raise
+
+    # Attribute an equal share of the batch latency to each target.
+    latency_ms = (time.perf_counter() - start) * 1000.0 / max(len(target_requests), 1)
+    return SkillSelectBatchResponse(
+        results=[
+            _record_selection(
+                req=target_request,
+                method=method,
+                top_n=top_n,
+                dev_mode=dev_mode,
+                baseline_filter=baseline_filter,
+                selected=selected,
+                meta=meta,
+                latency_ms=latency_ms,
+            )
+            for target_request, (selected, meta) in zip(target_requests, batch_results)
+        ]
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import openai
+
+from app.config import settings
+from app.model_transport import CassetteMissError
+from app.skill_selection.models import SimilarSkill, SimilarSkillsRequest, SimilarSkillsResponse
+from app.skill_selection.scoring import embeddings
+from app.skill_selection.similarity_index import (
+    DEFAULT_IVF_PROBES,
+    DEFAULT_IVF_THRESHOLD,
+    BruteForceIndex,
+    SkillIndexCache,
+)
+
+logger = logging.getLogger("skill_similarity")
+
+MAX_K = 100
+QUERY_CACHE_SIZE = 512
+
+skill_index = SkillIndexCache()
+# Embedded free-text queries, so repeated workbench lookups skip the embeddings API.
+# Requests run on worker threads, so reads and LRU updates go through the lock.
+_query_vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+_query_vectors_lock = threading.Lock()
+
+
+def current_skill_index() -> BruteForceIndex:
+    """The nearest-neighbour index over the skill cache, rebuilt when the cache changes."""
+    embeddings.cache.refresh()
+    return skill_index.get(
+        embeddings.cache.skill_cache,
+        ivf_threshold=getattr(settings, "SKILL_INDEX_IVF_THRESHOLD", DEFAULT_IVF_THRESHOLD),
+        probes=getattr(settings, "SKILL_INDEX_IVF_PROBES", DEFAULT_IVF_PROBES),
+    )
+
+
+def query_vector(text: str) -> tuple[np.ndarray, str]:
+    """Unit query vector for `text` and where it came from.
+
+    A text that normalizes to a cached skill reuses that skill's vector; anything else
+    is embedded once and memoized.
+    """
+    normalized = embeddings.normalize_skill(text)
+    cached = embeddings.cache.cache_lookup(normalized, type="skill")
+    if cached is not None:
+        return embeddings.unit_rows(cached)[0], "skill_cache"
+
+    key = " ".join(text.split())
+    with _query_vectors_lock:
+        vector = _query_vectors.get(key)
+        if vector is not None:
+            _query_vectors.move_to_end(key)
+            return vector, "query_cache"
+
+    # Embed outside the lock so one slow API call does not block cached lookups.
+    vector = embeddings.unit_rows(embeddings.embed_role(key))[0]
+    with _query_vectors_lock:
+        _query_vectors[key] = vector
+        _query_vectors.move_to_end(key)
+        while len(_query_vectors) > QUERY_CACHE_SIZE:
+            _query_vectors.popitem(last=False)
+    return vector, "embedded"
+
+
+def similar_skills_service(req: SimilarSkillsRequest) -> SimilarSkillsResponse:
+    """Return the k known skills whose embeddings are closest to a free-text query."""
+    text = req.text.strip()
+    if not text:
+        raise ValueError("text must not be empty")
+    if not 1 <= req.k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}")
+
+    normalized = embeddings.normalize_skill(text)
+    try:
+        vector, source = query_vector(text)
+    except (openai.OpenAIError, CassetteMissError) as e:
+        logger.error(
+            "similar_skills_embedding_error",
+            extra={"event": "similar_skills_embedding_error", "error": str(e)},
+        )
+        raise RuntimeError(f"Embedding API error: {e}") from e
+    index = current_skill_index()
+    exclude = frozenset() if req.include_query else frozenset({normalized})
+    neighbors = index.search(vector, req.k, exclude=exclude)
+    if req.min_similarity is not None:
+        neighbors = [(skill, score) for skill, score in neighbors if score >= req.min_similarity]
+
+    dev_mode = req.dev_mode if req.dev_mode is not None else settings.DEV_MODE
+    details = None
+    if dev_mode:
+        details = {"index": index.kind, "indexed_skills": len(index), "query_source": source}
+
+    logger.debug(
+        "similar_skills_served",
+        extra={"event": "similar_skills_served", "index": index.kind, "query_source": source, "k": req.k},
+    )
+    return SimilarSkillsResponse(
+        query=req.text,
+        normalized_query=normalized,
+        results=[SimilarSkill(skill=skill, similarity=round(score, 6)) for skill, score in neighbors],
+        details=details,
+    )
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from typing import Mapping
+
+import numpy as np
+
+logger = logging.getLogger("skill_similarity")
+
+DEFAULT_IVF_THRESHOLD = 50_000
+DEFAULT_IVF_PROBES = 8
+IVF_TRAINING_SAMPLE = 20_000
+IVF_ITERATIONS = 8
+ASSIGN_BLOCK_ROWS = 8192
+
+Neighbor = tuple[str, float]
+
+
+def _unit_float_rows(matrix: np.ndarray) -> np.ndarray:
+    """float32 copy of `matrix` with unit-length rows (works on int8/float16 codes too)."""
+    rows = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+
+
+def _row_norms(matrix: np.ndarray) -> np.ndarray:
+    norms = np.empty(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), ASSIGN_BLOCK_ROWS):
+        block = matrix[start:start + ASSIGN_BLOCK_ROWS]
+        norms[start:start + len(block)] = np.sqrt(np.einsum("ij,ij->i", block, block, dtype=np.float32))
+    return norms
+
+
+class BruteForceIndex:
+    """Exact k-NN: one matrix-vector product over every stored row.
+
+    `matrix` is used as given (the store's memory-mapped rows, in storage dtype); only
+    the row norms are precomputed.
+    """
+
+    kind = "brute_force"
+
+    def __init__(self, keys: list[str], matrix: np.ndarray):
+        self.keys = keys
+        self.matrix = matrix
+        self._norms = _row_norms(matrix)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _scores(self, rows: np.ndarray | slice, query_unit: np.ndarray) -> np.ndarray:
+        dots = (self.matrix[rows] @ query_unit).astype(np.float32, copy=False)
+        norms = self._norms[rows]
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    def _top_k(self, rows: np.ndarray, scores: np.ndarray, k: int, exclude: frozenset[str]) -> list[Neighbor]:
+        # Over-fetch by the excluded count so exclusions never shrink the result.
+        limit = min(len(rows), k + len(exclude))
+        if limit < len(rows):
+            keep = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[keep], scores[keep]
+        ranked = sorted(zip(rows.tolist(), scores.tolist()), key=lambda item: (-item[1], self.keys[item[0]]))
+        return [(self.keys[row], score) for row, score in ranked if self.keys[row] not in exclude][:k]
+
+    def search(self, query_unit: np.ndarray, k: int, exclude: frozenset[str] = frozenset()) -> list[Neighbor]:
+        if not self.keys or k <= 0:
+            return []
+        return self._top_k(np.arange(len(self.keys)), self._scores(slice(None), query_unit), k, exclude)
+
+
+class IVFIndex(BruteForceIndex):
+    """Approximate k-NN that only scores rows in the clusters nearest the query.
+
+    Rows are grouped by spherical k-means (about sqrt(n) clusters trained on a sample);
+    a search scores the `probes` closest clusters exactly, which skips most of the
+    matrix once the store holds tens of thousands of vectors.
+    """
+
+    kind = "ivf"
+
+    def __init__(
+        self,
+        keys: list[str],
+        matrix: np.ndarray,
+        *,
+        n_lists: int | None = None,
+        probes: int = DEFAULT_IVF_PROBES,
+        seed: int = 0,
+    ):
+        super().__init__(keys, matrix)
+        rng = np.random.default_rng(seed)
+        n_lists = max(1, min(n_lists or int(math.sqrt(len(keys))), len(keys)))
+        self.probes = max(1, min(probes, n_lists))
+        self.centroids = self._train(rng, n_lists)
+
+        assignments = np.empty(len(keys), dtype=np.int64)
+        for start in range(0, len(keys), ASSIGN_BLOCK_ROWS):
+            block = _unit_float_rows(matrix[start:start + ASSIGN_BLOCK_ROWS])
+            assignments[start:start + len(block)] = np.argmax(block @ self.centroids.T, axis=1)
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(n_lists + 1))
+        self.lists = [order[bounds[c]:bounds[c + 1]] for c in range(n_lists)]
+
+    def _train(self, rng: np.random.Generator, n_lists: int) -> np.ndarray:
+        sample_rows = np.sort(rng.choice(len(self.keys), min(len(self.keys), IVF_TRAINING_SAMPLE), replace=False))
+        sample = _unit_float_rows(self.matrix[sample_rows])
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(IVF_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = _unit_float_rows(sums)
+        return centroids
+
+    def search(self, query_unit: np.ndarray, k: int, exclude: frozenset[str] = frozenset()) -> list[Neighbor]:
+        if not self.keys or k <= 0:
+            return []
+        nearest = np.argsort(-(self.centroids @ query_unit))[: self.probes]
+        rows = np.sort(np.concatenate([self.lists[c] for c in nearest]))
+        return self._top_k(rows, self._scores(rows, query_unit), k, exclude)
+
+
+def build_index(
+    keys: list[str],
+    matrix: np.ndarray,
+    *,
+    ivf_threshold: int = DEFAULT_IVF_THRESHOLD,
+    probes: int = DEFAULT_IVF_PROBES,
+) -> BruteForceIndex:
+    """Brute force below `ivf_threshold` rows, cluster-pruned IVF at or above it."""
+    if len(keys) >= ivf_threshold:
+        return IVFIndex(keys, matrix, probes=probes)
+    return BruteForceIndex(keys, matrix)
+
+
+class SkillIndexCache:
+    """Keeps one index per store, rebuilt when the store has changed.
+
+    The first index is built on the caller's thread. After that, a brute-force index
+    is rebuilt in place, which is only a snapshot copy. An IVF index needs k-means
+    training, so it is rebuilt on a background thread while callers keep searching
+    the previous index. New rows become searchable once the rebuild finishes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._signature: tuple | None = None
+        self._index: BruteForceIndex | None = None
+        self._rebuild: threading.Thread | None = None
+
+    def get(self, store: Mapping, *, ivf_threshold: int, probes: int) -> BruteForceIndex:
+        signature = (id(store), getattr(store, "version", None), len(store), ivf_threshold, probes)
+        with self._lock:
+            index = self._index
+            if index is not None and signature == self._signature:
+                return index
+            if index is None or (index.kind == "brute_force" and len(store) < ivf_threshold):
+                return self._build(store, signature, ivf_threshold=ivf_threshold, probes=probes)
+            if self._rebuild is None or not self._rebuild.is_alive():
+                self._rebuild = threading.Thread(
+                    target=self._build_in_background,
+                    args=(store, signature),
+                    kwargs={"ivf_threshold": ivf_threshold, "probes": probes},
+                    name="skill-index-rebuild",
+                    daemon=True,
+                )
+                self._rebuild.start()
+            return index
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for a background rebuild, if one is running."""
+        rebuild = self._rebuild
+        if rebuild is not None:
+            rebuild.join(timeout)
+
+    def _build_in_background(self, store: Mapping, signature: tuple, *, ivf_threshold: int, probes: int) -> None:
+        try:
+            index = self._build_index(store, ivf_threshold=ivf_threshold, probes=probes)
+        except Exception:
+            logger.exception("skill_index_rebuild_failed", extra={"event": "skill_index_rebuild_failed"})
+            return
+        with self._lock:
+            # A store changed again mid-build gets another rebuild on the next `get`.
+            self._index = index
+            self._signature = signature
+
+    def _build(self, store: Mapping, signature: tuple, *, ivf_threshold: int, probes: int) -> BruteForceIndex:
+        self._index = self._build_index(store, ivf_threshold=ivf_threshold, probes=probes)
+        self._signature = signature
+        return self._index
+
+    def _build_index(self, store: Mapping, *, ivf_threshold: int, probes: int) -> BruteForceIndex:
+        snapshot = getattr(store, "snapshot", None)
+        if snapshot is not None:
+            keys, matrix = snapshot()
+        else:
+            keys = list(store)
+            matrix = np.asarray([store[key] for key in keys], dtype=np.float32).reshape(len(keys), -1)
+        index = build_index(keys, matrix, ivf_threshold=ivf_threshold, probes=probes)
+        logger.info(
+            "skill_index_built",
+            extra={"event": "skill_index_built", "kind": index.kind, "skills": len(keys)},
+        )
+        return index
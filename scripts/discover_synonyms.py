@@ -0,0 +1,64 @@
+"""Suggest synonym pairs for app/skill_selection/data/synonym_to_normalized.json.
+
+Searches the skill embedding cache for pairs of cached skills whose embeddings are
+nearly identical (for example "k8s" and "kubernetes"). Pairs already linked by the
+synonym map are skipped. The output is a review list; nothing is written to the map.
+
+Usage:
+    PYTHONPATH=. python scripts/discover_synonyms.py                     # pairs with similarity >= 0.9
+    PYTHONPATH=. python scripts/discover_synonyms.py --min-similarity 0.85 --neighbors 3
+    PYTHONPATH=. python scripts/prewarm_embeddings.py && PYTHONPATH=. python scripts/discover_synonyms.py
+
+Run scripts/prewarm_embeddings.py first so the cache holds every known skill.
+"""
+
+import argparse
+import json
+
+from app.skill_selection.scoring import embeddings
+from app.skill_selection.scoring.synonyms import SYNONYM_TO_NORMALIZED
+from app.skill_selection.similar_skills import current_skill_index
+
+
+def discover_synonyms(min_similarity: float, neighbors: int) -> list[dict]:
+    """Nearest-neighbour pairs at or above `min_similarity`, most similar first."""
+    index = current_skill_index()
+    known = {(synonym, canonical) for synonym, canonical in SYNONYM_TO_NORMALIZED.items()}
+    known |= {(canonical, synonym) for synonym, canonical in known}
+
+    pairs: dict[tuple[str, str], float] = {}
+    for row, skill in enumerate(index.keys):
+        query = embeddings.unit_rows(index.matrix[row])[0]
+        for neighbor, similarity in index.search(query, neighbors, exclude=frozenset({skill})):
+            pair = tuple(sorted((skill, neighbor)))
+            if similarity >= min_similarity and pair not in known:
+                pairs[pair] = max(similarity, pairs.get(pair, similarity))
+
+    return [
+        {"skills": list(pair), "similarity": round(similarity, 4)}
+        for pair, similarity in sorted(pairs.items(), key=lambda item: (-item[1], item[0]))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Suggest synonym pairs from nearest neighbours in the skill embedding cache.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--min-similarity", type=float, default=0.9,
+        help="Cosine similarity a pair needs to be suggested (default: 0.9).",
+    )
+    parser.add_argument(
+        "--neighbors", type=int, default=5,
+        help="Nearest neighbours checked per skill (default: 5).",
+    )
+    args = parser.parse_args()
+
+    suggestions = discover_synonyms(args.min_similarity, args.neighbors)
+    print(json.dumps(suggestions, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Pre-embed every known skill so live requests hit the skill embedding cache.
+
+Collects normalized skills from the skill pools (data/skill_pools/normalized/skill_pools.json)
+and the resume evidence skills (user/resume_evidence/skills.yaml), embeds those missing from
+the cache in concurrent batches, writes them to the embedding store, and prints coverage.
+
+Usage:
+    PYTHONPATH=. python scripts/prewarm_embeddings.py                  # embed and report
+    PYTHONPATH=. python scripts/prewarm_embeddings.py --dry-run        # report coverage only
+    PYTHONPATH=. python scripts/prewarm_embeddings.py --skill-pools path/to/pools.json --skills path/to/skills.yaml
+
+Batching follows EMBEDDING_BATCH_SIZE and EMBEDDING_MAX_CONCURRENCY; the cache is the one
+for EMBEDDING_PROVIDER and EMBEDDING_MODEL. Exits with status 1 if any skill failed to embed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.skill_selection.embedding_client import embedding_cache_namespace
+from app.skill_selection.embedding_prewarm import collect_prewarm_skills, prewarm_skill_embeddings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-embed skill pool and resume evidence skills into the embedding cache.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--skill-pools", type=Path, default=None,
+        help="Normalized skill pools JSON (default: SKILL_POOLS_PATH).",
+    )
+    parser.add_argument(
+        "--skills", type=Path, default=None,
+        help="Resume evidence skills.yaml (default: RESUME_EVIDENCE_ROOT/skills.yaml).",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Skills embedded per journal append (default: EMBEDDING_BATCH_SIZE x EMBEDDING_MAX_CONCURRENCY).",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Report cache coverage without embedding anything.",
+    )
+    parser.add_argument(
+        "--show-missing", action="store_true",
+        help="List skills still missing from the cache.",
+    )
+    args = parser.parse_args()
+
+    sources = collect_prewarm_skills(args.skill_pools, args.skills)
+    print(f"Embedding cache: {embedding_cache_namespace()}")
+    print("Sources: " + ", ".join(f"{name} ({len(skills)} skills)" for name, skills in sources.items()))
+
+    report = prewarm_skill_embeddings(sources, chunk_size=args.chunk_size, dry_run=args.dry_run).model_dump()
+    if not args.show_missing:
+        report["missing"] = len(report["missing"])
+    print(json.dumps(report, indent=2))
+
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
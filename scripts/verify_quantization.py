@@ -0,0 +1,229 @@
+"""Check that quantized skill vectors rank skills like full-precision ones.
+
+Replays eval cases through embedding_select_skills twice: once against a float32 copy
+of the skill embedding cache and once per quantized dtype (float16, int8), then reports
+ordering differences, top-N changes, similarity error, and skill store size.
+
+Usage:
+    PYTHONPATH=. python scripts/verify_quantization.py                         # all files in data/eval_cases/
+    PYTHONPATH=. python scripts/verify_quantization.py -f eval_cases_real.json # one file
+    PYTHONPATH=. python scripts/verify_quantization.py --dtype int8 --fail-on-top-n-change
+    EMBEDDING_PROVIDER=local PYTHONPATH=. python scripts/verify_quantization.py # offline
+
+Vectors come from the configured embedding cache; skills and roles it is missing are
+embedded once with the configured provider. The live cache is never modified.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from app.config import settings
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.embedding_client import embedding_cache_namespace
+from app.skill_selection.scoring import embeddings
+from scripts.eval import CATEGORIES, EVAL_CASES_DIR, load_cases, resolve_file
+
+QUANTIZED_DTYPES = ["float16", "int8"]
+
+
+def _vectors(store) -> dict[str, np.ndarray]:
+    """Full-precision copies of every row in a cache store (EmbeddingStore or dict)."""
+    decode = getattr(store, "vector", None)
+    return {
+        key: decode(key) if decode is not None else np.asarray(store[key], dtype=np.float32)
+        for key in list(store)
+    }
+
+
+def build_cache(cache_dir: Path, dtype: str, roles: dict, skills: dict) -> EmbeddingCache:
+    """Create a scratch cache seeded with role and skill vectors, skills stored as `dtype`."""
+    cache = EmbeddingCache(
+        embedding_cache_namespace(),
+        cache_dir=cache_dir,
+        skill_dtype=dtype,
+    )
+    # Role keys are already digests, so write them to the store directly.
+    for key, vector in roles.items():
+        cache.role_cache[key] = vector
+    for key, vector in skills.items():
+        cache.skill_cache[key] = vector
+    cache.role_cache.save()
+    cache.skill_cache.save()
+    return cache
+
+
+@contextmanager
+def using_cache(cache: EmbeddingCache):
+    previous = embeddings.cache
+    embeddings.cache = cache
+    try:
+        yield cache
+    finally:
+        embeddings.cache = previous
+
+
+def rank_cases(cases: list[dict]) -> list[dict]:
+    """Full rankings and similarities for every case and category."""
+    rankings = []
+    for case in cases:
+        case_input = case["input"]
+        selected, details = embeddings.embedding_select_skills(
+            job_role=case_input["job_role"],
+            technology=case_input["technology"],
+            programming=case_input["programming"],
+            concepts=case_input["concepts"],
+            job_text=case_input.get("job_text"),
+            top_n=None,
+            dev_mode=True,
+        )
+        rankings.append({
+            cat: {
+                "ranked": selected[cat],
+                "similarity": {
+                    skill: info["similarity"] for skill, info in (details or {}).get(cat, {}).items()
+                },
+            }
+            for cat in CATEGORIES
+        })
+    return rankings
+
+
+def compare_rankings(reference: list[dict], quantized: list[dict], cases: list[dict], top_n: int) -> dict:
+    """Summarize how quantized rankings differ from the reference rankings."""
+    compared = identical = top_n_changes = 0
+    max_displacement = 0
+    max_similarity_error = 0.0
+    differences = []
+
+    for case, ref_case, quant_case in zip(cases, reference, quantized):
+        for cat in CATEGORIES:
+            ref, quant = ref_case[cat], quant_case[cat]
+            compared += 1
+            if ref["ranked"] == quant["ranked"]:
+                identical += 1
+                continue
+
+            quant_positions = {skill: pos for pos, skill in enumerate(quant["ranked"])}
+            displacement = max(
+                abs(pos - quant_positions.get(skill, pos)) for pos, skill in enumerate(ref["ranked"])
+            )
+            top_n_changed = set(ref["ranked"][:top_n]) != set(quant["ranked"][:top_n])
+            top_n_changes += top_n_changed
+            max_displacement = max(max_displacement, displacement)
+            differences.append({
+                "job_role": case["input"]["job_role"],
+                "category": cat,
+                "top_n_changed": top_n_changed,
+                "max_displacement": displacement,
+                "reference": ref["ranked"],
+                "quantized": quant["ranked"],
+            })
+
+        for cat in CATEGORIES:
+            ref_sims, quant_sims = ref_case[cat]["similarity"], quant_case[cat]["similarity"]
+            for skill, ref_sim in ref_sims.items():
+                quant_sim = quant_sims.get(skill)
+                if ref_sim is not None and quant_sim is not None:
+                    max_similarity_error = max(max_similarity_error, abs(ref_sim - quant_sim))
+
+    return {
+        "categories_compared": compared,
+        "identical_orderings": identical,
+        "top_n_changes": top_n_changes,
+        "max_rank_displacement": max_displacement,
+        "max_similarity_error": round(max_similarity_error, 6),
+        "differences": differences,
+    }
+
+
+def store_bytes(cache: EmbeddingCache) -> int:
+    store = cache.skill_cache
+    return sum(
+        path.stat().st_size
+        for path in (store.matrix_path, store.scales_path)
+        if path.exists()
+    )
+
+
+def verify(cases: list[dict], dtypes: list[str], top_n: int) -> dict:
+    live = embeddings.cache
+    roles, skills = _vectors(live.role_cache), _vectors(live.skill_cache)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reference_cache = build_cache(Path(tmp) / "float32", "float32", roles, skills)
+        with using_cache(reference_cache):
+            reference = rank_cases(cases)
+        reference_cache.close()
+        # The reference pass embedded anything the live cache was missing.
+        roles, skills = _vectors(reference_cache.role_cache), _vectors(reference_cache.skill_cache)
+
+        report = {
+            "cases": len(cases),
+            "top_n": top_n,
+            "skills": len(skills),
+            "float32_store_bytes": store_bytes(reference_cache),
+            "dtypes": {},
+        }
+        for dtype in dtypes:
+            quantized_cache = build_cache(Path(tmp) / dtype, dtype, roles, skills)
+            with using_cache(quantized_cache):
+                quantized = rank_cases(cases)
+            quantized_cache.close()
+            report["dtypes"][dtype] = {
+                "store_bytes": store_bytes(quantized_cache),
+                **compare_rankings(reference, quantized, cases, top_n),
+            }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare skill rankings from full-precision and quantized embedding stores.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "-f", "--file", action="append", default=None,
+        help="Eval case file (repeatable). Defaults to every *.json file in data/eval_cases/.",
+    )
+    parser.add_argument(
+        "--dtype", choices=QUANTIZED_DTYPES, action="append", default=None,
+        help="Quantized dtype to check (repeatable). Defaults to float16 and int8.",
+    )
+    parser.add_argument(
+        "--top-n", type=int, default=settings.SKILL_TOP_N,
+        help="Top-N cutoff whose membership must not change (default: SKILL_TOP_N).",
+    )
+    parser.add_argument(
+        "--fail-on-top-n-change", action="store_true",
+        help="Exit with status 1 if any category's top-N set differs from full precision.",
+    )
+    parser.add_argument(
+        "--show-differences", action="store_true",
+        help="Include every differing ranking in the report.",
+    )
+    args = parser.parse_args()
+
+    files = [resolve_file(name) for name in args.file] if args.file else sorted(EVAL_CASES_DIR.glob("*.json"))
+    cases = [case for path in files for case in load_cases(path)]
+    dtypes = args.dtype or QUANTIZED_DTYPES
+
+    print(f"Files: {', '.join(path.name for path in files)} ({len(cases)} cases)")
+    report = verify(cases, dtypes, args.top_n)
+    if not args.show_differences:
+        for result in report["dtypes"].values():
+            result["differences"] = len(result["differences"])
+    print(json.dumps(report, indent=2))
+
+    if args.fail_on_top_n_change and any(result["top_n_changes"] for result in report["dtypes"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -51,3 +51,13 @@ def setup_test_environment():
         importlib.reload(app.skill_selection.scoring.baseline)
 
     yield
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start every test with closed LLM circuit breakers."""
+    from app.circuit_breaker import circuit_breakers
+
+    circuit_breakers.clear()
+    yield
+    circuit_breakers.clear()
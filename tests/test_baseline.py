@@ -1042,3 +1042,92 @@ def test_baseline_select_skills_consistency_across_categories():
     assert "Python" in result["programming"]
     # API and Database are backend concepts
     assert "API" in result["concepts"] or "Database" in result["concepts"]
+
+
+# === Job text tests ===
+
+def test_score_skill_job_text_mention_scores_unprofiled_skill():
+    """Skills named in the job text score even without a profile keyword match."""
+    score, details = score_skill(
+        skill="Zephyrflow",
+        role_family="backend",
+        category="technology",
+        job_text="You will maintain our Zephyrflow scheduling platform.",
+    )
+
+    assert score == 2.0
+    assert details["job_text_match"] is True
+
+
+def test_score_skill_job_text_does_not_lower_profile_match():
+    """A job text mention never lowers a strong profile match."""
+    score, details = score_skill(
+        skill="FastAPI",
+        role_family="backend",
+        category="technology",
+        job_text="Build services with FastAPI.",
+    )
+
+    assert score == 3.0
+    assert details["job_text_match"] is True
+
+
+def test_score_skill_job_text_requires_token_boundaries():
+    """Raw substrings inside job text words are not mentions."""
+    score, details = score_skill(
+        skill="Go",
+        role_family="frontend",
+        category="programming",
+        job_text="Good communication and ongoing learning.",
+    )
+
+    assert details["job_text_match"] is False
+    assert score < 2.0
+
+
+def test_score_skill_job_text_ignores_everyday_words():
+    """Short skill names used as plain English words are not mentions."""
+    go_score, go_details = score_skill(
+        "Go", "software_engineer", "programming", "We go the extra mile for customers"
+    )
+    rest_score, rest_details = score_skill(
+        "REST APIs", "software_engineer", "concepts", "Take a rest between sprints."
+    )
+
+    assert go_details["job_text_match"] is False
+    assert go_score == score_skill("Go", "software_engineer", "programming")[0]
+    assert rest_details["job_text_match"] is False
+    assert rest_score == score_skill("REST APIs", "software_engineer", "concepts")[0]
+
+
+def test_score_skill_job_text_matches_distinctive_short_names():
+    """Capitalized, all-caps, or compound forms of ambiguous names still count."""
+    job_text = "Experience with Go, REST and node.js; a rest api background helps."
+
+    assert score_skill("Go", "software_engineer", "programming", job_text)[1]["job_text_match"] is True
+    assert score_skill("REST APIs", "software_engineer", "concepts", job_text)[1]["job_text_match"] is True
+    assert score_skill("Node.js", "software_engineer", "technology", job_text)[1]["job_text_match"] is True
+    assert score_skill("REST APIs", "software_engineer", "concepts", "build a rest api")[1]["job_text_match"] is True
+    assert score_skill("Go", "software_engineer", "programming", "Go the extra mile.")[1]["job_text_match"] is False
+
+
+def test_score_skill_without_job_text_omits_job_text_match():
+    _, details = score_skill("FastAPI", "backend", "technology")
+
+    assert "job_text_match" not in details
+
+
+def test_baseline_select_skills_uses_job_text_mentions():
+    """Job text mentions lift otherwise unrecognized skills into the selection."""
+    result, details = baseline_select_skills(
+        job_role="Backend Engineer",
+        job_text="Experience with Zephyrflow and amazon cloud is required.",
+        technology=["Zephyrflow", "Unreal Engine", "AWS"],
+        programming=[],
+        concepts=[],
+        dev_mode=True,
+    )
+
+    assert result["technology"][:2] == ["AWS", "Zephyrflow"]
+    assert "Unreal Engine" not in result["technology"]
+    assert details["technology"]["Zephyrflow"]["score"] == 2.0
@@ -1,12 +1,16 @@
 import asyncio
+import json
 
 import httpx
 
 from app.bulletpoints_generation import service as bullet_service
 from app.bulletpoints_generation.llm_client import (
     BulletPointLLMClientError,
+    LLMBulletPointBatchResult,
     LLMBulletPointResult,
+    StreamedBulletPoint,
 )
+from app.bulletpoints_generation.models import BulletGenerationBatchRequest
 from app.main import app
 
 
@@ -91,7 +95,7 @@ def _experience_request_payload(**overrides) -> dict:
 def test_generate_bulletpoints_api_success_with_default_count_and_details(monkeypatch):
     captured = {}
 
-    def fake_generate(**kwargs):
+    async def fake_generate(**kwargs):
         captured["count_range"] = kwargs["count_range"]
         return LLMBulletPointResult(
             bullet_points=[
@@ -110,7 +114,7 @@ def test_generate_bulletpoints_api_success_with_default_count_and_details(monkey
         )
 
     before = api_request("GET", "/metrics-lite").json()
-    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm", fake_generate)
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", fake_generate)
     monkeypatch.setattr(bullet_service.settings, "BULLETPOINTS_DEFAULT_COUNT", 3)
 
     response = api_request("POST", "/generate-bulletpoints", json=_request_payload())
@@ -138,17 +142,54 @@ def test_generate_bulletpoints_api_success_with_default_count_and_details(monkey
     )
 
 
+def test_identical_concurrent_bulletpoint_requests_share_one_llm_call(monkeypatch):
+    calls = []
+
+    async def fake_generate(**kwargs):
+        calls.append((kwargs["project"] or kwargs["experience"]).id)
+        await asyncio.sleep(0.05)
+        return LLMBulletPointResult(
+            bullet_points=["Built FastAPI services for grounded resume selection workflows."],
+            metadata={"model": "test-model", "api_calls": 1, "total_tokens": 42},
+        )
+
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", fake_generate)
+    before = api_request("GET", "/metrics-lite").json()
+
+    async def _requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await asyncio.gather(
+                client.post("/generate-bulletpoints", json=_request_payload()),
+                client.post("/generate-bulletpoints", json=_request_payload()),
+                client.post("/generate-bulletpoints", json=_experience_request_payload()),
+            )
+
+    responses = asyncio.run(_requests())
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert sorted(calls) == ["backend-engineer", "jobforge"]
+    after = api_request("GET", "/metrics-lite").json()
+    before_bucket = before["subsystems"]["bulletpoints_generation"]
+    after_bucket = after["subsystems"]["bulletpoints_generation"]
+    assert after["coalesced_total"] == before["coalesced_total"] + 1
+    assert after["tokens_saved"] == before["tokens_saved"] + 42
+    assert after_bucket["requests_total"] == before_bucket["requests_total"] + 3
+    assert after_bucket["coalesced_total"] == before_bucket["coalesced_total"] + 1
+    assert after_bucket["total_tokens"] == before_bucket["total_tokens"] + 84
+
+
 def test_generate_bulletpoints_api_uses_request_count_range(monkeypatch):
     captured = {}
 
-    def fake_generate(**kwargs):
+    async def fake_generate(**kwargs):
         captured["count_range"] = kwargs["count_range"]
         return LLMBulletPointResult(
             bullet_points=["Built APIs.", "Validated evidence."],
             metadata={"model": "test-model", "total_tokens": 0},
         )
 
-    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm", fake_generate)
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", fake_generate)
 
     response = api_request(
         "POST",
@@ -164,14 +205,14 @@ def test_generate_bulletpoints_api_uses_request_count_range(monkeypatch):
 def test_generate_bulletpoints_api_accepts_experience_record(monkeypatch):
     captured = {}
 
-    def fake_generate(**kwargs):
+    async def fake_generate(**kwargs):
         captured.update(kwargs)
         return LLMBulletPointResult(
             bullet_points=["Designed schema-validated APIs for backend platforms."],
             metadata={"model": "test-model", "total_tokens": 0},
         )
 
-    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm", fake_generate)
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", fake_generate)
 
     response = api_request(
         "POST",
@@ -214,10 +255,10 @@ def test_generate_bulletpoints_api_rejects_missing_or_ambiguous_evidence():
 
 
 def test_generate_bulletpoints_api_returns_502_on_llm_failure(monkeypatch):
-    def raise_client_error(**_kwargs):
+    async def raise_client_error(**_kwargs):
         raise BulletPointLLMClientError("network down")
 
-    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm", raise_client_error)
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", raise_client_error)
 
     response = api_request("POST", "/generate-bulletpoints", json=_request_payload())
 
@@ -245,3 +286,207 @@ def test_generate_bulletpoints_api_rejects_invalid_count_range():
 
     assert response.status_code == 422
     assert "bullet_count_range.min" in response.text
+
+
+def _batch_request_payload(**overrides) -> dict:
+    payload = {
+        "context": {
+            "title": "Backend Engineer",
+            "description": "Build Python APIs with grounded AI workflows.",
+        },
+        "records": [
+            {"project": _project_payload(), "bullet_count_range": {"min": 2, "max": 2}},
+            {"experience": _experience_payload()},
+        ],
+        "dev_mode": True,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_generate_bulletpoints_batch_api_returns_results_in_record_order(monkeypatch):
+    captured = {}
+
+    async def fake_generate_batch(**kwargs):
+        captured["records"] = kwargs["records"]
+        return LLMBulletPointBatchResult(
+            bullet_points={
+                "project:jobforge": ["Built FastAPI services.", "Validated project evidence."],
+                "experience:backend-engineer": ["Designed schema-validated APIs."],
+            },
+            errors={},
+            metadata={"model": "test-model", "api_calls": 1, "total_tokens": 90},
+        )
+
+    monkeypatch.setattr(
+        bullet_service, "generate_bulletpoints_batch_with_llm_async", fake_generate_batch
+    )
+    monkeypatch.setattr(bullet_service.settings, "BULLETPOINTS_DEFAULT_COUNT", 1)
+
+    response = api_request("POST", "/generate-bulletpoints/batch", json=_batch_request_payload())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(result["evidence_type"], result["evidence_id"]) for result in data["results"]] == [
+        ("project", "jobforge"),
+        ("experience", "backend-engineer"),
+    ]
+    assert [count_range.model_dump() for *_, count_range in captured["records"]] == [
+        {"min": 2, "max": 2},
+        {"min": 1, "max": 1},
+    ]
+    assert data["results"][1]["bullet_points"] == ["Designed schema-validated APIs."]
+    assert data["results"][0]["details"]["batched"] is True
+    assert data["details"]["_bulletpoints_llm"]["total_tokens"] == 90
+
+
+def test_generate_bulletpoints_batch_api_regenerates_invalid_records_concurrently(monkeypatch):
+    single_calls = []
+    both_started = asyncio.Event()
+
+    async def fake_generate_batch(**_kwargs):
+        return LLMBulletPointBatchResult(
+            bullet_points={},
+            errors={
+                "project:jobforge": "Bullet point 1 must not be empty",
+                "experience:backend-engineer": "Bullet point 1 must not be empty",
+            },
+            metadata={"total_tokens": 90},
+        )
+
+    async def fake_generate(**kwargs):
+        record = kwargs["project"] or kwargs["experience"]
+        single_calls.append(record.id)
+        if len(single_calls) == 2:
+            both_started.set()
+        # Completes only if both regenerations are in flight at once.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return LLMBulletPointResult(
+            bullet_points=[f"Regenerated {record.id}.", "Second bullet."][
+                : kwargs["count_range"].max
+            ],
+            metadata={"total_tokens": 40},
+        )
+
+    monkeypatch.setattr(
+        bullet_service, "generate_bulletpoints_batch_with_llm_async", fake_generate_batch
+    )
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm_async", fake_generate)
+    monkeypatch.setattr(bullet_service.settings, "BULLETPOINTS_DEFAULT_COUNT", 1)
+
+    response = api_request("POST", "/generate-bulletpoints/batch", json=_batch_request_payload())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert sorted(single_calls) == ["backend-engineer", "jobforge"]
+    assert data["results"][0]["bullet_points"] == ["Regenerated jobforge.", "Second bullet."]
+    assert data["results"][1]["bullet_points"] == ["Regenerated backend-engineer."]
+    assert data["results"][0]["details"]["_bulletpoints_llm"]["total_tokens"] == 40
+    assert data["details"]["regenerated_records"] == [
+        "experience:backend-engineer",
+        "project:jobforge",
+    ]
+
+
+def test_generate_bulletpoints_batch_service_regenerates_invalid_records_alone(monkeypatch):
+    single_calls = []
+
+    def fake_generate_batch(**_kwargs):
+        return LLMBulletPointBatchResult(
+            bullet_points={"experience:backend-engineer": ["Designed schema-validated APIs."]},
+            errors={"project:jobforge": "Bullet point 1 must not be empty"},
+            metadata={"total_tokens": 90},
+        )
+
+    def fake_generate(**kwargs):
+        single_calls.append(kwargs["project"].id)
+        return LLMBulletPointResult(
+            bullet_points=["Built FastAPI services.", "Validated project evidence."],
+            metadata={"total_tokens": 40},
+        )
+
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_batch_with_llm", fake_generate_batch)
+    monkeypatch.setattr(bullet_service, "generate_bulletpoints_with_llm", fake_generate)
+
+    response = bullet_service.generate_bulletpoints_batch_service(
+        BulletGenerationBatchRequest.model_validate(_batch_request_payload())
+    )
+
+    assert single_calls == ["jobforge"]
+    assert response.results[0].bullet_points == [
+        "Built FastAPI services.",
+        "Validated project evidence.",
+    ]
+    assert response.results[1].details["batched"] is True
+    assert response.details["regenerated_records"] == ["project:jobforge"]
+
+
+def test_generate_bulletpoints_batch_api_rejects_duplicate_records():
+    payload = _batch_request_payload(
+        records=[{"project": _project_payload()}, {"project": _project_payload()}]
+    )
+
+    response = api_request("POST", "/generate-bulletpoints/batch", json=payload)
+
+    assert response.status_code == 422
+    assert "Duplicate project record: jobforge" in response.text
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_generate_bulletpoints_stream_api_sends_bullets_then_usage(monkeypatch):
+    async def fake_stream(**_kwargs):
+        yield StreamedBulletPoint(index=0, text="Built FastAPI services.")
+        yield StreamedBulletPoint(index=1, text="Validated project evidence.")
+        yield LLMBulletPointResult(
+            bullet_points=["Built FastAPI services.", "Validated project evidence."],
+            metadata={
+                "model": "test-model",
+                "api_calls": 1,
+                "prompt_tokens": 30,
+                "completion_tokens": 12,
+                "total_tokens": 42,
+                "latency_ms": 900.0,
+                "first_bullet_ms": 310.0,
+            },
+        )
+
+    monkeypatch.setattr(bullet_service, "stream_bulletpoints_with_llm_async", fake_stream)
+
+    response = api_request("POST", "/generate-bulletpoints/stream", json=_request_payload())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    assert events[:2] == [
+        ("bullet", {"index": 0, "text": "Built FastAPI services."}),
+        ("bullet", {"index": 1, "text": "Validated project evidence."}),
+    ]
+    event, done = events[2]
+    assert event == "done"
+    assert done["bullet_points"] == ["Built FastAPI services.", "Validated project evidence."]
+    assert done["usage"]["total_tokens"] == 42
+    assert done["usage"]["first_bullet_ms"] == 310.0
+    assert done["details"]["_bulletpoints_llm"]["model"] == "test-model"
+
+
+def test_generate_bulletpoints_stream_api_reports_failures_as_error_events(monkeypatch):
+    async def failing_stream(**_kwargs):
+        yield StreamedBulletPoint(index=0, text="Built FastAPI services.")
+        raise BulletPointLLMClientError("stream dropped")
+
+    monkeypatch.setattr(bullet_service, "stream_bulletpoints_with_llm_async", failing_stream)
+
+    response = api_request("POST", "/generate-bulletpoints/stream", json=_request_payload())
+
+    assert response.status_code == 200
+    assert _sse_events(response.text) == [
+        ("bullet", {"index": 0, "text": "Built FastAPI services."}),
+        ("error", {"detail": "stream dropped"}),
+    ]
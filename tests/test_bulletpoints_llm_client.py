@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from types import SimpleNamespace
 
@@ -8,10 +9,17 @@ import pytest
 from app.bulletpoints_generation import llm_client as bullet_llm_client
 from app.bulletpoints_generation.llm_client import (
     BulletPointLLMClientError,
+    LLMBulletPointResult,
+    StreamedBulletPoint,
+    build_bulletpoint_batch_schema,
     build_bulletpoint_instructions,
     build_bulletpoint_prompt_payload,
     build_bulletpoint_schema,
+    generate_bulletpoints_batch_with_llm,
+    generate_bulletpoints_batch_with_llm_async,
     generate_bulletpoints_with_llm,
+    generate_bulletpoints_with_llm_async,
+    stream_bulletpoints_with_llm_async,
 )
 from app.bulletpoints_generation.models import BulletCountRange, BulletJobContext
 from app.job_focus_generation.models import JobFocus
@@ -376,3 +384,279 @@ def test_generate_bulletpoints_with_llm_requires_api_key(monkeypatch):
             project=_project(),
             count_range=BulletCountRange(min=1, max=1),
         )
+
+
+def test_generate_bulletpoints_with_llm_async_validates_bullets(monkeypatch):
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            assert kwargs["text"]["format"]["name"] == "project_bullet_points"
+            return SimpleNamespace(
+                output_text='{"bullet_points":["- Built APIs."]}',
+                usage=SimpleNamespace(input_tokens=10, output_tokens=5, total_tokens=15),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(bullet_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    result = asyncio.run(
+        generate_bulletpoints_with_llm_async(
+            context=BulletJobContext(title="Backend Engineer", description="Build APIs."),
+            project=_project(),
+            count_range=BulletCountRange(min=1, max=1),
+        )
+    )
+
+    assert result.bullet_points == ["Built APIs."]
+    assert result.metadata["total_tokens"] == 15
+
+
+def test_build_bulletpoint_batch_schema_has_one_count_range_per_record():
+    schema = build_bulletpoint_batch_schema(
+        {
+            "project:jobforge": BulletCountRange(min=2, max=4),
+            "experience:backend-engineer": BulletCountRange(min=1, max=1),
+        }
+    )
+
+    assert schema["required"] == ["project:jobforge", "experience:backend-engineer"]
+    assert schema["additionalProperties"] is False
+    project_bullets = schema["properties"]["project:jobforge"]["properties"]["bullet_points"]
+    experience_bullets = schema["properties"]["experience:backend-engineer"]["properties"][
+        "bullet_points"
+    ]
+    assert (project_bullets["minItems"], project_bullets["maxItems"]) == (2, 4)
+    assert (experience_bullets["minItems"], experience_bullets["maxItems"]) == (1, 1)
+
+
+def test_generate_bulletpoints_batch_with_llm_sends_shared_context_once(monkeypatch):
+    captured = {}
+
+    class DummyResponses:
+        def create(self, **kwargs):
+            captured["kwargs"] = kwargs
+            return SimpleNamespace(
+                output_text=json.dumps(
+                    {
+                        "project:jobforge": {
+                            "bullet_points": [
+                                "Built FastAPI APIs for grounded resume generation.",
+                                "Validated user-authored project evidence.",
+                            ]
+                        },
+                        "experience:backend-engineer": {
+                            "bullet_points": ["- Designed schema-validated backend APIs."]
+                        },
+                    }
+                ),
+                usage=SimpleNamespace(input_tokens=50, output_tokens=20, total_tokens=70),
+            )
+
+    class DummyOpenAI:
+        def __init__(self, **kwargs):
+            self.responses = DummyResponses()
+
+    monkeypatch.setattr(bullet_llm_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(bullet_llm_client.settings, "BULLETPOINTS_LLM_MODEL", "test-model")
+    monkeypatch.setattr(bullet_llm_client.settings, "BULLETPOINTS_LLM_MAX_OUTPUT_TOKENS", 400)
+
+    result = generate_bulletpoints_batch_with_llm(
+        context=BulletJobContext(title="Backend Engineer", description="Build APIs."),
+        records=[
+            (_project(), None, BulletCountRange(min=2, max=4)),
+            (None, _experience(), BulletCountRange(min=1, max=1)),
+        ],
+    )
+
+    kwargs = captured["kwargs"]
+    prompt = json.loads(kwargs["input"])
+    assert kwargs["max_output_tokens"] == 800
+    assert kwargs["text"]["format"]["name"] == "bullet_points_batch"
+    assert prompt["job"] == {"title": "Backend Engineer", "description": "Build APIs."}
+    assert [record["key"] for record in prompt["records"]] == [
+        "project:jobforge",
+        "experience:backend-engineer",
+    ]
+    assert prompt["records"][1]["bullet_count_range"] == {"min": 1, "max": 1}
+    assert result.bullet_points["experience:backend-engineer"] == [
+        "Designed schema-validated backend APIs."
+    ]
+    assert len(result.bullet_points["project:jobforge"]) == 2
+    assert result.errors == {}
+    assert result.metadata["api_calls"] == 1
+    assert result.metadata["total_tokens"] == 70
+
+
+def test_generate_bulletpoints_batch_with_llm_reports_invalid_records(monkeypatch):
+    class DummyResponses:
+        def create(self, **kwargs):
+            return SimpleNamespace(
+                output_text=json.dumps(
+                    {
+                        "project:jobforge": {"bullet_points": ["Only one bullet."]},
+                        "experience:backend-engineer": {"bullet_points": ["Designed APIs."]},
+                    }
+                ),
+                usage=SimpleNamespace(input_tokens=5, output_tokens=5, total_tokens=10),
+            )
+
+    class DummyOpenAI:
+        def __init__(self, **kwargs):
+            self.responses = DummyResponses()
+
+    monkeypatch.setattr(bullet_llm_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    result = generate_bulletpoints_batch_with_llm(
+        context=BulletJobContext(title="Backend Engineer"),
+        records=[
+            (_project(), None, BulletCountRange(min=2, max=4)),
+            (None, _experience(), BulletCountRange(min=1, max=1)),
+        ],
+    )
+
+    assert list(result.bullet_points) == ["experience:backend-engineer"]
+    assert "outside the requested range" in result.errors["project:jobforge"]
+
+    with pytest.raises(BulletPointLLMClientError, match="no valid records"):
+        generate_bulletpoints_batch_with_llm(
+            context=BulletJobContext(title="Backend Engineer"),
+            records=[(_project(), None, BulletCountRange(min=2, max=4))],
+        )
+
+
+def test_generate_bulletpoints_batch_with_llm_async_uses_async_client(monkeypatch):
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            assert kwargs["text"]["format"]["name"] == "bullet_points_batch"
+            return SimpleNamespace(
+                output_text=json.dumps({"project:jobforge": {"bullet_points": ["Built APIs."]}}),
+                usage=SimpleNamespace(input_tokens=10, output_tokens=5, total_tokens=15),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(bullet_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    result = asyncio.run(
+        generate_bulletpoints_batch_with_llm_async(
+            context=BulletJobContext(title="Backend Engineer"),
+            records=[(_project(), None, BulletCountRange(min=1, max=1))],
+        )
+    )
+
+    assert result.bullet_points == {"project:jobforge": ["Built APIs."]}
+    assert result.metadata["total_tokens"] == 15
+
+
+def _streaming_openai(attempts: list[list[str]], calls: list[dict], consumed: list[str]):
+    """Fake async client whose Nth call streams attempts[N] as text deltas."""
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            assert kwargs.pop("stream") is True
+            calls.append(kwargs)
+            deltas = attempts[len(calls) - 1]
+
+            async def events():
+                for delta in deltas:
+                    consumed.append(delta)
+                    yield SimpleNamespace(type="response.output_text.delta", delta=delta)
+                complete = "".join(deltas).endswith("}")
+                yield SimpleNamespace(
+                    type="response.completed" if complete else "response.incomplete",
+                    response=SimpleNamespace(
+                        usage=SimpleNamespace(input_tokens=12, output_tokens=8, total_tokens=20)
+                    ),
+                )
+
+            return events()
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    return DummyAsyncOpenAI
+
+
+def _collect_stream(count_range: BulletCountRange, consumed: list[str]) -> list:
+    async def collect():
+        items = []
+        async for item in stream_bulletpoints_with_llm_async(
+            context=BulletJobContext(title="Backend Engineer"),
+            project=_project(),
+            count_range=count_range,
+        ):
+            items.append((item, len(consumed)))
+        return items
+
+    return asyncio.run(collect())
+
+
+def test_stream_bulletpoints_emits_each_bullet_once_complete(monkeypatch):
+    calls: list[dict] = []
+    consumed: list[str] = []
+    deltas = [
+        '{"bullet_points":["- Built \\"grounded',
+        '\\" APIs."',
+        ',"Validated evidence."',
+        "]}",
+    ]
+    monkeypatch.setattr(
+        bullet_llm_client, "AsyncOpenAI", _streaming_openai([deltas], calls, consumed)
+    )
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    items = _collect_stream(BulletCountRange(min=2, max=3), consumed)
+
+    assert [item for item, _ in items[:2]] == [
+        StreamedBulletPoint(index=0, text='Built "grounded" APIs.'),
+        StreamedBulletPoint(index=1, text="Validated evidence."),
+    ]
+    # Each bullet is yielded as soon as the delta that closes it arrives.
+    assert [deltas_read for _, deltas_read in items[:2]] == [2, 3]
+    result, _ = items[2]
+    assert isinstance(result, LLMBulletPointResult)
+    assert result.bullet_points == ['Built "grounded" APIs.', "Validated evidence."]
+    assert result.metadata["total_tokens"] == 20
+    assert result.metadata["first_bullet_ms"] >= 0
+    assert calls[0]["text"]["format"]["name"] == "project_bullet_points"
+
+
+def test_stream_bulletpoints_rejects_bullets_past_the_maximum(monkeypatch):
+    consumed: list[str] = []
+    deltas = ['{"bullet_points":["One."', ',"Two."', "]}"]
+    monkeypatch.setattr(
+        bullet_llm_client, "AsyncOpenAI", _streaming_openai([deltas], [], consumed)
+    )
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    with pytest.raises(BulletPointLLMClientError, match="outside the requested range"):
+        _collect_stream(BulletCountRange(min=1, max=1), consumed)
+
+
+def test_stream_bulletpoints_retries_truncated_stream_before_first_bullet(monkeypatch):
+    calls: list[dict] = []
+    consumed: list[str] = []
+    attempts = [['{"bullet_points":["Trunc'], ['{"bullet_points":["Built APIs."]}']]
+    monkeypatch.setattr(
+        bullet_llm_client, "AsyncOpenAI", _streaming_openai(attempts, calls, consumed)
+    )
+    monkeypatch.setattr(bullet_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    items = _collect_stream(BulletCountRange(min=1, max=1), consumed)
+
+    assert [item.text for item, _ in items if isinstance(item, StreamedBulletPoint)] == [
+        "Built APIs."
+    ]
+    result = items[-1][0]
+    assert result.metadata["api_calls"] == 2
+    assert "not valid JSON" in result.metadata["retry_reason"]
+    assert calls[1]["max_output_tokens"] > calls[0]["max_output_tokens"]
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app import circuit_breaker as circuit_breaker_module
+from app.circuit_breaker import CircuitBreaker, circuit_breakers
+from app.main import app
+from app.project_selection import ProjectCandidate, ProjectJobContext
+from app.project_selection import llm as project_llm
+from app.project_selection.llm_client import ProjectLLMClientError
+from app.skill_selection.llm_client import LLMClientError, LLMScoreResult
+from app.skill_selection.scoring import llm
+from app.skill_selection.scoring.llm import llm_select_skills, llm_select_skills_async
+from resume_evidence.models import ProjectSkills
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def breaker_settings(monkeypatch):
+    monkeypatch.setattr(circuit_breaker_module.settings, "CIRCUIT_BREAKER_ENABLED", True)
+    monkeypatch.setattr(circuit_breaker_module.settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(circuit_breaker_module.settings, "CIRCUIT_BREAKER_SLOW_CALL_MS", 5000.0)
+    monkeypatch.setattr(circuit_breaker_module.settings, "CIRCUIT_BREAKER_OPEN_SECONDS", 30.0)
+
+
+def _skill_selection(**overrides):
+    return {
+        "job_role": "Backend Engineer",
+        "technology": ["Django", "Photoshop"],
+        "programming": ["Python"],
+        "concepts": ["API"],
+        "top_n": 2,
+        "dev_mode": True,
+        "llm_model": "test-model",
+        **overrides,
+    }
+
+
+def test_breaker_opens_after_consecutive_failures_and_recovers_through_a_probe(breaker_settings):
+    clock = FakeClock()
+    breaker = CircuitBreaker("skill_selection", "m", clock)
+
+    breaker.record_failure("timeout")
+    breaker.record_success(latency_ms=50)
+    for _ in range(2):
+        breaker.record_failure("timeout")
+    assert breaker.allow() and breaker.state == "closed"
+
+    breaker.record_success(latency_ms=9000)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in_seconds"] == 30.0
+
+    clock.now += 30
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_failure("timeout")
+    assert breaker.state == "open"
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success(latency_ms=50)
+    assert breaker.allow() and breaker.state == "closed"
+    assert breaker.snapshot() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "opened_total": 2,
+        "short_circuited": 2,
+        "last_failure": "timeout",
+        "retry_in_seconds": 0.0,
+    }
+
+
+def test_abandoned_half_open_probe_is_replaced(breaker_settings):
+    clock = FakeClock()
+    breaker = CircuitBreaker("skill_selection", "m", clock)
+    for _ in range(3):
+        breaker.record_failure("timeout")
+
+    clock.now += 30
+    assert breaker.allow()
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+def test_disabled_breaker_always_allows(breaker_settings, monkeypatch):
+    monkeypatch.setattr(circuit_breaker_module.settings, "CIRCUIT_BREAKER_ENABLED", False)
+    breaker = CircuitBreaker("skill_selection", "m")
+    for _ in range(5):
+        breaker.record_failure("timeout")
+
+    assert breaker.allow()
+
+
+def test_open_skill_circuit_skips_the_model_and_uses_baseline(breaker_settings, monkeypatch):
+    calls = []
+
+    def failing_client(**kwargs):
+        calls.append(kwargs["model"])
+        raise LLMClientError("LLM request failed: timeout")
+
+    monkeypatch.setattr(llm, "score_skills_with_llm", failing_client)
+    for _ in range(3):
+        llm_select_skills(**_skill_selection())
+    assert len(calls) == 3
+
+    selected, details = llm_select_skills(**_skill_selection())
+
+    assert len(calls) == 3
+    assert selected["technology"] == ["Django", "Photoshop"]
+    assert details["_fallback_method"] == "baseline"
+    assert details["_llm"] == {
+        "model": "test-model",
+        "circuit": "open",
+        "fallback": "baseline",
+        "reason": "LLM circuit open for test-model; used baseline",
+    }
+    # Other models keep their own breaker.
+    llm_select_skills(**_skill_selection(llm_model="other-model"))
+    assert calls[-1] == "other-model"
+
+
+def test_skill_circuit_half_open_probe_closes_on_success(breaker_settings, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breakers, "_clock", clock)
+    circuit_breakers.clear()
+    outcomes = iter([LLMClientError("timeout")] * 3)
+
+    async def scoring_client(**_kwargs):
+        outcome = next(outcomes, None)
+        if outcome is not None:
+            raise outcome
+        return LLMScoreResult(
+            scores={"technology": {"Django": 3, "Photoshop": 0}, "programming": {"Python": 3}, "concepts": {"API": 2}},
+            metadata={"model": "test-model", "total_tokens": 10},
+        )
+
+    monkeypatch.setattr(llm, "score_skills_with_llm_async", scoring_client)
+    for _ in range(3):
+        asyncio.run(llm_select_skills_async(**_skill_selection()))
+    assert circuit_breakers.get("skill_selection", "test-model").state == "open"
+
+    clock.now += 30
+    _selected, details = asyncio.run(llm_select_skills_async(**_skill_selection()))
+
+    assert "_fallback_method" not in details
+    assert circuit_breakers.get("skill_selection", "test-model").state == "closed"
+
+
+def test_half_open_probe_reopens_when_scoring_raises_a_non_client_error(breaker_settings, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breakers, "_clock", clock)
+    circuit_breakers.clear()
+    breaker = circuit_breakers.get("skill_selection", "test-model")
+    for _ in range(3):
+        breaker.record_failure("timeout")
+
+    def sync_client(**_kwargs):
+        raise RuntimeError("Embedding replay failed")
+
+    async def async_client(**_kwargs):
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(llm, "score_skills_with_llm", sync_client)
+    monkeypatch.setattr(llm, "score_skills_with_llm_async", async_client)
+
+    clock.now += 30
+    with pytest.raises(RuntimeError):
+        llm_select_skills(**_skill_selection())
+    assert breaker.state == "open"
+    assert breaker.last_failure == "RuntimeError: Embedding replay failed"
+
+    clock.now += 30
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(llm_select_skills_async(**_skill_selection()))
+    assert breaker.state == "open"
+    assert breaker.snapshot()["retry_in_seconds"] == 30.0
+
+
+def test_open_project_circuit_skips_the_model_and_is_reported_in_health(breaker_settings, monkeypatch):
+    calls = []
+
+    def failing_client(**_kwargs):
+        calls.append(1)
+        raise ProjectLLMClientError("network down")
+
+    monkeypatch.setattr(project_llm, "score_projects_with_llm", failing_client)
+    selection = {
+        "context": ProjectJobContext(title="Backend Engineer", description="Python Django API"),
+        "candidates": [
+            ProjectCandidate(
+                id="project",
+                name="Project",
+                summary="Project summary.",
+                skills=ProjectSkills(technology=["Django"], programming=["Python"], concepts=["API"]),
+            )
+        ],
+        "dev_mode": True,
+        "llm_model": "test-model",
+    }
+    for _ in range(4):
+        result = project_llm.llm_select_projects(**selection)
+
+    assert len(calls) == 3
+    assert result.selected_project_ids == ["project"]
+    assert result.details["_project_llm"]["circuit"] == "open"
+
+    async def get_health():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.get("/health")
+
+    breakers = asyncio.run(get_health()).json()["circuit_breakers"]
+    assert breakers["enabled"] is True
+    project_breaker = breakers["subsystems"]["project_selection"]["test-model"]
+    assert project_breaker["state"] == "open"
+    assert project_breaker["short_circuited"] == 1
+    assert project_breaker["last_failure"] == "network down"
@@ -166,3 +166,86 @@ def test_legacy_selection_env_vars_are_not_honored(monkeypatch):
     assert settings.PROJ_LLM_MAX_OUTPUT_TOKENS == 1200
     assert settings.BULLETPOINTS_LLM_MODEL == "gpt-5-mini"
     assert settings.LINK_SCANNING_LLM_MODEL == "gpt-5-mini"
+
+
+def test_settings_validates_selection_cache_limits(monkeypatch):
+    monkeypatch.delenv("SELECTION_CACHE_ENABLED", raising=False)
+    settings = Settings(_env_file=None)
+    assert settings.SELECTION_CACHE_ENABLED is False
+    assert settings.SELECTION_CACHE_TTL_SECONDS == 3600.0
+    assert settings.SELECTION_CACHE_MAX_ENTRIES == 1024
+
+    for name in ("SELECTION_CACHE_TTL_SECONDS", "SELECTION_CACHE_MAX_ENTRIES"):
+        monkeypatch.setenv(name, "0")
+        with pytest.raises(ValidationError):
+            Settings(_env_file=None)
+        monkeypatch.delenv(name)
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("OUTPUT_BUDGET_PERCENTILE", "0"),
+        ("OUTPUT_BUDGET_PERCENTILE", "1.5"),
+        ("OUTPUT_BUDGET_HEADROOM", "0.9"),
+        ("OUTPUT_BUDGET_MIN_SAMPLES", "0"),
+    ],
+)
+def test_settings_validates_output_budget(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
+def test_settings_parses_model_rate_limits(monkeypatch):
+    monkeypatch.setenv("OPENAI_TPM_LIMIT", "100000")
+    monkeypatch.setenv("OPENAI_MODEL_RATE_LIMITS", '{"gpt-5-mini": {"rpm": 500}}')
+    settings = Settings(_env_file=None)
+
+    assert settings.OPENAI_RPM_LIMIT is None
+    assert settings.OPENAI_TPM_LIMIT == 100000
+    assert settings.OPENAI_MODEL_RATE_LIMITS == {"gpt-5-mini": {"rpm": 500}}
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("OPENAI_RPM_LIMIT", "0"),
+        ("OPENAI_MODEL_RATE_LIMITS", '{"gpt-5-mini": {"rps": 5}}'),
+        ("OPENAI_MODEL_RATE_LIMITS", '{"gpt-5-mini": {"tpm": -1}}'),
+        ("OPENAI_INTERACTIVE_RESERVE", "1"),
+    ],
+)
+def test_settings_validates_model_rate_limits(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["CIRCUIT_BREAKER_FAILURE_THRESHOLD", "CIRCUIT_BREAKER_SLOW_CALL_MS", "CIRCUIT_BREAKER_OPEN_SECONDS"],
+)
+def test_settings_validates_circuit_breaker_limits(monkeypatch, name):
+    monkeypatch.setenv(name, "0")
+
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("LLM_HEDGE_PERCENTILE", "0"),
+        ("LLM_HEDGE_PERCENTILE", "1"),
+        ("LLM_HEDGE_MIN_SAMPLES", "0"),
+        ("LLM_HEDGE_WINDOW", "0"),
+    ],
+)
+def test_settings_validates_llm_hedging(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
@@ -1,14 +1,21 @@
 from types import SimpleNamespace
+import threading
 
+import httpx
 import logging
+import openai
 import pytest
 
 from app.skill_selection import embedding_client
 
 
 class FakeTokenizer:
-    def encode(self, text: str):
-        return list(range(len(text)))
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode_ordinary_batch(self, texts: list[str]):
+        self.encoded.extend(texts)
+        return [list(range(len(text))) for text in texts]
 
     def decode(self, tokens):
         return "x" * len(tokens)
@@ -35,6 +42,40 @@ def test_truncate_texts_logs_truncation_with_context(monkeypatch, caplog):
     assert record.truncated_length == 5
 
 
+def test_truncate_texts_only_tokenizes_texts_that_may_overflow(monkeypatch):
+    tokenizer = FakeTokenizer()
+    monkeypatch.setattr(embedding_client, "get_tokenizer", lambda model: tokenizer)
+
+    result = embedding_client.truncate_texts(
+        ["go", "python", "kubernetes operators", "ĉĉĉ"],
+        max_tokens=5,
+        model="fake-model",
+    )
+
+    assert result == ["go", "xxxxx", "xxxxx", "ĉĉĉ"]
+    # "ĉĉĉ" is 3 characters but 6 UTF-8 bytes, so it cannot skip the tokenizer.
+    assert tokenizer.encoded == ["python", "kubernetes operators", "ĉĉĉ"]
+
+
+def test_get_tokenizer_is_resolved_once_per_model(monkeypatch):
+    resolved = []
+
+    def fake_encoding_for_model(model_name):
+        resolved.append(model_name)
+        return FakeTokenizer()
+
+    monkeypatch.setattr(embedding_client.tiktoken, "encoding_for_model", fake_encoding_for_model)
+    embedding_client.get_tokenizer.cache_clear()
+    try:
+        first = embedding_client.get_tokenizer("model-a")
+        assert embedding_client.get_tokenizer("model-a") is first
+        embedding_client.get_tokenizer("model-b")
+    finally:
+        embedding_client.get_tokenizer.cache_clear()
+
+    assert resolved == ["model-a", "model-b"]
+
+
 def test_embed_role_passes_dimensions(monkeypatch):
     captured = {}
 
@@ -71,3 +112,115 @@ def test_embed_role_passes_dimensions(monkeypatch):
 def test_embed_skills_empty_list_raises():
     with pytest.raises(ValueError, match="empty list"):
         embedding_client.embed_skills([])
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(429, request=request, headers={"retry-after": "0"})
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _use_batched_client(monkeypatch, create, *, batch_size=2, concurrency=3, retries=2):
+    class DummyOpenAI:
+        def __init__(self, **_kwargs):
+            self.embeddings = SimpleNamespace(create=create)
+
+    monkeypatch.setattr(embedding_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(embedding_client.time, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(
+        embedding_client,
+        "truncate_texts",
+        lambda texts, max_tokens, model, text_kind=None: texts,
+    )
+    monkeypatch.setattr(
+        embedding_client,
+        "settings",
+        SimpleNamespace(
+            EMBEDDING_MODEL="test-model",
+            EMBEDDING_BATCH_SIZE=batch_size,
+            EMBEDDING_MAX_CONCURRENCY=concurrency,
+            EMBEDDING_RATE_LIMIT_RETRIES=retries,
+            DEV_MODE=False,
+            OPENAI_API_KEY="",
+        ),
+    )
+
+
+def _fake_response(texts):
+    return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(text)), 1.0]) for text in texts])
+
+
+def test_embed_skills_splits_into_batches_and_keeps_order(monkeypatch):
+    requested = []
+    lock = threading.Lock()
+
+    def create(**kwargs):
+        with lock:
+            requested.append(list(kwargs["input"]))
+        return _fake_response(kwargs["input"])
+
+    _use_batched_client(monkeypatch, create, batch_size=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    result = embedding_client.embed_skills(texts)
+
+    assert result == [[float(len(text)), 1.0] for text in texts]
+    assert sorted(requested) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_embed_skills_retries_only_the_rate_limited_batch(monkeypatch):
+    attempts: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def create(**kwargs):
+        first = kwargs["input"][0]
+        with lock:
+            attempts[first] = attempts.get(first, 0) + 1
+            count = attempts[first]
+        if first == "ccc" and count == 1:
+            raise _rate_limit_error()
+        return _fake_response(kwargs["input"])
+
+    _use_batched_client(monkeypatch, create, batch_size=2)
+
+    result = embedding_client.embed_skills(["a", "bb", "ccc", "dddd"])
+
+    assert result == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+    assert attempts == {"a": 1, "ccc": 2}
+
+
+def test_embed_skills_failed_batch_falls_back_to_none(monkeypatch, caplog):
+    def create(**kwargs):
+        if kwargs["input"][0] == "ccc":
+            raise _rate_limit_error()
+        return _fake_response(kwargs["input"])
+
+    _use_batched_client(monkeypatch, create, batch_size=2, retries=1)
+
+    with caplog.at_level(logging.ERROR, logger="embedding_client"):
+        result = embedding_client.embed_skills(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert result == [[1.0, 1.0], [2.0, 1.0], None, None, [5.0, 1.0]]
+    assert any(record.msg == "embedding_batch_failed" and record.batch_index == 1 for record in caplog.records)
+
+
+def test_embed_skills_raises_when_every_batch_fails(monkeypatch):
+    def create(**_kwargs):
+        raise _rate_limit_error()
+
+    _use_batched_client(monkeypatch, create, batch_size=2, retries=0)
+
+    with pytest.raises(openai.RateLimitError):
+        embedding_client.embed_skills(["a", "bb", "ccc"])
+
+
+def test_embed_roles_does_not_return_partial_results(monkeypatch):
+    def create(**kwargs):
+        if kwargs["input"][0] == "ccc":
+            raise _rate_limit_error()
+        return _fake_response(kwargs["input"])
+
+    _use_batched_client(monkeypatch, create, batch_size=2, retries=0)
+
+    with pytest.raises(openai.RateLimitError):
+        embedding_client.embed_roles(["a", "bb", "ccc"])
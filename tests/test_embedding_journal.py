@@ -0,0 +1,150 @@
+"""Unit tests for the append-only embedding journal and EmbeddingCache write batching."""
+import json
+import os
+
+import pytest
+
+from app.skill_selection import embedding_journal
+from app.skill_selection.embedding_cache import EmbeddingCache, role_cache_key
+from app.skill_selection.embedding_journal import EmbeddingJournal
+
+
+def _count_fsyncs(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    real_fsync = os.fsync
+
+    def counting_fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(embedding_journal.os, "fsync", counting_fsync)
+    return calls
+
+
+def test_journal_replays_appended_records(tmp_path):
+    journal = EmbeddingJournal(tmp_path / "cache.journal", model="test-model")
+
+    journal.append({"role": {"backend engineer": [1.0, 0.0]}, "skill": {"python": [0.5, 0.5], "rust": [0.0, 1.0]}})
+
+    replayed = {type: {key: vec.tolist() for key, vec in rows.items()} for type, rows in journal.replay()}
+    assert replayed == {
+        "role": {"backend engineer": [1.0, 0.0]},
+        "skill": {"python": [0.5, 0.5], "rust": [0.0, 1.0]},
+    }
+
+
+def test_journal_drops_torn_tail_and_truncates_file(tmp_path, caplog):
+    path = tmp_path / "cache.journal"
+    journal = EmbeddingJournal(path, model="test-model")
+    journal.append({"skill": {"python": [0.5, 0.5]}})
+    valid_size = journal.size
+    journal.append({"skill": {"rust": [0.0, 1.0]}})
+    with open(path, "r+b") as f:
+        f.truncate(journal.size - 3)
+
+    replayed = [rows for _, rows in journal.replay()]
+
+    assert [list(rows) for rows in replayed] == [["python"]]
+    assert journal.size == valid_size
+    assert any(record.message == "embedding_journal_truncated" for record in caplog.records)
+
+
+def test_journal_skips_records_for_other_models(tmp_path):
+    path = tmp_path / "cache.journal"
+    EmbeddingJournal(path, model="other-model").append({"skill": {"python": [0.5, 0.5]}})
+
+    assert list(EmbeddingJournal(path, model="test-model").replay()) == []
+
+
+def test_write_batch_costs_one_fsynced_append(tmp_path, monkeypatch):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
+    fsyncs = _count_fsyncs(monkeypatch)
+
+    with cache.write_batch():
+        cache.cache_store("backend engineer", [1.0, 0.0], type="role")
+        cache.cache_store_many({"python": [0.5, 0.5]}, type="skill")
+        cache.cache_store_many({"rust": [0.0, 1.0], "go": [1.0, 1.0]}, type="skill")
+        assert cache.cache_lookup("rust", type="skill").tolist() == [0.0, 1.0]
+        assert fsyncs == []
+
+    assert len(fsyncs) == 1
+    assert not (tmp_path / "skill_cache.index.json").exists()
+
+
+def test_journaled_entries_survive_restart_without_compaction(tmp_path):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
+    cache.cache_store_many({"python": [0.5, 0.5], "rust": [0.0, 1.0]}, type="skill")
+
+    reloaded = EmbeddingCache("test-model", cache_dir=tmp_path)
+
+    assert reloaded.cache_lookup("rust", type="skill").tolist() == pytest.approx([0.0, 1.0])
+    assert len(reloaded.skill_cache) == 2
+
+
+def test_compact_folds_journal_into_store(tmp_path):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
+    cache.cache_store_many({"python": [0.5, 0.5]}, type="skill")
+    cache.cache_store("backend engineer", [1.0, 0.0], type="role")
+
+    cache.close()
+
+    assert not cache.journal.path.exists()
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["keys"] == ["python"]
+    assert json.loads((tmp_path / "role_cache.index.json").read_text())["keys"] == [role_cache_key("backend engineer")]
+    reloaded = EmbeddingCache("test-model", cache_dir=tmp_path)
+    assert reloaded.cache_lookup("python", type="skill").tolist() == pytest.approx([0.5, 0.5])
+
+
+def test_journal_over_threshold_compacts_in_background(tmp_path):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path, compact_bytes=1)
+
+    cache.cache_store_many({"python": [0.5, 0.5]}, type="skill")
+    cache._compactor.join(timeout=5)
+
+    assert not cache.journal.path.exists()
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["keys"] == ["python"]
+
+
+# ---------------------------------------------------------------------------
+# Shared cache across workers (separate EmbeddingCache instances, one cache_dir)
+# ---------------------------------------------------------------------------
+
+def test_worker_sees_entries_another_worker_journaled(tmp_path):
+    worker_a = EmbeddingCache("test-model", cache_dir=tmp_path)
+    worker_b = EmbeddingCache("test-model", cache_dir=tmp_path)
+
+    worker_a.cache_store_many({"python": [0.5, 0.5]}, type="skill")
+
+    assert worker_b.cache_lookup("python", type="skill") is None
+    found = worker_b.cache_lookup_many(["python", "rust"], type="skill")
+    assert found[0].tolist() == pytest.approx([0.5, 0.5])
+    assert found[1] is None
+
+
+def test_compaction_merges_entries_from_other_workers(tmp_path):
+    worker_a = EmbeddingCache("test-model", cache_dir=tmp_path)
+    worker_b = EmbeddingCache("test-model", cache_dir=tmp_path)
+    worker_a.cache_store_many({"python": [0.5, 0.5]}, type="skill")
+    worker_b.cache_store_many({"rust": [0.0, 1.0]}, type="skill")
+
+    worker_a.compact()
+    worker_b.cache_store_many({"go": [1.0, 1.0]}, type="skill")
+    worker_b.compact()
+
+    keys = json.loads((tmp_path / "skill_cache.index.json").read_text())["keys"]
+    assert sorted(keys) == ["go", "python", "rust"]
+    assert worker_a.refresh() == 1
+    assert worker_a.cache_lookup("go", type="skill").tolist() == pytest.approx([1.0, 1.0])
+
+
+def test_worker_tails_new_journal_after_another_worker_compacts(tmp_path):
+    worker_a = EmbeddingCache("test-model", cache_dir=tmp_path)
+    worker_b = EmbeddingCache("test-model", cache_dir=tmp_path)
+    worker_a.cache_store_many({"python": [0.5, 0.5], "rust": [0.0, 1.0]}, type="skill")
+    assert worker_a.refresh() == 0
+
+    worker_b.compact()
+    worker_b.cache_store_many({"go": [1.0, 1.0]}, type="skill")
+
+    assert worker_a.cache_lookup_many(["go"], type="skill")[0].tolist() == pytest.approx([1.0, 1.0])
+    assert len(worker_a.skill_cache) == 3
@@ -0,0 +1,120 @@
+"""Unit tests for app/skill_selection/embedding_prewarm.py"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from app import main
+from app.skill_selection import embedding_prewarm
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.embedding_prewarm import collect_prewarm_skills, prewarm_skill_embeddings
+from app.skill_selection.scoring import embeddings
+
+
+@pytest.fixture
+def sources_on_disk(tmp_path):
+    pools = {
+        "backend": {
+            "technology": {"core": ["Docker", "postgres"], "nice": ["redis"], "exclude": ["flutter"]},
+            "programming": {"core": ["Python"], "nice": [], "exclude": []},
+            "concepts": {"core": ["API"], "nice": [], "exclude": []},
+        },
+    }
+    pools_path = tmp_path / "skill_pools.json"
+    pools_path.write_text(json.dumps(pools))
+    skills_path = tmp_path / "skills.yaml"
+    skills_path.write_text(yaml.safe_dump({
+        "schema_version": 1,
+        "skills": {"technology": ["docker", "FastAPI"], "programming": ["python"], "concepts": []},
+    }))
+    return pools_path, skills_path
+
+
+@pytest.fixture
+def prewarm_cache(tmp_path, monkeypatch):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(embeddings, "cache", cache)
+    monkeypatch.setattr(
+        embedding_prewarm,
+        "settings",
+        SimpleNamespace(EMBEDDING_BATCH_SIZE=2, EMBEDDING_MAX_CONCURRENCY=1),
+    )
+    return cache
+
+
+def test_collect_prewarm_skills_normalizes_and_dedupes(sources_on_disk):
+    pools_path, skills_path = sources_on_disk
+
+    sources = collect_prewarm_skills(pools_path, skills_path)
+
+    assert sources["skill_pools"] == ["docker", "postgresql", "redis", "flutter", "python", "api"]
+    assert sources["resume_evidence"] == ["docker", "fastapi", "python"]
+
+
+def test_collect_prewarm_skills_skips_missing_sources(tmp_path, sources_on_disk, caplog):
+    pools_path, _ = sources_on_disk
+
+    sources = collect_prewarm_skills(pools_path, tmp_path / "missing.yaml")
+
+    assert list(sources) == ["skill_pools"]
+    assert any(record.message == "embedding_prewarm_source_missing" for record in caplog.records)
+
+
+def test_prewarm_embeds_only_missing_skills_in_chunks(prewarm_cache, monkeypatch):
+    prewarm_cache.cache_store("docker", [1.0, 0.0], type="skill")
+    requested = []
+
+    def fake_embed_skills(texts):
+        requested.append(list(texts))
+        return [[0.0, 1.0] for _ in texts]
+
+    monkeypatch.setattr(embeddings, "embed_skills", fake_embed_skills)
+
+    report = prewarm_skill_embeddings({"pools": ["docker", "python", "rust"], "evidence": ["python", "go"]})
+
+    assert requested == [["python", "rust"], ["go"]]
+    assert (report.skills, report.already_cached, report.embedded, report.failed) == (4, 1, 3, 0)
+    assert report.coverage == 1.0
+    assert report.sources["evidence"] == {"skills": 2, "cached": 2, "coverage": 1.0}
+    assert not prewarm_cache.journal.path.exists()
+    assert len(EmbeddingCache("test-model", cache_dir=prewarm_cache.cache_dir).skill_cache) == 4
+
+
+def test_prewarm_reports_failed_chunks_and_keeps_going(prewarm_cache, monkeypatch):
+    def fake_embed_skills(texts):
+        if "python" in texts:
+            raise RuntimeError("embedding outage")
+        return [[0.0, 1.0] if text != "go" else None for text in texts]
+
+    monkeypatch.setattr(embeddings, "embed_skills", fake_embed_skills)
+
+    report = prewarm_skill_embeddings({"pools": ["python", "rust", "go", "java"]})
+
+    assert (report.embedded, report.failed) == (1, 3)
+    assert report.missing == ["python", "rust", "go"]
+    assert report.coverage == 0.25
+
+
+def test_prewarm_dry_run_only_reports_coverage(prewarm_cache, monkeypatch):
+    prewarm_cache.cache_store("docker", [1.0, 0.0], type="skill")
+    monkeypatch.setattr(embeddings, "embed_skills", lambda texts: pytest.fail("dry run must not embed"))
+
+    report = prewarm_skill_embeddings({"pools": ["docker", "python"]}, dry_run=True)
+
+    assert report.model_dump()["coverage"] == 0.5
+    assert report.missing == ["python"]
+
+
+def test_app_startup_prewarms_when_enabled(monkeypatch):
+    started = []
+    monkeypatch.setattr(main, "load_registered_evidence", lambda: {})
+    monkeypatch.setattr(main, "prewarm_in_background", lambda: started.append(True))
+    monkeypatch.setattr(main.settings, "EMBEDDING_PREWARM_ON_STARTUP", True)
+
+    async def _run_startup():
+        async with main.lifespan(main.app):
+            assert started == [True]
+
+    asyncio.run(_run_startup())
@@ -0,0 +1,192 @@
+"""Unit tests for app/skill_selection/embedding_store.py"""
+import json
+
+import numpy as np
+import pytest
+
+from app.skill_selection import embedding_store
+from app.skill_selection.embedding_store import EmbeddingStore
+
+
+def _store(tmp_path, **kwargs) -> EmbeddingStore:
+    return EmbeddingStore(tmp_path / "skill_cache", model="test-model", dimensions=None, **kwargs)
+
+
+def test_store_round_trips_vectors_through_binary_files(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store["rust"] = [3.0, 4.0]
+    store.save()
+
+    reloaded = _store(tmp_path)
+
+    assert set(reloaded) == {"python", "rust"}
+    assert reloaded["rust"].tolist() == [3.0, 4.0]
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["dtype"] == "float32"
+
+
+def test_store_lookups_are_zero_copy_memmap_views(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store.save()
+
+    reloaded = _store(tmp_path)
+    view = reloaded["python"]
+
+    assert isinstance(view.base, np.memmap) or isinstance(view, np.memmap)
+    assert not view.flags.writeable
+    assert reloaded["python"] is view
+
+
+def test_store_pending_vectors_are_visible_before_save(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+
+    assert "python" in store
+    assert store.dirty
+    assert not list(tmp_path.glob("*.npy"))
+
+
+def test_store_rejects_mismatched_widths(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+
+    with pytest.raises(ValueError, match="dimensions"):
+        store["rust"] = [1.0, 2.0, 3.0]
+
+
+def test_store_delete_removes_rows_on_save(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store["rust"] = [3.0, 4.0]
+    store.save()
+
+    del store["python"]
+    store.save()
+
+    reloaded = _store(tmp_path)
+    assert list(reloaded) == ["rust"]
+    assert np.load(reloaded.matrix_path).shape == (1, 2)
+    assert list(tmp_path.glob("*.npy")) == [reloaded.matrix_path]
+
+
+def test_store_crash_before_index_switch_keeps_old_rows(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store["rust"] = [3.0, 4.0]
+    store.save()
+
+    write = embedding_store._atomic_write_bytes
+
+    def crash_on_index(path, writer):
+        if path == store.index_path:
+            raise OSError("disk full")
+        write(path, writer)
+
+    monkeypatch.setattr(embedding_store, "_atomic_write_bytes", crash_on_index)
+    del store["python"]
+    store["go"] = [5.0, 6.0]
+    with pytest.raises(OSError):
+        store.save()
+
+    reloaded = _store(tmp_path)
+    assert list(reloaded) == ["python", "rust"]
+    assert reloaded["python"].tolist() == [1.0, 2.0]
+    assert reloaded["rust"].tolist() == [3.0, 4.0]
+
+
+def test_store_loads_unsuffixed_rows_written_before_generations(tmp_path):
+    np.save(tmp_path / "skill_cache.npy", np.array([[1.0, 2.0]], dtype=np.float32))
+    index = {"version": 2, "model": "test-model", "dimensions": None, "dtype": "float32", "keys": ["python"]}
+    (tmp_path / "skill_cache.index.json").write_text(json.dumps(index))
+
+    store = _store(tmp_path)
+    assert store["python"].tolist() == [1.0, 2.0]
+
+    store["rust"] = [3.0, 4.0]
+    store.save()
+
+    assert list(tmp_path.glob("*.npy")) == [store.matrix_path]
+    assert _store(tmp_path)["python"].tolist() == [1.0, 2.0]
+
+
+def test_store_ignores_index_keys_without_rows(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store.save()
+    index = json.loads((tmp_path / "skill_cache.index.json").read_text())
+    index["keys"].append("orphan")
+    (tmp_path / "skill_cache.index.json").write_text(json.dumps(index))
+
+    reloaded = _store(tmp_path)
+
+    assert list(reloaded) == ["python"]
+
+
+def test_store_migrates_legacy_payload_once(tmp_path):
+    legacy = tmp_path / "skill_cache.json"
+    legacy.write_text(json.dumps({"version": 1, "model": "test-model", "dimensions": None, "data": {"go": [0.5, 0.5]}}))
+
+    store = _store(tmp_path, legacy_path=legacy)
+
+    assert store["go"].tolist() == [0.5, 0.5]
+    legacy.write_text(json.dumps({"go": [9.0, 9.0]}))
+    assert _store(tmp_path, legacy_path=legacy)["go"].tolist() == [0.5, 0.5]
+
+
+def test_store_rejects_model_mismatch(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [1.0, 2.0]
+    store.save()
+
+    other = EmbeddingStore(tmp_path / "skill_cache", model="other-model", dimensions=None)
+
+    assert len(other) == 0
+
+
+# ---------------------------------------------------------------------------
+# Quantized storage
+# ---------------------------------------------------------------------------
+
+def test_float16_store_saves_half_precision_rows(tmp_path):
+    store = _store(tmp_path, dtype="float16")
+    store["python"] = [0.25, -0.5]
+    store.save()
+
+    reloaded = _store(tmp_path, dtype="float16")
+
+    assert reloaded["python"].dtype == np.float16
+    assert reloaded.vector("python").tolist() == [0.25, -0.5]
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["dtype"] == "float16"
+
+
+def test_int8_store_keeps_per_row_scales(tmp_path):
+    store = _store(tmp_path, dtype="int8")
+    store["python"] = [0.1, -0.2, 0.05]
+    store["rust"] = [30.0, 10.0, 0.0]
+    store.save()
+
+    reloaded = _store(tmp_path, dtype="int8")
+
+    assert reloaded["rust"].dtype == np.int8
+    assert reloaded["rust"].tolist() == [127, 42, 0]
+    assert reloaded.vector("python").tolist() == pytest.approx([0.1, -0.2, 0.05], abs=0.2 / 254)
+    assert reloaded.vector("rust").tolist() == pytest.approx([30.0, 10.0, 0.0], abs=30.0 / 254)
+    assert np.load(reloaded.scales_path).shape == (2,)
+
+
+def test_store_requantizes_rows_saved_with_another_dtype(tmp_path):
+    store = _store(tmp_path)
+    store["python"] = [0.5, -1.0]
+    store.save()
+
+    quantized = _store(tmp_path, dtype="int8")
+
+    assert quantized["python"].tolist() == [64, -127]
+    assert quantized.vector("python").tolist() == pytest.approx([0.5, -1.0], abs=1 / 254)
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["dtype"] == "int8"
+
+
+def test_store_rejects_unknown_dtype(tmp_path):
+    with pytest.raises(ValueError, match="dtype"):
+        _store(tmp_path, dtype="bfloat16")
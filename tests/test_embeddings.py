@@ -1,6 +1,9 @@
 """Unit tests for app/skill_selection/scoring/embeddings.py"""
 import json
 import math
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 from unittest.mock import patch
 
@@ -8,11 +11,12 @@ from app.skill_selection.scoring import embeddings
 from app.skill_selection.scoring.embeddings import (
     normalize_skill,
     construct_role_text,
+    cosine_scores,
     cosine_similarity,
     embedding_rank_skills,
     embedding_select_skills,
 )
-from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.embedding_cache import EmbeddingCache, LRUBudget, role_cache_key
 
 
 # ---------------------------------------------------------------------------
@@ -83,15 +87,17 @@ def _make_cache(role_data: dict | None = None, skill_data: dict | None = None) -
     cache.skill_cache = skill_data if skill_data is not None else {}
     cache.model = "test-model"
     cache.dimensions = None
+    cache.role_budget = LRUBudget(max_entries=None, max_bytes=None)
     return cache
 
 
 def _disable_cache_writes(monkeypatch):
     monkeypatch.setattr(embeddings.cache, "cache_store", lambda *args, **kwargs: None)
+    monkeypatch.setattr(embeddings.cache, "cache_store_many", lambda *args, **kwargs: None)
 
 
 def test_cache_lookup_role_hit():
-    cache = _make_cache(role_data={"backend engineer": [0.1, 0.2]})
+    cache = _make_cache(role_data={role_cache_key("backend engineer"): [0.1, 0.2]})
     assert cache.cache_lookup("backend engineer", type="role") == [0.1, 0.2]
 
 
@@ -116,82 +122,112 @@ def test_cache_lookup_invalid_type_raises():
         cache.cache_lookup("anything", type="invalid")
 
 
-def test_load_embeddings_cache_loads_json(tmp_path):
+def test_load_embeddings_cache_migrates_legacy_json(tmp_path):
     role_data = {"backend engineer": [0.1, 0.2]}
     skill_data = {"python": [0.5, 0.6]}
+    (tmp_path / "role_cache.json").write_text(json.dumps(role_data))
+    (tmp_path / "skill_cache.json").write_text(json.dumps(skill_data))
 
-    role_file = tmp_path / "role_cache.json"
-    skill_file = tmp_path / "skill_cache.json"
-    role_file.write_text(json.dumps(role_data))
-    skill_file.write_text(json.dumps(skill_data))
-
-    cache = EmbeddingCache.__new__(EmbeddingCache)
-    cache._ROLE_EMB_CACHE_DIR = role_file
-    cache._SKILL_EMB_CACHE_DIR = skill_file
-    cache.role_cache, cache.skill_cache = cache._load_embeddings_cache()
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
 
-    assert cache.role_cache == role_data
-    assert cache.skill_cache == skill_data
+    assert cache.cache_lookup("backend engineer", type="role").tolist() == pytest.approx([0.1, 0.2])
+    assert cache.cache_lookup("python", type="skill").tolist() == pytest.approx([0.5, 0.6])
+    assert cache.role_cache.matrix_path.exists()
+    assert json.loads((tmp_path / "skill_cache.index.json").read_text())["keys"] == ["python"]
 
 
 def test_load_embeddings_cache_missing_files_defaults_to_empty(tmp_path):
-    cache = EmbeddingCache.__new__(EmbeddingCache)
-    cache._ROLE_EMB_CACHE_DIR = tmp_path / "nonexistent_role.json"
-    cache._SKILL_EMB_CACHE_DIR = tmp_path / "nonexistent_skill.json"
-    cache.role_cache, cache.skill_cache = cache._load_embeddings_cache()
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
 
-    assert cache.role_cache == {}
-    assert cache.skill_cache == {}
+    assert len(cache.role_cache) == 0
+    assert len(cache.skill_cache) == 0
+    assert cache.cache_lookup("python", type="skill") is None
 
 
-def test_cache_store_persists_role_write_through(tmp_path):
-    cache = EmbeddingCache.__new__(EmbeddingCache)
-    cache._ROLE_EMB_CACHE_DIR = tmp_path / "role_cache.json"
-    cache._SKILL_EMB_CACHE_DIR = tmp_path / "skill_cache.json"
-    cache.model = "test-model"
-    cache.dimensions = 3
-    cache.role_cache = {}
-    cache.skill_cache = {}
+def test_cache_store_compacts_role_into_store(tmp_path, monkeypatch):
+    from app.skill_selection import embedding_cache
+
+    monkeypatch.setattr(embedding_cache, "settings", SimpleNamespace(EMBEDDING_DIMENSIONS=3))
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
 
     cache.cache_store("backend engineer", [0.1, 0.2, 0.3], type="role")
+    cache.compact()
 
-    payload = json.loads(cache._ROLE_EMB_CACHE_DIR.read_text())
-    assert payload["model"] == "test-model"
-    assert payload["dimensions"] == 3
-    assert payload["data"]["backend engineer"] == [0.1, 0.2, 0.3]
+    index = json.loads((tmp_path / "role_cache.index.json").read_text())
+    assert index["model"] == "test-model"
+    assert index["dimensions"] == 3
+    assert index["keys"] == [role_cache_key("backend engineer")]
+    matrix = np.load(cache.role_cache.matrix_path)
+    assert matrix.dtype == np.float32
+    assert matrix[0].tolist() == pytest.approx([0.1, 0.2, 0.3])
 
 
-def test_cache_store_persists_skill_write_through(tmp_path):
-    cache = EmbeddingCache.__new__(EmbeddingCache)
-    cache._ROLE_EMB_CACHE_DIR = tmp_path / "role_cache.json"
-    cache._SKILL_EMB_CACHE_DIR = tmp_path / "skill_cache.json"
-    cache.model = "test-model"
-    cache.dimensions = None
-    cache.role_cache = {}
-    cache.skill_cache = {}
+def test_cache_store_compacts_skill_into_store(tmp_path):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
 
     cache.cache_store("python", [0.5, 0.6], type="skill")
+    cache.compact()
+
+    index = json.loads((tmp_path / "skill_cache.index.json").read_text())
+    assert index["model"] == "test-model"
+    assert index["dimensions"] is None
+    assert index["keys"] == ["python"]
+    reloaded = EmbeddingCache("test-model", cache_dir=tmp_path)
+    assert reloaded.cache_lookup("python", type="skill").tolist() == pytest.approx([0.5, 0.6])
+
+
+def test_role_cache_key_normalizes_whitespace():
+    assert role_cache_key("backend  engineer\n") == role_cache_key("backend engineer")
+    assert role_cache_key("backend engineer") != role_cache_key("data engineer")
+    assert len(role_cache_key("x" * 10_000)) == len(role_cache_key("x"))
+
 
-    payload = json.loads(cache._SKILL_EMB_CACHE_DIR.read_text())
-    assert payload["model"] == "test-model"
-    assert payload["dimensions"] is None
-    assert payload["data"]["python"] == [0.5, 0.6]
+def test_role_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path, role_max_entries=2)
+    cache.cache_store("backend engineer", [1.0, 0.0], type="role")
+    cache.cache_store("data engineer", [0.0, 1.0], type="role")
+
+    assert cache.cache_lookup("backend engineer", type="role") is not None
+    cache.cache_store("ml engineer", [1.0, 1.0], type="role")
+
+    assert cache.cache_lookup("data engineer", type="role") is None
+    assert cache.cache_lookup("backend engineer", type="role") is not None
+    stats = cache.role_cache_stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+
+
+def test_role_cache_byte_budget_survives_restart(tmp_path):
+    entry_bytes = len(role_cache_key("x")) + 2 * 4
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path, role_max_bytes=entry_bytes * 3)
+    for index in range(5):
+        cache.cache_store(f"role {index}", [float(index), 1.0], type="role")
+    assert cache.role_cache_stats()["bytes"] <= entry_bytes * 3
+    cache.close()
+
+    reloaded = EmbeddingCache("test-model", cache_dir=tmp_path, role_max_entries=2)
+
+    assert len(reloaded.role_cache) == 2
+    assert reloaded.cache_lookup("role 4", type="role").tolist() == pytest.approx([4.0, 1.0])
+
+
+def test_load_embeddings_cache_rekeys_legacy_role_text(tmp_path):
+    (tmp_path / "role_cache.json").write_text(json.dumps({"Backend Engineer at Example": [0.1, 0.2]}))
+
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
+
+    assert list(cache.role_cache) == [role_cache_key("Backend Engineer at Example")]
+    index = json.loads((tmp_path / "role_cache.index.json").read_text())
+    assert index["keys"] == [role_cache_key("Backend Engineer at Example")]
 
 
 def test_load_embeddings_cache_rejects_model_mismatch(tmp_path, caplog):
     payload = {"version": 1, "model": "other-model", "dimensions": 3, "data": {"x": [0.1]}}
-    role_file = tmp_path / "role_cache.json"
-    role_file.write_text(json.dumps(payload))
+    (tmp_path / "role_cache.json").write_text(json.dumps(payload))
 
-    cache = EmbeddingCache.__new__(EmbeddingCache)
-    cache._ROLE_EMB_CACHE_DIR = role_file
-    cache._SKILL_EMB_CACHE_DIR = tmp_path / "skill_cache.json"
-    cache.model = "test-model"
-    cache.dimensions = 3
-
-    cache.role_cache, cache.skill_cache = cache._load_embeddings_cache()
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path)
 
-    assert cache.role_cache == {}
+    assert len(cache.role_cache) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +262,35 @@ def test_embedding_rank_skills_orders_by_similarity(monkeypatch):
     assert ranked == ["high", "mid", "low"]
 
 
+def test_cosine_scores_on_int8_rows_match_full_precision():
+    from app.skill_selection.embedding_store import quantize_rows
+
+    rng = np.random.default_rng(7)
+    matrix = rng.normal(size=(20, 64)).astype(np.float32)
+    role = rng.normal(size=64).astype(np.float32)
+    role /= np.linalg.norm(role)
+    codes, _ = quantize_rows(matrix, "int8")
+
+    expected = (matrix @ role) / np.linalg.norm(matrix, axis=1)
+    assert cosine_scores(codes, role) == pytest.approx(expected, abs=0.01)
+    assert cosine_scores(np.zeros((1, 64), dtype=np.int8), role).tolist() == [0.0]
+
+
+def test_embedding_rank_skills_ranks_quantized_cache_rows(tmp_path, monkeypatch):
+    _disable_cache_writes(monkeypatch)
+    quantized = EmbeddingCache("test-model", cache_dir=tmp_path, skill_dtype="int8")
+    quantized.skill_cache["low"] = [0.0, 1.0]
+    quantized.skill_cache["high"] = [1.0, 0.0]
+    quantized.skill_cache["mid"] = [0.7071, 0.7071]
+    monkeypatch.setattr(embeddings.cache, "skill_cache", quantized.skill_cache)
+    monkeypatch.setattr(embeddings, "embed_skills", lambda _: pytest.fail("skills should be cached"))
+
+    ranked, details = embedding_rank_skills(skills=["low", "high", "mid"], role_vec=ROLE_VEC, dev_mode=True)
+
+    assert ranked == ["high", "mid", "low"]
+    assert details["mid"]["similarity"] == pytest.approx(0.7071, abs=1e-3)
+
+
 def test_embedding_rank_skills_top_n(monkeypatch):
     _disable_cache_writes(monkeypatch)
     monkeypatch.setattr(embeddings.cache, "skill_cache", {})
@@ -255,6 +320,19 @@ def test_embedding_rank_skills_length_mismatch_raises(monkeypatch):
         embedding_rank_skills(skills=["a", "b"], role_vec=ROLE_VEC)
 
 
+def test_embedding_rank_skills_ranks_failed_batch_last_without_caching(monkeypatch):
+    calls = []
+    monkeypatch.setattr(embeddings.cache, "skill_cache", {})
+    monkeypatch.setattr(embeddings.cache, "cache_store_many", lambda *args, **kwargs: calls.append((args, kwargs)))
+    monkeypatch.setattr(embeddings, "embed_skills", lambda texts: [None, [0.0, 1.0], [1.0, 0.0]])
+
+    ranked, details = embedding_rank_skills(skills=["Go", "Rust", "Python"], role_vec=ROLE_VEC, dev_mode=True)
+
+    assert ranked == ["Python", "Rust", "Go"]
+    assert details["Go"] == {"similarity": None, "normalized_skill": "go", "embedding_failed": True}
+    assert calls == [(({"rust": [0.0, 1.0], "python": [1.0, 0.0]},), {"type": "skill"})]
+
+
 def test_embedding_rank_skills_stable_tiebreak(monkeypatch):
     _disable_cache_writes(monkeypatch)
     monkeypatch.setattr(embeddings.cache, "skill_cache", {})
@@ -290,7 +368,7 @@ def test_embedding_select_skills_uses_role_cache(monkeypatch):
     _disable_cache_writes(monkeypatch)
     monkeypatch.setattr(embeddings.cache, "skill_cache", {})
     role_text = "backend engineer"
-    monkeypatch.setattr(embeddings.cache, "role_cache", {role_text: ROLE_VEC_2D})
+    monkeypatch.setattr(embeddings.cache, "role_cache", {role_cache_key(role_text): ROLE_VEC_2D})
     called = []
     monkeypatch.setattr(embeddings, "embed_role", lambda t: called.append(t) or ROLE_VEC_2D)
     monkeypatch.setattr(embeddings, "embed_skills", lambda skills: [[1.0, 0.0]] * len(skills))
@@ -430,7 +508,7 @@ def test_embedding_select_skills_stores_role_on_cache_miss(monkeypatch):
     calls = []
     monkeypatch.setattr(embeddings.cache, "role_cache", {})
     monkeypatch.setattr(embeddings.cache, "skill_cache", {})
-    monkeypatch.setattr(embeddings.cache, "cache_store", lambda *args, **kwargs: calls.append((args, kwargs)))
+    monkeypatch.setattr(embeddings.cache, "cache_store_many", lambda *args, **kwargs: calls.append((args, kwargs)))
     monkeypatch.setattr(embeddings, "embed_role", lambda _: ROLE_VEC_2D)
 
     embedding_select_skills(
@@ -440,13 +518,13 @@ def test_embedding_select_skills_stores_role_on_cache_miss(monkeypatch):
         concepts=[],
     )
 
-    assert any(args[0] == "backend engineer" and kwargs.get("type") == "role" for args, kwargs in calls)
+    assert any("backend engineer" in args[0] and kwargs.get("type") == "role" for args, kwargs in calls)
 
 
 def test_embedding_rank_skills_uses_cache_and_stores_missing(monkeypatch):
     calls = []
     monkeypatch.setattr(embeddings.cache, "skill_cache", {"python": [1.0, 0.0]})
-    monkeypatch.setattr(embeddings.cache, "cache_store", lambda *args, **kwargs: calls.append((args, kwargs)))
+    monkeypatch.setattr(embeddings.cache, "cache_store_many", lambda *args, **kwargs: calls.append((args, kwargs)))
 
     requested = []
     def fake_embed_skills(texts):
@@ -458,7 +536,7 @@ def test_embedding_rank_skills_uses_cache_and_stores_missing(monkeypatch):
     ranked, _ = embedding_rank_skills(skills=["Python", "Rust"], role_vec=ROLE_VEC)
     assert ranked
     assert requested == [["rust"]]
-    assert any(args[0] == "rust" and kwargs.get("type") == "skill" for args, kwargs in calls)
+    assert calls == [(({"rust": [0.0, 1.0]},), {"type": "skill"})]
 
 
 # ---------------------------------------------------------------------------
@@ -632,3 +710,44 @@ def test_embedding_select_skills_never_invents_skills(monkeypatch):
         for skill in result[cat]:
             assert skill in cat_input, f"skill '{skill}' in output but not in input for {cat}"
         assert len(result[cat]) <= 3
+
+
+# ---------------------------------------------------------------------------
+# vectorized ranking
+# ---------------------------------------------------------------------------
+
+def test_unit_rows_normalizes_to_float32_and_keeps_zero_rows():
+    matrix = embeddings.unit_rows([[3.0, 4.0], [0.0, 0.0]])
+
+    assert matrix.dtype == embeddings.np.float32
+    assert matrix[0].tolist() == pytest.approx([0.6, 0.8])
+    assert matrix[1].tolist() == [0.0, 0.0]
+
+
+def test_unit_role_vector_is_memoized_per_role_embedding():
+    role_vec = [3.0, 4.0]
+
+    first = embeddings.unit_role_vector(role_vec)
+    second = embeddings.unit_role_vector(role_vec)
+
+    assert first is second
+    assert embeddings.unit_role_vector([3.0, 4.0]) is not first
+
+
+def test_embedding_rank_skills_matches_pairwise_cosine(monkeypatch):
+    _disable_cache_writes(monkeypatch)
+    vectors = {
+        "python": [0.9, 0.1, 0.3],
+        "rust": [0.2, 0.8, 0.1],
+        "go": [0.5, 0.5, 0.5],
+        "zero": [0.0, 0.0, 0.0],
+    }
+    monkeypatch.setattr(embeddings.cache, "skill_cache", vectors)
+    role_vec = [1.0, 0.2, 0.4]
+
+    ranked, details = embedding_rank_skills(skills=list(vectors), role_vec=role_vec, dev_mode=True)
+
+    expected = sorted(vectors, key=lambda name: (-cosine_similarity(role_vec, vectors[name]), name))
+    assert ranked == expected
+    for name, vec in vectors.items():
+        assert details[name]["similarity"] == pytest.approx(cosine_similarity(role_vec, vec), abs=1e-6)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app import hedging
+from app.hedging import HedgedCreate, latency_windows
+from app.job_focus_generation import llm_client as job_focus_llm_client
+from app.job_focus_generation.llm_client import derive_job_focus_with_llm_async
+
+SUBSYSTEM = "hedge_test"
+
+
+def _usage(response):
+    return {
+        "prompt_tokens": response.prompt,
+        "completion_tokens": response.completion,
+        "total_tokens": response.prompt + response.completion,
+    }
+
+
+@pytest.fixture
+def hedge_settings(monkeypatch):
+    monkeypatch.setattr(hedging.settings, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(hedging.settings, "LLM_HEDGE_PERCENTILE", 0.5)
+    monkeypatch.setattr(hedging.settings, "LLM_HEDGE_MIN_SAMPLES", 3)
+    latency_windows.clear()
+    yield
+    latency_windows.clear()
+
+
+def _prime(subsystem: str, latency_ms: float = 20.0) -> None:
+    for _ in range(3):
+        latency_windows.observe(subsystem, latency_ms)
+
+
+class ScriptedCreate:
+    """Each call sleeps for the next scripted delay, then returns or raises."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self, **request):
+        delay, outcome = self.script[self.started]
+        self.started += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_hedge_delay_needs_enough_recent_samples(hedge_settings):
+    latency_windows.observe(SUBSYSTEM, 100.0)
+    latency_windows.observe(SUBSYSTEM, 300.0)
+    assert latency_windows.hedge_delay_ms(SUBSYSTEM) is None
+
+    latency_windows.observe(SUBSYSTEM, 200.0)
+    assert latency_windows.hedge_delay_ms(SUBSYSTEM) == 200.0
+
+
+def test_slow_call_is_hedged_and_the_loser_cancelled(hedge_settings):
+    _prime(SUBSYSTEM)
+    create = ScriptedCreate(
+        (5.0, SimpleNamespace(name="primary", prompt=100, completion=40)),
+        (0.0, SimpleNamespace(name="hedge", prompt=100, completion=30)),
+    )
+    hedged = HedgedCreate(create, subsystem=SUBSYSTEM, usage=_usage)
+
+    response = asyncio.run(asyncio.wait_for(hedged(model="m", input="x"), timeout=2))
+
+    assert response.name == "hedge"
+    assert create.started == 2
+    assert create.cancelled == 1
+    assert hedged.attempt_metadata() == {
+        "hedge": {
+            "winner": "hedge",
+            "delay_ms": 20.0,
+            "cancelled": True,
+            "estimated": True,
+            "prompt_tokens": 100,
+            "completion_tokens": 0,
+            "total_tokens": 100,
+        }
+    }
+
+
+def test_fast_call_and_disabled_policy_send_one_request(hedge_settings, monkeypatch):
+    _prime(SUBSYSTEM, latency_ms=500.0)
+    create = ScriptedCreate((0.0, SimpleNamespace(name="primary", prompt=1, completion=1)))
+    hedged = HedgedCreate(create, subsystem=SUBSYSTEM, usage=_usage)
+    assert asyncio.run(hedged(model="m")).name == "primary"
+    assert hedged.attempt_metadata() == {}
+
+    monkeypatch.setattr(hedging.settings, "LLM_HEDGE_ENABLED", False)
+    _prime(SUBSYSTEM, latency_ms=0.001)
+    create = ScriptedCreate((0.05, SimpleNamespace(name="primary", prompt=1, completion=1)))
+    hedged = HedgedCreate(create, subsystem=SUBSYSTEM, usage=_usage)
+    assert asyncio.run(hedged(model="m")).name == "primary"
+    assert create.started == 1
+
+
+def test_hedge_covers_a_primary_that_fails_after_it_fired(hedge_settings):
+    _prime(SUBSYSTEM)
+    create = ScriptedCreate(
+        (0.05, RuntimeError("primary failed")),
+        (0.2, SimpleNamespace(name="hedge", prompt=10, completion=5)),
+    )
+    hedged = HedgedCreate(create, subsystem=SUBSYSTEM, usage=_usage)
+
+    assert asyncio.run(hedged(model="m")).name == "hedge"
+    assert hedged.attempt_metadata()["hedge"]["failed"] is True
+
+    create = ScriptedCreate((0.05, RuntimeError("primary failed")), (0.1, RuntimeError("hedge failed")))
+    with pytest.raises(RuntimeError, match="primary failed"):
+        asyncio.run(HedgedCreate(create, subsystem=SUBSYSTEM, usage=_usage)(model="m"))
+
+
+def test_job_focus_records_both_hedged_requests_in_attempt_metadata(hedge_settings, monkeypatch):
+    job_focus = {
+        "summary": "Backend API work.",
+        "required_skills": ["Python"],
+        "preferred_skills": [],
+        "responsibilities": ["Build APIs"],
+        "domain_emphasis": [],
+        "resume_relevant_constraints": [],
+        "excluded_context": [],
+    }
+    delays = [1.0, 0.0]
+
+    class DummyAsyncResponses:
+        async def create(self, **_kwargs):
+            await asyncio.sleep(delays.pop(0))
+            return SimpleNamespace(
+                output_text=json.dumps(job_focus),
+                usage=SimpleNamespace(input_tokens=50, output_tokens=20, total_tokens=70),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(job_focus_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(job_focus_llm_client.settings, "OPENAI_API_KEY", "test-key")
+    _prime(job_focus_llm_client.METRICS_SUBSYSTEM)
+
+    result = asyncio.run(derive_job_focus_with_llm_async(title="Backend Engineer", description="Python APIs"))
+
+    assert result.job_focus.summary == "Backend API work."
+    attempt = result.metadata["attempts"][0]
+    assert attempt["total_tokens"] == 70
+    assert attempt["hedge"]["winner"] == "hedge"
+    assert attempt["hedge"]["prompt_tokens"] == 50
+    assert result.metadata["hedge_tokens"] == 50
+    assert result.metadata["total_tokens"] == 120
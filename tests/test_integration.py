@@ -3,9 +3,11 @@ import asyncio
 
 import httpx
 
+from app.skill_selection import selector as skill_selector
 from app.skill_selection.scoring import llm as llm_scorer
 from app.main import app
 from app.metrics import metrics
+from app.response_cache import ResponseCache
 from app.skill_selection.llm_client import LLMClientError, LLMScoreResult
 
 PAYLOAD = {
@@ -66,20 +68,24 @@ def test_metrics_lite_includes_total_tokens():
     assert isinstance(data["total_tokens"], int)
 
 
+def test_metrics_lite_includes_role_embedding_cache_counters():
+    role_stats = api_request("GET", "/metrics-lite").json()["embedding_cache"]["role"]
+    assert {"entries", "bytes", "max_entries", "max_bytes", "hits", "misses", "evictions"} <= set(role_stats)
+
+
 def test_select_skills_llm_method_returns_subset(monkeypatch):
     """The LLM method must preserve the API shape and subset invariant."""
-    monkeypatch.setattr(
-        llm_scorer,
-        "score_skills_with_llm",
-        lambda **_kwargs: LLMScoreResult(
+    async def fake_score_skills_with_llm(**_kwargs):
+        return LLMScoreResult(
             scores={
                 "technology": {"Docker": 3, "Redis": 2},
                 "programming": {"Python": 3, "Go": 2},
                 "concepts": {"API": 3, "Microservices": 2},
             },
             metadata={"model": "test-model", "api_calls": 1},
-        ),
-    )
+        )
+
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", fake_score_skills_with_llm)
 
     res = api_request(
         "POST",
@@ -96,10 +102,8 @@ def test_select_skills_llm_method_returns_subset(monkeypatch):
 
 def test_select_skills_llm_success_increments_total_tokens(monkeypatch):
     """Token usage should be counted even when details are not returned."""
-    monkeypatch.setattr(
-        llm_scorer,
-        "score_skills_with_llm",
-        lambda **_kwargs: LLMScoreResult(
+    async def fake_score_skills_with_llm(**_kwargs):
+        return LLMScoreResult(
             scores={
                 "technology": {"Docker": 3},
                 "programming": {"Python": 3},
@@ -112,8 +116,9 @@ def test_select_skills_llm_success_increments_total_tokens(monkeypatch):
                 "completion_tokens": 17,
                 "total_tokens": 37,
             },
-        ),
-    )
+        )
+
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", fake_score_skills_with_llm)
     before = api_request("GET", "/metrics-lite").json()
 
     res = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "llm", "dev_mode": False})
@@ -126,10 +131,10 @@ def test_select_skills_llm_success_increments_total_tokens(monkeypatch):
 
 def test_select_skills_llm_failure_falls_back_to_baseline(monkeypatch):
     """LLM scorer failures should return baseline output with a dev warning."""
-    def raise_client_error(**_kwargs):
+    async def raise_client_error(**_kwargs):
         raise LLMClientError("simulated outage")
 
-    monkeypatch.setattr(llm_scorer, "score_skills_with_llm", raise_client_error)
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", raise_client_error)
 
     res = api_request(
         "POST",
@@ -145,7 +150,7 @@ def test_select_skills_llm_failure_falls_back_to_baseline(monkeypatch):
 
 def test_select_skills_llm_fallback_counts_baseline_usage(monkeypatch):
     """Fallback responses should increment baseline usage, not the failed method."""
-    def raise_client_error(**_kwargs):
+    async def raise_client_error(**_kwargs):
         raise LLMClientError(
             "simulated outage",
             metadata={
@@ -161,7 +166,7 @@ def test_select_skills_llm_fallback_counts_baseline_usage(monkeypatch):
             },
         )
 
-    monkeypatch.setattr(llm_scorer, "score_skills_with_llm", raise_client_error)
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", raise_client_error)
     before = api_request("GET", "/metrics-lite").json()
 
     res = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "llm", "dev_mode": False})
@@ -174,6 +179,67 @@ def test_select_skills_llm_fallback_counts_baseline_usage(monkeypatch):
     assert after["method_usage"].get("llm", 0) == before["method_usage"].get("llm", 0)
 
 
+def test_select_skills_response_cache_serves_repeated_llm_requests(monkeypatch):
+    """Cached LLM selections ignore top_n/dev_mode in the key and skip token accounting."""
+    calls = []
+
+    async def fake_score_skills_with_llm(**kwargs):
+        calls.append(kwargs["job_role"])
+        return LLMScoreResult(
+            scores={
+                "technology": {"Docker": 3, "Python": 2, "Redis": 1},
+                "programming": {"Python": 3, "Go": 1},
+                "concepts": {"API": 3},
+            },
+            metadata={"model": "test-model", "api_calls": 1, "total_tokens": 37},
+        )
+
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", fake_score_skills_with_llm)
+    monkeypatch.setattr(skill_selector.settings, "SELECTION_CACHE_ENABLED", True)
+    monkeypatch.setattr(
+        skill_selector, "response_cache", ResponseCache(max_entries=8, ttl_seconds=60)
+    )
+    before = api_request("GET", "/metrics-lite").json()
+
+    first = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "llm", "top_n": 1, "dev_mode": False})
+    second = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "llm", "top_n": 2, "dev_mode": True})
+    other_role = api_request("POST", "/select-skills", json={**PAYLOAD, "job_role": "data", "method": "llm"})
+
+    assert [res.status_code for res in (first, second, other_role)] == [200, 200, 200]
+    assert calls == ["backend", "data"]
+    assert first.json()["technology"] == ["Docker"]
+    assert first.json()["details"] is None
+    assert second.json()["technology"] == ["Docker", "Python"]
+    assert second.json()["details"]["_response_cache"] == "hit"
+    after = api_request("GET", "/metrics-lite").json()
+    assert after["requests_total"] == before["requests_total"] + 3
+    assert after["total_tokens"] == before["total_tokens"] + 74
+    assert after["selection_cache"]["skill_selection"]["hits"] == 1
+    assert after["selection_cache"]["skill_selection"]["entries"] == 2
+
+
+def test_select_skills_response_cache_skips_baseline_fallbacks(monkeypatch):
+    calls = []
+
+    async def raise_client_error(**kwargs):
+        calls.append(kwargs["job_role"])
+        raise LLMClientError("simulated outage")
+
+    monkeypatch.setattr(llm_scorer, "score_skills_with_llm_async", raise_client_error)
+    monkeypatch.setattr(skill_selector.settings, "SELECTION_CACHE_ENABLED", True)
+    monkeypatch.setattr(
+        skill_selector, "response_cache", ResponseCache(max_entries=8, ttl_seconds=60)
+    )
+
+    for _ in range(2):
+        res = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "llm"})
+        assert res.status_code == 200
+        assert res.json()["details"]["_llm"]["fallback"] == "baseline"
+
+    assert calls == ["backend", "backend"]
+    assert len(skill_selector.response_cache) == 0
+
+
 def test_select_skills_unsupported_method_returns_400():
     res = api_request("POST", "/select-skills", json={**PAYLOAD, "method": "not-a-method"})
     assert res.status_code == 400
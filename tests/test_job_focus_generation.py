@@ -141,7 +141,7 @@ def test_derive_job_focus_with_llm_requires_api_key(monkeypatch):
 
 
 def test_derive_job_focus_api_success_with_details(monkeypatch):
-    def fake_generate(**_kwargs):
+    async def fake_generate(**_kwargs):
         return LLMJobFocusResult(
             job_focus=_job_focus(),
             metadata={
@@ -154,7 +154,7 @@ def test_derive_job_focus_api_success_with_details(monkeypatch):
             },
         )
 
-    monkeypatch.setattr(job_focus_service, "derive_job_focus_with_llm", fake_generate)
+    monkeypatch.setattr(job_focus_service, "derive_job_focus_with_llm_async", fake_generate)
 
     response = api_request(
         "POST",
@@ -174,12 +174,12 @@ def test_derive_job_focus_api_success_with_details(monkeypatch):
 
 
 def test_derive_job_focus_api_returns_502_on_llm_failure(monkeypatch):
-    def raise_client_error(**_kwargs):
+    async def raise_client_error(**_kwargs):
         raise JobFocusLLMClientError("network down")
 
     monkeypatch.setattr(
         job_focus_service,
-        "derive_job_focus_with_llm",
+        "derive_job_focus_with_llm_async",
         raise_client_error,
     )
 
@@ -191,3 +191,95 @@ def test_derive_job_focus_api_returns_502_on_llm_failure(monkeypatch):
 
     assert response.status_code == 502
     assert "network down" in response.json()["detail"]
+
+
+def test_concurrent_job_focus_requests_overlap_on_one_event_loop(monkeypatch):
+    in_flight: list[str] = []
+    release = asyncio.Event()
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            in_flight.append(json.loads(kwargs["input"])["job"]["title"])
+            await release.wait()
+            return SimpleNamespace(
+                output_text=_job_focus().model_dump_json(),
+                usage=SimpleNamespace(input_tokens=20, output_tokens=10, total_tokens=30),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(job_focus_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(job_focus_llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    async def _requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            pending = [
+                asyncio.create_task(client.post("/derive-job-focus", json={"title": title}))
+                for title in ("Backend Engineer", "Data Engineer")
+            ]
+
+            async def _both_waiting():
+                while len(in_flight) < 2:
+                    await asyncio.sleep(0.01)
+
+            # Both LLM calls are awaiting their responses at once, and the loop still serves /health.
+            await asyncio.wait_for(_both_waiting(), timeout=5)
+            health = await client.get("/health")
+            release.set()
+            return health, await asyncio.gather(*pending)
+
+    health, responses = asyncio.run(_requests())
+
+    assert sorted(in_flight) == ["Backend Engineer", "Data Engineer"]
+    assert health.status_code == 200
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_identical_concurrent_job_focus_requests_share_one_llm_call(monkeypatch):
+    calls: list[str] = []
+    release = asyncio.Event()
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            calls.append(json.loads(kwargs["input"])["job"]["title"])
+            await release.wait()
+            return SimpleNamespace(
+                output_text=_job_focus().model_dump_json(),
+                usage=SimpleNamespace(input_tokens=20, output_tokens=10, total_tokens=30),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(job_focus_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(job_focus_llm_client.settings, "OPENAI_API_KEY", "test-key")
+    bucket = job_focus_service.metrics.job_focus_generation
+    coalesced_before, saved_before = bucket.coalesced_total, bucket.tokens_saved
+    tokens_before = bucket.total_tokens
+
+    async def _requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            pending = [
+                asyncio.create_task(client.post("/derive-job-focus", json={"title": "Backend Engineer"}))
+                for _ in range(3)
+            ]
+            while len(job_focus_service._in_flight) == 0 or not calls:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*pending)
+
+    responses = asyncio.run(_requests())
+
+    assert calls == ["Backend Engineer"]
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert len({response.text for response in responses}) == 1
+    assert bucket.coalesced_total - coalesced_before == 2
+    assert bucket.tokens_saved - saved_before == 60
+    assert bucket.total_tokens - tokens_before == 30
+    assert len(job_focus_service._in_flight) == 0
@@ -0,0 +1,84 @@
+import pytest
+
+from app.skill_selection.scoring import keyword_index
+from app.skill_selection.scoring.baseline import rank_skills, score_skill
+from app.skill_selection.scoring.keyword_index import (
+    EMPTY_KEYWORD_INDEX,
+    ROLE_KEYWORD_INDEXES,
+    build_keyword_index,
+    get_keyword_index,
+)
+
+
+def test_role_keyword_indexes_built_for_every_profile_and_category():
+    for role_family in keyword_index.ROLE_PROFILES:
+        for category in keyword_index.CATEGORIES:
+            assert (role_family, category) in ROLE_KEYWORD_INDEXES
+
+
+def test_get_keyword_index_returns_shared_instance():
+    assert get_keyword_index("backend", "technology") is get_keyword_index("backend", "technology")
+
+
+def test_get_keyword_index_unknown_role_falls_back_to_general():
+    assert get_keyword_index("unknown-role", "technology") is ROLE_KEYWORD_INDEXES[("general", "technology")]
+
+
+def test_get_keyword_index_unknown_category_is_empty():
+    assert get_keyword_index("backend", "unknown") is EMPTY_KEYWORD_INDEX
+
+
+def test_keyword_index_is_immutable():
+    index = build_keyword_index({"fastapi"})
+
+    with pytest.raises(TypeError):
+        index.postings[("django",)] = frozenset({"django"})  # type: ignore[index]
+
+
+def test_keyword_index_pretokenizes_keywords_with_aliases():
+    index = build_keyword_index({"aws lambda"})
+
+    assert index.keyword_tokens["aws lambda"] == ("amazon", "web", "services", "lambda")
+    assert index.postings[("lambda",)] == frozenset({"aws lambda"})
+
+
+def test_keyword_index_strong_matches_both_containment_directions():
+    index = build_keyword_index({"rest api", "docker", "machine learning"})
+
+    assert index.strong_matches("docker compose") == ["docker"]
+    assert index.strong_matches("api") == ["rest api"]
+    assert index.strong_matches("docker") == ["docker"]
+    assert index.strong_matches("dock") == []
+
+
+def test_keyword_index_partial_matches_use_raw_substring():
+    index = build_keyword_index({"postgresql", "sql"})
+
+    assert index.partial_matches("gres") == ["postgresql"]
+    assert index.partial_matches("") == []
+
+
+def test_score_skill_accepts_precompiled_index():
+    index = build_keyword_index({"fastapi"})
+
+    score, details = score_skill("FastAPI", "frontend", "technology", index=index)
+
+    assert score == 3.0
+    assert details["matched_keywords"] == ["fastapi"]
+
+
+def test_rank_skills_builds_no_index_per_skill(monkeypatch):
+    calls = []
+    original = keyword_index.get_keyword_index
+
+    def counting_get_keyword_index(role_family, category):
+        calls.append((role_family, category))
+        return original(role_family, category)
+
+    from app.skill_selection.scoring import baseline
+
+    monkeypatch.setattr(baseline, "get_keyword_index", counting_get_keyword_index)
+
+    rank_skills(["Python", "Docker", "FastAPI", "Go"], "backend", "technology")
+
+    assert calls == [("backend", "technology")]
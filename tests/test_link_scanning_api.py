@@ -66,7 +66,7 @@ def _request_payload(**overrides) -> dict:
 def test_enrich_link_evidence_api_returns_llm_highlight_patch_with_details(monkeypatch):
     captured = {}
 
-    def fake_scan_evidence_links_with_llm(**kwargs):
+    async def fake_scan_evidence_links_with_llm(**kwargs):
         captured.update(kwargs)
         return LLMLinkScanResult(
             highlights=[
@@ -85,7 +85,7 @@ def test_enrich_link_evidence_api_returns_llm_highlight_patch_with_details(monke
         )
 
     monkeypatch.setattr(
-        "app.link_scanning.service.scan_evidence_links_with_llm",
+        "app.link_scanning.service.scan_evidence_links_with_llm_async",
         fake_scan_evidence_links_with_llm,
     )
 
@@ -117,7 +117,7 @@ def test_enrich_link_evidence_api_returns_llm_highlight_patch_with_details(monke
 def test_enrich_link_evidence_api_accepts_experience_records(monkeypatch):
     captured = {}
 
-    def fake_scan_evidence_links_with_llm(**kwargs):
+    async def fake_scan_evidence_links_with_llm(**kwargs):
         captured.update(kwargs)
         return LLMLinkScanResult(
             highlights=[],
@@ -125,7 +125,7 @@ def test_enrich_link_evidence_api_accepts_experience_records(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "app.link_scanning.service.scan_evidence_links_with_llm",
+        "app.link_scanning.service.scan_evidence_links_with_llm_async",
         fake_scan_evidence_links_with_llm,
     )
 
@@ -164,14 +164,14 @@ def test_enrich_link_evidence_api_rejects_legacy_project_payload():
 
 
 def test_enrich_link_evidence_api_omits_details_when_dev_mode_false(monkeypatch):
-    def fake_scan_evidence_links_with_llm(**_kwargs):
+    async def fake_scan_evidence_links_with_llm(**_kwargs):
         return LLMLinkScanResult(
             highlights=[],
             metadata={"model": "test-model", "api_calls": 1, "total_tokens": 0},
         )
 
     monkeypatch.setattr(
-        "app.link_scanning.service.scan_evidence_links_with_llm",
+        "app.link_scanning.service.scan_evidence_links_with_llm_async",
         fake_scan_evidence_links_with_llm,
     )
 
@@ -184,7 +184,7 @@ def test_enrich_link_evidence_api_omits_details_when_dev_mode_false(monkeypatch)
 def test_enrich_link_evidence_api_passes_llm_overrides(monkeypatch):
     captured = {}
 
-    def fake_scan_evidence_links_with_llm(**kwargs):
+    async def fake_scan_evidence_links_with_llm(**kwargs):
         captured.update(kwargs)
         return LLMLinkScanResult(
             highlights=[],
@@ -192,7 +192,7 @@ def test_enrich_link_evidence_api_passes_llm_overrides(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "app.link_scanning.service.scan_evidence_links_with_llm",
+        "app.link_scanning.service.scan_evidence_links_with_llm_async",
         fake_scan_evidence_links_with_llm,
     )
 
@@ -215,11 +215,11 @@ def test_enrich_link_evidence_api_passes_llm_overrides(monkeypatch):
 
 
 def test_enrich_link_evidence_api_returns_502_when_llm_fails(monkeypatch):
-    def fake_scan_evidence_links_with_llm(**_kwargs):
+    async def fake_scan_evidence_links_with_llm(**_kwargs):
         raise LinkScanningLLMClientError("web scan failed")
 
     monkeypatch.setattr(
-        "app.link_scanning.service.scan_evidence_links_with_llm",
+        "app.link_scanning.service.scan_evidence_links_with_llm_async",
         fake_scan_evidence_links_with_llm,
     )
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from types import SimpleNamespace
 
@@ -15,6 +16,7 @@ from app.link_scanning.llm_client import (
     classify_link_scan_target,
     resolve_link_scan_max_output_tokens,
     scan_evidence_links_with_llm,
+    scan_evidence_links_with_llm_async,
 )
 from resume_evidence.models import ExperienceRecord, ProjectRecord, ProjectSkills
 
@@ -556,3 +558,21 @@ def test_scan_evidence_links_with_llm_requires_api_key(monkeypatch):
             evidence_type="project",
             evidence=_project(),
         )
+
+
+def test_scan_evidence_links_with_llm_async_skips_evidence_without_links(monkeypatch):
+    def fail_async_openai(**_kwargs):
+        raise AssertionError("no client is needed without links")
+
+    monkeypatch.setattr(link_llm_client, "AsyncOpenAI", fail_async_openai)
+    monkeypatch.setattr(link_llm_client.settings, "OPENAI_API_KEY", "")
+
+    result = asyncio.run(
+        scan_evidence_links_with_llm_async(
+            evidence_type="project",
+            evidence=_project().model_copy(update={"links": []}),
+        )
+    )
+
+    assert result.highlights == []
+    assert result.metadata["api_calls"] == 0
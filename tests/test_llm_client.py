@@ -1,3 +1,4 @@
+import asyncio
 import json
 from types import SimpleNamespace
 
@@ -8,6 +9,7 @@ from app.skill_selection.llm_client import (
     LLMClientError,
     _extract_output_text,
     score_skills_with_llm,
+    score_skills_with_llm_async,
 )
 
 
@@ -319,3 +321,82 @@ def test_score_skills_with_llm_wraps_openai_errors(monkeypatch):
             programming=[],
             concepts=[],
         )
+
+
+def test_score_skills_with_llm_async_sends_the_sync_request(monkeypatch):
+    captured = {}
+    response = SimpleNamespace(
+        output_text='{"technology":{"React":3},"programming":{},"concepts":{}}',
+        usage=SimpleNamespace(input_tokens=12, output_tokens=8, total_tokens=20),
+    )
+
+    class DummyResponses:
+        def create(self, **kwargs):
+            captured["sync"] = kwargs
+            return response
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            captured["async"] = kwargs
+            return response
+
+    class DummyOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyResponses()
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(llm_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(llm_client.settings, "OPENAI_API_KEY", "test-key")
+    inputs = {
+        "job_role": "Frontend Engineer",
+        "job_text": None,
+        "technology": ["React"],
+        "programming": [],
+        "concepts": [],
+    }
+
+    sync_result = score_skills_with_llm(**inputs)
+    async_result = asyncio.run(score_skills_with_llm_async(**inputs))
+
+    assert captured["async"] == captured["sync"]
+    assert async_result.scores == sync_result.scores
+    assert async_result.metadata["total_tokens"] == 20
+
+
+def test_score_skills_with_llm_async_retries_and_wraps_errors(monkeypatch):
+    calls = []
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            calls.append(kwargs["max_output_tokens"])
+            if len(calls) == 1:
+                return SimpleNamespace(output_text='{"technology":', usage=None)
+            raise RuntimeError("connection reset")
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(llm_client.settings, "OPENAI_API_KEY", "test-key")
+
+    with pytest.raises(LLMClientError, match="connection reset") as exc_info:
+        asyncio.run(
+            score_skills_with_llm_async(
+                job_role="Frontend Engineer",
+                job_text=None,
+                technology=["React"],
+                programming=[],
+                concepts=[],
+                max_output_tokens=500,
+            )
+        )
+
+    assert calls == [500, 3000]
+    attempts = exc_info.value.metadata["attempts"]
+    assert attempts[0]["error"].startswith("LLM response was not valid JSON")
+    assert attempts[1]["error"] == "LLM request failed: connection reset"
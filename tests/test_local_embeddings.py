@@ -0,0 +1,91 @@
+"""Unit tests for the offline hashed n-gram embedding provider."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.skill_selection import embedding_client
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.local_embeddings import HashedNgramEmbedder
+from app.skill_selection.scoring import embeddings
+
+
+def test_hashed_ngram_embedder_is_deterministic_unit_length():
+    first = HashedNgramEmbedder(64).embed(["Python", "distributed systems"])
+    second = HashedNgramEmbedder(64).embed(["Python", "distributed systems"])
+
+    assert first.shape == (2, 64)
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), [1.0, 1.0], rtol=1e-6)
+
+
+def test_hashed_ngram_embedder_returns_zero_row_for_text_without_tokens():
+    assert not HashedNgramEmbedder(32).embed(["---"]).any()
+
+
+def test_hashed_ngram_embedder_scores_lexical_overlap_higher():
+    embedder = HashedNgramEmbedder()
+    role, python, react = embedder.embed(["backend engineer python services", "python", "react"])
+
+    assert float(role @ python) > float(role @ react)
+
+
+def test_hashed_ngram_embedder_rejects_non_positive_dimensions():
+    with pytest.raises(ValueError, match="greater than 0"):
+        HashedNgramEmbedder(0)
+
+
+def _use_local_provider(monkeypatch, dimensions=128):
+    monkeypatch.setattr(
+        embedding_client,
+        "settings",
+        SimpleNamespace(EMBEDDING_PROVIDER="local", LOCAL_EMBEDDING_DIMENSIONS=dimensions, EMBEDDING_MODEL="unused"),
+    )
+
+    def fail_openai(**_kwargs):
+        raise AssertionError("local provider must not call the OpenAI API")
+
+    monkeypatch.setattr(embedding_client, "OpenAI", fail_openai)
+
+
+def test_local_provider_embeds_without_openai_and_namespaces_cache(monkeypatch):
+    _use_local_provider(monkeypatch)
+
+    role_vec = embedding_client.embed_role("backend engineer")
+    skill_vecs = embedding_client.embed_skills(["python", "rust"])
+
+    assert role_vec.shape == (128,)
+    assert len(skill_vecs) == 2
+    assert embedding_client.embedding_cache_namespace() == "local-hashed-ngram-v1-128"
+
+
+def test_non_persistent_cache_never_touches_disk(tmp_path):
+    cache = EmbeddingCache("local-hashed-ngram-v1-128", cache_dir=tmp_path / "local", persist=False)
+
+    with cache.write_batch():
+        cache.cache_store_many({"python": [1.0, 0.0]}, type="skill")
+    cache.close()
+
+    assert cache.cache_lookup_many(["python", "rust"], type="skill") == [[1.0, 0.0], None]
+    assert not (tmp_path / "local").exists()
+
+
+def test_embedding_select_skills_runs_offline_with_local_provider(monkeypatch, tmp_path):
+    _use_local_provider(monkeypatch)
+    monkeypatch.setattr(embeddings, "embed_role", embedding_client.embed_role)
+    monkeypatch.setattr(embeddings, "embed_skills", embedding_client.embed_skills)
+    monkeypatch.setattr(embeddings, "cache", EmbeddingCache("local-test", cache_dir=tmp_path, persist=False))
+
+    selected, details = embeddings.embedding_select_skills(
+        job_role="Backend Engineer",
+        job_text="Build Python services on Kubernetes.",
+        technology=["Kubernetes", "Figma"],
+        programming=["Python", "Swift"],
+        concepts=[],
+        dev_mode=True,
+    )
+
+    assert selected["technology"] == ["Kubernetes", "Figma"]
+    assert selected["programming"] == ["Python", "Swift"]
+    assert details["technology"]["Kubernetes"]["similarity"] > details["technology"]["Figma"]["similarity"]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app import model_scheduler as model_scheduler_module
+from app.model_scheduler import (
+    ModelScheduler,
+    estimate_request_tokens,
+    model_call_priority,
+    model_scheduler,
+    scheduled_call,
+    scheduled_call_async,
+)
+from app.openai_clients import run_response_exchange
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    def set_limits(*, rpm=None, tpm=None, per_model=None, reserve=0.0):
+        monkeypatch.setattr(model_scheduler_module.settings, "OPENAI_RPM_LIMIT", rpm)
+        monkeypatch.setattr(model_scheduler_module.settings, "OPENAI_TPM_LIMIT", tpm)
+        monkeypatch.setattr(model_scheduler_module.settings, "OPENAI_MODEL_RATE_LIMITS", per_model or {})
+        monkeypatch.setattr(model_scheduler_module.settings, "OPENAI_INTERACTIVE_RESERVE", reserve)
+
+    return set_limits
+
+
+def test_estimate_request_tokens_covers_prompt_and_output_budget():
+    assert estimate_request_tokens({"instructions": "a" * 40, "input": "b" * 40, "max_output_tokens": 100}) == 121
+    assert estimate_request_tokens({"input": ["x" * 8, "y" * 8], "model": "embed"}) == 5
+
+
+def test_unlimited_models_are_admitted_without_queueing(limits):
+    limits()
+    scheduler = ModelScheduler(clock=FakeClock())
+
+    for _ in range(3):
+        reservation = scheduler.acquire("m", 10_000)
+        assert reservation.wait_ms == 0
+
+    snapshot = scheduler.snapshot()
+    assert snapshot["priorities"]["interactive"]["calls"] == 3
+    assert snapshot["priorities"]["interactive"]["waited"] == 0
+    assert snapshot["models"] == {}
+
+
+def test_over_budget_calls_wait_for_refill_and_settle_refunds_unused_tokens(limits, monkeypatch):
+    limits(tpm=600, per_model={"small": {"tpm": 60}})
+    clock = FakeClock()
+    scheduler = ModelScheduler(clock=clock)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(model_scheduler_module.asyncio, "sleep", fake_sleep)
+
+    first = scheduler.acquire("m", 500)
+    scheduler.settle(first, used_tokens=100)
+    # 400 unused tokens came back, so a second 500-token call still fits.
+    scheduler.acquire("m", 500)
+
+    # The bucket is empty and refills at 10 tokens/s: a 300-token call waits 30 s
+    # instead of failing.
+    reservation = asyncio.run(scheduler.acquire_async("m", 300))
+    assert reservation.wait_ms == pytest.approx(30_000, rel=0.05)
+
+    snapshot = scheduler.snapshot()
+    assert snapshot["priorities"]["interactive"]["waited"] == 1
+    assert snapshot["priorities"]["interactive"]["queued"] == 0
+    assert snapshot["priorities"]["interactive"]["max_queued"] == 1
+    assert snapshot["models"]["m"] == {"rpm": None, "tpm": 600, "queued": 0}
+
+    # Per-model overrides replace the default; oversized calls go through once full.
+    assert scheduler.acquire("small", 1_000).wait_ms == 0
+    assert scheduler.snapshot()["models"]["small"]["tpm"] == 60
+
+
+def test_failed_calls_return_their_reserved_output_budget(limits, monkeypatch):
+    limits(tpm=600)
+    clock = FakeClock()
+    scheduler = ModelScheduler(clock=clock)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(model_scheduler_module, "model_scheduler", scheduler)
+    monkeypatch.setattr(model_scheduler_module.asyncio, "sleep", fake_sleep)
+    request = {"model": "m", "input": "x" * 40, "max_output_tokens": 500}
+
+    def create(**_request):
+        raise ConnectionError("connection reset")
+
+    async def create_async(**_request):
+        raise ConnectionError("connection reset")
+
+    with pytest.raises(ConnectionError):
+        scheduled_call(create, request)
+    with pytest.raises(ConnectionError):
+        asyncio.run(scheduled_call_async(create_async, request))
+
+    # Each failure keeps only its 11 estimated prompt tokens, so 578 tokens are free.
+    assert asyncio.run(scheduler.acquire_async("m", 578)).wait_ms == 0
+
+
+def test_interactive_calls_are_admitted_before_queued_batch_calls(limits):
+    limits(rpm=1)
+    clock = FakeClock()
+    scheduler = ModelScheduler(clock=clock)
+    scheduler.acquire("m", 1)
+
+    async def scenario():
+        order = []
+
+        async def call(priority):
+            await scheduler.acquire_async("m", 1, priority=priority)
+            order.append(priority)
+
+        batch = asyncio.create_task(call("batch"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("interactive"))
+        await asyncio.sleep(0)
+        assert scheduler.snapshot()["models"]["m"]["queued"] == 2
+
+        clock.now += 60
+        await asyncio.wait({batch, interactive}, return_when=asyncio.FIRST_COMPLETED)
+        assert order == ["interactive"]
+
+        clock.now += 60
+        await asyncio.wait_for(batch, timeout=5)
+        return order
+
+    assert asyncio.run(scenario()) == ["interactive", "batch"]
+
+
+def test_batch_calls_leave_the_interactive_reserve(limits, monkeypatch):
+    limits(tpm=600, reserve=0.5)
+    clock = FakeClock()
+    scheduler = ModelScheduler(clock=clock)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(model_scheduler_module.asyncio, "sleep", fake_sleep)
+    scheduler.acquire("m", 400)
+
+    # 200 tokens left: interactive may use 100 at once, batch must leave 300 behind.
+    assert scheduler.acquire("m", 100, priority="interactive").wait_ms == 0
+    reservation = asyncio.run(scheduler.acquire_async("m", 100, priority="batch"))
+    assert reservation.wait_ms == pytest.approx(30_000, rel=0.05)
+
+
+def test_exchange_driver_schedules_each_call_at_the_context_priority(limits):
+    limits()
+    before = model_scheduler.snapshot()["priorities"]
+
+    def exchange():
+        response = yield {"model": "m", "input": "hello", "max_output_tokens": 10}
+        return response.output_text
+
+    def create(**request):
+        return SimpleNamespace(output_text="ok", usage=SimpleNamespace(total_tokens=12))
+
+    assert run_response_exchange(exchange(), create) == "ok"
+    with model_call_priority("batch"):
+        assert run_response_exchange(exchange(), create) == "ok"
+
+    after = model_scheduler.snapshot()["priorities"]
+    assert after["interactive"]["calls"] - before["interactive"]["calls"] == 1
+    assert after["batch"]["calls"] - before["batch"]["calls"] == 1
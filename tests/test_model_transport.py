@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai.types import CreateEmbeddingResponse
+from openai.types.responses import Response
+
+from app import model_transport as model_transport_module
+from app.main import app
+from app.job_focus_generation import llm_client as job_focus_llm_client
+from app.job_focus_generation.llm_client import (
+    JobFocusLLMClientError,
+    derive_job_focus_with_llm,
+    derive_job_focus_with_llm_async,
+)
+from app.model_transport import CassetteMissError, cassette_key, model_transport
+from app.skill_selection import embedding_client
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.scoring import embeddings
+
+JOB_FOCUS = {
+    "summary": "Backend API work.",
+    "required_skills": ["Python"],
+    "preferred_skills": [],
+    "responsibilities": ["Build APIs"],
+    "domain_emphasis": [],
+    "resume_relevant_constraints": [],
+    "excluded_context": [],
+}
+
+
+def _response(text: str) -> Response:
+    return Response.model_validate(
+        {
+            "id": "resp_1",
+            "created_at": 0,
+            "model": "test-model",
+            "object": "response",
+            "output": [
+                {
+                    "type": "message",
+                    "id": "msg_1",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                }
+            ],
+            "parallel_tool_calls": False,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": 40,
+                "output_tokens": 25,
+                "total_tokens": 65,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens_details": {"reasoning_tokens": 0},
+            },
+        }
+    )
+
+
+@pytest.fixture
+def cassette(monkeypatch, tmp_path):
+    def set_mode(mode: str, *, replay_latency: bool = False):
+        monkeypatch.setattr(model_transport_module.settings, "LLM_CASSETTE_MODE", mode)
+        monkeypatch.setattr(model_transport_module.settings, "LLM_CASSETTE_REPLAY_LATENCY", replay_latency)
+
+    monkeypatch.setattr(model_transport_module.settings, "LLM_CASSETTE_DIR", tmp_path)
+    monkeypatch.setattr(job_focus_llm_client.settings, "OPENAI_API_KEY", "test-key")
+    return set_mode
+
+
+def _job_focus_openai(calls: list):
+    class DummyResponses:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            return _response(json.dumps(JOB_FOCUS))
+
+    class DummyOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyResponses()
+
+    return DummyOpenAI
+
+
+def test_cassette_key_ignores_kwarg_order():
+    assert cassette_key("responses", {"model": "m", "input": "x"}) == cassette_key(
+        "responses", {"input": "x", "model": "m"}
+    )
+    assert cassette_key("responses", {"input": "x"}) != cassette_key("embeddings", {"input": "x"})
+
+
+def test_recorded_llm_exchange_replays_offline(cassette, monkeypatch, tmp_path):
+    calls: list = []
+    monkeypatch.setattr(job_focus_llm_client, "OpenAI", _job_focus_openai(calls))
+
+    cassette("record")
+    recorded = derive_job_focus_with_llm(title="Backend Engineer", description="Python APIs")
+
+    assert len(calls) == 1
+    [path] = (tmp_path / "responses").glob("*.json")
+    recording = json.loads(path.read_text())
+    assert recording["request"] == calls[0]
+    assert recording["usage"]["total_tokens"] == 65
+    assert recording["latency_ms"] >= 0
+
+    cassette("replay")
+    replayed = derive_job_focus_with_llm(title="Backend Engineer", description="Python APIs")
+
+    assert len(calls) == 1
+    assert replayed.job_focus == recorded.job_focus
+    assert replayed.metadata["total_tokens"] == 65
+
+
+def api_request(method: str, path: str, **kwargs):
+    async def _request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(_request())
+
+
+def test_replay_serves_api_requests_without_an_api_key(cassette, monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(job_focus_llm_client, "OpenAI", _job_focus_openai(calls))
+    cassette("record")
+    recorded = derive_job_focus_with_llm(title="Backend Engineer", description="Python APIs")
+
+    class OfflineAsyncResponses:
+        async def create(self, **kwargs):
+            raise AssertionError("replay must not reach the API")
+
+    class OfflineAsyncOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = OfflineAsyncResponses()
+
+    monkeypatch.setattr(job_focus_llm_client, "AsyncOpenAI", OfflineAsyncOpenAI)
+    monkeypatch.setattr(job_focus_llm_client.settings, "OPENAI_API_KEY", "")
+    cassette("replay")
+
+    response = api_request(
+        "POST", "/derive-job-focus", json={"title": "Backend Engineer", "description": "Python APIs"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["job_focus"] == recorded.job_focus.model_dump()
+    assert len(calls) == 1
+
+
+def test_embedding_replay_miss_is_a_service_error_not_a_500(cassette, monkeypatch):
+    monkeypatch.setattr(embeddings, "cache", EmbeddingCache("test-model", persist=False))
+    monkeypatch.setattr(embedding_client.settings, "EMBEDDING_PROVIDER", "openai")
+    monkeypatch.setattr(embedding_client.settings, "OPENAI_API_KEY", "")
+    cassette("replay")
+
+    response = api_request(
+        "POST",
+        "/select-skills",
+        json={
+            "job_role": "Backend Engineer",
+            "method": "embeddings",
+            "technology": ["Django"],
+            "programming": ["Python"],
+            "concepts": ["API"],
+        },
+    )
+
+    assert response.status_code == 503
+    assert "No embeddings recording" in response.json()["detail"]
+
+
+def test_replay_miss_fails_like_a_request_error(cassette, monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(job_focus_llm_client, "OpenAI", _job_focus_openai(calls))
+    cassette("replay")
+
+    with pytest.raises(JobFocusLLMClientError, match="No responses recording"):
+        derive_job_focus_with_llm(title="Never recorded", description=None)
+    assert calls == []
+
+
+def test_async_replay_injects_recorded_latency(cassette, monkeypatch, tmp_path):
+    calls: list = []
+    monkeypatch.setattr(job_focus_llm_client, "OpenAI", _job_focus_openai(calls))
+    cassette("record")
+    derive_job_focus_with_llm(title="Backend Engineer", description="Python APIs")
+    [path] = (tmp_path / "responses").glob("*.json")
+    recording = json.loads(path.read_text())
+    recording["latency_ms"] = 1500.0
+    path.write_text(json.dumps(recording))
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(model_transport_module.asyncio, "sleep", fake_sleep)
+    cassette("replay", replay_latency=True)
+    result = asyncio.run(derive_job_focus_with_llm_async(title="Backend Engineer", description="Python APIs"))
+
+    assert result.job_focus.summary == "Backend API work."
+    assert sleeps == [1.5]
+
+
+def test_embeddings_record_and_replay(cassette, monkeypatch):
+    calls: list = []
+
+    class DummyEmbeddings:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            return CreateEmbeddingResponse.model_validate(
+                {
+                    "data": [{"embedding": [0.1, 0.2], "index": 0, "object": "embedding"}],
+                    "model": kwargs["model"],
+                    "object": "list",
+                    "usage": {"prompt_tokens": 3, "total_tokens": 3},
+                }
+            )
+
+    class DummyOpenAI:
+        def __init__(self, **_kwargs):
+            self.embeddings = DummyEmbeddings()
+
+    monkeypatch.setattr(embedding_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(embedding_client.settings, "EMBEDDING_PROVIDER", "openai")
+
+    cassette("record")
+    assert embedding_client.embed_role("role text") == [0.1, 0.2]
+    cassette("replay")
+    assert embedding_client.embed_role("role text") == [0.1, 0.2]
+    assert len(calls) == 1
+    with pytest.raises(CassetteMissError):
+        model_transport.send(DummyEmbeddings().create, {"input": "other", "model": "m"}, endpoint="embeddings")
+
+
+def test_streamed_call_replays_a_recording_as_stream_events(cassette, monkeypatch):
+    from app.model_scheduler import scheduled_stream_async
+
+    request = {"model": "test-model", "input": "hello", "max_output_tokens": 50}
+    text = json.dumps({"bullet_points": ["Built APIs."]})
+    cassette("record")
+
+    async def create(**kwargs):
+        assert kwargs.pop("stream") is True
+        assert kwargs == request
+
+        async def events():
+            yield type("Delta", (), {"type": "response.output_text.delta", "delta": text})()
+            yield type("Done", (), {"type": "response.completed", "response": _response(text)})()
+
+        return events()
+
+    async def collect(create_fn):
+        return [event async for event in scheduled_stream_async(create_fn, request)]
+
+    recorded = asyncio.run(collect(create))
+
+    async def unreachable(**_kwargs):
+        raise AssertionError("replay must not call the API")
+
+    cassette("replay")
+    replayed = asyncio.run(collect(unreachable))
+
+    assert [event.type for event in recorded] == [event.type for event in replayed]
+    assert replayed[0].delta == text
+    assert replayed[1].response.usage.total_tokens == 65
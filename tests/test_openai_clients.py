@@ -0,0 +1,179 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app import openai_clients as openai_clients_module
+from app.openai_clients import (
+    REPLAY_API_KEY,
+    OpenAIClientRegistry,
+    get_openai_client,
+    openai_api_key,
+    run_response_exchange,
+    run_response_exchange_async,
+)
+
+
+class RecordingClient:
+    created: list[dict] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+        RecordingClient.created.append(kwargs)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_recording_client():
+    RecordingClient.created = []
+
+
+def test_registry_reuses_client_per_api_key_and_base_url():
+    registry = OpenAIClientRegistry()
+
+    first = registry.get("key-a", factory=RecordingClient)
+    again = registry.get("key-a", factory=RecordingClient)
+    other_key = registry.get("key-b", factory=RecordingClient)
+    other_url = registry.get("key-a", base_url="http://localhost:8080/v1", factory=RecordingClient)
+
+    assert first is again
+    assert len({id(first), id(other_key), id(other_url)}) == 3
+    assert len(RecordingClient.created) == 3
+    assert other_url.kwargs["base_url"] == "http://localhost:8080/v1"
+    assert "base_url" not in first.kwargs
+    registry.close()
+
+
+def test_registry_clients_share_a_tuned_keep_alive_pool(monkeypatch):
+    monkeypatch.setattr(openai_clients_module.settings, "OPENAI_MAX_CONNECTIONS", 7)
+    monkeypatch.setattr(openai_clients_module.settings, "OPENAI_MAX_KEEPALIVE_CONNECTIONS", 3)
+    registry = OpenAIClientRegistry()
+
+    client = registry.get("key-a", factory=RecordingClient)
+
+    pool = client.kwargs["http_client"]._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    registry.close()
+
+
+def test_registry_close_releases_clients_and_pools():
+    registry = OpenAIClientRegistry()
+    client = registry.get("key-a", factory=RecordingClient)
+    http_client = client.kwargs["http_client"]
+
+    registry.close()
+
+    assert client.closed is True
+    assert http_client.is_closed
+    assert len(registry) == 0
+    assert registry.get("key-a", factory=RecordingClient) is not client
+    registry.close()
+
+
+def test_registry_closes_pool_when_factory_fails():
+    registry = OpenAIClientRegistry()
+    pools = []
+
+    def failing_factory(**kwargs):
+        pools.append(kwargs["http_client"])
+        raise RuntimeError("bad config")
+
+    with pytest.raises(RuntimeError, match="bad config"):
+        registry.get("key-a", factory=failing_factory)
+
+    assert pools[0].is_closed
+    assert len(registry) == 0
+
+
+def test_get_openai_client_defaults_to_configured_base_url(monkeypatch):
+    registry = OpenAIClientRegistry()
+    monkeypatch.setattr(openai_clients_module, "openai_clients", registry)
+    monkeypatch.setattr(openai_clients_module.settings, "OPENAI_BASE_URL", "http://proxy.internal/v1")
+
+    client = get_openai_client("key-a", factory=RecordingClient)
+
+    assert client.kwargs["base_url"] == "http://proxy.internal/v1"
+    assert get_openai_client("key-a", factory=RecordingClient) is client
+    registry.close()
+
+
+@pytest.mark.parametrize(
+    ("key", "mode", "expected"),
+    [
+        ("sk-live", "replay", "sk-live"),
+        ("  ", "off", ""),
+        ("", "record", ""),
+        ("", "replay", REPLAY_API_KEY),
+    ],
+)
+def test_openai_api_key_is_optional_only_in_replay(monkeypatch, key, mode, expected):
+    monkeypatch.setattr(openai_clients_module.settings, "OPENAI_API_KEY", key)
+    monkeypatch.setattr(openai_clients_module.settings, "LLM_CASSETTE_MODE", mode)
+
+    assert openai_api_key() == expected
+
+
+def test_registry_shares_async_clients_per_event_loop():
+    registry = OpenAIClientRegistry()
+
+    async def _clients():
+        first = registry.get_async("key-a", factory=RecordingClient)
+        assert registry.get_async("key-a", factory=RecordingClient) is first
+        return first
+
+    first_loop = asyncio.run(_clients())
+    second_loop = asyncio.run(_clients())
+
+    assert first_loop is not second_loop
+    assert isinstance(second_loop.kwargs["http_client"], httpx.AsyncClient)
+    # The client bound to the closed first loop was dropped when the second was created.
+    assert len(registry) == 1
+
+
+def test_registry_aclose_closes_sync_and_async_pools():
+    registry = OpenAIClientRegistry()
+    sync_client = registry.get("key-a", factory=RecordingClient)
+
+    async def _run():
+        async_client = registry.get_async("key-a", factory=RecordingClient)
+        await registry.aclose()
+        return async_client
+
+    async_client = asyncio.run(_run())
+
+    assert sync_client.closed is True
+    assert sync_client.kwargs["http_client"].is_closed
+    assert async_client.closed is True
+    assert async_client.kwargs["http_client"].is_closed
+    assert len(registry) == 0
+
+
+def _retrying_exchange(log: list):
+    try:
+        first = yield {"attempt": 1}
+    except RuntimeError as exc:
+        log.append(f"error: {exc}")
+        first = None
+    second = yield {"attempt": 2, "previous": first}
+    return second
+
+
+def test_run_response_exchange_feeds_responses_and_errors_back():
+    def create(**kwargs):
+        if kwargs["attempt"] == 1:
+            raise RuntimeError("timeout")
+        return f"response {kwargs['attempt']}"
+
+    async def create_async(**kwargs):
+        return create(**kwargs)
+
+    sync_log: list = []
+    async_log: list = []
+
+    assert run_response_exchange(_retrying_exchange(sync_log), create) == "response 2"
+    assert asyncio.run(run_response_exchange_async(_retrying_exchange(async_log), create_async)) == "response 2"
+    assert sync_log == async_log == ["error: timeout"]
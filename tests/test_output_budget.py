@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app import output_budget as output_budget_module
+from app.output_budget import OutputBudgetModel, input_size_bucket
+from app.skill_selection import llm_client
+from app.skill_selection.llm_client import build_prompt_payload, score_skills_with_llm
+
+
+def _attempts(*completion_tokens: int, prompt_tokens: int = 100) -> list[dict]:
+    return [
+        {"attempt": index, "prompt_tokens": prompt_tokens, "completion_tokens": tokens}
+        for index, tokens in enumerate(completion_tokens, start=1)
+    ]
+
+
+@pytest.fixture
+def adaptive_settings(monkeypatch):
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_ADAPTIVE", True)
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_PERCENTILE", 0.9)
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_HEADROOM", 1.25)
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_MIN_SAMPLES", 4)
+
+
+def test_input_size_bucket_groups_powers_of_two():
+    assert [input_size_bucket(size) for size in (0, 1, 2, 3, 4, 5, 8, 9)] == [0, 0, 1, 2, 2, 3, 3, 4]
+
+
+def test_budget_uses_default_until_enough_samples_then_percentile(adaptive_settings):
+    model = OutputBudgetModel()
+    request = {"subsystem": "skill_selection", "model": "m", "input_size": 1000}
+
+    for tokens in (800, 1000, 1200):
+        model.observe(**request, attempts=_attempts(tokens), succeeded=True)
+    assert model.budget(**request, default=500) == 500
+
+    for tokens in (900, 1100, 1300, 1400, 1500, 1600, 2000):
+        model.observe(**request, attempts=_attempts(tokens), succeeded=True)
+    # 90th percentile of ten samples is the 9th smallest (1600), times 1.25 headroom.
+    assert model.budget(**request, default=500) == 2000
+    assert model.budget(**request, default=3000) == 3000
+    assert model.budget(**{**request, "input_size": 4000}, default=500) == 500
+    assert model.budget(**{**request, "model": "other"}, default=500) == 500
+
+
+def test_budget_is_static_when_adaptive_sizing_is_off(adaptive_settings, monkeypatch):
+    model = OutputBudgetModel()
+    for _ in range(10):
+        model.observe(
+            subsystem="skill_selection", model="m", input_size=10, attempts=_attempts(5000), succeeded=True
+        )
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_ADAPTIVE", False)
+
+    assert model.budget(subsystem="skill_selection", model="m", input_size=10, default=1200) == 1200
+
+
+def test_observe_counts_retries_and_resent_prompt_tokens():
+    model = OutputBudgetModel()
+    request = {"subsystem": "bulletpoints_generation", "model": "m", "input_size": 10}
+
+    model.observe(**request, attempts=_attempts(700), succeeded=True)
+    model.observe(**request, attempts=_attempts(3000, 900, prompt_tokens=250), succeeded=True)
+    model.observe(**request, attempts=_attempts(3000, 6000, prompt_tokens=250), succeeded=False)
+
+    assert model.snapshot()["bulletpoints_generation"] == {
+        "exchanges": 3,
+        "first_attempt_successes": 1,
+        "retries": 2,
+        "retry_prompt_tokens": 500,
+        "retry_rate": 0.6667,
+        "buckets": 1,
+    }
+
+
+def test_samples_persist_to_path(tmp_path, adaptive_settings):
+    path = tmp_path / "budgets" / "output_budget.json"
+    model = OutputBudgetModel(path=path, max_samples=4)
+    for tokens in (3000, 2000, 2000, 2000, 2000):
+        model.observe(
+            subsystem="skill_selection", model="m", input_size=10, attempts=_attempts(tokens), succeeded=True
+        )
+    model.save()
+
+    reloaded = OutputBudgetModel(path=path, max_samples=4)
+    # Only the four most recent samples were kept, so the 3000-token outlier is gone.
+    assert reloaded.budget(subsystem="skill_selection", model="m", input_size=10, default=1) == 2500
+
+    path.write_text("not json", encoding="utf-8")
+    assert OutputBudgetModel(path=path).budget(
+        subsystem="skill_selection", model="m", input_size=10, default=1
+    ) == 1
+
+
+@pytest.mark.parametrize(("adaptive", "expected_calls"), [(False, 2), (True, 1)])
+def test_learned_budget_avoids_truncated_first_attempt(monkeypatch, adaptive_settings, adaptive, expected_calls):
+    needed_tokens = 2400
+    budgets_sent: list[int] = []
+
+    class DummyResponses:
+        def create(self, **kwargs):
+            budgets_sent.append(kwargs["max_output_tokens"])
+            if kwargs["max_output_tokens"] < needed_tokens:
+                output_text, output_tokens = '{"technology":{"Re', kwargs["max_output_tokens"]
+            else:
+                output_text, output_tokens = '{"technology":{"React":3},"programming":{},"concepts":{}}', needed_tokens
+            return SimpleNamespace(
+                output_text=output_text,
+                usage=SimpleNamespace(input_tokens=50, output_tokens=output_tokens, total_tokens=50 + output_tokens),
+            )
+
+    class DummyOpenAI:
+        def __init__(self, **_kwargs):
+            self.responses = DummyResponses()
+
+    model = OutputBudgetModel()
+    prompt_size = len(
+        build_prompt_payload(job_role="Frontend Engineer", job_text=None, technology=["React"], programming=[], concepts=[])
+    )
+    for _ in range(4):
+        model.observe(
+            subsystem="skill_selection",
+            model="test-model",
+            input_size=prompt_size,
+            attempts=_attempts(needed_tokens),
+            succeeded=True,
+        )
+    monkeypatch.setattr(llm_client, "output_budgets", model)
+    monkeypatch.setattr(llm_client, "OpenAI", DummyOpenAI)
+    monkeypatch.setattr(llm_client.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llm_client.settings, "SKILL_LLM_MODEL", "test-model")
+    monkeypatch.setattr(llm_client.settings, "SKILL_LLM_MAX_OUTPUT_TOKENS", 1200)
+    monkeypatch.setattr(output_budget_module.settings, "OUTPUT_BUDGET_ADAPTIVE", adaptive)
+
+    result = score_skills_with_llm(
+        job_role="Frontend Engineer",
+        job_text=None,
+        technology=["React"],
+        programming=[],
+        concepts=[],
+    )
+
+    assert result.metadata["api_calls"] == expected_calls
+    assert budgets_sent[0] == (3000 if adaptive else 1200)
+    stats = model.snapshot()["skill_selection"]
+    assert stats["retries"] == (0 if adaptive else 1)
+    assert stats["retry_prompt_tokens"] == (0 if adaptive else 50)
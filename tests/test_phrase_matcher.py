@@ -0,0 +1,76 @@
+from app.skill_selection.scoring.keyword_index import (
+    VOCABULARY_MATCHER,
+    job_text_phrases,
+    job_text_tokens,
+    phrase_tokens,
+)
+from app.skill_selection.scoring.phrase_matcher import PhraseMatcher
+
+
+def test_phrase_matcher_finds_overlapping_and_nested_phrases():
+    matcher = PhraseMatcher(
+        [
+            (("machine", "learning"), "ml"),
+            (("learning",), "learning"),
+            (("deep", "learning"), "dl"),
+        ]
+    )
+
+    assert matcher.find(("deep", "machine", "learning")) == {"ml", "learning"}
+    assert matcher.find(("deep", "learning")) == {"dl", "learning"}
+
+
+def test_phrase_matcher_requires_full_token_runs():
+    matcher = PhraseMatcher([(("rest", "api"), "rest api")])
+
+    assert matcher.find(("rest", "apis")) == set()
+    assert matcher.find(("rest", "and", "api")) == set()
+    assert matcher.find(("build", "rest", "api", "services")) == {"rest api"}
+
+
+def test_phrase_matcher_follows_failure_links():
+    matcher = PhraseMatcher([(("a", "b", "c"), "abc"), (("b", "d"), "bd")])
+
+    assert matcher.find(("a", "b", "d")) == {"bd"}
+
+
+def test_phrase_matcher_iter_matches_reports_end_positions():
+    matcher = PhraseMatcher([(("docker",), "docker")])
+
+    assert list(matcher.iter_matches(("docker", "and", "docker"))) == [(0, "docker"), (2, "docker")]
+
+
+def test_phrase_matcher_ignores_empty_patterns():
+    matcher = PhraseMatcher([((), "empty")])
+
+    assert matcher.pattern_count == 0
+    assert matcher.find(("anything",)) == set()
+
+
+def test_vocabulary_matcher_maps_synonym_phrases_to_canonical_form():
+    found = VOCABULARY_MATCHER.find(phrase_tokens("deployed on amazon cloud"))
+
+    assert phrase_tokens("amazon web services") in found
+
+
+def test_job_text_phrases_matches_known_and_unknown_skills():
+    job_text = "We use Postgres, AWS and an in-house Zephyrflow scheduler."
+
+    found = job_text_phrases(job_text, ["PostgreSQL", "Amazon Web Services", "Zephyrflow", "Kafka"])
+
+    assert found == {
+        phrase_tokens("postgresql"),
+        phrase_tokens("amazon web services"),
+        phrase_tokens("zephyrflow"),
+    }
+
+
+def test_job_text_phrases_without_job_text_is_empty():
+    assert job_text_phrases(None, ["Python"]) == frozenset()
+    assert job_text_phrases("", ["Python"]) == frozenset()
+
+
+def test_job_text_tokens_drop_ambiguous_words_in_prose():
+    assert job_text_tokens("we go on a rest day") == ("we", "", "on", "a", "", "day")
+    assert job_text_tokens("Ship Go services over REST") == ("ship", "go", "services", "over", "restful", "api")
+    assert job_text_phrases("We go the extra mile; take a rest.", ["Go", "REST"]) == frozenset()
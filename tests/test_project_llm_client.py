@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from types import SimpleNamespace
 
@@ -8,7 +9,11 @@ import pytest
 from app.project_selection import ProjectCandidate, ProjectJobContext
 from resume_evidence.models import ProjectSkills
 from app.project_selection import llm_client as project_llm_client
-from app.project_selection.llm_client import ProjectLLMClientError, score_projects_with_llm
+from app.project_selection.llm_client import (
+    ProjectLLMClientError,
+    score_projects_with_llm,
+    score_projects_with_llm_async,
+)
 
 
 def _candidate(project_id: str, name: str) -> ProjectCandidate:
@@ -121,3 +126,36 @@ def test_score_projects_with_llm_requires_api_key(monkeypatch):
             context=ProjectJobContext(title="Backend Engineer"),
             candidates=[_candidate("jobforge", "JobForge")],
         )
+
+
+def test_score_projects_with_llm_async_uses_async_client(monkeypatch):
+    captured = {}
+
+    class DummyAsyncResponses:
+        async def create(self, **kwargs):
+            captured["kwargs"] = kwargs
+            return SimpleNamespace(
+                output_text='{"jobforge":2}',
+                usage=SimpleNamespace(input_tokens=4, output_tokens=2, total_tokens=6),
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, **kwargs):
+            captured["init"] = kwargs
+            self.responses = DummyAsyncResponses()
+
+    monkeypatch.setattr(project_llm_client, "AsyncOpenAI", DummyAsyncOpenAI)
+    monkeypatch.setattr(project_llm_client.settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(project_llm_client.settings, "PROJ_LLM_MODEL", "test-model")
+
+    result = asyncio.run(
+        score_projects_with_llm_async(
+            context=ProjectJobContext(title="Backend Engineer", description="Build APIs."),
+            candidates=[_candidate("jobforge", "JobForge")],
+        )
+    )
+
+    assert captured["init"]["api_key"] == "test-key"
+    assert captured["kwargs"]["model"] == "test-model"
+    assert result.scores == {"jobforge": 2}
+    assert result.metadata["total_tokens"] == 6
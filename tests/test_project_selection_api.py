@@ -6,6 +6,7 @@ from app.main import app
 from app.project_selection import llm as project_llm
 from app.project_selection import service as project_service
 from app.project_selection.llm_client import LLMProjectScoreResult, ProjectLLMClientError
+from app.response_cache import ResponseCache
 
 
 def api_request(method: str, path: str, **kwargs):
@@ -107,10 +108,10 @@ def test_select_projects_api_rejects_unsupported_method():
 
 
 def test_select_projects_api_llm_fallback_returns_baseline(monkeypatch):
-    def raise_client_error(**_kwargs):
+    async def raise_client_error(**_kwargs):
         raise ProjectLLMClientError("network down")
 
-    monkeypatch.setattr(project_llm, "score_projects_with_llm", raise_client_error)
+    monkeypatch.setattr(project_llm, "score_projects_with_llm_async", raise_client_error)
 
     response = api_request("POST", "/select-projects", json=_request_payload(method="llm"))
 
@@ -124,10 +125,8 @@ def test_select_projects_api_llm_fallback_returns_baseline(monkeypatch):
 def test_select_projects_api_records_project_metrics_and_tokens(monkeypatch):
     before = api_request("GET", "/metrics-lite").json()
 
-    monkeypatch.setattr(
-        project_llm,
-        "score_projects_with_llm",
-        lambda **_kwargs: LLMProjectScoreResult(
+    async def fake_score_projects_with_llm(**_kwargs):
+        return LLMProjectScoreResult(
             scores={"jobforge": 3, "portfolio": 1},
             metadata={
                 "model": "test-model",
@@ -137,8 +136,9 @@ def test_select_projects_api_records_project_metrics_and_tokens(monkeypatch):
                 "total_tokens": 13,
                 "latency_ms": 1.2,
             },
-        ),
-    )
+        )
+
+    monkeypatch.setattr(project_llm, "score_projects_with_llm_async", fake_score_projects_with_llm)
 
     response = api_request("POST", "/select-projects", json=_request_payload(method="llm"))
 
@@ -154,6 +154,45 @@ def test_select_projects_api_records_project_metrics_and_tokens(monkeypatch):
     assert project_metrics["method_usage"].get("llm", 0) == before_project_metrics["method_usage"].get("llm", 0) + 1
 
 
+def test_select_projects_api_response_cache_reuses_llm_rankings(monkeypatch):
+    calls = []
+
+    async def fake_score_projects_with_llm(**kwargs):
+        calls.append(kwargs["context"].title)
+        if kwargs["context"].title == "Flaky":
+            raise ProjectLLMClientError("network down")
+        return LLMProjectScoreResult(
+            scores={"jobforge": 3, "portfolio": 1},
+            metadata={"model": "test-model", "api_calls": 1, "total_tokens": 13},
+        )
+
+    monkeypatch.setattr(project_llm, "score_projects_with_llm_async", fake_score_projects_with_llm)
+    monkeypatch.setattr(project_service.settings, "SELECTION_CACHE_ENABLED", True)
+    monkeypatch.setattr(
+        project_service, "response_cache", ResponseCache(max_entries=8, ttl_seconds=60)
+    )
+    before = api_request("GET", "/metrics-lite").json()["subsystems"]["project_selection"]
+
+    first = api_request("POST", "/select-projects", json=_request_payload(method="llm", top_n=1))
+    second = api_request(
+        "POST", "/select-projects", json=_request_payload(method="llm", top_n=None, dev_mode=False)
+    )
+    flaky = _request_payload(method="llm", context={"title": "Flaky"})
+    fallbacks = [api_request("POST", "/select-projects", json=flaky) for _ in range(2)]
+
+    assert first.json()["selected_project_ids"] == ["jobforge"]
+    assert "_response_cache" not in first.json()["details"]
+    assert second.json()["selected_project_ids"] == ["jobforge", "portfolio"]
+    assert second.json()["details"] is None
+    assert all(res.json()["details"]["_fallback_method"] == "baseline" for res in fallbacks)
+    assert calls == ["Backend Engineer", "Flaky", "Flaky"]
+
+    after = api_request("GET", "/metrics-lite").json()
+    assert after["subsystems"]["project_selection"]["total_tokens"] == before["total_tokens"] + 13
+    assert after["selection_cache"]["project_selection"]["hits"] == 1
+    assert after["selection_cache"]["project_selection"]["entries"] == 1
+
+
 def test_select_projects_api_records_project_errors():
     before = api_request("GET", "/metrics-lite").json()
 
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from app.response_cache import ResponseCache, is_baseline_fallback
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_response_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("key", {"skills": ["Python"]})
+
+    clock.now = 9.9
+    assert cache.get("key") == {"skills": ["Python"]}
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.snapshot()["expirations"] == 1
+    assert cache.snapshot()["hits"] == 1
+    assert cache.snapshot()["misses"] == 1
+
+
+def test_response_cache_evicts_least_recently_used_entries():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.snapshot()["evictions"] == 1
+
+
+def test_response_cache_returns_copies():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    value = {"skills": ["Python"]}
+    cache.put("key", value)
+    value["skills"].append("Go")
+    cache.get("key")["skills"].append("Rust")
+
+    assert cache.get("key") == {"skills": ["Python"]}
+
+
+@pytest.mark.parametrize(
+    ("details", "expected"),
+    [
+        (None, False),
+        ({"_llm": {"total_tokens": 10}}, False),
+        ({"_fallback_method": "baseline"}, True),
+        ({"_llm": {"fallback": "baseline"}}, True),
+        ({"_project_llm": {"fallback": "baseline"}}, True),
+    ],
+)
+def test_is_baseline_fallback(details, expected):
+    assert is_baseline_fallback(details) is expected
@@ -62,7 +62,10 @@ from resume_generation.main import (
     write_resume_pdf_from_config,
     write_resume_result_artifact,
 )
-from resume_generation.token_usage import extract_response_token_usage
+from resume_generation.token_usage import (
+    ResumeGenerationTokenUsageMonitor,
+    extract_response_token_usage,
+)
 from resume_evidence import load_evidence_yaml
 
 
@@ -1301,6 +1304,103 @@ def test_project_bullet_cache_reuses_when_count_is_inside_requested_range(
     assert len(second_result[0].bullet_points) == 3
 
 
+def test_batched_project_bullets_share_per_record_cache_with_single_requests(
+    monkeypatch,
+    tmp_path,
+):
+    cache = ResumeGenerationStageCache(tmp_path / "cache")
+    batch_config_payload = _config_payload()
+    batch_config_payload["project_bullet_point_generation"]["batch_size"] = 5
+    batch_config = load_generation_config(
+        _write_yaml(tmp_path / "batch-config.yaml", batch_config_payload)
+    )
+    single_config = load_generation_config(
+        _write_yaml(tmp_path / "config.yaml", _config_payload())
+    )
+    job_target = load_job_target(_write_yaml(tmp_path / "job.yaml", _job_target_payload()))
+    projects_path = _write_yaml(tmp_path / "projects.yaml", _projects_payload())
+    skills_path = _write_yaml(tmp_path / "skills.yaml", _skills_payload())
+    projects_by_id = _loaded_evidence(projects_path, skills_path)["projects"].projects_by_id()
+    requests: list[tuple[str, dict]] = []
+
+    class FakeClient:
+        def __init__(self, *, base_url: str, timeout: float):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return None
+
+        def post(self, endpoint: str, json: dict):
+            requests.append((endpoint, json))
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "evidence_type": "project",
+                            "evidence_id": record["project"]["id"],
+                            "bullet_points": [
+                                f"First bullet for {record['project']['id']}.",
+                                f"Second bullet for {record['project']['id']}.",
+                            ],
+                            "details": {"batched": True},
+                        }
+                        for record in json["records"]
+                    ],
+                    "details": {"_bulletpoints_llm": {"total_tokens": 30, "api_calls": 1}},
+                },
+            )
+
+    monkeypatch.setattr("resume_generation.bullet_points.httpx.Client", FakeClient)
+
+    generate_project_bullet_points(
+        selected_projects=[projects_by_id["active-project"]],
+        config=batch_config,
+        job_target=job_target,
+        cache=cache,
+    )
+    token_usage_monitor = ResumeGenerationTokenUsageMonitor()
+    stage_response_records: list[dict] = []
+    batch_result = generate_project_bullet_points(
+        selected_projects=[projects_by_id["active-project"], projects_by_id["inactive-project"]],
+        config=batch_config,
+        job_target=job_target,
+        cache=cache,
+        token_usage_monitor=token_usage_monitor,
+        stage_response_records=stage_response_records,
+    )
+    single_result = generate_project_bullet_points(
+        selected_projects=[projects_by_id["active-project"], projects_by_id["inactive-project"]],
+        config=single_config,
+        job_target=job_target,
+        cache=cache,
+    )
+
+    assert [endpoint for endpoint, _ in requests] == [
+        "/generate-bulletpoints/batch",
+        "/generate-bulletpoints/batch",
+    ]
+    second_payload = requests[1][1]
+    assert [record["project"]["id"] for record in second_payload["records"]] == [
+        "inactive-project"
+    ]
+    assert second_payload["records"][0]["bullet_count_range"] == {"min": 2, "max": 4}
+    assert second_payload["context"]["title"] == "Backend Engineer"
+    assert "batch_size" not in second_payload
+    assert [(record["source"], record["namespace"]) for record in stage_response_records] == [
+        ("cache", "active-project"),
+        ("http", "inactive-project"),
+    ]
+    assert token_usage_monitor.stage_total("project_bullet_points").total_tokens == 30
+    assert [item.project_id for item in batch_result] == ["active-project", "inactive-project"]
+    assert [item.bullet_points for item in single_result] == [
+        item.bullet_points for item in batch_result
+    ]
+
+
 def test_project_bullet_cache_refreshes_when_count_is_outside_requested_range(
     monkeypatch,
     tmp_path,
@@ -4044,9 +4144,12 @@ def api_request(method: str, path: str, **kwargs):
 
 
 def test_generate_bulletpoints_route_logs_http_source(monkeypatch, caplog):
+    async def fake_generate_bulletpoints_service(payload):
+        return BulletGenerationResponse(bullet_points=["Built APIs."])
+
     monkeypatch.setattr(
-        "app.main.generate_bulletpoints_service",
-        lambda payload: BulletGenerationResponse(bullet_points=["Built APIs."]),
+        "app.main.generate_bulletpoints_service_async",
+        fake_generate_bulletpoints_service,
     )
 
     with caplog.at_level(logging.INFO, logger="app_main"):
@@ -4080,7 +4183,7 @@ def test_generate_bulletpoints_route_logs_http_source(monkeypatch, caplog):
 def test_skill_selection_api_uses_request_llm_overrides(monkeypatch, caplog):
     captured: dict = {}
 
-    def fake_score_skills_with_llm(**kwargs):
+    async def fake_score_skills_with_llm(**kwargs):
         captured.update(kwargs)
         return LLMScoreResult(
             scores={
@@ -4092,7 +4195,7 @@ def test_skill_selection_api_uses_request_llm_overrides(monkeypatch, caplog):
         )
 
     monkeypatch.setattr(
-        "app.skill_selection.scoring.llm.score_skills_with_llm",
+        "app.skill_selection.scoring.llm.score_skills_with_llm_async",
         fake_score_skills_with_llm,
     )
 
@@ -4128,7 +4231,7 @@ def test_skill_selection_api_uses_request_llm_overrides(monkeypatch, caplog):
 def test_project_selection_api_uses_request_llm_overrides(monkeypatch):
     captured: dict = {}
 
-    def fake_score_projects_with_llm(**kwargs):
+    async def fake_score_projects_with_llm(**kwargs):
         captured.update(kwargs)
         return LLMProjectScoreResult(
             scores={"jobforge": 3},
@@ -4136,7 +4239,7 @@ def test_project_selection_api_uses_request_llm_overrides(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "app.project_selection.llm.score_projects_with_llm",
+        "app.project_selection.llm.score_projects_with_llm_async",
         fake_score_projects_with_llm,
     )
 
@@ -0,0 +1,193 @@
+"""Tests for the nearest-neighbour skill index and POST /skills/similar."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
+import pytest
+
+from app import main
+from app.main import app
+from app.skill_selection import similar_skills
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.local_embeddings import HashedNgramEmbedder
+from app.skill_selection.models import SimilarSkillsRequest, SimilarSkillsResponse
+from app.skill_selection.scoring import embeddings
+from app.skill_selection.similar_skills import similar_skills_service
+from app.skill_selection.similarity_index import BruteForceIndex, IVFIndex, SkillIndexCache, build_index
+from scripts import discover_synonyms
+
+SKILLS = ["kubernetes", "k8s", "docker", "python", "python3", "react", "reactjs", "postgresql", "go"]
+
+
+def api_request(method: str, path: str, **kwargs):
+    async def _request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(_request())
+
+
+@pytest.fixture
+def local_skill_cache(tmp_path, monkeypatch):
+    embedder = HashedNgramEmbedder(128)
+    cache = EmbeddingCache("test-model", cache_dir=tmp_path, skill_dtype="int8")
+    cache.cache_store_many(dict(zip(SKILLS, embedder.embed(SKILLS))), type="skill")
+    embedded = []
+
+    def fake_embed_role(text):
+        embedded.append(text)
+        return embedder.embed([text])[0]
+
+    monkeypatch.setattr(embeddings, "cache", cache)
+    monkeypatch.setattr(embeddings, "embed_role", fake_embed_role)
+    monkeypatch.setattr(similar_skills, "skill_index", SkillIndexCache())
+    monkeypatch.setattr(similar_skills, "_query_vectors", similar_skills.OrderedDict())
+    return cache, embedded
+
+
+def _unit(rows):
+    return embeddings.unit_rows(rows)
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+def test_brute_force_index_returns_nearest_rows_in_order():
+    keys = ["x", "diag", "y", "neg"]
+    index = BruteForceIndex(keys, np.array([[1, 0], [1, 1], [0, 1], [-1, 0]], dtype=np.float32))
+
+    neighbors = index.search(_unit([1.0, 0.2])[0], 2)
+
+    assert [key for key, _ in neighbors] == ["x", "diag"]
+    assert neighbors[0][1] == pytest.approx(0.9806, abs=1e-4)
+    assert [key for key, _ in index.search(_unit([1.0, 0.2])[0], 2, exclude=frozenset({"x"}))] == ["diag", "y"]
+
+
+def test_ivf_index_matches_brute_force_on_clustered_vectors():
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(16, 32))
+    matrix = (np.repeat(centers, 50, axis=0) + rng.normal(scale=0.05, size=(800, 32))).astype(np.float32)
+    keys = [f"skill-{row}" for row in range(len(matrix))]
+    exact = BruteForceIndex(keys, matrix)
+    approximate = IVFIndex(keys, matrix, n_lists=16, probes=2)
+
+    for query_row in (0, 123, 555):
+        query = _unit(matrix[query_row])[0]
+        assert approximate.search(query, 5) == exact.search(query, 5)
+    assert sum(len(rows) for rows in approximate.lists) == len(keys)
+
+
+def test_build_index_switches_to_ivf_at_threshold():
+    matrix = np.eye(4, dtype=np.float32)
+
+    assert build_index(list("abcd"), matrix, ivf_threshold=5).kind == "brute_force"
+    assert build_index(list("abcd"), matrix, ivf_threshold=4).kind == "ivf"
+
+
+def test_index_cache_rebuilds_only_when_store_changes(local_skill_cache):
+    cache, _ = local_skill_cache
+    index_cache = SkillIndexCache()
+
+    first = index_cache.get(cache.skill_cache, ivf_threshold=1000, probes=1)
+    assert index_cache.get(cache.skill_cache, ivf_threshold=1000, probes=1) is first
+    assert first.matrix.dtype == np.int8
+
+    cache.cache_store("rust", [1.0] * 128, type="skill")
+    rebuilt = index_cache.get(cache.skill_cache, ivf_threshold=1000, probes=1)
+    assert rebuilt is not first
+    assert "rust" in rebuilt.keys
+
+
+def test_index_cache_rebuilds_ivf_off_the_request_path(local_skill_cache):
+    cache, _ = local_skill_cache
+    index_cache = SkillIndexCache()
+
+    first = index_cache.get(cache.skill_cache, ivf_threshold=1, probes=1)
+    assert first.kind == "ivf"
+
+    cache.cache_store("rust", [1.0] * 128, type="skill")
+    assert index_cache.get(cache.skill_cache, ivf_threshold=1, probes=1) is first
+
+    index_cache.join()
+    rebuilt = index_cache.get(cache.skill_cache, ivf_threshold=1, probes=1)
+    assert rebuilt is not first
+    assert "rust" in rebuilt.keys
+
+
+# ---------------------------------------------------------------------------
+# Service and API
+# ---------------------------------------------------------------------------
+
+def test_similar_skills_reuses_cached_skill_vector(local_skill_cache):
+    _, embedded = local_skill_cache
+
+    response = similar_skills_service(SimilarSkillsRequest(text="ReactJS", k=2, dev_mode=True))
+
+    assert response.normalized_query == "react"
+    assert response.results[0].skill == "reactjs"
+    assert "react" not in [result.skill for result in response.results]
+    assert response.details == {"index": "brute_force", "indexed_skills": len(SKILLS), "query_source": "skill_cache"}
+    assert embedded == []
+
+
+def test_similar_skills_embeds_free_text_once(local_skill_cache):
+    _, embedded = local_skill_cache
+    request = SimilarSkillsRequest(text="python  developer", k=3, min_similarity=0.1)
+
+    first = similar_skills_service(request)
+    second = similar_skills_service(request)
+
+    assert embedded == ["python developer"]
+    assert first.results == second.results
+    assert {result.skill for result in first.results} >= {"python", "python3"}
+    assert all(result.similarity >= 0.1 for result in first.results)
+
+
+def test_query_vector_cache_is_bounded_under_concurrent_lookups(local_skill_cache, monkeypatch):
+    monkeypatch.setattr(similar_skills, "QUERY_CACHE_SIZE", 4)
+    texts = [f"query {n % 12}" for n in range(400)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(similar_skills.query_vector, texts))
+
+    assert {source for _, source in results} <= {"embedded", "query_cache"}
+    assert len(similar_skills._query_vectors) == 4
+
+
+def test_similar_skills_endpoint_rejects_empty_text_and_bad_k(local_skill_cache):
+    assert api_request("POST", "/skills/similar", json={"text": "  "}).status_code == 400
+    assert api_request("POST", "/skills/similar", json={"text": "python", "k": 0}).status_code == 400
+
+    response = api_request("POST", "/skills/similar", json={"text": "docker", "k": 1})
+    assert response.status_code == 200
+    assert response.json()["query"] == "docker"
+    assert len(response.json()["results"]) == 1
+
+
+def test_similar_skills_endpoint_runs_service_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def fake_service(payload):
+        threads.append(threading.current_thread())
+        return SimilarSkillsResponse(query=payload.text, normalized_query=payload.text, results=[])
+
+    monkeypatch.setattr(main, "similar_skills_service", fake_service)
+
+    response = api_request("POST", "/skills/similar", json={"text": "docker"})
+
+    assert response.status_code == 200
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_discover_synonyms_suggests_close_unmapped_pairs(local_skill_cache):
+    suggestions = discover_synonyms.discover_synonyms(min_similarity=0.3, neighbors=3)
+
+    pairs = [suggestion["skills"] for suggestion in suggestions]
+    assert ["python", "python3"] in pairs
+    # "reactjs" -> "react" is already in synonym_to_normalized.json.
+    assert ["react", "reactjs"] not in pairs
+    assert [s["similarity"] for s in suggestions] == sorted((s["similarity"] for s in suggestions), reverse=True)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.resume_generation.cache import ResumeGenerationStageCache
+from app.single_flight import SingleFlight, stage_request_key
+
+
+def test_stage_request_key_matches_stage_cache_key(tmp_path):
+    payload = {"title": "Backend Engineer", "skills": ["Python", "SQL"]}
+
+    assert stage_request_key(stage="job_focus_generation", payload=payload) == (
+        ResumeGenerationStageCache(tmp_path).cache_key(stage="job_focus_generation", payload=payload)
+    )
+    assert stage_request_key(stage="a", payload={"x": 1, "y": 2}) == stage_request_key(
+        stage="a", payload={"y": 2, "x": 1}
+    )
+    assert stage_request_key(stage="a", payload={"x": 1}) != stage_request_key(stage="b", payload={"x": 1})
+
+
+def test_single_flight_shares_results_and_errors_then_releases_the_key():
+    flight: SingleFlight[str] = SingleFlight()
+    calls: list[str] = []
+
+    async def _run():
+        release = asyncio.Event()
+
+        async def call():
+            calls.append("call")
+            await release.wait()
+            return "result"
+
+        async def fail():
+            calls.append("fail")
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        first = asyncio.create_task(flight.run("key", call))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.run("key", call))
+        other = asyncio.create_task(flight.run("other", call))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, other)
+        assert len(flight) == 0
+
+        failures = await asyncio.gather(
+            flight.run("bad", fail), flight.run("bad", fail), return_exceptions=True
+        )
+        again = await flight.run("key", call)
+        return results, failures, again
+
+    results, failures, again = asyncio.run(_run())
+
+    assert results == [("result", False), ("result", True), ("result", False)]
+    assert [str(exc) for exc in failures] == ["boom", "boom"]
+    assert again == ("result", False)
+    assert calls == ["call", "call", "fail", "call"]
+
+
+def test_single_flight_keeps_the_call_running_when_a_waiter_is_cancelled():
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def _run():
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return 7
+
+        leader = asyncio.create_task(flight.run("key", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(_run()) == (7, True)
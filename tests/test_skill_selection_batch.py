@@ -0,0 +1,195 @@
+"""Tests for batch skill selection against a shared inventory."""
+import asyncio
+
+import httpx
+import pytest
+
+from app.main import app
+from app.metrics import metrics
+from app.skill_selection.embedding_cache import role_cache_key
+from app.skill_selection.models import SkillSelectBatchRequest, SkillSelectRequest
+from app.skill_selection.scoring import embeddings
+from app.skill_selection.scoring.baseline import baseline_select_skills, baseline_select_skills_batch
+from app.skill_selection.selector import select_skills_batch_service, select_skills_service
+
+INVENTORY = {
+    "technology": ["Python", "Django", "PostgreSQL", "Redis", "Docker", "React", "Zephyrflow", "AWS"],
+    "programming": ["Python", "Java", "Go", "TypeScript", "JavaScript"],
+    "concepts": ["API", "Microservices", "Database", "CI/CD", "Responsive Design", "Machine Learning"],
+}
+
+TARGETS = [
+    {"job_role": "Backend Engineer", "job_text": "Build Django services on amazon cloud with Zephyrflow."},
+    {"job_role": "Frontend Developer", "job_text": "React and TypeScript UI work."},
+    {"job_role": "ML Engineer"},
+    {"job_role": "Backend Engineer", "job_text": ""},
+    {"job_role": "Chef"},
+]
+
+
+def api_request(method: str, path: str, **kwargs):
+    async def _request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(_request())
+
+
+@pytest.mark.parametrize("include_zero", [False, True])
+@pytest.mark.parametrize("top_n", [None, 3])
+def test_baseline_select_skills_batch_matches_single_target(include_zero, top_n):
+    batch = baseline_select_skills_batch(
+        targets=[(target["job_role"], target.get("job_text")) for target in TARGETS],
+        top_n=top_n,
+        dev_mode=True,
+        include_zero=include_zero,
+        **INVENTORY,
+    )
+
+    for target, result in zip(TARGETS, batch):
+        expected = baseline_select_skills(
+            job_role=target["job_role"],
+            job_text=target.get("job_text"),
+            top_n=top_n,
+            dev_mode=True,
+            include_zero=include_zero,
+            **INVENTORY,
+        )
+        assert result == expected
+
+
+def test_baseline_select_skills_batch_handles_empty_inputs():
+    assert baseline_select_skills_batch([], **INVENTORY) == []
+
+    [(selected, details)] = baseline_select_skills_batch(
+        [("Backend Engineer", None)],
+        technology=[],
+        programming=[],
+        concepts=[],
+    )
+    assert selected == {"technology": [], "programming": [], "concepts": []}
+    assert details is None
+
+
+def test_select_skills_batch_endpoint_matches_single_endpoint():
+    payload = {"targets": TARGETS, "method": "baseline", "dev_mode": True, **INVENTORY}
+
+    response = api_request("POST", "/select-skills/batch", json=payload)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == len(TARGETS)
+    for target, result in zip(TARGETS, results):
+        single = api_request(
+            "POST",
+            "/select-skills",
+            json={**target, "method": "baseline", "dev_mode": True, **INVENTORY},
+        )
+        assert result == single.json()
+
+
+def test_select_skills_batch_records_per_target_metrics():
+    before = metrics.skill_selection.snapshot()
+
+    select_skills_batch_service(SkillSelectBatchRequest(targets=TARGETS, method="baseline", **INVENTORY))
+
+    after = metrics.skill_selection.snapshot()
+    assert after["requests_total"] == before["requests_total"] + len(TARGETS)
+    assert after["method_usage"]["baseline"] == before["method_usage"].get("baseline", 0) + len(TARGETS)
+    assert after["errors_total"] == before["errors_total"]
+
+
+def test_select_skills_batch_embeddings_embeds_roles_in_one_request(monkeypatch):
+    monkeypatch.setattr(embeddings.cache, "cache_store", lambda *args, **kwargs: None)
+    monkeypatch.setattr(embeddings.cache, "cache_store_many", lambda *args, **kwargs: None)
+    monkeypatch.setattr(embeddings.cache, "role_cache", {})
+    monkeypatch.setattr(embeddings.cache, "skill_cache", {})
+    role_calls = []
+
+    def fake_embed_roles(texts):
+        role_calls.append(list(texts))
+        return [[1.0, float(index)] for index, _ in enumerate(texts)]
+
+    def fake_embed_role(_text):
+        raise AssertionError("batch selection should not embed roles one at a time")
+
+    monkeypatch.setattr(embeddings, "embed_roles", fake_embed_roles)
+    monkeypatch.setattr(embeddings, "embed_role", fake_embed_role)
+    monkeypatch.setattr(
+        embeddings,
+        "embed_skills",
+        lambda texts: [[float(len(text) % 3), 1.0] for text in texts],
+    )
+
+    targets = [{"job_role": "Backend Engineer"}, {"job_role": "Data Engineer"}, {"job_role": "Backend Engineer"}]
+    response = select_skills_batch_service(
+        SkillSelectBatchRequest(targets=targets, method="embeddings", dev_mode=True, **INVENTORY)
+    )
+
+    assert role_calls == [["backend engineer", "data engineer"]]
+    assert response.results[0] == response.results[2]
+
+    monkeypatch.setattr(embeddings, "embed_role", lambda _text: pytest.fail("role should be cached"))
+    monkeypatch.setattr(
+        embeddings.cache,
+        "role_cache",
+        {role_cache_key("backend engineer"): [1.0, 0.0], role_cache_key("data engineer"): [1.0, 1.0]},
+    )
+    for target, result in zip(targets, response.results):
+        single = select_skills_service(
+            SkillSelectRequest(**target, method="embeddings", dev_mode=True, **INVENTORY)
+        )
+        assert result == single
+
+
+def test_select_skills_batch_llm_method_runs_per_target(monkeypatch):
+    from app.skill_selection import selector
+
+    calls = []
+
+    def fake_select_skills_service(req):
+        calls.append(req.job_role)
+        return selector.SkillSelectResponse(technology=[], programming=[], concepts=[])
+
+    monkeypatch.setattr(selector, "select_skills_service", fake_select_skills_service)
+
+    response = select_skills_batch_service(
+        SkillSelectBatchRequest(targets=TARGETS[:2], method="llm", **INVENTORY)
+    )
+
+    assert calls == ["Backend Engineer", "Frontend Developer"]
+    assert len(response.results) == 2
+
+
+def test_select_skills_batch_endpoint_runs_service_off_the_event_loop(monkeypatch):
+    import threading
+
+    from app import main as app_main
+
+    threads = []
+
+    def fake_batch_service(payload):
+        threads.append(threading.current_thread())
+        return select_skills_batch_service(payload)
+
+    monkeypatch.setattr(app_main, "select_skills_batch_service", fake_batch_service)
+
+    response = api_request(
+        "POST",
+        "/select-skills/batch",
+        json={"targets": TARGETS, "method": "baseline", **INVENTORY},
+    )
+
+    assert response.status_code == 200
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_select_skills_batch_unsupported_method_returns_400():
+    response = api_request(
+        "POST",
+        "/select-skills/batch",
+        json={"targets": TARGETS[:1], "method": "unknown", **INVENTORY},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,58 @@
+"""Tests for scripts/verify_quantization.py"""
+from app.skill_selection.embedding_cache import EmbeddingCache
+from app.skill_selection.local_embeddings import HashedNgramEmbedder
+from app.skill_selection.scoring import embeddings
+from scripts import verify_quantization
+
+CASES = [
+    {
+        "input": {
+            "job_role": "backend developer",
+            "technology": ["postgresql", "docker", "react", "kubernetes"],
+            "programming": ["python", "java", "swift"],
+            "concepts": ["api", "database", "ui"],
+        },
+        "expected": {},
+    },
+]
+
+
+def _ranking(technology: list[str]) -> dict:
+    return {
+        cat: {"ranked": technology if cat == "technology" else [], "similarity": {}}
+        for cat in verify_quantization.CATEGORIES
+    }
+
+
+def test_compare_rankings_reports_top_n_changes_and_displacement():
+    reference = [_ranking(["a", "b", "c", "d"])]
+    quantized = [_ranking(["b", "a", "d", "c"])]
+
+    result = verify_quantization.compare_rankings(reference, quantized, CASES, top_n=2)
+
+    assert result["categories_compared"] == 3
+    assert result["identical_orderings"] == 2
+    assert result["top_n_changes"] == 0
+    assert result["max_rank_displacement"] == 1
+
+    result = verify_quantization.compare_rankings(reference, [_ranking(["c", "b", "a", "d"])], CASES, top_n=2)
+    assert result["top_n_changes"] == 1
+    assert result["max_rank_displacement"] == 2
+
+
+def test_verify_replays_cases_against_quantized_stores(tmp_path, monkeypatch):
+    embedder = HashedNgramEmbedder(64)
+    monkeypatch.setattr(embeddings, "cache", EmbeddingCache("test-model", cache_dir=tmp_path, persist=False))
+    monkeypatch.setattr(embeddings, "embed_role", lambda text: embedder.embed([text])[0])
+    monkeypatch.setattr(embeddings, "embed_skills", lambda texts: list(embedder.embed(texts)))
+    live_cache = embeddings.cache
+
+    report = verify_quantization.verify(CASES, ["float16", "int8"], top_n=2)
+
+    assert embeddings.cache is live_cache
+    assert report["skills"] == 10
+    assert report["dtypes"]["float16"]["store_bytes"] < report["float32_store_bytes"]
+    assert report["dtypes"]["int8"]["store_bytes"] < report["dtypes"]["float16"]["store_bytes"]
+    for result in report["dtypes"].values():
+        assert result["categories_compared"] == 3
+        assert result["max_similarity_error"] < 0.02